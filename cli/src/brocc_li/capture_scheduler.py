@@ -0,0 +1,223 @@
+"""
+Central scheduling for tab captures (HTML fetch + conversion).
+
+Before this, every caller decided for itself when to fetch: change-triggered fetches used a
+fixed debounce per tab, and batch fetches a local Semaphore(5). With 100+ tabs open that
+meant startup capture and bursts of page activity all hit Chrome and the CPU at once.
+
+Structure:
+- `run(key, url, priority, job)` runs a capture once a slot is free. Waiting captures start
+  in priority order (focused tab first, background backfill last), at most
+  MAX_CONCURRENT_CAPTURES at a time, with starts on the same host spaced by
+  HOST_MIN_INTERVAL_SECONDS.
+- Requests are coalesced per key: a second request for a key that is still waiting joins
+  the first (taking the higher priority). A key never runs twice concurrently; a request
+  made while it runs is queued once to run after it, since the page may have changed.
+- `request(key, url, job, focused)` is the debounced form used for content changes. Each
+  key's delay adapts: it doubles (up to DEBOUNCE_MAX_SECONDS) while the tab keeps changing
+  within CHURN_WINDOW_SECONDS of its last capture, relaxes back toward
+  DEBOUNCE_BASE_SECONDS once it quiets down, and is halved (down to DEBOUNCE_MIN_SECONDS)
+  for the focused tab, where the user is actively reading.
+
+Gotchas:
+- Callers pick keys: jobs under one key must be interchangeable, since coalesced callers
+  get the result of whichever job runs.
+- `cancel(key)` drops a waiting request, a pending debounce and a running job for the key;
+  callers waiting on them get CancelledError.
+"""
+
+import asyncio
+import itertools
+import time
+from enum import IntEnum
+from typing import Any, Awaitable, Callable, Dict, Hashable, NamedTuple, Optional, Set, TypeVar
+from urllib.parse import urlparse
+
+from brocc_li.utils.logger import logger
+
+MAX_CONCURRENT_CAPTURES = 5  # Captures running at once, across all tabs
+HOST_MIN_INTERVAL_SECONDS = 0.2  # Minimum time between capture starts on one host
+DEBOUNCE_MIN_SECONDS = 0.25
+DEBOUNCE_BASE_SECONDS = 0.75
+DEBOUNCE_MAX_SECONDS = 15.0
+CHURN_WINDOW_SECONDS = 10.0  # A change this soon after the last capture counts as churn
+
+T = TypeVar("T")
+Job = Callable[[], Awaitable[Any]]
+
+
+class CapturePriority(IntEnum):
+    """Lower values start first."""
+
+    FOCUSED = 0  # The tab the user is looking at
+    CHANGED = 1  # A background tab that navigated or changed content
+    BACKGROUND = 2  # Backfill of tabs nobody is looking at
+
+
+class _Request:
+    __slots__ = ("key", "host", "priority", "order", "job", "future")
+
+    def __init__(
+        self, key: Hashable, host: str, priority: CapturePriority, order: int, job: Job
+    ) -> None:
+        self.key = key
+        self.host = host
+        self.priority = priority
+        self.order = order
+        self.job = job
+        self.future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        # Coalesced callers may all have given up; don't warn about an unread failure
+        self.future.add_done_callback(lambda f: f.cancelled() or f.exception())
+
+
+class _Debounce(NamedTuple):
+    delay: float
+    timer: Optional[asyncio.TimerHandle] = None
+    last_fired: float = -CHURN_WINDOW_SECONDS
+
+
+def host_of(url: Optional[str]) -> str:
+    return (urlparse(url).hostname or "") if url else ""
+
+
+class CaptureScheduler:
+    """Runs captures by priority under a global and per-host cap, with adaptive debounce."""
+
+    def __init__(
+        self,
+        max_concurrent: int = MAX_CONCURRENT_CAPTURES,
+        host_interval: float = HOST_MIN_INTERVAL_SECONDS,
+    ):
+        self.max_concurrent = max_concurrent
+        self.host_interval = host_interval
+        self._order = itertools.count()
+        self._waiting: Dict[Hashable, _Request] = {}
+        self._running: Dict[Hashable, asyncio.Task[None]] = {}
+        self._host_next_start: Dict[str, float] = {}  # host -> earliest time.monotonic()
+        self._wakeup: Optional[asyncio.TimerHandle] = None
+        self._debounces: Dict[Hashable, _Debounce] = {}
+        self._fired: Set[asyncio.Task[Any]] = set()  # Debounced runs, kept referenced
+
+    @property
+    def waiting(self) -> int:
+        return len(self._waiting)
+
+    @property
+    def running(self) -> int:
+        return len(self._running)
+
+    async def run(
+        self,
+        key: Hashable,
+        url: Optional[str],
+        priority: CapturePriority,
+        job: Callable[[], Awaitable[T]],
+    ) -> T:
+        """Run job under the scheduler's caps and return its result (shared if coalesced)."""
+        request = self._waiting.get(key)
+        if request is not None:
+            if priority < request.priority:
+                request.priority = priority
+        else:
+            request = _Request(key, host_of(url), priority, next(self._order), job)
+            self._waiting[key] = request
+            self._pump()
+        # Shielded: one coalesced caller giving up doesn't cancel the others' capture
+        return await asyncio.shield(request.future)
+
+    def request(self, key: Hashable, url: Optional[str], job: Job, focused: bool = False) -> None:
+        """Run job after the key's adaptive debounce delay; repeat calls meanwhile coalesce."""
+        state = self._debounces.get(key) or _Debounce(DEBOUNCE_BASE_SECONDS)
+        if state.timer is not None:
+            return  # The pending run will see this change too
+        since_last = time.monotonic() - state.last_fired
+        if focused:
+            delay = max(DEBOUNCE_MIN_SECONDS, state.delay / 2)
+        elif since_last < CHURN_WINDOW_SECONDS:
+            delay = min(DEBOUNCE_MAX_SECONDS, state.delay * 2)
+        else:
+            delay = max(DEBOUNCE_BASE_SECONDS, state.delay / 2)
+        priority = CapturePriority.FOCUSED if focused else CapturePriority.CHANGED
+        timer = asyncio.get_running_loop().call_later(delay, self._fire, key, url, priority, job)
+        self._debounces[key] = _Debounce(delay, timer, state.last_fired)
+
+    def debounce_delay(self, key: Hashable) -> float:
+        """The delay the key's last (or pending) debounced request used."""
+        state = self._debounces.get(key)
+        return state.delay if state else DEBOUNCE_BASE_SECONDS
+
+    def cancel(self, key: Hashable) -> None:
+        state = self._debounces.pop(key, None)
+        if state is not None and state.timer is not None:
+            state.timer.cancel()
+        request = self._waiting.pop(key, None)
+        if request is not None:
+            request.future.cancel()
+        task = self._running.get(key)
+        if task is not None:
+            task.cancel()
+
+    def cancel_all(self) -> None:
+        for key in set(self._debounces) | set(self._waiting) | set(self._running):
+            self.cancel(key)
+        for task in self._fired:
+            task.cancel()
+
+    def _fire(self, key: Hashable, url: Optional[str], priority: CapturePriority, job: Job):
+        state = self._debounces.get(key)
+        if state is not None:
+            self._debounces[key] = state._replace(timer=None, last_fired=time.monotonic())
+        task = asyncio.create_task(self.run(key, url, priority, job))
+        self._fired.add(task)
+        task.add_done_callback(self._fired_done)
+
+    def _fired_done(self, task: "asyncio.Task[Any]") -> None:
+        self._fired.discard(task)
+        # Failures are the job's to log; just don't leave the exception unretrieved
+        if not task.cancelled():
+            task.exception()
+
+    def _pump(self) -> None:
+        """Start waiting requests while slots are free, best priority first."""
+        if self._wakeup is not None:
+            self._wakeup.cancel()
+            self._wakeup = None
+        now = time.monotonic()
+        next_ready: Optional[float] = None
+        for request in sorted(self._waiting.values(), key=lambda r: (r.priority, r.order)):
+            if len(self._running) >= self.max_concurrent:
+                return  # A finishing job pumps again
+            if request.key in self._running:
+                continue
+            ready_at = self._host_next_start.get(request.host, now)
+            if request.host and ready_at > now:
+                next_ready = ready_at if next_ready is None else min(next_ready, ready_at)
+                continue
+            self._start(request, now)
+        if next_ready is not None:
+            self._wakeup = asyncio.get_running_loop().call_later(next_ready - now, self._pump)
+
+    def _start(self, request: _Request, now: float) -> None:
+        del self._waiting[request.key]
+        if request.host:
+            self._host_next_start[request.host] = now + self.host_interval
+        task = asyncio.create_task(self._execute(request))
+        self._running[request.key] = task
+
+    async def _execute(self, request: _Request) -> None:
+        try:
+            result = await request.job()
+        except asyncio.CancelledError:
+            request.future.cancel()
+            raise
+        except Exception as e:
+            logger.debug(f"Capture {request.key!r} failed: {type(e).__name__} - {e}")
+            if not request.future.done():
+                request.future.set_exception(e)
+        else:
+            if not request.future.done():
+                request.future.set_result(result)
+        finally:
+            if self._running.get(request.key) is asyncio.current_task():
+                del self._running[request.key]
+            self._pump()
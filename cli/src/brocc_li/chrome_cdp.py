@@ -1,22 +1,18 @@
 import asyncio
 import json
 import re
-from typing import List, Optional, Tuple
+from typing import Any, AsyncIterator, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 import aiohttp
-import websockets
-import websockets.protocol
 from pydantic import BaseModel, Field
 
-from brocc_li.utils.chrome import REMOTE_DEBUG_PORT
+from brocc_li.chrome_session import CdpBrowserSession, CdpError
+from brocc_li.utils.chrome import REMOTE_DEBUG_PORT, client_session
 from brocc_li.utils.logger import logger
 
 # Default timeout for Chrome info retrieval via CDP (seconds)
 CHROME_INFO_TIMEOUT = 2
 
-# Default timeout for HTML content retrieval via CDP (seconds)
-GET_HTML_TIMEOUT = 2
-
 
 class ChromeTab(BaseModel):
     id: str
@@ -27,13 +23,16 @@ class ChromeTab(BaseModel):
     devtoolsFrontendUrl: Optional[str] = None
 
 
-async def get_tabs() -> List[ChromeTab]:
+async def get_tabs(session: Optional[aiohttp.ClientSession] = None) -> List[ChromeTab]:
     """
     Get all Chrome browser tabs via CDP HTTP API.
 
     Connects to Chrome DevTools Protocol to retrieve tab information.
     Only returns actual page tabs (not DevTools, extensions, etc).
 
+    Args:
+        session: Pooled HTTP session to reuse (ChromeManager's); a one-off session otherwise
+
     Returns:
         List of ChromeTab objects representing open browser tabs
     """
@@ -41,8 +40,8 @@ async def get_tabs() -> List[ChromeTab]:
 
     try:
         # Get list of tabs via Chrome DevTools HTTP API
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
+        async with client_session(session) as http:
+            async with http.get(
                 f"http://localhost:{REMOTE_DEBUG_PORT}/json/list",
                 timeout=aiohttp.ClientTimeout(total=2),
             ) as response:
@@ -94,12 +93,34 @@ async def get_tabs() -> List[ChromeTab]:
     return []
 
 
-async def get_chrome_info():
+def tabs_from_targets(targets: Iterable[Dict[str, Any]]) -> List[ChromeTab]:
+    """
+    ChromeTabs for the page targets reported by CDP target discovery (TargetInfo dicts).
+
+    Same tabs as get_tabs() without the HTTP round trip; window_id and the per-tab
+    WebSocket URLs are not part of TargetInfo.
+    """
+    return [
+        ChromeTab(
+            id=info["targetId"],
+            title=info.get("title") or "Untitled",
+            url=info.get("url") or "about:blank",
+        )
+        for info in targets
+        # Prerendered pages are page targets too, but not tabs the user can see
+        if info.get("type") == "page" and info.get("subtype") != "prerender"
+    ]
+
+
+async def get_chrome_info(session: Optional[aiohttp.ClientSession] = None):
     """
     Get Chrome version info and check connection via CDP HTTP API.
 
     Makes a single request to get both connection status and Chrome version.
 
+    Args:
+        session: Pooled HTTP session to reuse (ChromeManager's); a one-off session otherwise
+
     Returns:
         dict: {
             "connected": bool indicating if connection succeeded,
@@ -110,8 +131,8 @@ async def get_chrome_info():
     result = {"connected": False, "version": "Unknown", "data": None}
 
     try:
-        async with aiohttp.ClientSession() as session:
-            async with session.get(
+        async with client_session(session) as http:
+            async with http.get(
                 f"http://localhost:{REMOTE_DEBUG_PORT}/json/version",
                 timeout=aiohttp.ClientTimeout(total=CHROME_INFO_TIMEOUT),
             ) as response:
@@ -129,11 +150,13 @@ async def get_chrome_info():
     return result
 
 
-async def get_tab_html_content(ws_url: str) -> Tuple[Optional[str], Optional[str]]:
+async def get_tab_html_content(
+    cdp: CdpBrowserSession, tab_id: str
+) -> Tuple[Optional[str], Optional[str]]:
     """Get HTML and URL with hard timeout using asyncio.wait_for"""
     try:
         # Give up after 10 seconds total for entire CDP operation
-        return await asyncio.wait_for(_get_html_using_dom(ws_url), timeout=10.0)
+        return await asyncio.wait_for(_get_html_using_dom(cdp, tab_id), timeout=10.0)
     except asyncio.TimeoutError:
         logger.error("CDP HTML retrieval timed out after 10 seconds")
         return None, None
@@ -142,270 +165,374 @@ async def get_tab_html_content(ws_url: str) -> Tuple[Optional[str], Optional[str
         return None, None
 
 
-async def _send_cdp_command(ws, msg_id: int, method: str, params: Optional[dict] = None) -> dict:
-    """Send a CDP command and wait for the specific response matching the ID."""
-    command = {"id": msg_id, "method": method}
-    if params:
-        command["params"] = params
-
-    # logger.debug(f"Sending CDP command (id={msg_id}): {method}")
-    await ws.send(json.dumps(command))
-
-    # Loop until we get the response matching our msg_id
-    while True:
-        response_raw = await ws.recv()
-        response = json.loads(response_raw)
-
-        # Check if it's the response we are waiting for
-        if response.get("id") == msg_id:
-            # logger.debug(f"Received response for id={msg_id}")
-            return response
-        elif "method" in response:  # It's an event, ignore
-            pass
-        else:  # Unexpected message format
-            pass
-
-
-async def _get_html_using_dom(ws_url: str) -> Tuple[Optional[str], Optional[str]]:
+async def _get_html_using_dom(
+    cdp: CdpBrowserSession, tab_id: str
+) -> Tuple[Optional[str], Optional[str]]:
     """Get HTML content and final URL using DOM.getOuterHTML CDP method"""
-    msg_counter = 1  # Use a counter for unique message IDs
     current_url: Optional[str] = None  # Store the URL found
     try:
-        logger.debug(f"Connecting to tab via WebSocket: {ws_url}")
-        async with websockets.connect(
-            ws_url,
-            open_timeout=GET_HTML_TIMEOUT,
-            close_timeout=GET_HTML_TIMEOUT,
-            max_size=20 * 1024 * 1024,  # default is 1mb, we use 20mb
-        ) as ws:
-            # First check if page is ready using Page.getResourceTree
-            # This will tell us quickly if it's a blank/loading page
-            try:
-                # Enable Page domain (required for getResourceTree)
-                await _send_cdp_command(ws, msg_counter, "Page.enable")
-                msg_counter += 1
-
-                # Get Resource Tree
-                resource_result = await _send_cdp_command(ws, msg_counter, "Page.getResourceTree")
-                msg_counter += 1
-
-                # Check if this is an about:blank or empty page
-                frame = resource_result.get("result", {}).get("frameTree", {}).get("frame", {})
-                current_url = frame.get("url", None)  # Store the URL from frame
-                if current_url in ["about:blank", ""]:
-                    logger.debug("Detected blank/empty page - returning empty HTML")
-                    return None, current_url  # Return None HTML, but the URL
-            except Exception as e:
-                # If this fails, just continue with normal DOM method
-                logger.debug(f"Resource check failed: {e}, continuing with DOM method")
-
-            # Enable DOM domain
-            await _send_cdp_command(ws, msg_counter, "DOM.enable")
-            msg_counter += 1
-
-            # Get document root node
-            doc_result = await _send_cdp_command(ws, msg_counter, "DOM.getDocument")
-            msg_counter += 1
-            # logger.debug(f"DOM.getDocument result: {doc_result}")
-
-            # Extract document URL if available (more reliable than frame URL sometimes)
-            root_data = doc_result.get("result", {}).get("root", {})
-            doc_url = root_data.get("documentURL")
-            if doc_url:
-                current_url = doc_url  # Prefer documentURL if found
-                logger.debug(f"Updated current URL from DOM.getDocument: {current_url}")
-
-            # Extract root node ID from response
-            root_node_id = root_data.get("nodeId")
-            if not root_node_id:
-                logger.error("Failed to get root node ID")
-                return None, current_url  # Return None HTML, but potentially URL
-
-            # Get outer HTML using the root node ID
-            html_result = await _send_cdp_command(
-                ws, msg_counter, "DOM.getOuterHTML", {"nodeId": root_node_id}
+        # Reuses the tab's session (and its enabled domains) after the first fetch
+        session_id = await cdp.attach(tab_id)
+
+        # First check if page is ready using Page.getResourceTree
+        # This will tell us quickly if it's a blank/loading page
+        try:
+            # Enable Page domain (required for getResourceTree)
+            await cdp.enable(session_id, "Page")
+            resource_result = await cdp.send("Page.getResourceTree", session_id=session_id)
+
+            # Check if this is an about:blank or empty page
+            frame = resource_result.get("frameTree", {}).get("frame", {})
+            current_url = frame.get("url", None)  # Store the URL from frame
+            if current_url in ["about:blank", ""]:
+                logger.debug("Detected blank/empty page - returning empty HTML")
+                return None, current_url  # Return None HTML, but the URL
+        except CdpError as e:
+            # If this fails, just continue with normal DOM method
+            logger.debug(f"Resource check failed: {e}, continuing with DOM method")
+
+        await cdp.enable(session_id, "DOM")
+
+        # Get document root node
+        doc_result = await cdp.send("DOM.getDocument", session_id=session_id)
+
+        # Extract document URL if available (more reliable than frame URL sometimes)
+        root_data = doc_result.get("root", {})
+        doc_url = root_data.get("documentURL")
+        if doc_url:
+            current_url = doc_url  # Prefer documentURL if found
+            logger.debug(f"Updated current URL from DOM.getDocument: {current_url}")
+
+        # Extract root node ID from response
+        root_node_id = root_data.get("nodeId")
+        if not root_node_id:
+            logger.error("Failed to get root node ID")
+            return None, current_url  # Return None HTML, but potentially URL
+
+        # Get outer HTML using the root node ID
+        try:
+            html_result = await cdp.send(
+                "DOM.getOuterHTML", {"nodeId": root_node_id}, session_id=session_id
             )
-            msg_counter += 1
-
-            # Extract HTML content and log summary
-            html_content = html_result.get("result", {}).get("outerHTML", "")
-            if "error" in html_result:
-                error_message = html_result["error"].get("message", "Unknown error")
-                logger.warning(f"DOM.getOuterHTML failed: {error_message}")
-            elif html_content:
-                # logger.debug(f"DOM.getOuterHTML success: HTML length = {len(html_content)}")
-                pass
-            else:
-                logger.warning("DOM.getOuterHTML succeeded but returned empty HTML")
-
-            if html_content:
-                return html_content, current_url
-            else:
-                return None, current_url  # Return None HTML, but the URL we found
+        except CdpError as e:
+            logger.warning(f"DOM.getOuterHTML failed: {e}")
+            return None, current_url
 
-    except asyncio.TimeoutError:
-        # websockets uses asyncio.TimeoutError for connection timeouts?
-        logger.warning("WebSocket connection timed out")
-        return None, None
-    except websockets.ConnectionClosedError as e:
-        if "403 Forbidden" in str(e):
-            logger.error(
-                "Chrome rejected WebSocket connection. "
-                "Please relaunch Chrome with --remote-allow-origins=* flag. "
-                "You may need to quit all Chrome instances and restart the app."
-            )
+        html_content = html_result.get("outerHTML", "")
+        if html_content:
+            return html_content, current_url
         else:
-            logger.error(f"WebSocket connection error: {e}")
-        return None, None
+            logger.warning("DOM.getOuterHTML succeeded but returned empty HTML")
+            return None, current_url  # Return None HTML, but the URL we found
+
+    except CdpError as e:
+        logger.error(f"CDP command failed for tab {tab_id}: {e}")
+        return None, current_url
+    except ConnectionError as e:
+        logger.error(f"Browser CDP connection unavailable: {e}")
+        return None, current_url
     except Exception as e:
-        logger.error(f"Failed to connect to tab via WebSocket: {e}")
-        return None, None
-
-
-async def monitor_user_interactions(ws_url: str):
+        logger.error(f"Failed to get HTML for tab {tab_id}: {e}")
+        return None, current_url
+
+
+# Page function the injected observer calls (via Runtime.addBinding) to report changes
+DOM_CHANGE_BINDING = "__broccDomChange"
+# Added elements the observer tracks between captures before giving up on a delta
+DELTA_MAX_ADDED_ELEMENTS = 5000
+
+# Installs a MutationObserver that sums what changed and reports it (with whether the page
+# has focus) at most every REPORT_MS, and right away when the tab gains focus. Parser
+# insertions are left out: the observer starts at DOMContentLoaded, and the loaded page
+# itself is captured by navigation handling.
+#
+# The observer also remembers the elements added since the last capture, so a capture can
+# serialize just those subtrees (see get_tab_html_delta). Captures are numbered per
+# document; one that doesn't continue from the caller's cursor returns reset instead.
+DOM_CHANGE_OBSERVER_JS = """
+(function() {
+    if (window.__broccDomObserver) return "already installed";
+    const REPORT_MS = 500;
+    const MAX_ADDED = %(max_added)d;
+    const SKIP_TAGS = new Set(["SCRIPT", "STYLE", "NOSCRIPT", "TEMPLATE", "LINK", "META"]);
+    const docId = Date.now().toString(36) + Math.random().toString(36).slice(2);
+    let pending = null;
+    let added = new Set();
+    let overflowed = false;
+    let seq = 0;
+
+    function textLength(node) {
+        return node.nodeType === Node.ELEMENT_NODE || node.nodeType === Node.TEXT_NODE
+            ? (node.textContent || "").length
+            : 0;
+    }
+
+    function emptyChange() {
+        return { added_nodes: 0, removed_nodes: 0, text_added: 0, text_removed: 0 };
+    }
+
+    function report() {
+        const change = pending;
+        pending = null;
+        change.focused = document.hasFocus();
+        window.%(binding)s(JSON.stringify(change));
+    }
+
+    // Switching to this tab is reported right away, even with nothing changed
+    window.addEventListener("focus", () => {
+        if (!pending) {
+            pending = emptyChange();
+            setTimeout(report, 0);
+        }
+    });
+
+    function remember(node) {
+        if (node.nodeType !== Node.ELEMENT_NODE || SKIP_TAGS.has(node.tagName) || overflowed) return;
+        added.add(node);
+        if (added.size > MAX_ADDED) {
+            // Too much to send as a delta; the next capture is a full snapshot
+            overflowed = true;
+            added = new Set();
+        }
+    }
+
+    const observer = new MutationObserver(records => {
+        const change = pending || emptyChange();
+        for (const record of records) {
+            if (record.type === "characterData") {
+                const delta = (record.target.textContent || "").length - (record.oldValue || "").length;
+                if (delta > 0) change.text_added += delta; else change.text_removed -= delta;
+                continue;
+            }
+            for (const node of record.addedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) change.added_nodes += 1;
+                change.text_added += textLength(node);
+                remember(node);
+            }
+            for (const node of record.removedNodes) {
+                if (node.nodeType === Node.ELEMENT_NODE) change.removed_nodes += 1;
+                change.text_removed += textLength(node);
+            }
+        }
+        if (!pending) {
+            pending = change;
+            setTimeout(report, REPORT_MS);
+        }
+    });
+    window.__broccDomObserver = observer;
+
+    // Start a new delta sequence; called right before a full snapshot
+    window.__broccDeltaStart = function() {
+        added = new Set();
+        overflowed = false;
+        seq += 1;
+        return { doc_id: docId, seq: seq, url: location.href };
+    };
+
+    // Subtrees added since the caller's cursor, outermost only, in insertion order
+    window.__broccDeltaTake = function(sinceDocId, sinceSeq) {
+        if (sinceDocId !== docId || sinceSeq !== seq || overflowed) {
+            return { doc_id: docId, seq: seq, url: location.href, reset: true };
+        }
+        const fragments = [];
+        for (const node of added) {
+            if (!node.isConnected) continue;
+            let nested = false;
+            for (let parent = node.parentNode; parent; parent = parent.parentNode) {
+                if (added.has(parent)) { nested = true; break; }
+            }
+            if (!nested) fragments.push(node.outerHTML);
+        }
+        added = new Set();
+        seq += 1;
+        return { doc_id: docId, seq: seq, url: location.href, reset: false, fragments: fragments };
+    };
+
+    function start() {
+        observer.observe(document, {
+            childList: true, subtree: true, characterData: true, characterDataOldValue: true
+        });
+    }
+    if (document.readyState === "loading") {
+        document.addEventListener("DOMContentLoaded", start, { once: true });
+    } else {
+        start();
+    }
+    return "DOM change observer installed";
+})();
+""" % {"binding": DOM_CHANGE_BINDING, "max_added": DELTA_MAX_ADDED_ELEMENTS}
+
+
+class DomChange(NamedTuple):
+    """What the page's DOM change observer saw during one report window."""
+
+    added_nodes: int = 0  # Elements inserted
+    removed_nodes: int = 0  # Elements removed
+    text_added: int = 0  # Characters of text inserted (gross, not net of removals)
+    text_removed: int = 0  # Characters of text removed
+    focused: bool = False  # Whether the page had focus when it reported
+
+
+async def monitor_dom_changes(cdp: CdpBrowserSession, tab_id: str) -> AsyncIterator[DomChange]:
     """
-    Monitor clicks and scrolls in a tab using CDP and yield events.
+    Monitor DOM content changes in a tab and yield them as DomChange summaries.
 
-    Connects to the tab's WebSocket, injects JS listeners, and listens
-    for console messages indicating user interaction.
-
-    Yields:
-        dict: Structured event data like {"type": "click", "data": {...}} or {"type": "scroll", "data": {...}}
+    Attaches to the tab over the shared browser connection, exposes a binding to the page
+    and installs a MutationObserver that calls it, in the current document and in every
+    document the tab loads later. Stops when the tab's session or the browser connection
+    goes away.
     """
-    msg_counter = 1
-    connection = None  # Keep track of the connection to close it reliably
+    label = tab_id[:8]
+    session_id: Optional[str] = None
+    events = None
     try:
-        logger.debug(f"Monitoring interactions for: {ws_url}")
-        connection = await websockets.connect(
-            ws_url,
-            open_timeout=5.0,  # Slightly longer timeout for initial connection
-            close_timeout=5.0,
-            max_size=20 * 1024 * 1024,
-        )
-        ws = connection
-
-        # === Step 1: Enable Runtime domain FIRST ===
-        await _send_cdp_command(ws, msg_counter, "Runtime.enable")
-        msg_counter += 1
-        logger.info(f"[{ws_url[-10:]}] Runtime domain enabled.")
-
-        # === Step 2: Enable dependent domains (Page, Log) ===
-        await _send_cdp_command(ws, msg_counter, "Page.enable")
-        msg_counter += 1
-        logger.info(f"[{ws_url[-10:]}] Page domain enabled.")
-
-        # === Step 3: Subscribe to consoleAPICalled event (Reverting from Log.entryAdded) ===
-        # Note: We are testing if consoleAPICalled is more reliable here than Log.entryAdded
-        # await _send_cdp_command(ws, msg_counter, "Log.enable") # Previous method
-        # msg_counter += 1
-        logger.info(
-            f"[{ws_url[-10:]}] Subscribing via Runtime.enable (for consoleAPICalled)...done."
+        logger.debug(f"Monitoring DOM changes for tab: {tab_id}")
+        session_id = await cdp.attach(tab_id)
+        # Subscribe before enabling Runtime so no binding call is missed
+        events = cdp.subscribe(session_id, ["Runtime.bindingCalled"])
+
+        # Binding calls are only delivered while Runtime is enabled
+        await cdp.enable(session_id, "Runtime")
+        await cdp.enable(session_id, "Page")
+        # Bindings persist across navigations within the target
+        await cdp.send("Runtime.addBinding", {"name": DOM_CHANGE_BINDING}, session_id=session_id)
+        await cdp.send(
+            "Page.addScriptToEvaluateOnNewDocument",
+            {"source": DOM_CHANGE_OBSERVER_JS},
+            session_id=session_id,
         )
-
-        # Inject JS listeners
-        js_code = """
-        (function() {
-            console.log('BROCC_DEBUG: Injecting listeners...'); // Debug log
-            // Use a closure to prevent polluting the global scope too much
-            let lastScrollTimestamp = 0;
-            let lastClickTimestamp = 0;
-            const DEBOUNCE_MS = 250; // Only log if events are spaced out
-
-            document.addEventListener('click', e => {
-                const now = Date.now();
-                if (now - lastClickTimestamp > DEBOUNCE_MS) {
-                    const clickData = {
-                        x: e.clientX,
-                        y: e.clientY,
-                        target: e.target ? e.target.tagName : 'unknown',
-                        timestamp: now
-                    };
-                    console.log('BROCC_CLICK_EVENT', JSON.stringify(clickData));
-                    lastClickTimestamp = now;
-                }
-            }, { capture: true, passive: true }); // Use capture phase, non-blocking
-
-            document.addEventListener('scroll', e => {
-                 const now = Date.now();
-                 if (now - lastScrollTimestamp > DEBOUNCE_MS) {
-                    const scrollData = {
-                        scrollX: window.scrollX,
-                        scrollY: window.scrollY,
-                        timestamp: now
-                    };
-                    console.log('BROCC_SCROLL_EVENT', JSON.stringify(scrollData));
-                    lastScrollTimestamp = now;
-                 }
-            }, { capture: true, passive: true }); // Use capture phase, non-blocking
-
-            console.log('BROCC_DEBUG: Listeners successfully installed.'); // Debug log
-            return "Interaction listeners installed.";
-        })();
-        """
-        eval_result = await _send_cdp_command(
-            ws,
-            msg_counter,
+        eval_result = await cdp.send(
             "Runtime.evaluate",
-            {"expression": js_code, "awaitPromise": False, "returnByValue": True},
-        )
-        msg_counter += 1
-        # Log the result of the script injection
-        injected_status = (
-            eval_result.get("result", {}).get("result", {}).get("value", "Failed to inject")
+            {"expression": DOM_CHANGE_OBSERVER_JS, "returnByValue": True},
+            session_id=session_id,
         )
-        logger.debug(f"{ws_url}: {injected_status}")
+        injected_status = eval_result.get("result", {}).get("value", "Failed to inject")
+        logger.debug(f"[{label}] {injected_status}")
 
-        # Listen for console entries
         while True:
-            response_raw = await ws.recv()
-            response = json.loads(response_raw)
-
-            if response.get("method") == "Runtime.consoleAPICalled":
-                call_type = response.get("params", {}).get("type")
-                args = response.get("params", {}).get("args", [])
-
-                # Check if it's a log message with our specific prefix
-                if call_type == "log" and len(args) >= 1:
-                    first_arg_value = args[0].get("value")
-
-                    # --- Handle BROCC_DEBUG messages ---
-                    if first_arg_value == "BROCC_DEBUG: Injecting listeners...":
-                        logger.info(f"[{ws_url[-10:]}] JS Injection: Starting setup.")
-                    elif first_arg_value == "BROCC_DEBUG: Listeners successfully installed.":
-                        logger.success(
-                            f"[{ws_url[-10:]}] JS Injection: Listeners confirmed installed."
-                        )
-                    # --- Handle BROCC_CLICK_EVENT ---
-                    elif first_arg_value == "BROCC_CLICK_EVENT" and len(args) >= 2:
-                        try:
-                            click_data = json.loads(args[1].get("value", "{}"))
-                            logger.debug(f"Detected click via CDP console: {click_data}")
-                            yield {"type": "click", "data": click_data}
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse click event data from CDP console")
-                    elif first_arg_value == "BROCC_SCROLL_EVENT" and len(args) >= 2:
-                        try:
-                            scroll_data = json.loads(args[1].get("value", "{}"))
-                            logger.debug(f"Detected scroll via CDP console: {scroll_data}")
-                            yield {"type": "scroll", "data": scroll_data}
-                        except json.JSONDecodeError:
-                            logger.warning("Failed to parse scroll event data from CDP console")
-
-    except (
-        websockets.ConnectionClosedOK,
-        websockets.ConnectionClosedError,
-        websockets.ConnectionClosed,
-    ) as e:
-        logger.info(f"WebSocket connection closed for {ws_url}: {e}")
+            event = await events.get()
+            if event is None:
+                logger.info(f"CDP session closed for tab {tab_id}")
+                break
+            params = event.get("params", {})
+            if params.get("name") != DOM_CHANGE_BINDING:
+                continue
+            try:
+                data = json.loads(params.get("payload") or "{}")
+                change = DomChange(
+                    added_nodes=int(data.get("added_nodes", 0)),
+                    removed_nodes=int(data.get("removed_nodes", 0)),
+                    text_added=int(data.get("text_added", 0)),
+                    text_removed=int(data.get("text_removed", 0)),
+                    focused=bool(data.get("focused")),
+                )
+            except (json.JSONDecodeError, TypeError, ValueError):
+                logger.warning(f"[{label}] Could not parse DOM change report")
+                continue
+            yield change
+
+    except CdpError as e:
+        logger.info(f"Could not monitor tab {tab_id}: {e}")
+    except ConnectionError as e:
+        logger.info(f"Browser CDP connection closed while monitoring {tab_id}: {e}")
     except asyncio.TimeoutError:
-        logger.warning(f"WebSocket connection attempt timed out for {ws_url}")
+        logger.warning(f"CDP command timed out while setting up monitoring for {tab_id}")
     except Exception as e:
         logger.error(
-            f"Error monitoring interactions for {ws_url}: {type(e).__name__} - {e}", exc_info=True
+            f"Error monitoring DOM changes for {tab_id}: {type(e).__name__} - {e}", exc_info=True
         )
     finally:
-        # Check state before attempting to close
-        if connection and connection.state != websockets.protocol.State.CLOSED:
-            await connection.close()
-            logger.debug(f"Closed WebSocket connection for {ws_url}")
-        # This generator stops yielding when an error occurs or connection closes.
+        # The session stays attached for fetches; only drop this monitor's queue
+        if events is not None:
+            cdp.unsubscribe(session_id, events)
+
+
+class DeltaCursor(NamedTuple):
+    """Position in a document's capture sequence; deltas continue from here."""
+
+    doc_id: str  # Random per document (and per observer install), so reloads reset it
+    seq: int
+
+
+class DomDelta(NamedTuple):
+    cursor: DeltaCursor  # Pass to the next get_tab_html_delta call
+    url: str
+    fragments: List[str]  # outerHTML of the subtrees added since the previous cursor
+
+
+async def _call_delta_function(
+    cdp: CdpBrowserSession, tab_id: str, expression: str
+) -> Optional[Dict[str, Any]]:
+    try:
+        session_id = await cdp.attach(tab_id)
+        result = await cdp.send(
+            "Runtime.evaluate",
+            {"expression": expression, "returnByValue": True},
+            session_id=session_id,
+        )
+    except (CdpError, ConnectionError, asyncio.TimeoutError) as e:
+        logger.debug(f"Delta capture unavailable for tab {tab_id}: {e}")
+        return None
+    value = result.get("result", {}).get("value")
+    return value if isinstance(value, dict) else None
+
+
+async def start_tab_html_delta(cdp: CdpBrowserSession, tab_id: str) -> Optional[DeltaCursor]:
+    """
+    Start a delta sequence for the tab; call right before taking a full snapshot.
+
+    Returns None if the tab has no DOM change observer (see monitor_dom_changes).
+    Elements added between this call and the snapshot can show up in both.
+    """
+    value = await _call_delta_function(
+        cdp, tab_id, "window.__broccDeltaStart && window.__broccDeltaStart()"
+    )
+    if not value:
+        return None
+    return DeltaCursor(str(value["doc_id"]), int(value["seq"]))
+
+
+async def get_tab_html_delta(
+    cdp: CdpBrowserSession, tab_id: str, since: DeltaCursor
+) -> Optional[DomDelta]:
+    """
+    HTML of the subtrees added to the tab since the cursor, instead of the whole document.
+
+    Returns None when a delta can't continue from the cursor (new document, missed
+    capture, too many changes, no observer); the caller should take a full snapshot.
+    """
+    expression = (
+        "window.__broccDeltaTake && "
+        f"window.__broccDeltaTake({json.dumps(since.doc_id)}, {since.seq})"
+    )
+    value = await _call_delta_function(cdp, tab_id, expression)
+    if not value or value.get("reset"):
+        return None
+    return DomDelta(
+        cursor=DeltaCursor(str(value["doc_id"]), int(value["seq"])),
+        url=str(value.get("url", "")),
+        fragments=[fragment for fragment in value.get("fragments", []) if fragment],
+    )
+
+
+TAB_VISIBILITY_TIMEOUT = 1.0  # Discarded or hung tabs never answer; treat them as hidden
+
+
+async def get_tab_visibility(cdp: CdpBrowserSession, tab_id: str) -> str:
+    """ "focused", "visible" or "hidden" (also when the tab doesn't answer in time)."""
+    try:
+        session_id = await cdp.attach(tab_id)
+        result = await cdp.send(
+            "Runtime.evaluate",
+            {
+                "expression": 'document.hasFocus() ? "focused" : document.visibilityState',
+                "returnByValue": True,
+            },
+            session_id=session_id,
+            timeout=TAB_VISIBILITY_TIMEOUT,
+        )
+    except (CdpError, ConnectionError, asyncio.TimeoutError) as e:
+        logger.debug(f"Could not read visibility of tab {tab_id}: {e}")
+        return "hidden"
+    value = result.get("result", {}).get("value")
+    return value if value in ("focused", "visible") else "hidden"
@@ -1,11 +1,26 @@
 import asyncio
+import math
 import os
+import time
 from enum import Enum
 from typing import Dict, List, NamedTuple, Optional, Tuple
 
+import aiohttp
 from rich.console import Console
 
-from brocc_li.chrome_cdp import get_chrome_info, get_tab_html_content, get_tabs
+from brocc_li.capture_scheduler import CapturePriority, CaptureScheduler
+from brocc_li.chrome_cdp import (
+    ChromeTab,
+    DeltaCursor,
+    DomDelta,
+    get_chrome_info,
+    get_tab_html_content,
+    get_tab_html_delta,
+    get_tab_visibility,
+    get_tabs,
+    start_tab_html_delta,
+)
+from brocc_li.chrome_session import CdpBrowserSession
 from brocc_li.utils.chrome import (
     is_chrome_debug_port_active,
     is_chrome_process_running,
@@ -20,6 +35,9 @@ from brocc_li.utils.logger import logger
 CPU_COUNT = os.cpu_count() or 1  # Default to 1 if cpu_count returns None
 MAX_WORKERS = min(10, CPU_COUNT + 4)
 
+# Seconds a /json/list result is reused, so a batch of lookups makes one listing call
+TAB_LIST_TTL = 1.0
+
 
 class ChromeState(NamedTuple):
     is_running: bool
@@ -40,6 +58,14 @@ class ChromeManager:
         self._state: ChromeState = ChromeState(False, False)  # Initial state
         self._connected: bool = False
         self._initialized = False
+        self._cdp: Optional[CdpBrowserSession] = None  # Shared browser-level connection
+        self._cdp_lock = asyncio.Lock()
+        self._http: Optional[aiohttp.ClientSession] = None  # Pooled client for /json/*
+        self._tab_list: Dict[str, ChromeTab] = {}  # tab id -> tab, from the last /json/list
+        self._tab_list_at = -math.inf  # time.monotonic() of the last /json/list
+        self._tab_list_lock = asyncio.Lock()
+        # Every tab capture (batch fetches here, change-triggered ones in ChromeTabs)
+        self.capture_scheduler = CaptureScheduler()
 
     async def _ensure_initialized(self):
         """Ensure async initialization has been performed"""
@@ -57,7 +83,7 @@ class ChromeManager:
         """Tests connection to Chrome debug port, updates status"""
         try:
             # Try to connect - directly use async function
-            chrome_info = await get_chrome_info()
+            chrome_info = await get_chrome_info(self.http_session())
             if chrome_info["connected"]:
                 self._connected = True
                 if not quiet:
@@ -74,7 +100,7 @@ class ChromeManager:
 
     async def _get_chrome_state(self) -> ChromeState:
         """Get the current state of Chrome (running and debug port status)."""
-        has_debug_port = await is_chrome_debug_port_active()
+        has_debug_port = await is_chrome_debug_port_active(session=self.http_session())
         is_running = has_debug_port or await is_chrome_process_running()
         return ChromeState(
             is_running=is_running,
@@ -136,7 +162,7 @@ class ChromeManager:
                 logger.debug("Chrome already running with debug port. Attempting to connect...")
 
             # Get connection status and version in one call - directly use async function
-            chrome_info = await get_chrome_info()
+            chrome_info = await get_chrome_info(self.http_session())
             if chrome_info["connected"]:
                 self._connected = True
                 if not quiet:
@@ -182,7 +208,7 @@ class ChromeManager:
                 logger.debug("Attempting to connect to newly launched Chrome...")
 
             # Check connection directly instead of using helper method
-            chrome_info = await get_chrome_info()
+            chrome_info = await get_chrome_info(self.http_session())
             chrome_connected = chrome_info["connected"]
 
             if chrome_connected:
@@ -202,14 +228,37 @@ class ChromeManager:
                 logger.error("Failed to launch Chrome. Cannot connect.")
             return False
 
+    def http_session(self) -> aiohttp.ClientSession:
+        """Pooled HTTP client for the DevTools /json endpoints, created on first use."""
+        if self._http is None or self._http.closed:
+            self._http = aiohttp.ClientSession(connector=aiohttp.TCPConnector(limit=MAX_WORKERS))
+        return self._http
+
+    async def list_tabs(self, max_age: float = TAB_LIST_TTL) -> List[ChromeTab]:
+        """
+        Open tabs from /json/list, reusing the last listing if it is under max_age seconds old.
+
+        Concurrent callers wait for one request instead of each listing the tabs.
+        """
+        async with self._tab_list_lock:
+            if time.monotonic() - self._tab_list_at > max_age:
+                tabs = await get_tabs(self.http_session())
+                self._tab_list = {tab.id: tab for tab in tabs}
+                self._tab_list_at = time.monotonic()
+            return list(self._tab_list.values())
+
+    async def get_tab(self, tab_id: str, max_age: float = TAB_LIST_TTL) -> Optional[ChromeTab]:
+        """A single tab from the (cached) tab list, or None if it isn't open."""
+        await self.list_tabs(max_age)
+        return self._tab_list.get(tab_id)
+
     async def get_all_tabs(self) -> List[dict]:
         """
         Get information about all open tabs in Chrome using CDP HTTP API:
         - Title, URL, ID, window_id, webSocketDebuggerUrl, devtoolsFrontendUrl
         """
         await self._ensure_initialized()
-        # Directly use async function
-        tabs_data = await get_tabs()
+        tabs_data = await self.list_tabs()
 
         # Convert the Pydantic models to dictionaries for backward compatibility
         tabs = []
@@ -224,10 +273,53 @@ class ChromeManager:
 
         return tabs
 
+    async def cdp_session(self) -> CdpBrowserSession:
+        """
+        The browser-level CDP connection shared by all fetches and monitors.
+
+        Opened on first use and reopened if Chrome dropped it.
+        """
+        async with self._cdp_lock:
+            if self._cdp is not None and self._cdp.connected:
+                return self._cdp
+            chrome_info = await get_chrome_info(self.http_session())
+            data = chrome_info["data"]
+            ws_url = data.get("webSocketDebuggerUrl") if isinstance(data, dict) else None
+            if not isinstance(ws_url, str) or not ws_url:
+                raise ConnectionError("Chrome did not report a browser WebSocket URL")
+            cdp = CdpBrowserSession()
+            await cdp.connect(ws_url)
+            self._cdp = cdp
+            return cdp
+
+    async def close_cdp_session(self) -> None:
+        """Close the shared CDP connection (detaches from every tab)."""
+        async with self._cdp_lock:
+            if self._cdp is not None:
+                await self._cdp.close()
+                self._cdp = None
+
+    async def close(self) -> None:
+        """
+        Cancel scheduled captures, close the CDP connection and the pooled HTTP client;
+        both reopen on next use.
+        """
+        self.capture_scheduler.cancel_all()
+        await self.close_cdp_session()
+        if self._http is not None:
+            await self._http.close()
+            self._http = None
+        self._tab_list = {}
+        self._tab_list_at = -math.inf
+
     async def get_tab_html(self, tab_id: str) -> Tuple[Optional[str], Optional[str]]:
         """
         Get the HTML content and the final URL from a specific tab using its ID via CDP.
 
+        Runs over the shared browser connection, so there is no per-fetch connection
+        setup; the tab list is only consulted (through the TTL cache) when CDP can't
+        report the URL.
+
         Args:
             tab_id: The ID of the tab to get HTML from
 
@@ -239,35 +331,79 @@ class ChromeManager:
             logger.error("Chrome debug port is not active. Cannot get tab HTML.")
             return None, None
 
-        # Refresh our state first to ensure we have the latest connection status
-        self._state = await self._get_chrome_state()
+        try:
+            cdp = await self.cdp_session()
+        except Exception as e:
+            logger.error(f"Could not open CDP connection to Chrome: {e}")
+            return None, None
 
-        final_url: Optional[str] = None  # Keep track of the best URL we find
+        html, final_url = await get_tab_html_content(cdp, tab_id)
+        if not final_url:
+            # Fall back to the URL target discovery last reported for the tab, then to the
+            # tab list (shared by every failed fetch in a batch)
+            final_url = cdp.targets.get(tab_id, {}).get("url")
+        if not final_url:
+            tab = await self.get_tab(tab_id)
+            final_url = tab.url if tab else None
+        return html, final_url
 
-        tabs = await get_tabs()
-        tab = next((t for t in tabs if t.id == tab_id), None)
+    async def start_tab_delta(self, tab_id: str) -> Optional[DeltaCursor]:
+        """Start a delta sequence for a monitored tab, right before a full get_tab_html."""
+        try:
+            cdp = await self.cdp_session()
+        except Exception as e:
+            logger.debug(f"Could not open CDP connection to Chrome: {e}")
+            return None
+        return await start_tab_html_delta(cdp, tab_id)
 
-        if tab:
-            final_url = tab.url
-        if not tab or not tab.webSocketDebuggerUrl:
-            logger.error(f"Tab with ID {tab_id} not found or has no WebSocket URL")
-            return None, final_url
+    async def get_tab_delta(self, tab_id: str, since: DeltaCursor) -> Optional[DomDelta]:
+        """
+        HTML of the subtrees added to a monitored tab since the cursor.
 
-        ws_url = tab.webSocketDebuggerUrl
-        html, cdp_url = await get_tab_html_content(ws_url)
-        if cdp_url:  # Update URL if CDP returned one
-            final_url = cdp_url
+        Returns None if the caller needs a full get_tab_html instead.
+        """
+        try:
+            cdp = await self.cdp_session()
+        except Exception as e:
+            logger.debug(f"Could not open CDP connection to Chrome: {e}")
+            return None
+        return await get_tab_html_delta(cdp, tab_id, since)
 
-        return html, final_url
+    async def get_tab_visibilities(self, tab_ids: List[str]) -> Dict[str, str]:
+        """
+        tab id -> "focused", "visible" or "hidden". Tabs are probed (attach plus an
+        evaluate each) as many at a time as the capture scheduler runs captures.
+        """
+        try:
+            cdp = await self.cdp_session()
+        except Exception as e:
+            logger.debug(f"Could not open CDP connection to Chrome: {e}")
+            return dict.fromkeys(tab_ids, "hidden")
+        limit = asyncio.Semaphore(self.capture_scheduler.max_concurrent)
+
+        async def probe(tab_id: str) -> str:
+            async with limit:
+                return await get_tab_visibility(cdp, tab_id)
+
+        states = await asyncio.gather(*(probe(tab_id) for tab_id in tab_ids))
+        return dict(zip(tab_ids, states, strict=True))
 
     async def get_html_for_tabs(
-        self, tabs: List[dict]
+        self,
+        tabs: List[dict],
+        priority: CapturePriority = CapturePriority.CHANGED,
+        focused_tab_id: Optional[str] = None,
     ) -> List[Tuple[dict, Optional[str], Optional[str]]]:
         """
         Get HTML content and final URLs from multiple tabs via CDP.
 
+        Fetches go through the capture scheduler, so they share its concurrency and per-host
+        caps with every other capture, and join a fetch already queued for the same tab.
+
         Args:
             tabs: List of tab dictionaries containing id and other info
+            priority: Scheduling priority for these fetches
+            focused_tab_id: A tab in the batch the user is looking at; it goes first
 
         Returns:
             List of (tab_dict, html | None, final_url | None) tuples
@@ -281,38 +417,41 @@ class ChromeManager:
             return []
 
         console.print(f"[cyan]get_html_for_tabs: processing {len(tabs)} tabs...[/cyan]")
-        semaphore = asyncio.Semaphore(5)  # Limit to 5 concurrent CDP tasks
 
         async def process_tab_with_cdp_async(tab):
-            async with semaphore:  # Acquire semaphore before running
-                tab_id = tab.get("id")
-                title = tab.get("title", "Untitled")
-                short_title = (title[:30] + "...") if len(title) > 30 else title
-
-                console.print(f"[dim]get_tab_html: {short_title}...[/dim]")
-                html: Optional[str] = None
-                url: Optional[str] = tab.get("url")  # Start with the initial URL
-
-                try:
-                    # This now returns (html, url) and only uses CDP
-                    html, url = await self.get_tab_html(tab_id)
-
-                except asyncio.TimeoutError:
-                    console.print(f"[red]⌛[/red] get_tab_html: {short_title} timed out")
-                    # html remains None, url might be updated
-                except Exception as e:  # Catch other potential errors during CDP
-                    console.print(f"[red]✗[/red] get_tab_html: {short_title}: {e}")
-                    # html remains None, url might be updated
-
-                if not html:
-                    console.print(f"[yellow]get_tab_html: {short_title} failed[/yellow]")
-                else:
-                    console.print(f"[green]✓[/green] get_tab_html: {short_title} from {url}")
-                # Store the URL found by CDP, even if it failed
-                if tab_id and url:
-                    cdp_fetched_urls[tab_id] = url
-
-                return tab, html, url
+            tab_id = tab.get("id")
+            title = tab.get("title", "Untitled")
+            short_title = (title[:30] + "...") if len(title) > 30 else title
+
+            console.print(f"[dim]get_tab_html: {short_title}...[/dim]")
+            html: Optional[str] = None
+            url: Optional[str] = tab.get("url")  # Start with the initial URL
+
+            try:
+                # This now returns (html, url) and only uses CDP
+                html, url = await self.capture_scheduler.run(
+                    ("html", tab_id),
+                    url,
+                    CapturePriority.FOCUSED if tab_id == focused_tab_id else priority,
+                    lambda: self.get_tab_html(tab_id),
+                )
+
+            except asyncio.TimeoutError:
+                console.print(f"[red]⌛[/red] get_tab_html: {short_title} timed out")
+                # html remains None, url might be updated
+            except Exception as e:  # Catch other potential errors during CDP
+                console.print(f"[red]✗[/red] get_tab_html: {short_title}: {e}")
+                # html remains None, url might be updated
+
+            if not html:
+                console.print(f"[yellow]get_tab_html: {short_title} failed[/yellow]")
+            else:
+                console.print(f"[green]✓[/green] get_tab_html: {short_title} from {url}")
+            # Store the URL found by CDP, even if it failed
+            if tab_id and url:
+                cdp_fetched_urls[tab_id] = url
+
+            return tab, html, url
 
         # Process all tabs in parallel
         cdp_results = await asyncio.gather(*[process_tab_with_cdp_async(tab) for tab in tabs])
@@ -0,0 +1,245 @@
+"""
+One multiplexed DevTools connection to the browser target.
+
+Every HTML fetch and interaction monitor used to open its own WebSocket to a page target
+and re-send Page.enable / DOM.enable / Runtime.enable before doing any work. A
+CdpBrowserSession keeps a single socket to the browser endpoint (`webSocketDebuggerUrl`
+from /json/version) and runs all page traffic over it.
+
+Structure:
+- One reader task owns the socket. Responses resolve the future registered under their
+  command id; events are routed by sessionId to subscriber queues.
+- Pages are attached with Target.attachToTarget(flatten=True), so their commands travel on
+  the same socket tagged with a sessionId. Sessions and enabled domains are cached per
+  target: repeated fetches skip the attach and *.enable round trips.
+- Target.setDiscoverTargets keeps `targets` (targetId -> TargetInfo) current from
+  targetCreated / targetInfoChanged / targetDestroyed events.
+
+Gotchas:
+- Attaching marks a target as attached, and /json/list then omits webSocketDebuggerUrl
+  for it. Don't use that field to decide whether a tab can be fetched.
+- When the socket closes, pending commands fail with ConnectionError and every subscriber
+  queue receives None. `ChromeManager.cdp_session()` opens a new session on next use.
+"""
+
+import asyncio
+import itertools
+import json
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+
+import websockets
+
+from brocc_li.utils.logger import logger
+
+CONNECT_TIMEOUT = 5.0
+COMMAND_TIMEOUT = 10.0
+MAX_MESSAGE_SIZE = 20 * 1024 * 1024  # default is 1mb, page HTML can be much larger
+
+# Browser-level events that keep `targets` current
+TARGET_LIFECYCLE_EVENTS = [
+    "Target.targetCreated",
+    "Target.targetInfoChanged",
+    "Target.targetDestroyed",
+]
+
+CdpEvent = Dict[str, Any]
+CdpResult = Dict[str, Any]
+EventQueue = asyncio.Queue[Optional[CdpEvent]]
+
+
+class CdpError(Exception):
+    """A CDP command returned an error response."""
+
+
+class CdpBrowserSession:
+    """A browser-level CDP connection shared by every page fetch and monitor."""
+
+    def __init__(self):
+        self._ws: Optional[websockets.ClientConnection] = None
+        self._reader: Optional[asyncio.Task[None]] = None
+        self._ids = itertools.count(1)
+        self._pending: Dict[int, asyncio.Future[CdpResult]] = {}  # command id -> response future
+        self._sessions: Dict[str, str] = {}  # target id -> session id
+        self._attach_locks: Dict[str, asyncio.Lock] = {}  # target id -> lock
+        # session id -> domain -> (possibly in-flight) enable request
+        self._enabled: Dict[str, Dict[str, asyncio.Future[CdpResult]]] = {}
+        # session id (None for browser-level events) -> [(method filter, queue)]
+        self._subscribers: Dict[Optional[str], List[Tuple[Optional[Set[str]], EventQueue]]] = {}
+        self.targets: Dict[str, Dict[str, Any]] = {}  # target id -> TargetInfo
+
+    @property
+    def connected(self) -> bool:
+        return self._reader is not None and not self._reader.done()
+
+    async def connect(self, ws_url: str) -> None:
+        """Open the socket, start routing messages and subscribe to target discovery."""
+        logger.debug(f"Connecting to browser via WebSocket: {ws_url}")
+        try:
+            self._ws = await websockets.connect(
+                ws_url,
+                open_timeout=CONNECT_TIMEOUT,
+                close_timeout=CONNECT_TIMEOUT,
+                max_size=MAX_MESSAGE_SIZE,
+            )
+        except websockets.InvalidStatus as e:
+            if e.response.status_code == 403:
+                logger.error(
+                    "Chrome rejected WebSocket connection. "
+                    "Please relaunch Chrome with --remote-allow-origins=* flag. "
+                    "You may need to quit all Chrome instances and restart the app."
+                )
+            raise
+        self._reader = asyncio.create_task(self._read_loop(self._ws))
+        await self.send("Target.setDiscoverTargets", {"discover": True})
+
+    async def close(self) -> None:
+        if self._ws is not None:
+            await self._ws.close()
+        if self._reader is not None:
+            try:
+                await asyncio.wait_for(self._reader, timeout=CONNECT_TIMEOUT)
+            except (asyncio.TimeoutError, asyncio.CancelledError):
+                self._reader.cancel()
+
+    async def send(
+        self,
+        method: str,
+        params: Optional[Dict[str, Any]] = None,
+        session_id: Optional[str] = None,
+        timeout: float = COMMAND_TIMEOUT,
+    ) -> CdpResult:
+        """Send a command (to a page if session_id is given) and return its result."""
+        if self._ws is None or not self.connected:
+            raise ConnectionError("CDP session is not connected")
+        msg_id = next(self._ids)
+        command: Dict[str, Any] = {"id": msg_id, "method": method}
+        if params:
+            command["params"] = params
+        if session_id:
+            command["sessionId"] = session_id
+
+        future: asyncio.Future[CdpResult] = asyncio.get_running_loop().create_future()
+        self._pending[msg_id] = future
+        try:
+            await self._ws.send(json.dumps(command))
+            return await asyncio.wait_for(future, timeout=timeout)
+        finally:
+            self._pending.pop(msg_id, None)
+
+    async def attach(self, target_id: str) -> str:
+        """Session id for a page target, attaching on first use."""
+        session_id = self._sessions.get(target_id)
+        if session_id:
+            return session_id
+        # Concurrent callers for the same target share one attach
+        async with self._attach_locks.setdefault(target_id, asyncio.Lock()):
+            session_id = self._sessions.get(target_id)
+            if session_id:
+                return session_id
+            result = await self.send(
+                "Target.attachToTarget", {"targetId": target_id, "flatten": True}
+            )
+            session_id = result["sessionId"]
+            self._sessions[target_id] = session_id
+            return session_id
+
+    async def enable(self, session_id: str, domain: str) -> None:
+        """Enable a domain (e.g. "Page", "DOM") once per page session."""
+        enabling = self._enabled.setdefault(session_id, {})
+        request = enabling.get(domain)
+        if request is None:
+            # Concurrent callers wait on the same request; a failed one is retried next time
+            request = asyncio.ensure_future(self.send(f"{domain}.enable", session_id=session_id))
+            enabling[domain] = request
+        try:
+            await asyncio.shield(request)
+        except Exception:
+            if enabling.get(domain) is request:
+                enabling.pop(domain, None)
+            raise
+
+    def subscribe(
+        self, session_id: Optional[str], methods: Optional[Iterable[str]] = None
+    ) -> EventQueue:
+        """
+        Queue of events for a page session (or browser-level events for None), optionally
+        limited to the given methods. None is queued when the session or socket goes away.
+        """
+        queue: EventQueue = asyncio.Queue()
+        method_filter = set(methods) if methods is not None else None
+        self._subscribers.setdefault(session_id, []).append((method_filter, queue))
+        return queue
+
+    def unsubscribe(self, session_id: Optional[str], queue: EventQueue) -> None:
+        subscribers = self._subscribers.get(session_id)
+        if not subscribers:
+            return
+        subscribers[:] = [entry for entry in subscribers if entry[1] is not queue]
+        if not subscribers:
+            self._subscribers.pop(session_id, None)
+
+    async def _read_loop(self, ws: websockets.ClientConnection) -> None:
+        try:
+            async for raw in ws:
+                message = json.loads(raw)
+                if "id" in message:
+                    self._resolve(message)
+                else:
+                    self._dispatch(message)
+        except websockets.ConnectionClosed as e:
+            logger.info(f"Browser CDP connection closed: {e}")
+        except Exception as e:
+            logger.error(f"Browser CDP reader failed: {type(e).__name__} - {e}")
+        finally:
+            self._teardown()
+
+    def _resolve(self, message: Dict[str, Any]) -> None:
+        future = self._pending.get(message["id"])
+        if future is None or future.done():
+            return
+        if "error" in message:
+            future.set_exception(CdpError(message["error"].get("message", "Unknown error")))
+        else:
+            future.set_result(message.get("result", {}))
+
+    def _dispatch(self, message: CdpEvent) -> None:
+        method = message.get("method")
+        params = message.get("params", {})
+        if method in ("Target.targetCreated", "Target.targetInfoChanged"):
+            info = params.get("targetInfo", {})
+            if info.get("targetId"):
+                self.targets[info["targetId"]] = info
+        elif method == "Target.targetDestroyed":
+            target_id = params.get("targetId")
+            self.targets.pop(target_id, None)
+            self._attach_locks.pop(target_id, None)
+        elif method == "Target.detachedFromTarget":
+            self._forget_session(params.get("sessionId"))
+
+        session_id = message.get("sessionId")
+        for method_filter, queue in self._subscribers.get(session_id, []):
+            if method_filter is None or method in method_filter:
+                queue.put_nowait(message)
+
+    def _forget_session(self, session_id: Optional[str]) -> None:
+        if not session_id:
+            return
+        self._sessions = {
+            target: session for target, session in self._sessions.items() if session != session_id
+        }
+        self._enabled.pop(session_id, None)
+        for _, queue in self._subscribers.pop(session_id, []):
+            queue.put_nowait(None)
+
+    def _teardown(self) -> None:
+        for future in self._pending.values():
+            if not future.done():
+                future.set_exception(ConnectionError("CDP connection closed"))
+        self._pending.clear()
+        for subscribers in self._subscribers.values():
+            for _, queue in subscribers:
+                queue.put_nowait(None)
+        self._subscribers.clear()
+        self._sessions.clear()
+        self._enabled.clear()
+        self.targets.clear()
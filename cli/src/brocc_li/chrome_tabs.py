@@ -3,25 +3,35 @@ import shutil
 import signal
 import time
 from pathlib import Path
-from typing import Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Union
+from typing import Any, Awaitable, Callable, Dict, List, NamedTuple, Optional, Set, Tuple, Union
 
 from rich.console import Console
 from rich.markup import escape
 
-from brocc_li.chrome_cdp import ChromeTab, get_chrome_info, get_tabs, monitor_user_interactions
+from brocc_li.capture_scheduler import CapturePriority
+from brocc_li.chrome_cdp import (
+    ChromeTab,
+    DeltaCursor,
+    DomChange,
+    get_chrome_info,
+    monitor_dom_changes,
+    tabs_from_targets,
+)
 from brocc_li.chrome_manager import ChromeManager
-from brocc_li.html_to_md import html_to_md
-from brocc_li.merge_md import MergeResultType, merge_md
+from brocc_li.chrome_session import TARGET_LIFECYCLE_EVENTS, CdpBrowserSession, EventQueue
+from brocc_li.html_to_md import ConvertedPage, convert_page
+from brocc_li.merge_md import MergeResultType, append_md, merge_md
+from brocc_li.tab_state import TabReference, TabStateStore
 from brocc_li.utils.logger import logger
 from brocc_li.utils.slugify import slugify
 
 
-class TabReference(NamedTuple):
-    id: str
-    url: str
-    markdown: str
-    html: Optional[str] = None
-    title: Optional[str] = None
+class DeltaState(NamedTuple):
+    """Where a tab's delta captures continue from, and when it needs a full snapshot."""
+
+    cursor: DeltaCursor
+    deltas: int  # Deltas applied since the last full snapshot
+    snapshot_at: float  # time.monotonic() of the last full snapshot
 
 
 class TabChangeEvent(NamedTuple):
@@ -46,31 +56,68 @@ InteractionTabUpdateCallback = Union[
     Callable[[TabReference], Awaitable[None]],
 ]
 
-DEBOUNCE_DELAY_SECONDS = 0.75  # Time to wait after last interaction before fetching
+RecentlyStoredLookup = Callable[[List[str]], Set[str]]
+
+# A tab is re-fetched once the DOM changes since its last fetch reach either threshold
+CHANGE_TEXT_THRESHOLD = 200  # Characters of inserted text
+CHANGE_NODE_THRESHOLD = 50  # Inserted elements
+# Content changes are captured as deltas (added subtrees only) between full snapshots,
+# which also pick up edits and removals that deltas don't carry
+FULL_SNAPSHOT_EVERY_DELTAS = 10
+FULL_SNAPSHOT_INTERVAL_SECONDS = 120.0
+TARGET_EVENT_COALESCE_SECONDS = 0.1  # Window for batching a burst of target events
+CONSISTENCY_CHECK_INTERVAL = 30.0  # Tab list poll backing up target events
+NAVIGATION_MONITOR_DELAY = 1.0  # Lets the new document load before listeners are injected
+NAVIGATION_CAPTURE_DELAY = 1.0  # Lets the new document load before its first capture
+
+
+async def convert_page_in_thread(html: Optional[str], url: Optional[str]) -> ConvertedPage:
+    """
+    convert_page in a worker thread (empty markdown if there's no HTML). Conversion is
+    CPU-bound and waits on the parser pool, so on the event loop it would stall every
+    monitor and fetch meanwhile.
+    """
+    if not html:
+        return ConvertedPage("")
+    return await asyncio.to_thread(convert_page, html, url)
 
 
 class ChromeTabs:
     """Handles monitoring Chrome tabs and detecting changes."""
 
-    def __init__(self, chrome_manager: ChromeManager, check_interval: float = 2.0):
+    def __init__(
+        self,
+        chrome_manager: ChromeManager,
+        check_interval: float = CONSISTENCY_CHECK_INTERVAL,
+        recently_stored: Optional[RecentlyStoredLookup] = None,
+    ):
         """
         Args:
             chrome_manager: ChromeManager instance to use for Chrome interactions
-            check_interval: How often to check for tab changes, in seconds
+            check_interval: How often to poll the tab list as a consistency check on
+                target events, in seconds
+            recently_stored: Given the URLs of background tabs open at startup, returns
+                those stored recently enough that capturing them again can wait for a
+                change. Runs in a worker thread.
         """
         self.chrome_manager = chrome_manager
         self.check_interval = check_interval
-        self.previous_tab_refs: Set[TabReference] = set()
+        self.recently_stored = recently_stored
+        self.tab_states = TabStateStore()  # tab_id -> current TabReference
         self.last_tabs_check = 0
         self._monitoring = False
         self._on_polling_change_callback: Optional[PollingTabChangeCallback] = None
         self._on_interaction_update_callback: Optional[InteractionTabUpdateCallback] = None
         self._monitor_task = None  # Task for the main polling loop
+        self._startup_task: Optional[asyncio.Task[None]] = None  # Capture of initial tabs
 
         # State for interaction monitoring and debouncing
         self._interaction_monitors: Dict[str, asyncio.Task] = {}  # tab_id -> Task
-        self._debounce_timers: Dict[str, asyncio.TimerHandle] = {}  # tab_id -> TimerHandle
-        self._interaction_fetch_tasks: Dict[str, asyncio.Task] = {}  # tab_id -> Task fetching HTML
+        self._focused_tab_id: Optional[str] = None  # Last tab whose page reported focus
+        self._pending_changes: Dict[str, DomChange] = {}  # tab_id -> changes below threshold
+        self._delta_states: Dict[str, DeltaState] = {}  # tab_id -> delta capture position
+        # tab_id -> pending monitor start after a navigation
+        self._monitor_restarts: Dict[str, asyncio.TimerHandle] = {}
 
     async def start_monitoring(
         self,
@@ -82,7 +129,8 @@ class ChromeTabs:
 
         Args:
             on_polling_change_callback: Callback for new/closed/navigated tabs detected by polling.
-            on_interaction_update_callback: Callback for single tab content updates triggered by interaction.
+            on_interaction_update_callback: Callback for single tab content updates triggered by
+                in-page DOM changes (infinite scroll, expanded threads, ...).
 
         Returns:
             bool: True if monitoring started successfully
@@ -104,83 +152,146 @@ class ChromeTabs:
                 logger.error("Failed to connect to Chrome. Cannot monitor tabs.")
                 return False
 
-        # Get initial tabs and their HTML
+        # Record the initial tabs without their content; capturing it happens in the
+        # background, so monitoring starts in the same time however many tabs are open
         logger.debug("Getting initial tabs...")
-        initial_cdp_tabs: List[ChromeTab] = await get_tabs()  # Get full ChromeTab objects
+        initial_cdp_tabs: List[ChromeTab] = await self.chrome_manager.list_tabs()
 
-        # Filter for HTTP/HTTPS and valid websocket URLs
-        filtered_initial_tabs_with_ws = [
-            tab
-            for tab in initial_cdp_tabs
-            if tab.url.startswith(("http://", "https://")) and tab.webSocketDebuggerUrl
+        # Filter for HTTP/HTTPS tabs. Not on webSocketDebuggerUrl: /json/list omits it for
+        # tabs our shared CDP connection is attached to.
+        filtered_initial_tabs = [
+            tab for tab in initial_cdp_tabs if tab.url.startswith(("http://", "https://"))
         ]
-        logger.debug(
-            f"Found {len(filtered_initial_tabs_with_ws)} initial HTTP/HTTPS tabs with WebSocket URLs."
+        self.tab_states.clear()
+        for tab in filtered_initial_tabs:
+            self.tab_states.put(TabReference(id=tab.id, url=tab.url, markdown="", title=tab.title))
+        # Captures are dropped for tabs that move on from these before their turn comes
+        recorded = {tab.id: self.tab_states.version(tab.id) for tab in filtered_initial_tabs}
+        logger.debug(f"Recorded {len(filtered_initial_tabs)} initial HTTP/HTTPS tabs.")
+
+        # Start the main monitoring task; the tab list was just read, so the first
+        # consistency check can wait a full interval
+        self._monitoring = True
+        self.last_tabs_check = time.monotonic()
+        self._monitor_task = asyncio.create_task(self._monitor_loop())
+        self._startup_task = asyncio.create_task(
+            self._capture_startup_tabs(filtered_initial_tabs, recorded)
         )
+        logger.info(
+            f"Started async monitoring. Consistency check interval: {self.check_interval}s. Capturing {len(filtered_initial_tabs)} initial tabs in the background."
+        )
+        return True
 
-        # Get initial HTML content in parallel
-        if filtered_initial_tabs_with_ws:
-            # Convert ChromeTab models to simple dicts for get_parallel_tab_html if needed
-            # (Assuming get_parallel_tab_html expects dicts for now)
-            initial_tabs_dict = [tab.model_dump() for tab in filtered_initial_tabs_with_ws]
-
-            initial_tabs_with_html = await self.chrome_manager.get_html_for_tabs(initial_tabs_dict)
-
-            # Convert HTML to MD and create references
-            logger.debug(
-                f"Converting initial HTML to Markdown for {len(initial_tabs_with_html)} tabs..."
+    async def _capture_startup_tabs(self, tabs: List[ChromeTab], recorded: Dict[str, int]) -> None:
+        """
+        Captures the tabs that were open when monitoring started: visible tabs first, then
+        background tabs one by one at the lowest priority, skipping URLs stored recently.
+        Each capture is reported to the polling callback as a new tab.
+        """
+        try:
+            visibility = await self.chrome_manager.get_tab_visibilities([tab.id for tab in tabs])
+            for tab_id, state in visibility.items():
+                if state == "focused":
+                    self._focused_tab_id = tab_id
+            visible = [tab for tab in tabs if visibility.get(tab.id) != "hidden"]
+            background = [tab for tab in tabs if visibility.get(tab.id) == "hidden"]
+            logger.info(
+                f"Startup capture: {len(visible)} visible tabs first, then {len(background)} background tabs."
             )
-            self.previous_tab_refs = set()
-            for tab_dict, html, fetched_url in initial_tabs_with_html:
-                tab_id = tab_dict.get("id")
-                # Use the URL returned by the fetch, fallback to dict URL if needed
-                tab_url = fetched_url or tab_dict.get("url")
-                if tab_id and tab_url:
-                    original_html = html  # Store original HTML
-                    if html:
-                        # Pass the fetched URL to html_to_md
-                        markdown = html_to_md(html, tab_url)
-                        if markdown is None:  # Handle conversion failure
-                            logger.warning(
-                                f"Initial Markdown conversion failed for {tab_url}, storing empty."
-                            )
-                            markdown = ""
-                    else:
-                        markdown = ""  # No HTML, empty MD
-                    self.previous_tab_refs.add(
-                        TabReference(
-                            id=tab_id,
-                            url=tab_url,
-                            markdown=markdown,
-                            html=original_html,
-                            title=tab_dict.get("title"),
-                        )
-                    )
+            await self._capture_initial_tabs(visible, CapturePriority.CHANGED, tabs, recorded)
 
-            logger.info(f"Processed initial Markdown for {len(self.previous_tab_refs)} tabs.")
-
-            # Start interaction monitors for these initial tabs
-            initial_ws_urls = {
-                tab.id: tab.webSocketDebuggerUrl
-                for tab in filtered_initial_tabs_with_ws
-                if tab.webSocketDebuggerUrl
-            }
-            for tab_ref in self.previous_tab_refs:
-                ws_url = initial_ws_urls.get(tab_ref.id)
-                if ws_url:
-                    self._start_interaction_monitor(tab_ref.id, ws_url)
-                else:
-                    logger.warning(
-                        f"Missing WebSocket URL for initial tab {tab_ref.id}, cannot monitor interactions."
+            recent: Set[str] = set()
+            if self.recently_stored is not None and background:
+                try:
+                    recent = await asyncio.to_thread(
+                        self.recently_stored, [tab.url for tab in background]
                     )
+                except Exception as e:
+                    logger.warning(f"Could not look up recently stored tabs: {e}")
+            if recent:
+                logger.info(f"Startup capture: skipping {len(recent)} recently stored URLs.")
+            for tab in background:
+                if tab.url in recent and tab.id not in self._interaction_monitors:
+                    self._start_interaction_monitor(tab.id)
+            # Queued all at once; the capture scheduler runs them behind any other capture
+            await asyncio.gather(
+                *(
+                    self._capture_initial_tabs([tab], CapturePriority.BACKGROUND, tabs, recorded)
+                    for tab in background
+                    if tab.url not in recent
+                )
+            )
+            logger.info("Startup capture finished.")
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            logger.error(f"Error capturing initial tabs: {e}")
 
-        # Start the main polling monitoring task
-        self._monitoring = True
-        self._monitor_task = asyncio.create_task(self._monitor_loop())
-        logger.info(
-            f"Started async monitoring. Polling interval: {self.check_interval}s. Interaction monitoring active for {len(self._interaction_monitors)} tabs."
+    async def _capture_initial_tabs(
+        self,
+        tabs: List[ChromeTab],
+        priority: CapturePriority,
+        all_tabs: List[ChromeTab],
+        recorded: Dict[str, int],
+    ) -> None:
+        """
+        Fills in the recorded refs for some initial tabs and starts their monitors. recorded
+        holds the version each tab was recorded at.
+        """
+        if not tabs:
+            return
+        fetched = await self.chrome_manager.get_html_for_tabs(
+            [tab.model_dump() for tab in tabs],
+            priority=priority,
+            focused_tab_id=self._focused_tab_id,
         )
-        return True
+        captured: List[Dict[str, Any]] = []
+        # Convert concurrently, off the event loop
+        pages = await asyncio.gather(
+            *(
+                convert_page_in_thread(html, fetched_url or tab_dict["url"])
+                for tab_dict, html, fetched_url in fetched
+            )
+        )
+        for (tab_dict, html, fetched_url), page in zip(fetched, pages, strict=True):
+            tab_id = tab_dict["id"]
+            if not self._monitoring or tab_id not in self.tab_states:
+                continue  # Closed meanwhile
+            tab_url = fetched_url or tab_dict["url"]
+            markdown = page.markdown
+            if markdown is None:
+                logger.warning(f"Initial Markdown conversion failed for {tab_url}, storing empty.")
+                markdown = ""
+            # Unless navigated or captured by a change meanwhile
+            stored = self.tab_states.put(
+                TabReference(
+                    id=tab_id,
+                    url=tab_url,
+                    markdown=markdown,
+                    html=html,
+                    title=tab_dict.get("title"),
+                    metadata=page.metadata,
+                    items=page.items,
+                ),
+                if_version=recorded[tab_id],
+            )
+            if stored:
+                if markdown:
+                    captured.append(tab_dict)
+                else:
+                    self.tab_states.release_html(tab_id)  # Nothing to save
+            if tab_id not in self._interaction_monitors:
+                self._start_interaction_monitor(tab_id)
+
+        if captured:
+            await self._notify_polling_change(
+                TabChangeEvent(
+                    new_tabs=captured,
+                    closed_tabs=[],
+                    navigated_tabs=[],
+                    current_tabs=[tab.model_dump() for tab in all_tabs],
+                )
+            )
 
     async def stop_monitoring(self) -> None:
         """Stop monitoring tabs for changes (async version), including interaction monitors."""
@@ -190,6 +301,10 @@ class ChromeTabs:
 
         self._monitoring = False  # Signal loops to stop
 
+        if self._startup_task and not self._startup_task.done():
+            self._startup_task.cancel()
+        self._startup_task = None
+
         # Stop interaction monitors first
         logger.debug(f"Stopping {len(self._interaction_monitors)} interaction monitors...")
         await self._stop_all_interaction_monitors()
@@ -209,92 +324,118 @@ class ChromeTabs:
                 logger.error(f"Error stopping main polling task: {e}")
 
         # Clear state
-        self.previous_tab_refs = set()
+        self.tab_states.clear()
         self._on_polling_change_callback = None
         self._on_interaction_update_callback = None
         self._monitor_task = None
 
+        # Detach from all tabs and release the pooled HTTP connections
+        await self.chrome_manager.close()
+
         logger.debug("Async tab monitoring stopped completely.")
 
     # --- Interaction Monitoring Logic ---
 
-    def _start_interaction_monitor(self, tab_id: str, ws_url: str):
+    def _start_interaction_monitor(self, tab_id: str):
         """Starts the background task to monitor interactions for a single tab."""
         if tab_id in self._interaction_monitors:
             logger.warning(f"Interaction monitor already running for tab {tab_id}")
             return
 
         logger.debug(f"Starting interaction monitor for tab {tab_id}")
-        task = asyncio.create_task(self._run_interaction_monitor_for_tab(tab_id, ws_url))
+        task = asyncio.create_task(self._run_interaction_monitor_for_tab(tab_id))
         self._interaction_monitors[tab_id] = task
         # Add a callback to remove the task from the dict when it's done
         task.add_done_callback(lambda _task: self._interaction_monitors.pop(tab_id, None))
 
-    async def _run_interaction_monitor_for_tab(self, tab_id: str, ws_url: str):
-        """The actual monitoring loop for a single tab's interactions."""
+    def _start_interaction_monitor_later(self, tab_id: str) -> None:
+        """Starts the tab's interaction monitor after NAVIGATION_MONITOR_DELAY."""
+        pending = self._monitor_restarts.pop(tab_id, None)
+        if pending is not None:
+            pending.cancel()
+        self._monitor_restarts[tab_id] = asyncio.get_running_loop().call_later(
+            NAVIGATION_MONITOR_DELAY, self._start_delayed_monitor, tab_id
+        )
+
+    def _start_delayed_monitor(self, tab_id: str) -> None:
+        self._monitor_restarts.pop(tab_id, None)
+        # Unless monitoring stopped, the tab closed, or something else started it meanwhile
+        if (
+            self._monitoring
+            and tab_id in self.tab_states
+            and tab_id not in self._interaction_monitors
+        ):
+            self._start_interaction_monitor(tab_id)
+
+    async def _run_interaction_monitor_for_tab(self, tab_id: str):
+        """The actual monitoring loop for a single tab's DOM changes."""
         try:
-            async for event in monitor_user_interactions(ws_url):
+            cdp = await self.chrome_manager.cdp_session()
+            async for change in monitor_dom_changes(cdp, tab_id):
                 # Check if monitoring is still active overall and specifically for this tab
                 if not self._monitoring or tab_id not in self._interaction_monitors:
                     logger.debug(f"Interaction monitoring stopped for tab {tab_id}, exiting loop.")
                     break
-                # Process the received click/scroll event
-                await self._handle_interaction_event(tab_id, event.get("type"))
+                self._handle_dom_change(tab_id, change)
         except Exception as e:
-            logger.error(
-                f"Error in interaction monitor for tab {tab_id} ({ws_url}): {e}", exc_info=True
-            )
+            logger.error(f"Error in interaction monitor for tab {tab_id}: {e}", exc_info=True)
         finally:
             logger.debug(f"Interaction monitor task finished for tab {tab_id}")
             # Ensure cleanup happens even if the loop exits unexpectedly
             self._stop_interaction_monitor(tab_id)  # Call stop to clean up timers/fetch tasks
 
-    async def _handle_interaction_event(self, tab_id: str, event_type: Optional[str]):
-        """Handles a detected interaction event (click/scroll) by resetting the debounce timer."""
-        if not event_type:
+    def _handle_dom_change(self, tab_id: str, change: DomChange) -> None:
+        """
+        Adds a DOM change report to the tab's running total, and asks the capture scheduler
+        for a fetch once the total passes a threshold. Small churn (timestamps, counters,
+        spinners) never does.
+        """
+        if change.focused:
+            self._focused_tab_id = tab_id
+        elif self._focused_tab_id == tab_id:
+            self._focused_tab_id = None
+
+        previous = self._pending_changes.get(tab_id, DomChange())
+        pending = DomChange(
+            added_nodes=previous.added_nodes + change.added_nodes,
+            removed_nodes=previous.removed_nodes + change.removed_nodes,
+            text_added=previous.text_added + change.text_added,
+            text_removed=previous.text_removed + change.text_removed,
+        )
+        if (
+            pending.text_added < CHANGE_TEXT_THRESHOLD
+            and pending.added_nodes < CHANGE_NODE_THRESHOLD
+        ):
+            self._pending_changes[tab_id] = pending
             return
 
+        self._pending_changes.pop(tab_id, None)
         logger.debug(
-            f"Detected interaction '{event_type}' in tab {tab_id}. Resetting debounce timer."
+            f"Content changed in tab {tab_id} ({pending.added_nodes} elements, "
+            f"{pending.text_added} chars added). Requesting fetch."
         )
-
-        # Cancel existing timer for this tab, if any
-        if tab_id in self._debounce_timers:
-            self._debounce_timers[tab_id].cancel()
-
-        # Schedule the debounced fetch function to run after the delay
-        loop = asyncio.get_running_loop()
-        self._debounce_timers[tab_id] = loop.call_later(
-            DEBOUNCE_DELAY_SECONDS,
-            # Use lambda to create a coroutine task when the timer fires
-            lambda: asyncio.create_task(self._trigger_debounced_fetch(tab_id)),
+        # Debounce, priority and rate limits are the scheduler's; repeated requests coalesce
+        self.chrome_manager.capture_scheduler.request(
+            ("update", tab_id),
+            self.tab_states.url(tab_id),
+            lambda: self._fetch_and_update_tab_content(tab_id),
+            focused=tab_id == self._focused_tab_id,
         )
 
-    async def _trigger_debounced_fetch(self, tab_id: str):
-        """Callback function executed after the debounce delay. Starts the HTML fetch task."""
-        # Timer has fired, remove it from tracking
-        self._debounce_timers.pop(tab_id, None)
-
-        # Prevent concurrent fetches for the same tab initiated by interactions
-        if tab_id in self._interaction_fetch_tasks:
-            logger.debug(f"Fetch already in progress for tab {tab_id}, skipping debounced trigger.")
-            return
-
-        logger.info(f"Debounce finished for tab {tab_id}. Triggering HTML content fetch.")
-
-        # Run the fetch in the background
-        fetch_task = asyncio.create_task(self._fetch_and_update_tab_content(tab_id))
-        self._interaction_fetch_tasks[tab_id] = fetch_task
-
-        # Ensure the task is removed from the tracking dict once it completes
-        fetch_task.add_done_callback(lambda _task: self._interaction_fetch_tasks.pop(tab_id, None))
-
     async def _fetch_and_update_tab_content(self, tab_id: str):
         """Fetches HTML for a specific tab, converts to MD, updates internal state, and logs."""
         try:
+            if await self._apply_delta(tab_id):
+                return
+
             logger.debug(f"Fetching latest HTML and URL for tab {tab_id} due to interaction...")
+            version = self.tab_states.version(tab_id)
+            # Deltas continue from this snapshot
+            cursor = await self.chrome_manager.start_tab_delta(tab_id)
             # Fetch HTML and the *current* URL for the specific tab
             html_content, current_url = await self.chrome_manager.get_tab_html(tab_id)
+            # Deltas may only continue from this snapshot once it's stored
+            snapshot = DeltaState(cursor, 0, time.monotonic()) if cursor and html_content else None
 
             if not current_url:
                 logger.warning(
@@ -303,6 +444,9 @@ class ChromeTabs:
                 return
 
             new_markdown = None
+            new_metadata = None
+            cached = False
+            new_items = None
             original_html = html_content
             if not html_content:
                 logger.warning(
@@ -315,11 +459,30 @@ class ChromeTabs:
                 logger.debug(
                     f"Converting HTML to Markdown for interacted tab {tab_id} ({current_url})..."
                 )
-                new_markdown = html_to_md(html_content, current_url)  # Use FETCHED URL
-                # html_to_md returns None on error or empty content
+                # Use FETCHED URL; markdown is None on error or empty content
+                new_markdown, new_metadata, cached, new_items = await convert_page_in_thread(
+                    html_content, current_url
+                )
 
             # Find the existing reference for this tab (still needed for old_markdown)
-            current_ref = next((ref for ref in self.previous_tab_refs if ref.id == tab_id), None)
+            current_ref = self.tab_states.get(tab_id)
+            if self.tab_states.version(tab_id) != version:
+                # Navigated, closed or captured again while this fetch ran; that state wins
+                logger.debug(f"Tab {tab_id} changed during the fetch, dropping this capture.")
+                return
+
+            # Conversion cache hit on the exact HTML we already hold: nothing to merge or save
+            if (
+                cached
+                and current_ref
+                and current_ref.url == current_url
+                and html_content
+                and self.tab_states.html_matches(tab_id, html_content)
+            ):
+                logger.debug(
+                    f"Interaction in tab {tab_id} left the page unchanged, skipping merge."
+                )
+                return
             old_markdown = current_ref.markdown if current_ref else None
             old_title = current_ref.title if current_ref else None
 
@@ -358,31 +521,22 @@ class ChromeTabs:
                     markdown=merged_content or "",
                     html=original_html,
                     title=old_title,
+                    metadata=new_metadata,
+                    items=new_items,
                 )
-                # Update the set: remove old, add new
-                # Use discard() for safety, in case the ref was already removed by polling
-                self.previous_tab_refs.discard(current_ref)
-                self.previous_tab_refs.add(new_ref)
+                if not self._put_snapshot(new_ref, version, snapshot):
+                    return
 
                 # Trigger the interaction update callback if provided
                 if self._on_interaction_update_callback:
                     logger.debug(
                         f"Calling interaction update callback for tab {tab_id} with URL {display_url}"
                     )
-                    try:
-                        if asyncio.iscoroutinefunction(self._on_interaction_update_callback):
-                            await self._on_interaction_update_callback(new_ref)
-                        else:
-                            self._on_interaction_update_callback(new_ref)
-                    except Exception as cb_err:
-                        logger.error(
-                            f"Error in interaction update callback for tab {tab_id}: {cb_err}",
-                            exc_info=True,
-                        )
+                await self._notify_interaction_update(new_ref)
             elif not current_ref:
                 # Should not happen ideally if interaction is monitored, but handle it.
                 logger.warning(
-                    f"Tab {tab_id} not found in previous_tab_refs during interaction update. Storing fetched content for URL {display_url}."
+                    f"Tab {tab_id} not found in tab_states during interaction update. Storing fetched content for URL {display_url}."
                 )
                 # Store the newly fetched content (or merged) using the FETCHED URL
                 new_ref = TabReference(
@@ -391,24 +545,18 @@ class ChromeTabs:
                     markdown=merged_content or "",
                     html=original_html,
                     title=None,
+                    metadata=new_metadata,
+                    items=new_items,
                 )
-                self.previous_tab_refs.add(new_ref)
+                if not self._put_snapshot(new_ref, version, snapshot):
+                    return
                 # Optionally trigger callback here too?
                 # Let's trigger it if we just added it and there's a callback.
                 if self._on_interaction_update_callback:
                     logger.debug(
                         f"Calling interaction update callback for newly tracked tab {tab_id} with URL {display_url}"
                     )
-                    try:
-                        if asyncio.iscoroutinefunction(self._on_interaction_update_callback):
-                            await self._on_interaction_update_callback(new_ref)
-                        else:
-                            self._on_interaction_update_callback(new_ref)
-                    except Exception as cb_err:
-                        logger.error(
-                            f"Error in interaction update callback for tab {tab_id}: {cb_err}",
-                            exc_info=True,
-                        )
+                await self._notify_interaction_update(new_ref)
             else:  # current_ref exists but content_changed is False
                 # In that case, the url_for_new_ref might differ from current_ref.url.
                 # Always use url_for_new_ref for logging and saving.
@@ -421,6 +569,87 @@ class ChromeTabs:
                 f"Error fetching/updating tab {tab_id} after interaction: {e}", exc_info=True
             )
 
+    def _put_snapshot(
+        self, new_ref: TabReference, version: int, snapshot: Optional[DeltaState]
+    ) -> bool:
+        """
+        Stores a full capture unless the tab changed since `version`, and only then lets
+        deltas continue from it. Returns whether it was stored.
+        """
+        if not self.tab_states.put(new_ref, if_version=version):
+            logger.debug(f"Tab {new_ref.id} changed during the fetch, dropping this capture.")
+            return False
+        if snapshot is not None:
+            self._delta_states[new_ref.id] = snapshot
+        return True
+
+    async def _apply_delta(self, tab_id: str) -> bool:
+        """
+        Updates the tab from just the subtrees added since its last capture, appending their
+        markdown. Returns False when a full snapshot is due instead: no delta position yet,
+        too many deltas or too long since the last snapshot, or a new document.
+        """
+        state = self._delta_states.pop(tab_id, None)
+        current_ref = self.tab_states.get(tab_id)
+        version = self.tab_states.version(tab_id)
+        if (
+            state is None
+            or current_ref is None
+            or state.deltas >= FULL_SNAPSHOT_EVERY_DELTAS
+            or time.monotonic() - state.snapshot_at > FULL_SNAPSHOT_INTERVAL_SECONDS
+        ):
+            return False
+        delta = await self.chrome_manager.get_tab_delta(tab_id, state.cursor)
+        if delta is None or delta.url != current_ref.url:
+            return False
+        advanced = state._replace(cursor=delta.cursor, deltas=state.deltas + 1)
+        if not delta.fragments:
+            self._delta_states[tab_id] = advanced
+            return True
+
+        delta_html = f"<html><body>{''.join(delta.fragments)}</body></html>"
+        logger.debug(
+            f"Converting {len(delta.fragments)} added subtrees ({len(delta_html)} chars) "
+            f"for tab {tab_id}..."
+        )
+        delta_markdown = (await convert_page_in_thread(delta_html, current_ref.url)).markdown
+        merged_content = append_md(current_ref.markdown, delta_markdown).content or ""
+        if merged_content == current_ref.markdown:
+            logger.debug(f"Delta for tab {tab_id} added no new content.")
+            self._delta_states[tab_id] = advanced
+            return True
+
+        # The page's metadata comes from the last full snapshot; html holds only the delta,
+        # so item indexing sees just the new posts
+        new_ref = current_ref._replace(markdown=merged_content, html=delta_html)
+        if not self.tab_states.put(new_ref, if_version=version):
+            return True  # Navigated or closed while the delta was fetched; next is a snapshot
+        self._delta_states[tab_id] = advanced
+        logger.success(f"Interaction APPENDED delta content for tab {tab_id} ({new_ref.url}).")
+        await self._notify_interaction_update(new_ref)
+        return True
+
+    async def _notify_interaction_update(self, new_ref: TabReference) -> None:
+        """
+        Passes an updated tab to the interaction update callback, if one is set. The stored
+        HTML is released after: the callback (the saver) has it now.
+        """
+        version = self.tab_states.version(new_ref.id)
+        try:
+            if not self._on_interaction_update_callback:
+                return
+            if asyncio.iscoroutinefunction(self._on_interaction_update_callback):
+                await self._on_interaction_update_callback(new_ref)
+            else:
+                self._on_interaction_update_callback(new_ref)
+        except Exception as cb_err:
+            logger.error(
+                f"Error in interaction update callback for tab {new_ref.id}: {cb_err}",
+                exc_info=True,
+            )
+        finally:
+            self.tab_states.release_html(new_ref.id, if_version=version)
+
     def _stop_interaction_monitor(self, tab_id: str):
         """Stops monitoring interactions and cleans up resources for a single tab."""
         logger.debug(f"Stopping interaction monitor and cleaning up for tab {tab_id}...")
@@ -430,100 +659,183 @@ class ChromeTabs:
         if monitor_task and not monitor_task.done():
             monitor_task.cancel()
             # logger.debug(f"Cancelled interaction monitor task for tab {tab_id}")
+        pending_start = self._monitor_restarts.pop(tab_id, None)
+        if pending_start is not None:
+            pending_start.cancel()
 
-        # Cancel and remove the debounce timer
-        timer = self._debounce_timers.pop(tab_id, None)
-        if timer:
-            timer.cancel()
-            # logger.debug(f"Cancelled debounce timer for tab {tab_id}")
+        # Drop changes still below threshold and the delta position
+        self._pending_changes.pop(tab_id, None)
+        self._delta_states.pop(tab_id, None)
 
-        # Cancel and remove any ongoing fetch task triggered by interaction
-        fetch_task = self._interaction_fetch_tasks.pop(tab_id, None)
-        if fetch_task and not fetch_task.done():
-            fetch_task.cancel()
-            # logger.debug(f"Cancelled interaction fetch task for tab {tab_id}")
+        # Cancel a pending (debounced) or running fetch triggered by page changes
+        self.chrome_manager.capture_scheduler.cancel(("update", tab_id))
 
     async def _stop_all_interaction_monitors(self):
-        """Stops all interaction monitors and associated tasks/timers."""
-        if (
-            not self._interaction_monitors
-            and not self._debounce_timers
-            and not self._interaction_fetch_tasks
-        ):
-            logger.debug("No active interaction monitors/timers/tasks to stop.")
+        """Stops all interaction monitors and associated fetches."""
+        for pending_start in self._monitor_restarts.values():
+            pending_start.cancel()
+        self._monitor_restarts.clear()
+        if not self._interaction_monitors and not self._pending_changes:
+            logger.debug("No active interaction monitors to stop.")
             return
 
-        logger.info(
-            f"Stopping all interaction monitors ({len(self._interaction_monitors)}), timers ({len(self._debounce_timers)}), and fetch tasks ({len(self._interaction_fetch_tasks)})..."
-        )
-
-        # Get all unique tab IDs currently being tracked
-        all_tab_ids = (
-            set(self._interaction_monitors.keys())
-            | set(self._debounce_timers.keys())
-            | set(self._interaction_fetch_tasks.keys())
-        )
+        logger.info(f"Stopping all interaction monitors ({len(self._interaction_monitors)})...")
 
-        # Stop everything for each tab ID
-        for tab_id in list(all_tab_ids):  # Iterate over a copy
+        # Stop everything for each tab ID (including tabs whose monitor already ended)
+        for tab_id in list(set(self._interaction_monitors) | set(self._pending_changes)):
             self._stop_interaction_monitor(tab_id)
 
-        # Wait briefly for tasks to potentially cancel (optional)
-        # await asyncio.sleep(0.1)
-
         # Clear the dictionaries just in case
         self._interaction_monitors.clear()
-        self._debounce_timers.clear()
-        self._interaction_fetch_tasks.clear()
+        self._pending_changes.clear()
+        self._delta_states.clear()
         logger.debug("All interaction monitoring resources cleared.")
 
-    # --- Polling Logic Modifications ---
+    # --- Tab Lifecycle Tracking ---
 
     async def _monitor_loop(self) -> None:
-        """Async version of the monitoring loop (handles polling)."""
+        """
+        Track tab lifecycle from CDP target events (created / info changed / destroyed).
+
+        Polling /json/list every check_interval remains as a consistency check for anything
+        the events missed, and as the fallback when target events can't be subscribed.
+        """
+        watch: Optional[Tuple[CdpBrowserSession, EventQueue]] = None
         while self._monitoring:
-            current_time = time.time()
-
-            # Check connection status periodically
-            if not self.chrome_manager.connected:
-                logger.warning("Chrome connection lost. Attempting to reconnect...")
-                # Stop existing monitors before attempting reconnect
-                await self._stop_all_interaction_monitors()
-                connected = await self.chrome_manager.ensure_connection()
-                if connected:
-                    logger.success("Reconnected to Chrome. Will rescan tabs on next interval.")
-                    # Reset tab tracking - will be repopulated by process_tab_changes
-                    self.previous_tab_refs = set()
-                    self.last_tabs_check = 0  # Force immediate check
-                else:
-                    logger.error("Failed to reconnect to Chrome. Stopping monitoring.")
-                    self._monitoring = False  # Stop the loop
-                    break  # Exit loop immediately
+            if watch is None:
+                watch = await self._watch_targets()
+                if watch is None:
+                    await self._sync_tabs(await self.chrome_manager.list_tabs())
+                    await asyncio.sleep(self.check_interval)
+                    continue
+                # Catch up on anything that changed while we weren't subscribed
+                await self._sync_tabs(tabs_from_targets(watch[0].targets.values()))
+            cdp, target_events = watch
+
+            timeout = max(0.0, self.last_tabs_check + self.check_interval - time.monotonic())
+            try:
+                event = await asyncio.wait_for(target_events.get(), timeout=timeout)
+            except asyncio.TimeoutError:
+                # Consistency check
+                await self._sync_tabs(await self.chrome_manager.list_tabs())
+                self.last_tabs_check = time.monotonic()
+                continue
+
+            if event is not None:
+                # Coalesce bursts: a navigation reports its URL and title in separate events
+                await asyncio.sleep(TARGET_EVENT_COALESCE_SECONDS)
+                while event is not None and not target_events.empty():
+                    event = target_events.get_nowait()
+
+            if event is None:
+                # The shared CDP connection closed
+                watch = None
+                if not await self._reconnect():
+                    break
+                continue
 
-            # Periodically check for tab changes via polling
-            if current_time - self.last_tabs_check >= self.check_interval:
-                try:
-                    # Use get_tabs to get full ChromeTab objects including ws urls
-                    current_cdp_tabs: List[ChromeTab] = await get_tabs()
-                    # Pass the full objects to process_tab_changes
-                    changed_tabs_event = await self.process_tab_changes(current_cdp_tabs)
-
-                    # Call the main callback if registered and changes were detected by polling
-                    if self._on_polling_change_callback and changed_tabs_event:
-                        logger.info(
-                            "Polling detected tab changes (new/closed/navigated). Notifying callback."
-                        )
-                        if asyncio.iscoroutinefunction(self._on_polling_change_callback):
-                            await self._on_polling_change_callback(changed_tabs_event)
-                        else:
-                            self._on_polling_change_callback(changed_tabs_event)
-
-                    self.last_tabs_check = current_time
-                except Exception as e:
-                    logger.error(f"Error during polling loop: {e}", exc_info=True)
+            await self._sync_tabs(tabs_from_targets(cdp.targets.values()))
+
+    async def _watch_targets(self) -> Optional[Tuple[CdpBrowserSession, EventQueue]]:
+        """Subscribe to target lifecycle events on the shared CDP connection."""
+        try:
+            cdp = await self.chrome_manager.cdp_session()
+        except Exception as e:
+            logger.warning(f"Target events unavailable, polling for tab changes instead: {e}")
+            return None
+        return cdp, cdp.subscribe(None, TARGET_LIFECYCLE_EVENTS)
+
+    async def _reconnect(self) -> bool:
+        """Reconnect after the CDP connection dropped. False stops monitoring."""
+        logger.warning("Chrome connection lost. Attempting to reconnect...")
+        # Stop existing monitors before attempting reconnect
+        await self._stop_all_interaction_monitors()
+        connected = await self.chrome_manager.ensure_connection()
+        if connected:
+            logger.success("Reconnected to Chrome. Rescanning tabs.")
+            # Reset tab tracking - will be repopulated by process_tab_changes
+            self.tab_states.clear()
+            self.last_tabs_check = 0  # Force immediate check
+            return True
+        logger.error("Failed to reconnect to Chrome. Stopping monitoring.")
+        self._monitoring = False  # Stop the loop
+        return False
+
+    async def _sync_tabs(self, current_cdp_tabs: List[ChromeTab]) -> None:
+        """Apply the current tab list and notify the change callback."""
+        try:
+            changed_tabs_event = await self.process_tab_changes(current_cdp_tabs)
+
+            # Call the main callback if changes were detected
+            if changed_tabs_event:
+                logger.info("Detected tab changes (new/closed/navigated). Notifying callback.")
+                await self._notify_polling_change(changed_tabs_event)
+        except Exception as e:
+            logger.error(f"Error processing tab changes: {e}", exc_info=True)
+
+    async def _notify_polling_change(self, event: TabChangeEvent) -> None:
+        """
+        Passes a tab change event to the polling callback, if one is set, then releases the
+        stored HTML of the event's new and navigated tabs: the callback has had its chance to
+        read (and save) them.
+        """
+        versions = {
+            tab["id"]: self.tab_states.version(tab["id"])
+            for tab in event.new_tabs + event.navigated_tabs
+        }
+        try:
+            if self._on_polling_change_callback is None:
+                return
+            if asyncio.iscoroutinefunction(self._on_polling_change_callback):
+                await self._on_polling_change_callback(event)
+            else:
+                self._on_polling_change_callback(event)
+        finally:
+            for tab_id, version in versions.items():
+                self.tab_states.release_html(tab_id, if_version=version)
 
-            # Sleep briefly before next check
-            await asyncio.sleep(0.5)  # Maintain a base loop responsiveness
+    async def _capture_polled_tab(
+        self, tab_dict: Dict[str, Any], version: int, load_delay: float = 0.0
+    ) -> None:
+        """
+        Fetches and converts a new or navigated tab, then replaces its placeholder ref
+        (recorded at version) unless the tab closed or moved on meanwhile.
+
+        With a load_delay the fetch waits that long first, so a just-navigated page isn't
+        captured while its document is still nearly empty.
+        """
+        try:
+            if load_delay > 0:
+                await asyncio.sleep(load_delay)
+                if self.tab_states.version(tab_dict["id"]) != version:
+                    return  # Closed or navigated again while loading; that change captures it
+            fetched = await self.chrome_manager.get_html_for_tabs(
+                [tab_dict], focused_tab_id=self._focused_tab_id
+            )
+            for _, html, fetched_url in fetched:
+                # Use the URL returned by the fetch operation, fallback to tab_dict URL if None
+                tab_url = fetched_url or tab_dict["url"]
+                markdown, metadata, _, items = await convert_page_in_thread(html, tab_url)
+                if markdown is None:
+                    logger.warning(
+                        f"Polling Markdown conversion failed for {tab_url}, storing empty."
+                    )
+                    markdown = ""
+                self.tab_states.put(
+                    TabReference(
+                        id=tab_dict["id"],
+                        url=tab_url,
+                        markdown=markdown,
+                        html=html,
+                        title=tab_dict.get("title"),
+                        metadata=metadata,
+                        items=items,
+                    ),
+                    if_version=version,
+                )
+        except Exception as e:
+            # The placeholder stays; the other tabs in the batch are unaffected
+            logger.error(f"Error capturing tab {tab_dict['id']}: {type(e).__name__} - {e}")
 
     async def process_tab_changes(
         self, current_cdp_tabs: List[ChromeTab]
@@ -532,27 +844,22 @@ class ChromeTabs:
         Process changes based on polled tabs, manage interaction monitors, and fetch HTML for polling-detected changes.
 
         Args:
-            current_cdp_tabs: List of current ChromeTab objects from get_tabs()
+            current_cdp_tabs: List of current ChromeTab objects from list_tabs()
 
         Returns:
             TabChangeEvent if polling detected new/closed/navigated tabs, None otherwise.
         """
-        # Filter for only HTTP/HTTPS URLs and tabs with WebSocket URLs needed for monitoring
+        # Filter for only HTTP/HTTPS URLs (attached tabs have no webSocketDebuggerUrl)
         filtered_tabs = [
-            tab
-            for tab in current_cdp_tabs
-            if tab.url.startswith(("http://", "https://")) and tab.webSocketDebuggerUrl
+            tab for tab in current_cdp_tabs if tab.url.startswith(("http://", "https://"))
         ]
 
         # --- Identify Changes & Manage Interaction Monitors ---
 
-        current_tab_refs_map: Dict[str, TabReference] = {
-            ref.id: ref for ref in self.previous_tab_refs
-        }
         current_polled_tabs_map: Dict[str, ChromeTab] = {tab.id: tab for tab in filtered_tabs}
 
         current_tab_ids = set(current_polled_tabs_map.keys())
-        previous_tab_ids = set(current_tab_refs_map.keys())
+        previous_tab_ids = set(self.tab_states)
 
         added_tab_ids = current_tab_ids - previous_tab_ids
         removed_tab_ids = previous_tab_ids - current_tab_ids
@@ -566,38 +873,38 @@ class ChromeTabs:
             tab = current_polled_tabs_map[tab_id]
             logger.info(f"Polling: Detected NEW tab {tab.id} ({tab.url})")
             new_tabs_detected_by_poll.append(tab.model_dump())  # Store dict for event
+            # Tracked right away; the content is filled in by the fetch below
+            self.tab_states.put(TabReference(id=tab.id, url=tab.url, markdown="", title=tab.title))
             # Start interaction monitor for the new tab
-            if tab.webSocketDebuggerUrl:
-                self._start_interaction_monitor(tab.id, tab.webSocketDebuggerUrl)
-            else:
-                logger.warning(
-                    f"New tab {tab.id} missing WebSocket URL, cannot monitor interactions."
-                )
+            self._start_interaction_monitor(tab.id)
 
         # Process Removed Tabs
         for tab_id in removed_tab_ids:
-            ref = current_tab_refs_map[tab_id]
-            logger.info(f"Polling: Detected CLOSED tab {ref.id} ({ref.url})")
+            closed_url = self.tab_states.discard(tab_id)
+            if closed_url is None:
+                continue
+            logger.info(f"Polling: Detected CLOSED tab {tab_id} ({closed_url})")
             closed_tabs_detected_by_poll.append(
-                {"id": ref.id, "url": ref.url}
+                {"id": tab_id, "url": closed_url}
             )  # Store dict for event
             # Stop interaction monitor for the closed tab
             self._stop_interaction_monitor(tab_id)
 
         # Process Existing Tabs (Check for Navigation)
         potentially_navigated_ids = previous_tab_ids.intersection(current_tab_ids)
-        tabs_to_keep_refs = set()  # Track refs that don't need fetching by polling
 
         for tab_id in potentially_navigated_ids:
             current_tab = current_polled_tabs_map[tab_id]
-            previous_ref = current_tab_refs_map[tab_id]
+            previous_url = self.tab_states.url(tab_id)
+            if previous_url is None:
+                continue
 
-            if current_tab.url != previous_ref.url:
+            if current_tab.url != previous_url:
                 logger.info(
-                    f"Polling: Detected NAVIGATION in tab {tab_id}: '{previous_ref.url}' -> '{current_tab.url}'"
+                    f"Polling: Detected NAVIGATION in tab {tab_id}: '{previous_url}' -> '{current_tab.url}'"
                 )
                 nav_tab_info = current_tab.model_dump()
-                nav_tab_info["old_url"] = previous_ref.url  # Add old URL for event context
+                nav_tab_info["old_url"] = previous_url  # Add old URL for event context
                 navigated_tabs_detected_by_poll.append(nav_tab_info)
 
                 # 1. Stop any ongoing interaction work for the old URL context IMMEDIATELY.
@@ -611,9 +918,8 @@ class ChromeTabs:
                 logger.debug(
                     f"Navigation detected for {tab_id}: updating internal ref URL immediately to {current_tab.url}"
                 )
-                self.previous_tab_refs.discard(previous_ref)  # Remove old ref
-                # Add placeholder with new URL, empty markdown, and no HTML initially
-                self.previous_tab_refs.add(
+                # Placeholder with new URL, empty markdown, and no HTML initially
+                self.tab_states.put(
                     TabReference(
                         id=tab_id,
                         url=current_tab.url,
@@ -623,21 +929,10 @@ class ChromeTabs:
                     )
                 )
 
-                # 3. Start the interaction monitor for the *new* URL context.
-                # Add a small delay to allow the target page's WS endpoint to potentially stabilize
-                await asyncio.sleep(1.0)  # Wait 1 second
-
-                if current_tab.webSocketDebuggerUrl:
-                    self._start_interaction_monitor(tab_id, current_tab.webSocketDebuggerUrl)
-                else:
-                    logger.warning(
-                        f"Navigated tab {tab_id} missing WebSocket URL, cannot monitor interactions."
-                    )
-
-            else:
-                # URL didn't change according to polling, keep existing reference for now
-                # Interaction monitor should already be running if it was started previously
-                tabs_to_keep_refs.add(previous_ref)
+                # 3. Start the interaction monitor for the *new* URL context once the new
+                # document has had a moment to load. Scheduled, not awaited: other tabs'
+                # changes are processed meanwhile
+                self._start_interaction_monitor_later(tab_id)
 
         # --- Fetch HTML for Polling-Detected Changes ---
         tabs_needing_html_fetch_by_poll = []
@@ -646,52 +941,29 @@ class ChromeTabs:
         # Add navigated tabs (we already have the dicts)
         tabs_needing_html_fetch_by_poll.extend(navigated_tabs_detected_by_poll)
 
-        newly_fetched_tabs_with_html = []
+        # Results are only stored for tabs still at these versions when their fetch returns
+        fetch_versions = {
+            tab["id"]: self.tab_states.version(tab["id"]) for tab in tabs_needing_html_fetch_by_poll
+        }
         if tabs_needing_html_fetch_by_poll:
             logger.debug(
                 f"Polling needs to fetch HTML for {len(tabs_needing_html_fetch_by_poll)} new/navigated tabs..."
             )
-            # Fetch HTML in parallel ONLY for tabs identified by the polling logic
-            newly_fetched_tabs_with_html = await self.chrome_manager.get_html_for_tabs(
-                tabs_needing_html_fetch_by_poll  # Pass the list of dicts
-            )
-            logger.debug(f"Polling fetched HTML for {len(newly_fetched_tabs_with_html)} tabs.")
-
-        # --- Update Internal State (previous_tab_refs) ---
-        # Start with the refs for tabs whose URL didn't change
-        updated_tab_refs = set(tabs_to_keep_refs)
-
-        # Add/update refs for tabs where polling fetched new HTML
-        # The result now contains (tab_dict, html, url)
-        for tab_dict, html, fetched_url in newly_fetched_tabs_with_html:
-            tab_id = tab_dict.get("id")
-            # Use the URL returned by the fetch operation, fallback to tab_dict URL if None
-            tab_url = fetched_url or tab_dict.get("url")
-            original_html = html
-
-            if tab_id and tab_url:
-                # Convert HTML to Markdown using the fetched/confirmed URL
-                markdown = html_to_md(html, tab_url) if html else ""
-                if markdown is None:
-                    logger.warning(
-                        f"Polling Markdown conversion failed for {tab_url}, storing empty."
-                    )
-                    markdown = ""
-                # Remove any outdated ref for this ID if it exists (e.g., from navigation placeholder)
-                updated_tab_refs = {ref for ref in updated_tab_refs if ref.id != tab_id}
-                # Add the new reference with the fetched/confirmed URL and fresh markdown
-                updated_tab_refs.add(
-                    TabReference(
-                        id=tab_id,
-                        url=tab_url,
-                        markdown=markdown,
-                        html=original_html,
-                        title=tab_dict.get("title"),
+            # Each tab is fetched and converted as its own task: a slow page doesn't hold up
+            # converting the others, and the batch takes as long as its slowest tab.
+            # Navigated tabs wait for their new document to load, new tabs are captured now
+            await asyncio.gather(
+                *(
+                    self._capture_polled_tab(tab_dict, fetch_versions[tab_dict["id"]])
+                    for tab_dict in new_tabs_detected_by_poll
+                ),
+                *(
+                    self._capture_polled_tab(
+                        tab_dict, fetch_versions[tab_dict["id"]], NAVIGATION_CAPTURE_DELAY
                     )
-                )
-
-        # Atomically update the main set of references
-        self.previous_tab_refs = updated_tab_refs
+                    for tab_dict in navigated_tabs_detected_by_poll
+                ),
+            )
 
         # --- Return Event for Polling Callback ---
         # Only return an event if polling detected direct changes (new, close, navigate)
@@ -719,8 +991,6 @@ async def main() -> None:
     """Run the Chrome tab monitor as a standalone program."""
     console = Console()
 
-    POLLING_INTERVAL = 5.0
-
     stop_event = asyncio.Event()
 
     def signal_handler(sig, frame):
@@ -804,15 +1074,16 @@ async def main() -> None:
     # --- Callbacks ---
     async def on_polling_update(event: TabChangeEvent):
         console.print("[bold yellow]:mag: Polling Update Detected:[/bold yellow]")
+        refs = tabs_monitor.tab_states.snapshot(
+            tab["id"] for tab in event.new_tabs + event.navigated_tabs
+        )
         if event.new_tabs:
             console.print(f"  :heavy_plus_sign: [green]Added {len(event.new_tabs)} tab(s):[/green]")
             for i, tab in enumerate(event.new_tabs):
                 console.print(
                     f"    {i + 1}. [link={tab.get('url')}]{tab.get('url', 'N/A')}[/link] (ID: {tab.get('id', '?')[:8]}...)"
                 )
-                ref = next(
-                    (r for r in tabs_monitor.previous_tab_refs if r.id == tab.get("id")), None
-                )
+                ref = refs.get(tab["id"])
                 if ref:
                     await save_tab_content(ref)
 
@@ -824,9 +1095,7 @@ async def main() -> None:
                 console.print(
                     f"    {i + 1}. '[dim]{tab.get('old_url', 'N/A')}[/dim]' -> [link={tab.get('url')}]{tab.get('url', 'N/A')}[/link] (ID: {tab.get('id', '?')[:8]}...)"
                 )
-                ref = next(
-                    (r for r in tabs_monitor.previous_tab_refs if r.id == tab.get("id")), None
-                )
+                ref = refs.get(tab["id"])
                 if ref:
                     await save_tab_content(ref)
 
@@ -852,7 +1121,7 @@ async def main() -> None:
 
     # --- Main Execution Logic ---
     manager = ChromeManager()
-    tabs_monitor = ChromeTabs(manager, check_interval=POLLING_INTERVAL)
+    tabs_monitor = ChromeTabs(manager)
 
     try:
         logger.info("Attempting to start tab monitoring...")
@@ -862,19 +1131,18 @@ async def main() -> None:
         )
 
         if monitor_started:
-            chrome_info = await get_chrome_info()
+            chrome_info = await get_chrome_info(manager.http_session())
             logger.success(
                 f"Successfully connected to Chrome {chrome_info['version']} and started monitoring."
             )
-            initial_refs = sorted(tabs_monitor.previous_tab_refs, key=lambda r: r.url)
-            if initial_refs:
-                for _i, ref in enumerate(initial_refs):
-                    await save_tab_content(ref)  # Save MD and HTML for initial tabs
+            if tabs_monitor.tab_states:
+                # Initial tabs are saved as their content arrives, via on_polling_update
+                console.print(
+                    f"  Capturing {len(tabs_monitor.tab_states)} initial tabs in the background"
+                )
             else:
                 console.print("  (No initial HTTP/HTTPS tabs found)")
-            console.print(
-                f"[dim]Polling every {POLLING_INTERVAL}s. Waiting for interactions or polling changes...[/dim]"
-            )
+            console.print("[dim]Waiting for tab events or interactions...[/dim]")
 
             logger.info("Monitoring active. Press Ctrl+C to exit...")
             await stop_event.wait()  # Keep running until signal
@@ -2,7 +2,8 @@ import asyncio
 import os
 import threading
 import time
-from typing import Optional
+from datetime import datetime, timedelta
+from typing import List, Optional, Set
 
 from dotenv import load_dotenv
 from textual.app import App, ComposeResult
@@ -28,16 +29,19 @@ from brocc_li.doc_db import DocDB
 from brocc_li.fastapi_server import FASTAPI_HOST, FASTAPI_PORT, run_server_in_thread
 from brocc_li.frontend_server import WEBAPP_HOST, WEBAPP_PORT
 from brocc_li.frontend_server import run_server_in_thread as run_webapp_in_thread
-from brocc_li.types.doc import Doc
+from brocc_li.ingest_pipeline import IngestPipeline
 from brocc_li.utils.api_url import get_api_url
 from brocc_li.utils.auth_data import is_logged_in, load_auth_data
-from brocc_li.utils.html_metadata import extract_metadata
 from brocc_li.utils.logger import logger
 from brocc_li.utils.version import get_version
 from brocc_li.utils.version_check import check_for_updates
 
 load_dotenv()
 
+# Background tabs open at startup aren't captured again if stored within this window
+STARTUP_RECAPTURE_AFTER = timedelta(hours=6)
+INGEST_STOP_TIMEOUT = 2.0  # Time for queued saves to finish on quit (before force exit)
+
 
 class MainContent(Static):
     def __init__(self, app_instance, *args, **kwargs):
@@ -104,6 +108,7 @@ class BroccApp(App):
         # Initialize DocDB
         self.doc_db = None
         self.doc_db_thread = None
+        self.ingest_pipeline: Optional[IngestPipeline] = None  # Saves tabs to doc_db
 
         # Reference to info panel
         self.info_panel: Optional[InfoPanel] = None
@@ -174,7 +179,9 @@ class BroccApp(App):
 
         # Initialize Chrome Manager and Tabs Monitor
         self.chrome_manager = ChromeManager()
-        self.tabs_monitor = ChromeTabs(self.chrome_manager)
+        self.tabs_monitor = ChromeTabs(
+            self.chrome_manager, recently_stored=self._recently_stored_urls
+        )
 
         # Check health status initially
         self.run_worker(self._check_health_worker, thread=True)
@@ -246,6 +253,10 @@ class BroccApp(App):
         # Stop tab monitoring first
         await self._stop_tab_monitoring_if_running()
 
+        # Then let already queued tab saves finish, briefly
+        if self.ingest_pipeline is not None:
+            await asyncio.to_thread(self.ingest_pipeline.stop, INGEST_STOP_TIMEOUT)
+
         # First try to quickly terminate any active processes
         try:
             # Try direct termination of the webview process
@@ -592,6 +603,8 @@ class BroccApp(App):
         logger.debug("Initializing document database...")
         try:
             self.doc_db = DocDB()
+            self.ingest_pipeline = IngestPipeline(self.doc_db)
+            self.ingest_pipeline.start()
             logger.debug("Document database initialized successfully")
             # Trigger UI update with initial status
             self._update_doc_db_status()
@@ -713,111 +726,47 @@ class BroccApp(App):
         logger.debug(
             f"Received polling update: {len(event.new_tabs)} new, {len(event.closed_tabs)} closed, {len(event.navigated_tabs)} navigated"
         )
+        if self.tabs_monitor is None:
+            return
         tabs_to_save = []
-        # Collect refs for new and navigated tabs
-        for tab_info in event.new_tabs + event.navigated_tabs:
+        # Collect refs for new and navigated tabs from one view of the monitor's state
+        changed_tabs = event.new_tabs + event.navigated_tabs
+        refs = self.tabs_monitor.tab_states.snapshot(tab["id"] for tab in changed_tabs)
+        for tab_info in changed_tabs:
             tab_id = tab_info.get("id")
-            if tab_id and self.tabs_monitor:
-                # Find the TabReference matching this ID in the monitor's current state
-                ref = next((r for r in self.tabs_monitor.previous_tab_refs if r.id == tab_id), None)
+            if tab_id:
+                ref = refs.get(tab_id)
                 if ref:
                     tabs_to_save.append(ref)
                 else:
                     logger.warning(f"Polling update: Could not find TabReference for ID {tab_id}")
 
-        # Queue each ref for saving via the worker
+        # Queue each ref for saving (never waits on the ingest pipeline)
         for tab_ref in tabs_to_save:
             logger.debug(f"Polling: Queueing save for tab {tab_ref.id[:8]} ({tab_ref.url}) ")
-            # Wrap worker call in lambda to pass arguments correctly
-            self.run_worker(lambda ref=tab_ref: self._save_tab_ref_worker(ref), thread=True)
+            self._save_tab_ref(tab_ref)
 
     async def _handle_tab_interaction_update(self, tab_ref: TabReference):
         """Callback for interaction-based tab updates."""
         display_url = tab_ref.url[:80] + "..." if len(tab_ref.url) > 80 else tab_ref.url
         logger.debug(f"Received interaction update for tab {tab_ref.id[:8]}: {display_url}")
-        # Queue the ref for saving via the worker
-        # Wrap worker call in lambda to pass arguments correctly
-        self.run_worker(lambda ref=tab_ref: self._save_tab_ref_worker(ref), thread=True)
+        # Queue the ref for saving (never waits on the ingest pipeline)
+        self._save_tab_ref(tab_ref)
 
-    def _save_tab_ref_worker(self, tab_ref: TabReference):
-        """Synchronous worker to save a TabReference to DocDB."""
+    def _recently_stored_urls(self, urls: List[str]) -> Set[str]:
+        """Startup tabs that don't need capturing yet (called by the monitor in a thread)."""
         if self.doc_db is None:
-            logger.error("Cannot save tab reference: DocDB not initialized.")
-            return
+            return set()
+        return self.doc_db.get_recently_stored_urls(
+            urls, since=datetime.now() - STARTUP_RECAPTURE_AFTER
+        )
 
-        if not tab_ref.markdown:
-            logger.debug(f"Skipping save for tab {tab_ref.id[:8]}: No markdown content.")
+    def _save_tab_ref(self, tab_ref: TabReference):
+        """Queue a TabReference for saving to DocDB via the ingest pipeline."""
+        if self.ingest_pipeline is None:
+            logger.error("Cannot save tab reference: DocDB not initialized.")
             return
-
-        logger.info(f"Saving tab content to DB: {tab_ref.url}")
-
-        try:
-            if not tab_ref.html:
-                # If HTML is missing, it likely means the content fetch failed or the
-                # page wasn't HTML. We can't extract meaningful metadata or reliably
-                # store the content without it.
-                logger.warning(
-                    f"Skipping save for tab {tab_ref.id[:8]} ({tab_ref.url}): Missing HTML content in TabReference."
-                )
-                return
-
-            doc_title = tab_ref.title  # Start with title from tab reference
-            doc_description = None
-            doc_author = None
-            doc_created_at = None
-            doc_keywords = []
-            additional_metadata = {}
-
-            # If we have HTML, try to extract richer metadata
-            if tab_ref.html:
-                try:
-                    extracted_meta = extract_metadata(tab_ref.html, tab_ref.url)
-                    # Prioritize extracted title, fallback to tab title
-                    if extracted_meta.title:
-                        doc_title = extracted_meta.title
-                    doc_description = extracted_meta.description
-                    doc_author = extracted_meta.author
-
-                    # Handle published_at (save as created_at in Doc)
-                    if extracted_meta.published_at:
-                        doc_created_at = Doc.format_date(extracted_meta.published_at)
-
-                    # Handle keywords
-                    if extracted_meta.keywords:
-                        doc_keywords = extracted_meta.keywords
-
-                    if extracted_meta.og_image:
-                        additional_metadata["og_image"] = str(extracted_meta.og_image)
-                    if extracted_meta.favicon:
-                        additional_metadata["favicon"] = str(extracted_meta.favicon)
-                except Exception as meta_ex:
-                    logger.warning(f"Failed to extract HTML metadata for {tab_ref.url}: {meta_ex}")
-
-            # Construct the Doc object for storage
-            doc = Doc(
-                id=Doc.generate_id(),  # Generate ID for the pydantic model
-                url=tab_ref.url,
-                title=doc_title,  # Use potentially updated title
-                description=doc_description,  # Add extracted description
-                text_content=tab_ref.markdown,  # Use markdown as the text content
-                source="chrome",
-                contact_name=doc_author,  # Use author as contact_name
-                created_at=doc_created_at,  # Use publication date as created_at
-                keywords=doc_keywords,  # Add keywords from metadata
-                metadata=additional_metadata,  # Include extracted fields
-            )
-
-            # Store the document (handles new/update/merge logic)
-            success = self.doc_db.store_document(doc)
-
-            if success:
-                logger.success(f"Successfully saved/updated tab in DB: {tab_ref.url}")
-            else:
-                # store_document logs its own errors, but we can add context
-                logger.warning(f"Problem saving tab to DB (check previous logs): {tab_ref.url}")
-
-        except Exception as e:
-            logger.error(f"Error in _save_tab_ref_worker for {tab_ref.url}: {e}", exc_info=True)
+        self.ingest_pipeline.submit(tab_ref)
 
     async def _stop_tab_monitoring_if_running(self):
         """Checks if tab monitoring is running and stops it if so."""
@@ -8,8 +8,10 @@ from __future__ import annotations
 
 import json
 import os
+import re
+from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterable, List, NamedTuple, Sequence
 
 import duckdb
 import lancedb
@@ -20,6 +22,7 @@ from platformdirs import user_data_dir
 
 from brocc_li.embed.chunk_markdown import chunk_markdown
 from brocc_li.merge_md import MergeResultType, merge_md
+from brocc_li.parsers.feed_items import FeedItem, item_key
 from brocc_li.types.doc import BaseDocFields, Chunk, Doc, LanceChunk
 from brocc_li.utils.chunk_equality import chunks_are_identical
 from brocc_li.utils.geolocation import (
@@ -52,6 +55,70 @@ DEFAULT_LANCE_DIRNAME = "vector_store"
 DOCUMENTS_TABLE = "docs"
 DUCKDB_CHUNKS_TABLE = "chunks"
 LANCE_CHUNKS_TABLE = "chunks"
+# Feed item (post URL / URN, see parsers.feed_items.item_key) -> documents containing it
+ITEMS_TABLE = "doc_items"
+
+CREATE_ITEMS_SQL = f"""CREATE TABLE IF NOT EXISTS {ITEMS_TABLE} (
+                    item_key VARCHAR,
+                    doc_id VARCHAR,
+                    content_hash VARCHAR,
+                    last_seen VARCHAR,
+                    PRIMARY KEY (item_key, doc_id)
+                )"""
+
+
+class PreparedDocument(NamedTuple):
+    """A document chunked for storage by `prepare_document`, ready for `write_document`."""
+
+    doc_data: dict[str, Any]
+    text_content: str
+    chunks: list[Chunk]  # Chunks of text_content, compared with the stored ones
+    items: Sequence[FeedItem] | None
+
+
+class VectorUpdate(NamedTuple):
+    """Chunks written to DuckDB by `write_document` whose vectors `store_vectors` adds."""
+
+    doc_id: str
+    doc_data: dict[str, Any]
+    chunks: list[Chunk]
+    replace: bool  # The document's existing vectors are deleted first
+
+
+_MD_IMAGE_RE = re.compile(r"!\[[^\]]*\]\([^)]*\)")
+_MD_LINK_RE = re.compile(r"\[([^\]]*)\]\([^)]*\)")
+_WORD_RE = re.compile(r"\w+")
+
+
+def _words(text: str) -> str:
+    """Lowercased words only, padded with spaces so whole-word sequences can be searched."""
+    return f" {' '.join(_WORD_RE.findall(text.lower()))} "
+
+
+def _item_words(item: FeedItem) -> str:
+    # Chunk text comes from the rendered markdown: link text stays, URLs and images don't
+    return _words(_MD_LINK_RE.sub(r"\1", _MD_IMAGE_RE.sub(" ", item.markdown)))
+
+
+def _only_known_items(chunk: Chunk, known_words: Sequence[str]) -> bool:
+    """
+    Whether a chunk's text is made up of known items. The first and last pieces may be
+    part of an item that spans a chunk boundary; anything else left over means the chunk
+    has other content and is embedded.
+    """
+    text = _words(" ".join(part["text"] for part in chunk.content if part.get("type") == "text"))
+    if not text.strip():
+        return False
+    for words in known_words:
+        while words.strip() and words in text:
+            text = text.replace(words, " \0 ")
+    pieces = [piece.strip() for piece in text.split("\0")]
+    if len(pieces) > 2 and any(pieces[1:-1]):
+        return False
+    return all(
+        not piece or any(f" {piece} " in words for words in known_words)
+        for piece in (pieces[0], pieces[-1])
+    )
 
 
 def get_duckdb_path() -> str:
@@ -340,6 +407,8 @@ class DocDB:
                 create_chunks_sql = generate_create_table_sql(Chunk, DUCKDB_CHUNKS_TABLE)
                 conn.execute(create_chunks_sql)
 
+                conn.execute(CREATE_ITEMS_SQL)
+
             # If we get here without exception, DuckDB is initialized
             self.duckdb_status["initialized"] = True
         except Exception as e:
@@ -373,6 +442,21 @@ class DocDB:
             else:
                 return set() if df.is_empty() else {df.item()}
 
+    def get_recently_stored_urls(self, urls: Iterable[str], since: datetime) -> set[str]:
+        """The subset of URLs with a document stored (or updated) at or after since."""
+        urls = list(dict.fromkeys(urls))
+        if not urls:
+            return set()
+        placeholders = ", ".join(["?"] * len(urls))
+        # ingested_at is an ISO string written with Doc.format_date, so it sorts as text
+        query = (
+            f"SELECT DISTINCT url FROM {DOCUMENTS_TABLE} "
+            f"WHERE url IN ({placeholders}) AND ingested_at >= ?"
+        )
+        with self._get_connection() as conn:
+            rows = conn.execute(query, [*urls, Doc.format_date(since)]).fetchall()
+            return {row[0] for row in rows}
+
     def get_documents_by_url(self, url: str) -> list[dict[str, Any]]:
         """Retrieve all documents with the given URL."""
         if not url:
@@ -416,6 +500,68 @@ class DocDB:
             raw_dicts = polars_to_dicts(df)
             return [process_duckdb_chunk(chunk) for chunk in raw_dicts]
 
+    def get_item_doc_ids(self, key: str) -> list[str]:
+        """IDs of the documents containing a feed item, most recently seen first."""
+        with self._get_connection() as conn:
+            rows = conn.execute(
+                f"SELECT doc_id FROM {ITEMS_TABLE} WHERE item_key = ? ORDER BY last_seen DESC",
+                [key],
+            ).fetchall()
+            return [row[0] for row in rows]
+
+    def get_known_item_keys(self, keys: Iterable[str], exclude_url: str | None = None) -> set[str]:
+        """The subset of item keys already stored, ignoring documents at exclude_url."""
+        with self._get_connection() as conn:
+            return self._known_item_keys(conn, keys, exclude_url)
+
+    def _known_item_keys(
+        self, conn: duckdb.DuckDBPyConnection, keys: Iterable[str], exclude_url: str | None
+    ) -> set[str]:
+        keys = list(dict.fromkeys(keys))
+        if not keys:
+            return set()
+        placeholders = ", ".join(["?"] * len(keys))
+        query = (
+            f"SELECT DISTINCT i.item_key FROM {ITEMS_TABLE} i "
+            f"JOIN {DOCUMENTS_TABLE} d ON d.id = i.doc_id "
+            f"WHERE i.item_key IN ({placeholders})"
+        )
+        params: list[Any] = list(keys)
+        if exclude_url:
+            query += " AND d.url IS DISTINCT FROM ?"
+            params.append(exclude_url)
+        return {row[0] for row in conn.execute(query, params).fetchall()}
+
+    def _known_item_words(
+        self, conn: duckdb.DuckDBPyConnection, items: Sequence[FeedItem], url: str | None
+    ) -> list[str]:
+        """Words of the posts already stored under another URL, for `_chunks_to_embed`."""
+        known = self._known_item_keys(conn, (item_key(item) for item in items), url)
+        return [_item_words(item) for item in items if item_key(item) in known]
+
+    def _chunks_to_embed(self, chunks: list[Chunk], known_words: Sequence[str]) -> list[Chunk]:
+        """Leave out chunks holding only posts already embedded with another document."""
+        if not known_words:
+            return chunks
+        kept = [chunk for chunk in chunks if not _only_known_items(chunk, known_words)]
+        if len(kept) < len(chunks):
+            logger.info(
+                f"Not embedding {len(chunks) - len(kept)}/{len(chunks)} chunks of items "
+                "already stored in other documents"
+            )
+        return kept
+
+    def _index_items(
+        self, conn: duckdb.DuckDBPyConnection, doc_id: str, items: Sequence[FeedItem]
+    ) -> None:
+        """Record that the document contains these items (known ones included)."""
+        last_seen = Doc.format_date(datetime.now())
+        conn.executemany(
+            f"INSERT OR REPLACE INTO {ITEMS_TABLE} (item_key, doc_id, content_hash, last_seen) "
+            "VALUES (?, ?, ?, ?)",
+            [[item_key(item), doc_id, item.content_hash, last_seen] for item in items],
+        )
+
     def vector_search(
         self,
         query: str,
@@ -799,9 +945,13 @@ class DocDB:
             conn: DuckDB connection
             doc_id: The document ID whose chunks should be deleted
         """
+        self._delete_duckdb_chunks(conn, doc_id)
+        self._delete_lance_chunks(doc_id)
+
+    def _delete_duckdb_chunks(self, conn: duckdb.DuckDBPyConnection, doc_id: str) -> None:
         conn.execute(f"DELETE FROM {DUCKDB_CHUNKS_TABLE} WHERE doc_id = ?", [doc_id])
 
-        # Also delete from LanceDB
+    def _delete_lance_chunks(self, doc_id: str) -> None:
         if self.lance_db:
             try:
                 table = self.lance_db.open_table(LANCE_CHUNKS_TABLE)
@@ -816,18 +966,40 @@ class DocDB:
                     "Vector storage disabled due to error - future operations will be skipped"
                 )
 
-    def store_document(self, document: Doc) -> bool:
+    def store_document(self, document: Doc, items: Sequence[FeedItem] | None = None) -> bool:
         """
         Store a document in the database, updating if it already exists.
         If content differs but is mergeable, updates with merged content.
         Otherwise, creates a new document entry.
 
+        Runs `prepare_document`, `write_document` and `store_vectors` in turn; the
+        ingest pipeline runs them as separate stages.
+
         Args:
             document: A Doc object that must contain text_content for chunking.
+            items: Feed items (posts) in text_content, if the page has them. Chunks holding
+                only items already stored under another URL are kept but not embedded again,
+                and every item is indexed against the stored document.
 
         Returns:
             bool: True if the document was stored successfully.
 
+        Raises:
+            ValueError: If document doesn't contain required text_content field.
+        """
+        update = self.write_document(self.prepare_document(document, items))
+        if update is None:
+            return False
+        self.store_vectors(update)
+        return True
+
+    def prepare_document(
+        self, document: Doc, items: Sequence[FeedItem] | None = None
+    ) -> PreparedDocument:
+        """
+        Chunk a document's text_content for `write_document`. Only reads the database, so
+        it can run alongside writes.
+
         Raises:
             ValueError: If document doesn't contain required text_content field.
         """
@@ -847,7 +1019,6 @@ class DocDB:
 
         # Create a copy of the document data to avoid modifying the original
         doc_data = doc_dict.copy()
-        original_id = doc_data.get("id")
 
         # Generate initial chunks from the *incoming* text content to check for identity
         # We may regenerate these later if merging happens.
@@ -856,11 +1027,29 @@ class DocDB:
         initial_chunks = Doc.create_chunks_for_doc(
             initial_doc_obj_for_chunking, initial_chunked_content
         )
+        return PreparedDocument(doc_data, text_content, initial_chunks, items)
+
+    def write_document(self, prepared: PreparedDocument) -> VectorUpdate | None:
+        """
+        Write a prepared document and its chunks to DuckDB, merging with a stored version
+        of it where possible. Callers serialize writes: the document found for update and
+        the merge are only valid until the next write.
+
+        Returns:
+            The vectors to store (possibly none), or None if the document wasn't stored.
+        """
+        doc_data = prepared.doc_data.copy()
+        text_content = prepared.text_content
+        items = prepared.items
+        original_id = doc_data.get("id")
 
         with self._get_connection() as conn:
+            # Looked up here, in the single writer, so concurrent saves of the same posts agree
+            known_words = self._known_item_words(conn, items, doc_data.get("url")) if items else []
+
             # Check if an existing document needs to be updated or merged
             id_to_update, should_update_chunks, content_to_use = self._find_id_for_update(
-                doc_data, doc_data, initial_chunks, text_content
+                doc_data, doc_data, prepared.chunks, text_content
             )
 
             if id_to_update:
@@ -871,6 +1060,7 @@ class DocDB:
                 self._update_document(conn, db_document, id_to_update)
                 logger.debug(f"Updated metadata for document ID {id_to_update}")
 
+                update = VectorUpdate(id_to_update, doc_data, [], replace=False)
                 if should_update_chunks:
                     # Content was merged, need to regenerate chunks
                     logger.debug(
@@ -881,7 +1071,7 @@ class DocDB:
                         logger.error(
                             f"Error: should_update_chunks is True but content_to_use is None for doc {id_to_update}. Skipping chunk update."
                         )
-                        return False  # Indicate potential issue
+                        return None  # Indicate potential issue
 
                     # Regenerate chunks based on the merged content
                     merged_chunked_content = chunk_markdown(content_to_use)
@@ -891,12 +1081,20 @@ class DocDB:
                         doc_obj_for_merged_chunks, merged_chunked_content
                     )
 
-                    # Delete old chunks and store new ones
-                    self._delete_chunks(conn, id_to_update)
+                    # Replace the old chunks; their vectors are replaced by store_vectors
+                    self._delete_duckdb_chunks(conn, id_to_update)
                     self._store_duckdb_chunks(conn, merged_chunks)
-                    self._store_lance_chunks(merged_chunks, doc_data)  # Pass doc_data for metadata
+                    update = VectorUpdate(
+                        id_to_update,
+                        doc_data,
+                        self._chunks_to_embed(merged_chunks, known_words),
+                        replace=True,
+                    )
                 # else: Content was identical, only metadata was updated above.
 
+                if items:
+                    self._index_items(conn, id_to_update, items)
+
             else:
                 # No suitable existing document found, or merge wasn't possible/chosen.
                 # Create a completely new document entry.
@@ -930,9 +1128,24 @@ class DocDB:
                 # Insert new document and its chunks
                 self._insert_document(conn, db_document)
                 self._store_duckdb_chunks(conn, final_chunks)
-                self._store_lance_chunks(final_chunks, doc_data)
+                update = VectorUpdate(
+                    doc_data["id"],
+                    doc_data,
+                    self._chunks_to_embed(final_chunks, known_words),
+                    replace=False,
+                )
 
-        return True
+                if items:
+                    self._index_items(conn, doc_data["id"], items)
+
+        return update
+
+    def store_vectors(self, update: VectorUpdate) -> None:
+        """Store (embed) the chunks written by `write_document` in LanceDB."""
+        if update.replace:
+            self._delete_lance_chunks(update.doc_id)
+        if update.chunks:
+            self._store_lance_chunks(update.chunks, update.doc_data)  # doc_data for metadata
 
     def launch_duckdb_ui(self) -> None:
         """https://duckdb.org/docs/stable/extensions/ui.html"""
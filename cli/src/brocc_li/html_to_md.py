@@ -1,101 +1,55 @@
-import concurrent.futures
+import hashlib
 import re
-from typing import Any, Callable, Dict, List, Optional, Union, cast
+import threading
+from collections import OrderedDict
+from enum import Enum
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    Hashable,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+    Union,
+    cast,
+)
 from urllib.parse import urljoin, urlparse
 
 from bs4 import BeautifulSoup, Tag
-from bs4.element import Comment
+from bs4.element import CData, Comment, NavigableString
+from markdownify import MarkdownConverter
 from markdownify import markdownify as md
 
+from brocc_li.parser_pool import get_parser_pool
+from brocc_li.parser_registry import ParserRoute, resolve_parser
+
 # Import specific parsers directly
-from brocc_li.parsers.bsky_feed import bsky_feed_html_to_md
-from brocc_li.parsers.bsky_followers import bsky_followers_html_to_md
-from brocc_li.parsers.bsky_profile import bsky_profile_html_to_md
-from brocc_li.parsers.gmail_inbox import gmail_inbox_html_to_md
-from brocc_li.parsers.instagram_explore import instagram_explore_html_to_md
-from brocc_li.parsers.instagram_explore_search import instagram_explore_search_html_to_md
-from brocc_li.parsers.instagram_home import instagram_home_html_to_md
-from brocc_li.parsers.instagram_inbox import instagram_inbox_html_to_md
-from brocc_li.parsers.instagram_profile import instagram_profile_html_to_md
-from brocc_li.parsers.instagram_saved_collection import instagram_saved_collection_html_to_md
-from brocc_li.parsers.linkedin_company import linkedin_company_html_to_md
-from brocc_li.parsers.linkedin_company_about import linkedin_company_about_html_to_md
-from brocc_li.parsers.linkedin_company_people import linkedin_company_people_html_to_md
-from brocc_li.parsers.linkedin_connections_me import linkedin_connections_me_html_to_md
-from brocc_li.parsers.linkedin_feed_v2 import (
-    linkedin_feed_html_to_md as linkedin_feed_v2_html_to_md,
-)
-from brocc_li.parsers.linkedin_followers import linkedin_followers_html_to_md
-from brocc_li.parsers.linkedin_messages import linkedin_messages_html_to_md
-from brocc_li.parsers.linkedin_profile import linkedin_profile_html_to_md
-from brocc_li.parsers.linkedin_search_connections import linkedin_search_connections_html_to_md
-from brocc_li.parsers.threads_activity import threads_activity_html_to_md
-from brocc_li.parsers.threads_home import threads_home_html_to_md
-from brocc_li.parsers.twitter_bookmarks import twitter_bookmarks_html_to_md
-from brocc_li.parsers.twitter_home import twitter_feed_html_to_md
-from brocc_li.parsers.twitter_inbox import twitter_inbox_html_to_md
-from brocc_li.parsers.twitter_likes import twitter_likes_html_to_md
-from brocc_li.parsers.twitter_profile import twitter_profile_html_to_md
-from brocc_li.parsers.twitter_profile_followers import twitter_followers_html_to_md
-from brocc_li.parsers.twitter_thread import twitter_thread_html_to_md
-from brocc_li.parsers.youtube_history import youtube_history_html_to_md
-from brocc_li.parsers.youtube_home import youtube_home_html_to_md
+from brocc_li.utils.html_metadata import HtmlMetadata, extract_metadata, extract_metadata_from_soup
 from brocc_li.utils.logger import logger
 
+if TYPE_CHECKING:
+    from brocc_li.parsers.feed_items import FeedItem
+
 # Debug flag - set to match the test debug setting
 DEBUG = False  # This gets imported by the test
 
 # Default timeout for parsers in seconds
 PARSER_TIMEOUT = 3
 
-# Parser Registry: Maps URL regex patterns to specific parser functions
-# More specific patterns should come first
-# Reverted to specific Callable hint
-PARSER_REGISTRY: Dict[str, Callable[[str, bool], Optional[str]]] = {
-    # Gmail
-    r"https://mail\.google\.com/mail/u/\d+/\#inbox(\?.+)?$": gmail_inbox_html_to_md,
-    # Instagram
-    r"https://www\.instagram\.com/?(\?.+)?$": instagram_home_html_to_md,
-    r"https://www\.instagram\.com/direct/inbox/?(\?.+)?$": instagram_inbox_html_to_md,
-    r"https://www\.instagram\.com/explore/search/.*": instagram_explore_search_html_to_md,  # Instagram search
-    r"https://www\.instagram\.com/explore/.*": instagram_explore_html_to_md,  # Instagram explore
-    r"https://www\.instagram\.com/([^/]+)/saved/.*": instagram_saved_collection_html_to_md,  # Instagram saved collection
-    r"https://www\.instagram\.com/([^/]+)/?(\?.+)?$": instagram_profile_html_to_md,  # Profile (needs to be after inbox)
-    # Threads
-    r"https://www\.threads\.net/activity/?(\?.+)?$": threads_activity_html_to_md,  # Threads activity
-    r"https://www\.threads\.net/?(\?.+)?$": threads_home_html_to_md,  # Threads home
-    # Bluesky
-    r"https://bsky\.app/?(\?.+)?$": bsky_feed_html_to_md,  # Bluesky feed/home
-    r"https://bsky\.app/profile/([^/]+)/follows(\?.+)?$": bsky_followers_html_to_md,  # Bluesky following
-    r"https://bsky\.app/profile/([^/]+)/followers(\?.+)?$": bsky_followers_html_to_md,  # Bluesky followers
-    r"https://bsky\.app/profile/([^/]+)/?(\?.+)?$": bsky_profile_html_to_md,  # Bluesky profile
-    # LinkedIn - Company
-    r"https://www\.linkedin\.com/company/([^/]+)/about/?(\?.+)?$": linkedin_company_about_html_to_md,
-    r"https://www\.linkedin\.com/company/([^/]+)/people/?(\?.+)?$": linkedin_company_people_html_to_md,
-    r"https://www\.linkedin\.com/company/([^/]+)/posts/.*": linkedin_feed_v2_html_to_md,  # Use new feed parser for company posts
-    r"https://www\.linkedin\.com/company/([^/]+)/?(\?.+)?$": linkedin_company_html_to_md,
-    # LinkedIn - User specific
-    r"https://www\.linkedin\.com/messaging/.*": linkedin_messages_html_to_md,  # Catches all message views
-    r"https://www\.linkedin\.com/in/([^/]+)/recent-activity/.*": linkedin_feed_v2_html_to_md,  # User's recent activity feed
-    r"https://www\.linkedin\.com/in/([^/]+)/?(\?.+)?$": linkedin_profile_html_to_md,
-    r"https://www\.linkedin\.com/mynetwork/invite-connect/connections/?(\?.+)?$": linkedin_connections_me_html_to_md,  # Updated My Connections URL
-    r"https://www\.linkedin\.com/mynetwork/network-manager/people-follow/followers/.*": linkedin_followers_html_to_md,  # LinkedIn followers page
-    r"https://www\.linkedin\.com/mynetwork/network-manager/people-follow/following/.*": linkedin_followers_html_to_md,  # LinkedIn following page
-    r"https://www\.linkedin\.com/search/results/people/.*": linkedin_search_connections_html_to_md,  # General People Search results
-    r"https://www\.linkedin\.com/feed/followers/.*": linkedin_followers_html_to_md,  # LinkedIn followers page
-    r"https://www\.linkedin\.com/feed/.*": linkedin_feed_v2_html_to_md,  # Use new feed parser for all feed URLs
-    # Twitter / X
-    r"https://(x|twitter)\.com/home(\?.+)?$": twitter_feed_html_to_md,
-    r"https://(x|twitter)\.com/messages.*": twitter_inbox_html_to_md,
-    r"https://(x|twitter)\.com/i/bookmarks(\?.+)?$": twitter_bookmarks_html_to_md,
-    r"https://(x|twitter)\.com/([^/]+)/likes(\?.+)?$": twitter_likes_html_to_md,
-    r"https://(x|twitter)\.com/([^/]+)/followers(\?.+)?$": twitter_followers_html_to_md,
-    r"https://(x|twitter)\.com/([^/]+)/status/(\d+)(\?.+)?$": twitter_thread_html_to_md,  # Specific tweet/thread
-    r"https://(x|twitter)\.com/([^/]+)/?(\?.+)?$": twitter_profile_html_to_md,  # Profile needs to be after specific sub-pages like /likes, /followers
-    # YouTube
-    r"https://www\.youtube\.com/feed/history(\?.+)?$": youtube_history_html_to_md,
-    r"https://www\.youtube\.com/?(\?.+)?$": youtube_home_html_to_md,
-}
+
+class ParserBackend(str, Enum):
+    """HTML tree builders available to the generic conversion path."""
+
+    LXML = "lxml"
+    HTML5LIB = "html5lib"  # Spec-compliant but several times slower than lxml
+    SELECTOLAX = "selectolax"  # lexbor strips dead weight, lxml builds the soup (optional dep)
+
+
+# Backend used when callers don't pass one explicitly
+GENERIC_PARSER_BACKEND = ParserBackend.LXML
 
 # JS framework detection patterns
 JS_FRAMEWORK_PATTERNS = [
@@ -136,70 +90,141 @@ CONTENT_START_PATTERNS = r"function|document|window|\{|\}|var|const|let|==|=>|\(
 
 # Pattern to match all variants of the broccoli banner text
 BANNER_TEXT_PATTERN = r"🥦\s*(Reading|READING).*?(pages|PAGES|\.\.\.)"
+BANNER_TEXT_RE = re.compile(BANNER_TEXT_PATTERN, re.IGNORECASE)
 
 
-def clean_html(html: str) -> BeautifulSoup:
-    """Clean HTML by removing scripts, comments and unwanted elements."""
+# Shared markdownify options for every generic conversion
+MARKDOWN_OPTIONS: Dict[str, Any] = {"escape_misc": True, "heading_style": "ATX"}
+
+
+class ConvertedPage(NamedTuple):
+    """Markdown plus page metadata, produced from a single parse of the HTML."""
+
+    markdown: Optional[str]
+    metadata: Optional[HtmlMetadata] = None
+    cached: bool = False  # True if served from the conversion cache (HTML seen before)
+    items: Optional[List["FeedItem"]] = None  # Per-post items, for feed and timeline parsers
+
+
+# Conversions are memoized by (parser route, HTML hash). Interaction-triggered fetches
+# are often byte-identical to the previous one, so hits skip parsing entirely.
+CONVERSION_CACHE_SIZE = 64
+
+_conversion_cache: "OrderedDict[Hashable, ConvertedPage]" = OrderedDict()
+_conversion_cache_lock = threading.Lock()
+
+
+def clear_conversion_cache() -> None:
+    with _conversion_cache_lock:
+        _conversion_cache.clear()
+
+
+def _cache_get(key: Hashable) -> Optional[ConvertedPage]:
+    with _conversion_cache_lock:
+        page = _conversion_cache.get(key)
+        if page is not None:
+            _conversion_cache.move_to_end(key)
+        return page
+
+
+def _cache_put(key: Hashable, page: ConvertedPage) -> None:
+    with _conversion_cache_lock:
+        _conversion_cache[key] = page
+        _conversion_cache.move_to_end(key)
+        while len(_conversion_cache) > CONVERSION_CACHE_SIZE:
+            _conversion_cache.popitem(last=False)
+
+
+def parse_html(html: str, backend: Optional[ParserBackend] = None) -> BeautifulSoup:
+    """Parse raw HTML into the tree shared by metadata extraction and generic conversion."""
+    backend = backend or GENERIC_PARSER_BACKEND
     if DEBUG:
-        logger.info(f"Parsing HTML with size: {len(html)} bytes")
+        logger.info(f"Parsing HTML with size: {len(html)} bytes using {backend.value}")
+
+    if backend is ParserBackend.SELECTOLAX:
+        stripped = _lexbor_strip(html)
+        if stripped is not None:
+            return BeautifulSoup(stripped, ParserBackend.LXML.value)
+        backend = ParserBackend.LXML
 
-    soup = BeautifulSoup(html, "html5lib")
+    return BeautifulSoup(html, backend.value)
 
+
+def _lexbor_strip(html: str) -> Optional[str]:
+    """
+    Drop ELEMENTS_TO_REMOVE with lexbor before handing the (much smaller) document to lxml.
+    JSON-LD scripts survive so metadata extraction still sees them.
+    Returns None if selectolax isn't installed.
+    """
+    try:
+        from selectolax.lexbor import LexborHTMLParser
+    except ImportError:
+        logger.warning("selectolax is not installed, falling back to lxml")
+        return None
+
+    tree = LexborHTMLParser(html)
+    for node in tree.css(", ".join(ELEMENTS_TO_REMOVE)):
+        if node.tag == "script" and node.attributes.get("type") == "application/ld+json":
+            continue
+        node.decompose()
+    return tree.html or ""
+
+
+def bs4_features(backend: Optional[ParserBackend] = None) -> str:
+    """BeautifulSoup `features` string for a backend (selectolax builds its soup with lxml)."""
+    backend = backend or GENERIC_PARSER_BACKEND
+    return ParserBackend.LXML.value if backend is ParserBackend.SELECTOLAX else backend.value
+
+
+def clean_html(html: str, backend: Optional[ParserBackend] = None) -> BeautifulSoup:
+    """Clean HTML by removing scripts, comments and unwanted elements."""
+    return clean_soup(parse_html(html, backend))
+
+
+def _is_removable_tag(tag: Tag) -> bool:
+    # ELEMENTS_TO_REMOVE, plus anything carrying inline JS handlers (onclick, onload...)
+    return tag.name in ELEMENTS_TO_REMOVE or any(
+        attr.startswith("on") for attr in tag.attrs if isinstance(attr, str)
+    )
+
+
+def clean_soup(soup: BeautifulSoup) -> BeautifulSoup:
+    """
+    Clean an already-parsed soup in place (see clean_html).
+
+    One pre-order walk: removable subtrees are dropped without descending into them,
+    comments and banner strings are extracted along the way.
+    """
     # Count elements before cleaning
     if DEBUG:
         element_count_before = len(soup.find_all())
-        script_count = len(soup.find_all("script"))
-        style_count = len(soup.find_all("style"))
-        comment_count = len(soup.find_all(string=lambda text: isinstance(text, Comment)))
-        logger.info(
-            f"Before cleaning: {element_count_before} total elements, {script_count} scripts, {style_count} styles, {comment_count} comments"
-        )
-
-    # Remove all script, style tags and their contents
-    for tag_name in ELEMENTS_TO_REMOVE:
-        removed = 0
-        for script in soup(tag_name):
-            script.decompose()
-            removed += 1
-        if DEBUG and removed > 0:
-            logger.info(f"Removed {removed} {tag_name} elements")
-
-    # Remove all html comments
-    comments_removed = 0
-    for comment in soup.find_all(string=lambda text: isinstance(text, Comment)):
-        comment.extract()
-        comments_removed += 1
-    if DEBUG and comments_removed > 0:
-        logger.info(f"Removed {comments_removed} HTML comments")
-
-    # Remove the banner text if present
-    banner_removed = 0
-    for element in soup.find_all(
-        string=lambda text: bool(
-            text and re.search(BANNER_TEXT_PATTERN, text, re.IGNORECASE) is not None
-        )
-    ):
-        element.extract()
-        banner_removed += 1
 
-    if DEBUG and banner_removed > 0:
-        logger.info(f"Removed {banner_removed} elements with banner text")
-
-    # Remove all elements with inline JS handlers
-    js_handlers_removed = 0
-    for element in soup.find_all(
-        lambda tag: any(attr.startswith("on") for attr in tag.attrs if isinstance(attr, str))
-    ):
-        element.decompose()
-        js_handlers_removed += 1
-    if DEBUG and js_handlers_removed > 0:
-        logger.info(f"Removed {js_handlers_removed} elements with JS event handlers")
+    tags_removed = comments_removed = banner_removed = 0
+    stack: List[Tag] = [soup]
+    while stack:
+        node = stack.pop()
+        # Copy: removals below mutate node.contents
+        for child in list(node.contents):
+            if isinstance(child, Tag):
+                if _is_removable_tag(child):
+                    child.decompose()
+                    tags_removed += 1
+                else:
+                    stack.append(child)
+            elif isinstance(child, Comment):
+                child.extract()
+                comments_removed += 1
+            elif BANNER_TEXT_RE.search(child):
+                child.extract()
+                banner_removed += 1
 
     # Count elements after cleaning
     if DEBUG:
         element_count_after = len(soup.find_all())
         logger.info(
-            f"After cleaning: {element_count_after} elements remain (removed {element_count_before - element_count_after})"
+            f"Cleaning removed {tags_removed} script/style/handler subtrees, "
+            f"{comments_removed} comments, {banner_removed} banner strings; "
+            f"{element_count_after} of {element_count_before} elements remain"
         )
 
     return soup
@@ -285,8 +310,110 @@ def is_good_content_container(container: Tag) -> bool:
     return True
 
 
-def extract_content(soup: BeautifulSoup, html: str) -> Tag:
-    """Extract the meaningful content from the soup."""
+HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+
+# String types counted by get_text() on ordinary tags (no comments, template or ruby text)
+_TEXT_STRING_TYPES = frozenset([NavigableString, CData])
+
+# Bare "tag", ".class" or "#id" selectors can be matched during the scan itself
+_SIMPLE_SELECTOR_RE = re.compile(r"^([.#]?)([A-Za-z_][\w-]*)$")
+
+
+class ContentStats(NamedTuple):
+    """
+    Aggregates over a tag's descendants (the tag itself not included).
+    Text counts ordinary strings only, as get_text() does on any tag but <template>.
+    """
+
+    elements: int  # len(tag.find_all())
+    text: int  # len(tag.get_text(strip=True))
+    paragraphs: int  # len(tag.find_all("p"))
+    headings: int  # len(tag.find_all(["h1", ..., "h6"]))
+    paragraph_text: int  # sum(len(p.get_text(strip=True)) for p in tag.find_all("p"))
+
+
+class ContentScan(NamedTuple):
+    stats: Dict[int, ContentStats]  # Keyed by id(tag), root included
+    selector_matches: Dict[str, Tag]  # First match in document order, like select_one
+    divs: List[Tag]  # In document order
+
+
+def scan_content_tree(root: Tag, selectors: List[str]) -> ContentScan:
+    """
+    Walk the tree once: match simple selectors top-down in document order, then fold
+    each node's children into ContentStats bottom-up. O(n) overall, instead of a
+    find_all/get_text per candidate container and a CSS engine pass per selector.
+    Selectors that aren't a bare tag, .class or #id fall back to select_one.
+    """
+    by_tag: Dict[str, List[str]] = {}
+    by_class: Dict[str, List[str]] = {}
+    by_id: Dict[str, List[str]] = {}
+    selector_matches: Dict[str, Tag] = {}
+    for selector in selectors:
+        simple = _SIMPLE_SELECTOR_RE.match(selector)
+        if simple is None:
+            selected = root.select_one(selector)
+            if selected is not None:
+                selector_matches[selector] = selected
+            continue
+        prefix, value = simple.groups()
+        index = by_class if prefix == "." else by_id if prefix == "#" else by_tag
+        index.setdefault(value if prefix else value.lower(), []).append(selector)
+
+    def match(node: Tag, index: Dict[str, List[str]], key: Any) -> None:
+        for selector in index.get(key, ()):
+            selector_matches.setdefault(selector, node)
+
+    stats: Dict[int, ContentStats] = {}
+    divs: List[Tag] = []
+    stack: List[Tuple[Tag, bool]] = [(root, False)]
+    while stack:
+        node, children_done = stack.pop()
+        if not children_done:
+            if node is not root:
+                if by_tag:
+                    match(node, by_tag, node.name)
+                if by_class:
+                    classes = node.get("class") or []
+                    for class_name in classes.split() if isinstance(classes, str) else classes:
+                        match(node, by_class, class_name)
+                if by_id:
+                    match(node, by_id, node.get("id"))
+                if node.name == "div":
+                    divs.append(node)
+            stack.append((node, True))
+            # Reversed so children are popped (visited) in document order
+            stack.extend(
+                (child, False) for child in reversed(node.contents) if isinstance(child, Tag)
+            )
+            continue
+
+        elements = text = paragraphs = headings = paragraph_text = 0
+        for child in node.contents:
+            if isinstance(child, Tag):
+                child_stats = stats[id(child)]
+                elements += 1 + child_stats.elements
+                text += child_stats.text
+                paragraphs += child_stats.paragraphs
+                headings += child_stats.headings
+                paragraph_text += child_stats.paragraph_text
+                if child.name == "p":
+                    paragraphs += 1
+                    paragraph_text += child_stats.text
+                elif child.name in HEADING_TAGS:
+                    headings += 1
+            elif type(child) in _TEXT_STRING_TYPES:
+                text += len(child.strip())
+        stats[id(node)] = ContentStats(elements, text, paragraphs, headings, paragraph_text)
+    return ContentScan(stats, selector_matches, divs)
+
+
+def extract_content(soup: BeautifulSoup, html: Optional[str] = None) -> Tag:
+    """
+    Extract the meaningful content from the soup.
+
+    `html` is the raw page source, only used to log detected JS framework patterns.
+    """
     # Get body or fallback to full soup
     content = soup.body if soup.body else soup
 
@@ -296,11 +423,13 @@ def extract_content(soup: BeautifulSoup, html: str) -> Tag:
         else:
             logger.info("No <body> tag found, using full document")
 
-    # Check if this is a JS framework page
-    is_js_framework = any(pattern in html for pattern in JS_FRAMEWORK_PATTERNS)
-    if is_js_framework and DEBUG:
-        detected_patterns = [pattern for pattern in JS_FRAMEWORK_PATTERNS if pattern in html]
-        logger.info(f"Detected JS framework patterns: {', '.join(detected_patterns)}")
+        if html:
+            detected_patterns = [pattern for pattern in JS_FRAMEWORK_PATTERNS if pattern in html]
+            if detected_patterns:
+                logger.info(f"Detected JS framework patterns: {', '.join(detected_patterns)}")
+
+    scan = scan_content_tree(soup, MAIN_CONTENT_SELECTORS)
+    stats = scan.stats
 
     # Try to find the main content container
     best_container = None
@@ -308,17 +437,16 @@ def extract_content(soup: BeautifulSoup, html: str) -> Tag:
 
     # Try each selector in order
     for selector in MAIN_CONTENT_SELECTORS:
-        found = soup.select(selector)
-        if not found:
+        container = scan.selector_matches.get(selector)
+        if container is None:
             continue
 
-        container = found[0]
-
         # Calculate a score for this container
-        element_count = len(container.find_all())
-        text_length = len(container.get_text(strip=True))
-        p_count = len(container.find_all("p"))
-        h_count = len(container.find_all(["h1", "h2", "h3", "h4", "h5", "h6"]))
+        container_stats = stats[id(container)]
+        element_count = container_stats.elements
+        text_length = container_stats.text
+        p_count = container_stats.paragraphs
+        h_count = container_stats.headings
 
         # Only consider containers with substantial content
         if text_length < 50 or element_count < 3:
@@ -353,25 +481,20 @@ def extract_content(soup: BeautifulSoup, html: str) -> Tag:
     if DEBUG:
         logger.info("No suitable content container found, trying paragraph-based detection")
 
-    # Look for divs containing multiple paragraphs
-    div_scores = []
-    for div in soup.find_all("div"):
-        if not isinstance(div, Tag):
-            continue
-        p_tags = div.find_all("p")
-        if len(p_tags) > 2:  # At least 3 paragraphs
-            p_text = sum(len(p.get_text(strip=True)) for p in p_tags)
-            if p_text > 200:  # With substantial text
-                div_scores.append((div, p_text))
-
-    # Sort by paragraph text content
-    div_scores.sort(key=lambda x: x[1], reverse=True)
-
-    if div_scores:
-        best_div, score = div_scores[0]
+    # Look for the div with the most paragraph text (at least 3 paragraphs, 200+ chars).
+    # Strict > keeps the first div in document order on ties.
+    best_div = None
+    best_p_text = 200
+    for div in scan.divs:
+        div_stats = stats[id(div)]
+        if div_stats.paragraphs > 2 and div_stats.paragraph_text > best_p_text:
+            best_div = div
+            best_p_text = div_stats.paragraph_text
+
+    if best_div is not None:
         if DEBUG:
             logger.info(
-                f"Selected div with most paragraph content: {score} chars across {len(best_div.find_all('p'))} paragraphs"
+                f"Selected div with most paragraph content: {best_p_text} chars across {stats[id(best_div)].paragraphs} paragraphs"
             )
         return best_div
 
@@ -433,6 +556,11 @@ def get_strip_list(content: Tag) -> List[Union[str, Dict[str, Any]]]:
     return base_strip_list
 
 
+def soup_to_md(content: Tag, strip_list: List[Union[str, Dict[str, Any]]]) -> str:
+    """Convert an already-parsed tag to markdown without re-serializing and re-parsing it."""
+    return MarkdownConverter(strip=strip_list, **MARKDOWN_OPTIONS).convert_soup(content)
+
+
 def post_process_markdown(markdown: str) -> str:
     """Clean up the markdown after conversion."""
     if DEBUG:
@@ -509,27 +637,29 @@ def run_with_timeout(
     func: Callable, *args, timeout: float = PARSER_TIMEOUT, **kwargs
 ) -> Optional[Any]:
     """
-    Run a function with a timeout.
+    Run a function in the parser pool with a timeout.
 
-    Args:
-        func: The function to run
-        timeout: The timeout in seconds
-        *args, **kwargs: Arguments to pass to the function
+    The worker running a timed-out function is killed, so the work actually stops.
+    func must be picklable (a module-level function).
 
     Returns:
         The result of the function or None if timeout occurs
+
+    Raises:
+        RuntimeError: If the function raised in the worker
     """
-    with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-        future = executor.submit(func, *args, **kwargs)
-        try:
-            return future.result(timeout=timeout)
-        except concurrent.futures.TimeoutError:
-            logger.error(f"Function {func.__name__} timed out after {timeout} seconds")
-            return None
+    job = get_parser_pool().run(func, *args, timeout=timeout, **kwargs)
+    if job.error is not None:
+        raise RuntimeError(job.error)
+    return job.result
 
 
 def html_to_md(
-    html: str, url: Optional[str] = None, debug: bool = False, timeout: float = PARSER_TIMEOUT
+    html: str,
+    url: Optional[str] = None,
+    debug: bool = False,
+    timeout: float = PARSER_TIMEOUT,
+    parser_backend: Optional[ParserBackend] = None,
 ) -> Optional[str]:
     """
     Convert HTML to Markdown with enhanced cleaning and processing.
@@ -541,10 +671,52 @@ def html_to_md(
               If provided, will also be used to convert relative URLs to absolute.
         debug: Optional flag to enable debug logging for this conversion.
         timeout: Timeout in seconds for specific parsers (default: PARSER_TIMEOUT)
+        parser_backend: Tree builder for the generic path (default: GENERIC_PARSER_BACKEND)
 
     Returns:
         Cleaned markdown text or None if conversion fails or yields empty result.
     """
+    return _convert(html, url, debug, timeout, parser_backend, with_metadata=False).markdown
+
+
+def convert_page(
+    html: str,
+    url: Optional[str] = None,
+    debug: bool = False,
+    timeout: float = PARSER_TIMEOUT,
+    parser_backend: Optional[ParserBackend] = None,
+) -> ConvertedPage:
+    """
+    Like html_to_md, but also extracts HtmlMetadata.
+
+    On the generic path the page is parsed once and that tree is used for both the
+    metadata and the markdown. Specific parsers bring their own parsing, so metadata
+    for those pages comes from a separate (lxml) parse.
+    """
+    return _convert(html, url, debug, timeout, parser_backend, with_metadata=True)
+
+
+def _extract_metadata_safely(
+    url: Optional[str], html: Optional[str] = None, soup: Optional[BeautifulSoup] = None
+) -> Optional[HtmlMetadata]:
+    try:
+        if soup is not None:
+            return extract_metadata_from_soup(soup, url)
+        if html is not None:
+            return extract_metadata(html, url)
+    except Exception as e:
+        logger.warning(f"Failed to extract HTML metadata for {url or 'unknown'}: {e}")
+    return None
+
+
+def _convert(
+    html: str,
+    url: Optional[str],
+    debug: bool,
+    timeout: float,
+    parser_backend: Optional[ParserBackend],
+    with_metadata: bool,
+) -> ConvertedPage:
     # Use local debug flag if provided, otherwise global DEBUG
     use_debug = debug or DEBUG
     if use_debug and debug != DEBUG:
@@ -558,48 +730,55 @@ def html_to_md(
         if use_debug:
             logger.info(f"Derived base URL '{base_url}' from URL '{url}'")
 
+    route = resolve_parser(url) if url else None
+    # Specific parsers only see the HTML; the generic path also depends on base_url
+    # (relative links) and the backend. Metadata embeds the full URL.
+    cache_key = (
+        (route.module, route.function) if route else (base_url, parser_backend),
+        url if with_metadata else None,
+        hashlib.blake2b(html.encode("utf-8", "surrogatepass"), digest_size=16).digest(),
+    )
+    cached_page = _cache_get(cache_key)
+    if cached_page is not None:
+        if use_debug:
+            logger.info(f"Conversion cache hit for URL: {url or 'unknown'}")
+        return cached_page._replace(cached=True)
+
+    page, cacheable = _convert_uncached(
+        html, url, route, base_url, use_debug, timeout, parser_backend, with_metadata
+    )
+    if cacheable:
+        _cache_put(cache_key, page)
+    return page
+
+
+def _convert_uncached(
+    html: str,
+    url: Optional[str],
+    route: Optional[ParserRoute],
+    base_url: Optional[str],
+    use_debug: bool,
+    timeout: float,
+    parser_backend: Optional[ParserBackend],
+    with_metadata: bool,
+) -> Tuple[ConvertedPage, bool]:
+    """Returns the page and whether it may be cached (not after a parser timeout or error)."""
     # --- Check for Specific Parser ---
-    if url:
-        for pattern, parser_func in PARSER_REGISTRY.items():
-            if re.match(pattern, url):
-                if use_debug:
-                    logger.info(
-                        f"URL '{url}' matches pattern '{pattern}', using specific parser: {parser_func.__name__}"
-                    )
-                try:
-                    # Pass the effective debug flag to the specific parser
-                    # Explicitly cast to appease linter
-                    specific_parser = cast(Callable[[str, bool], Optional[str]], parser_func)
-
-                    # Use the timeout mechanism
-                    result = run_with_timeout(
-                        specific_parser, html, timeout=timeout, debug=use_debug
-                    )
-
-                    if result is not None:
-                        # Assuming specific parsers return cleaned markdown or None
-                        if use_debug:
-                            logger.info(f"Specific parser {parser_func.__name__} completed.")
-                        return result
-                    elif use_debug:
-                        logger.warning(
-                            f"Specific parser {parser_func.__name__} returned None for URL: {url}. Falling back to generic parser."
-                        )
-                    # If parser returned None, fall through to generic parsing
-                    break  # Stop checking patterns, proceed to generic
-                except Exception as e:
-                    # Log the exception with traceback only if debugging is enabled for this specific run
-                    msg = f"Specific parser {parser_func.__name__} failed for URL {url}: {e}. Falling back to generic parser."
-                    logger.error(msg, exc_info=use_debug)
-                    # Fall through to generic parsing on error
-                    break  # Stop checking patterns, proceed to generic
-        else:  # This else clause executes if the loop completed without a break (i.e., no pattern matched)
-            if use_debug:
-                logger.info(
-                    f"No specific parser pattern matched URL '{url}', using generic conversion."
-                )
+    cacheable = True
+    if route is not None and url:
+        specific_result, items, cacheable = _run_specific_parser(
+            html, url, route, use_debug, timeout
+        )
+        if specific_result is not None:
+            metadata = _extract_metadata_safely(url, html=html) if with_metadata else None
+            return ConvertedPage(specific_result, metadata, items=items), cacheable
     elif use_debug:
-        logger.info("No URL provided, using generic conversion.")
+        if url:
+            logger.info(
+                f"No specific parser pattern matched URL '{url}', using generic conversion."
+            )
+        else:
+            logger.info("No URL provided, using generic conversion.")
 
     # --- Generic HTML to Markdown Conversion ---
     if use_debug:
@@ -607,15 +786,85 @@ def html_to_md(
             "Starting generic HTML to markdown conversion" + (f" for URL: {url}" if url else "")
         )
 
+    try:
+        soup = parse_html(html, parser_backend)
+    except Exception as e:
+        logger.error(f"Failed to parse HTML for URL {url or 'unknown'}: {e}")
+        return ConvertedPage(None), False
+
+    # Metadata must be read before cleaning strips <script type="application/ld+json">
+    metadata = _extract_metadata_safely(url, soup=soup) if with_metadata else None
+    markdown = _generic_soup_to_md(soup, html, url, base_url, use_debug, parser_backend)
+    return ConvertedPage(markdown, metadata), cacheable
+
+
+def _parse_with_items(
+    route: ParserRoute, html: str, debug: bool
+) -> Tuple[Optional[str], List["FeedItem"]]:
+    """Pool job for item parsers: the page markdown plus the items it was rendered from."""
+    # Imported here so loading html_to_md still imports nothing from brocc_li.parsers
+    from brocc_li.parsers.feed_items import collecting_items
+
+    with collecting_items() as items:
+        markdown = route.load()(html, debug=debug)
+    return markdown, items
+
+
+def _run_specific_parser(
+    html: str, url: str, route: ParserRoute, use_debug: bool, timeout: float
+) -> Tuple[Optional[str], Optional[List["FeedItem"]], bool]:
+    """
+    Run the parser registered for the URL; None markdown means use the generic path.
+    Items are None unless the route has an item parser. The flag is False if the parser
+    timed out or failed, so the fallback isn't cached.
+    """
+    if use_debug:
+        logger.info(
+            f"URL '{url}' matches pattern '{route.pattern.pattern}', using specific parser: {route.function}"
+        )
+    # Pass the effective debug flag to the specific parser
+    if route.item_function is not None:
+        job = get_parser_pool().run(
+            _parse_with_items, route, html, timeout=timeout, debug=use_debug
+        )
+        markdown, items = job.result if job.result is not None else (None, None)
+    else:
+        job = get_parser_pool().run(route.parser, html, timeout=timeout, debug=use_debug)
+        markdown, items = job.result, None
+
+    if job.error is not None:
+        logger.error(
+            f"Specific parser {route.function} failed for URL {url}: {job.error}. Falling back to generic parser."
+        )
+    elif markdown is not None:
+        # Assuming specific parsers return cleaned markdown or None
+        if use_debug:
+            logger.info(f"Specific parser {route.function} completed in {job.elapsed:.2f}s.")
+        return markdown, items, True
+    elif use_debug and not job.timed_out:
+        logger.warning(
+            f"Specific parser {route.function} returned None for URL: {url}. Falling back to generic parser."
+        )
+    return None, None, job.error is None and not job.timed_out
+
+
+def _generic_soup_to_md(
+    soup: BeautifulSoup,
+    html: str,
+    url: Optional[str],
+    base_url: Optional[str],
+    use_debug: bool,
+    parser_backend: Optional[ParserBackend] = None,
+) -> Optional[str]:
     try:
         # Clean and extract meaningful content
-        soup = clean_html(html)
+        clean_soup(soup)
 
         # Convert relative URLs to absolute if base_url is provided
         if base_url:
             convert_relative_urls_to_absolute(soup, base_url, use_debug)
 
-        content = extract_content(soup, str(soup))
+        content = extract_content(soup, html)
         strip_list = get_strip_list(content)
 
         # Convert to markdown
@@ -627,13 +876,7 @@ def html_to_md(
             else:
                 logger.info("Converting content (unable to count elements)")
 
-        markdown = md(
-            str(content),
-            strip=strip_list,
-            beautiful_soup_parser="html5lib",
-            escape_misc=True,
-            heading_style="ATX",
-        )
+        markdown = soup_to_md(content, strip_list)
 
         if use_debug:
             logger.info(f"Markdownify produced {len(markdown)} characters")
@@ -648,13 +891,7 @@ def html_to_md(
                 )
             content = soup.body  # Use the body tag directly
             strip_list = get_strip_list(content)  # Re-evaluate strip list for body
-            markdown = md(
-                str(content),
-                strip=strip_list,
-                beautiful_soup_parser="html5lib",
-                escape_misc=True,
-                heading_style="ATX",
-            )
+            markdown = soup_to_md(content, strip_list)
             if use_debug:
                 logger.info(f"Fallback body conversion produced {len(markdown)} characters")
 
@@ -676,9 +913,8 @@ def html_to_md(
                 direct_markdown = md(
                     direct_content,
                     strip=direct_strip_list,  # Use a strip list appropriate for the extracted tags context
-                    beautiful_soup_parser="html5lib",
-                    escape_misc=True,
-                    heading_style="ATX",
+                    beautiful_soup_parser=bs4_features(parser_backend),
+                    **MARKDOWN_OPTIONS,
                 )
                 direct_cleaned = post_process_markdown(direct_markdown)  # Uses global DEBUG
 
@@ -707,6 +943,5 @@ def html_to_md(
             error_msg += f" for URL: {url}"
         if use_debug:  # Log error only if debugging is enabled for this run
             logger.error(error_msg, exc_info=True)  # Include traceback if debugging
-        # Return the error message itself, maybe? Or None? Let's return None on error.
         logger.error(f"Generic conversion failed for URL {url or 'unknown'}. Returning None.")
         return None
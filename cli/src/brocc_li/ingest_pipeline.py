@@ -0,0 +1,280 @@
+"""
+Saves captured tabs to DocDB through staged, bounded queues.
+
+Every tab update used to start its own worker thread (Textual `run_worker`) that extracted
+metadata, chunked and stored the page. A burst of tab events meant a burst of threads, all
+writing to a DuckDB file that has a single writer.
+
+Structure:
+- Four stages, each a fixed set of worker threads reading a queue:
+  metadata (TabReference -> Doc and feed items) -> chunking (`DocDB.prepare_document`)
+  -> write (`DocDB.write_document`) -> embedding (`DocDB.store_vectors`).
+- The write stage has exactly one worker. DuckDB writes, and the read-merge-write of an
+  updated document, never overlap. The other stages' worker counts are arguments.
+- A stage whose next queue is full blocks until there's room, so a slow writer holds back
+  the stages before it, down to the intake. `submit` never blocks and never drops: the
+  intake is unbounded but keeps one pending capture per (tab, URL), so a newer capture of a
+  page replaces the queued one. It grows with the pages captured while the stages are
+  backed up, not with the captures. The tab monitor's captures and lifecycle loop call
+  `submit`, and must not wait on DB throughput.
+
+Gotchas:
+- DuckDB has a document's new chunks before LanceDB has their vectors. Vector search
+  catches up once the embedding stage gets to them.
+- With more than one embedding worker, two updates of one document can store their
+  vectors out of order, which is why the default is one.
+- `stop` drains what's queued until its timeout. Whatever is left is dropped.
+"""
+
+import queue
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, List, NamedTuple, Optional, Union
+
+from brocc_li.doc_db import DocDB, PreparedDocument, VectorUpdate
+from brocc_li.parsers.feed_items import FeedItem
+from brocc_li.tab_state import TabReference
+from brocc_li.types.doc import Doc
+from brocc_li.utils.html_metadata import extract_metadata
+from brocc_li.utils.logger import logger
+
+METADATA_WORKERS = 2
+CHUNK_WORKERS = 2
+EMBED_WORKERS = 1
+QUEUE_SIZE = 16  # Items waiting per stage, after the intake
+STOP_TIMEOUT = 10.0
+
+_STOP = object()  # Queued once per worker to end it
+
+
+class ParsedTab(NamedTuple):
+    """A tab turned into a Doc by the metadata stage."""
+
+    doc: Doc
+    items: Optional[List[FeedItem]]  # Posts on feed and timeline pages
+
+
+def parse_tab(tab_ref: TabReference) -> Optional[ParsedTab]:
+    """The Doc (and feed items) to store for a captured tab, or None if there's nothing to."""
+    if not tab_ref.markdown:
+        logger.debug(f"Skipping save for tab {tab_ref.id[:8]}: No markdown content.")
+        return None
+    if not tab_ref.html:
+        # If HTML is missing, it likely means the content fetch failed or the
+        # page wasn't HTML. We can't extract meaningful metadata or reliably
+        # store the content without it.
+        logger.warning(
+            f"Skipping save for tab {tab_ref.id[:8]} ({tab_ref.url}): Missing HTML content in TabReference."
+        )
+        return None
+
+    doc_title = tab_ref.title  # Start with title from tab reference
+    doc_description = None
+    doc_author = None
+    doc_created_at = None
+    doc_keywords = []
+    additional_metadata = {}
+
+    # Try to extract richer metadata (reuse the monitor's parse if available)
+    try:
+        extracted_meta = tab_ref.metadata or extract_metadata(tab_ref.html, tab_ref.url)
+        # Prioritize extracted title, fallback to tab title
+        if extracted_meta.title:
+            doc_title = extracted_meta.title
+        doc_description = extracted_meta.description
+        doc_author = extracted_meta.author
+
+        # Handle published_at (save as created_at in Doc)
+        if extracted_meta.published_at:
+            doc_created_at = Doc.format_date(extracted_meta.published_at)
+
+        # Handle keywords
+        if extracted_meta.keywords:
+            doc_keywords = extracted_meta.keywords
+
+        if extracted_meta.og_image:
+            additional_metadata["og_image"] = str(extracted_meta.og_image)
+        if extracted_meta.favicon:
+            additional_metadata["favicon"] = str(extracted_meta.favicon)
+    except Exception as meta_ex:
+        logger.warning(f"Failed to extract HTML metadata for {tab_ref.url}: {meta_ex}")
+
+    doc = Doc(
+        id=Doc.generate_id(),  # Generate ID for the pydantic model
+        url=tab_ref.url,
+        title=doc_title,  # Use potentially updated title
+        description=doc_description,  # Add extracted description
+        text_content=tab_ref.markdown,  # Use markdown as the text content
+        source="chrome",
+        contact_name=doc_author,  # Use author as contact_name
+        created_at=doc_created_at,  # Use publication date as created_at
+        keywords=doc_keywords,  # Add keywords from metadata
+        metadata=additional_metadata,  # Include extracted fields
+    )
+    # Feed and timeline pages also index their posts, so posts already stored
+    # from another page aren't chunked and embedded again
+    return ParsedTab(doc, tab_ref.items)
+
+
+class _LatestPerPage:
+    """
+    Unbounded intake holding one pending capture per (tab id, URL). A newer capture of a
+    queued page replaces it in place, keeping its turn. Reads like the stage queues.
+    """
+
+    def __init__(self) -> None:
+        self._items: OrderedDict[Hashable, Any] = OrderedDict()
+        self._ready = threading.Condition()
+
+    def offer(self, tab_ref: TabReference) -> None:
+        """Queue the capture, replacing a pending capture of the same page."""
+        with self._ready:
+            self._items[(tab_ref.id, tab_ref.url)] = tab_ref
+            self._ready.notify()
+
+    def put(self, item: Any) -> None:
+        """Queue a control item (the stop marker); never refused, never coalesced."""
+        with self._ready:
+            self._items[object()] = item
+            self._ready.notify()
+
+    def get(self) -> Any:
+        with self._ready:
+            while not self._items:
+                self._ready.wait()
+            return self._items.popitem(last=False)[1]
+
+    def qsize(self) -> int:
+        with self._ready:
+            return len(self._items)
+
+
+class _Stage:
+    """Worker threads applying handler to items from a queue, passing results on."""
+
+    def __init__(
+        self,
+        name: str,
+        handler: Callable[[Any], Any],
+        workers: int,
+        queue_size: int,
+        intake: Optional[_LatestPerPage] = None,
+    ) -> None:
+        self.name = name
+        self.handler = handler
+        self.queue: Union[queue.Queue[Any], _LatestPerPage] = intake or queue.Queue(
+            maxsize=queue_size
+        )
+        self.next: Optional["_Stage"] = None
+        self.threads = [
+            threading.Thread(target=self._run, name=f"ingest-{name}-{i}", daemon=True)
+            for i in range(max(1, workers))
+        ]
+
+    def _run(self) -> None:
+        while True:
+            item = self.queue.get()
+            if item is _STOP:
+                return
+            try:
+                result = self.handler(item)
+            except Exception as e:
+                logger.error(f"Ingest {self.name} stage failed: {type(e).__name__} - {e}")
+                continue
+            if result is not None and self.next is not None:
+                self.next.queue.put(result)  # Blocks while the next stage is full
+
+    def stop(self, deadline: float) -> bool:
+        """Ends the workers once they've drained the queue. False if the deadline passed."""
+        try:
+            for _ in self.threads:
+                if isinstance(self.queue, _LatestPerPage):
+                    self.queue.put(_STOP)  # Unbounded, so never waits
+                else:
+                    self.queue.put(_STOP, timeout=max(0.0, deadline - time.monotonic()))
+        except queue.Full:
+            return False
+        for thread in self.threads:
+            thread.join(timeout=max(0.0, deadline - time.monotonic()))
+        return not any(thread.is_alive() for thread in self.threads)
+
+
+class IngestPipeline:
+    """Stores captured tabs in DocDB: metadata -> chunking -> single writer -> embedding."""
+
+    def __init__(
+        self,
+        doc_db: DocDB,
+        metadata_workers: int = METADATA_WORKERS,
+        chunk_workers: int = CHUNK_WORKERS,
+        embed_workers: int = EMBED_WORKERS,
+        queue_size: int = QUEUE_SIZE,
+    ):
+        self.doc_db = doc_db
+        self._intake = _LatestPerPage()
+        self._stages = [
+            _Stage("metadata", parse_tab, metadata_workers, queue_size, intake=self._intake),
+            _Stage("chunking", self._prepare, chunk_workers, queue_size),
+            _Stage("write", self._write, 1, queue_size),
+            _Stage("embedding", doc_db.store_vectors, embed_workers, queue_size),
+        ]
+        for stage, next_stage in zip(self._stages, self._stages[1:], strict=False):
+            stage.next = next_stage
+        self._running = False
+
+    @property
+    def running(self) -> bool:
+        return self._running
+
+    def queued(self) -> List[int]:
+        """Items waiting in each stage's queue, first stage first."""
+        return [stage.queue.qsize() for stage in self._stages]
+
+    def start(self) -> None:
+        if self._running:
+            return
+        for stage in self._stages:
+            for thread in stage.threads:
+                thread.start()
+        self._running = True
+
+    def submit(self, tab_ref: TabReference) -> bool:
+        """
+        Queue a captured tab for saving without waiting. Replaces a queued capture of the same
+        tab and URL. Returns False if the pipeline isn't running.
+        """
+        if not self._running:
+            logger.warning(f"Ingest pipeline not running, not saving {tab_ref.url}")
+            return False
+        self._intake.offer(tab_ref)
+        return True
+
+    def stop(self, timeout: float = STOP_TIMEOUT) -> bool:
+        """
+        Finishes what's queued and ends the workers, stage by stage. Returns False if that
+        took longer than timeout; the rest is dropped with the (daemon) workers.
+        """
+        if not self._running:
+            return True
+        self._running = False
+        deadline = time.monotonic() + timeout
+        for stage in self._stages:
+            if not stage.stop(deadline):
+                logger.warning(f"Ingest pipeline stopped with {sum(self.queued())} items unsaved")
+                return False
+        return True
+
+    def _prepare(self, parsed: ParsedTab) -> PreparedDocument:
+        return self.doc_db.prepare_document(parsed.doc, items=parsed.items)
+
+    def _write(self, prepared: PreparedDocument) -> Optional[VectorUpdate]:
+        url = prepared.doc_data.get("url")
+        logger.info(f"Saving tab content to DB: {url}")
+        update = self.doc_db.write_document(prepared)
+        if update is None:
+            # write_document logs its own errors, but we can add context
+            logger.warning(f"Problem saving tab to DB (check previous logs): {url}")
+        else:
+            logger.success(f"Successfully saved/updated tab in DB: {url}")
+        return update
@@ -145,3 +145,35 @@ def merge_md(old_md: Optional[str], new_md: Optional[str]) -> MergeResult:
             f"No significant commonality found ({', '.join(log_reason)}). Returning new MD."
         )
         return MergeResult(type=MergeResultType.KEPT_NEW, content=new_md)
+
+
+def append_md(old_md: Optional[str], delta_md: Optional[str]) -> MergeResult:
+    """
+    Appends markdown converted from newly added page content (a DOM delta) to the old
+    markdown, skipping blocks the old markdown already has.
+
+    Unlike merge_md, nothing in old_md is dropped: a delta only says what was added.
+
+    Args:
+        old_md: The previous markdown content.
+        delta_md: Markdown for the content added since old_md was captured.
+
+    Returns:
+        A MergeResult; MERGED with old_md unchanged if the delta added nothing new.
+    """
+    if old_md is None or not old_md.strip():
+        return merge_md(old_md, delta_md)
+    old_original_blocks, old_stripped_blocks = _split_into_blocks_and_strip(old_md)
+    if not delta_md:
+        return MergeResult(type=MergeResultType.MERGED, content="\n\n".join(old_original_blocks))
+
+    seen = set(old_stripped_blocks)
+    new_blocks = []
+    for original, stripped in zip(*_split_into_blocks_and_strip(delta_md), strict=True):
+        if stripped not in seen:
+            seen.add(stripped)
+            new_blocks.append(original)
+    logger.debug(f"Appending {len(new_blocks)} new blocks from delta.")
+    return MergeResult(
+        type=MergeResultType.MERGED, content="\n\n".join(old_original_blocks + new_blocks)
+    )
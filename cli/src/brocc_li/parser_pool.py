@@ -0,0 +1,281 @@
+"""
+Long-lived process pool for running HTML parsers with hard timeouts.
+
+Structure:
+- Each worker is a spawned process connected to the parent by its own Pipe.
+- `ParserPool.run` hands a job to an idle worker (spawning workers lazily up to
+  `workers`). The worker acks once the job is unpickled, then the parent waits at most
+  `timeout` seconds for the result.
+- A worker that misses its deadline is killed and replaced, so a runaway parser
+  costs one timeout, never a stalled pipeline. Crashed workers are replaced the same way.
+- Every job reports how long the parser itself ran (`ParseJobResult.elapsed`).
+
+Gotchas:
+- Callables and arguments must be picklable: use module-level functions, not lambdas,
+  closures or mocks. Unpicklable jobs fail fast with an error result.
+- Workers are spawned (not forked), so each worker pays the parser import cost once,
+  while unpickling its first job. That happens before the ack, so it doesn't count
+  against the parse timeout (it is bounded by STARTUP_TIMEOUT_SECONDS instead).
+- `workers=0` runs jobs inline in the calling thread with no isolation and no timeout.
+  Useful for debugging parsers and for tests that patch in mocks.
+"""
+
+import atexit
+import multiprocessing
+import os
+import queue
+import signal
+import threading
+import time
+from multiprocessing.connection import Connection
+from typing import Any, Callable, List, NamedTuple, Optional
+
+from brocc_li.utils.logger import logger
+
+
+def _default_workers() -> int:
+    # Parsing is CPU-bound and runs alongside Chrome, so leave most cores alone.
+    # BROCC_PARSER_WORKERS overrides the size of the shared pool (0 = run parsers inline).
+    default = max(1, min(4, (os.cpu_count() or 1) // 2))
+    value = os.environ.get("BROCC_PARSER_WORKERS")
+    if value is None:
+        return default
+    try:
+        return max(0, int(value))
+    except ValueError:
+        logger.warning(f"Ignoring invalid BROCC_PARSER_WORKERS={value!r}, using {default}")
+        return default
+
+
+DEFAULT_PARSER_WORKERS = _default_workers()
+
+# Upper bound for spawning a worker and importing a job's module before the parse starts
+STARTUP_TIMEOUT_SECONDS = 60.0
+
+# How long to wait for a worker to exit cleanly on shutdown before killing it
+SHUTDOWN_GRACE_SECONDS = 1.0
+
+# How often a job waiting for a busy pool checks whether the pool was shut down
+ACQUIRE_POLL_SECONDS = 0.5
+
+
+# Acks sent by a worker after receiving a job
+_STARTED = "started"
+_FAILED = "failed"
+
+
+class ParseJobResult(NamedTuple):
+    result: Any  # None on timeout or error
+    elapsed: float  # Seconds spent in the parser (the timeout, if it was killed)
+    timed_out: bool = False
+    error: Optional[str] = None
+
+
+def _worker_main(conn: Connection) -> None:
+    # Ctrl+C is handled by the parent, which tears the pool down
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    while True:
+        try:
+            job = conn.recv()
+        except (EOFError, OSError):
+            break
+        except Exception as e:
+            # The job itself couldn't be unpickled (e.g. its module failed to import)
+            conn.send((_FAILED, f"Could not load job: {e}"))
+            continue
+        if job is None:
+            break
+
+        conn.send((_STARTED, None))
+        func, args, kwargs = job
+        start = time.perf_counter()
+        try:
+            result, error = func(*args, **kwargs), None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        elapsed = time.perf_counter() - start
+
+        try:
+            conn.send((result, elapsed, error))
+        except Exception as e:
+            # Unpicklable return value: report it instead of dying
+            conn.send((None, elapsed, f"Could not send result back: {e}"))
+
+
+class _Worker:
+    def __init__(self, ctx: Any):
+        self.conn, child_conn = ctx.Pipe()
+        self.process = ctx.Process(target=_worker_main, args=(child_conn,), daemon=True)
+        self.process.start()
+        child_conn.close()
+
+    def kill(self) -> None:
+        if self.process.is_alive():
+            self.process.kill()
+        self.process.join(timeout=SHUTDOWN_GRACE_SECONDS)
+        self.conn.close()
+
+    def stop(self) -> None:
+        try:
+            self.conn.send(None)
+            self.process.join(timeout=SHUTDOWN_GRACE_SECONDS)
+        except (OSError, ValueError):
+            pass
+        self.kill()
+
+
+class ParserPool:
+    """Runs parser jobs in worker processes that can be killed on timeout."""
+
+    def __init__(self, workers: int = DEFAULT_PARSER_WORKERS):
+        self.workers = workers
+        self._ctx = multiprocessing.get_context("spawn")
+        self._idle: "queue.Queue[_Worker]" = queue.Queue()
+        self._live: List[_Worker] = []
+        self._lock = threading.Lock()
+        self._closed = False
+
+    def run(
+        self, func: Callable[..., Any], *args: Any, timeout: float, **kwargs: Any
+    ) -> ParseJobResult:
+        """Run func(*args, **kwargs), giving up (and killing the worker) after `timeout`."""
+        if self.workers <= 0:
+            return self._run_inline(func, args, kwargs)
+        if self._closed:
+            return ParseJobResult(None, 0.0, error="Parser pool is shut down")
+
+        worker = self._acquire()
+        if worker is None:
+            return ParseJobResult(None, 0.0, error="Parser pool is shut down")
+        try:
+            worker.conn.send((func, args, kwargs))
+        except OSError as e:
+            # The worker died while idle (broken pipe)
+            logger.error(f"Parser worker pid {worker.process.pid} died while idle")
+            self._replace(worker)
+            return ParseJobResult(None, 0.0, error=f"Worker died: {e!r}")
+        except Exception as e:
+            # Pickling happens before anything is written, so the worker is still clean
+            self._release(worker)
+            return ParseJobResult(None, 0.0, error=f"Could not send job to worker: {e}")
+
+        try:
+            if not worker.conn.poll(STARTUP_TIMEOUT_SECONDS):
+                logger.error(f"Parser worker pid {worker.process.pid} never started {_name(func)}")
+                self._replace(worker)
+                return ParseJobResult(None, 0.0, error="Worker did not start the job")
+            status, detail = worker.conn.recv()
+            if status == _FAILED:
+                self._release(worker)
+                return ParseJobResult(None, 0.0, error=detail)
+
+            if not worker.conn.poll(timeout):
+                logger.error(
+                    f"{_name(func)} timed out after {timeout} seconds, killing worker pid {worker.process.pid}"
+                )
+                self._replace(worker)
+                return ParseJobResult(None, timeout, timed_out=True)
+
+            result, elapsed, error = worker.conn.recv()
+        except (EOFError, OSError) as e:
+            logger.error(f"Parser worker pid {worker.process.pid} died running {_name(func)}")
+            self._replace(worker)
+            return ParseJobResult(None, 0.0, error=f"Worker died: {e!r}")
+
+        self._release(worker)
+        return ParseJobResult(result, elapsed, error=error)
+
+    def shutdown(self) -> None:
+        with self._lock:
+            self._closed = True
+            workers, self._live = self._live, []
+        for worker in workers:
+            worker.stop()
+
+    def _run_inline(self, func: Callable[..., Any], args: Any, kwargs: Any) -> ParseJobResult:
+        start = time.perf_counter()
+        try:
+            result, error = func(*args, **kwargs), None
+        except Exception as e:
+            result, error = None, f"{type(e).__name__}: {e}"
+        return ParseJobResult(result, time.perf_counter() - start, error=error)
+
+    def _acquire(self) -> Optional[_Worker]:
+        """Take an idle worker (spawning one if below `workers`); None once shut down."""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            pass
+        with self._lock:
+            if self._closed:
+                return None
+            if len(self._live) < self.workers:
+                worker = _Worker(self._ctx)
+                self._live.append(worker)
+                return worker
+        # Shutdown stops every worker without handing any back, so don't wait forever
+        while not self._closed:
+            try:
+                worker = self._idle.get(timeout=ACQUIRE_POLL_SECONDS)
+            except queue.Empty:
+                continue
+            if self._closed:
+                worker.stop()
+                return None
+            return worker
+        return None
+
+    def _release(self, worker: _Worker) -> None:
+        if self._closed:
+            worker.stop()
+        else:
+            self._idle.put(worker)
+
+    def _replace(self, worker: _Worker) -> None:
+        worker.kill()
+        with self._lock:
+            if worker in self._live:
+                self._live.remove(worker)
+            if self._closed:
+                return
+            replacement = _Worker(self._ctx)
+            self._live.append(replacement)
+        self._idle.put(replacement)
+
+
+def _name(func: Callable[..., Any]) -> str:
+    return getattr(func, "__name__", repr(func))
+
+
+_pool: Optional[ParserPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_parser_pool() -> ParserPool:
+    """Return the shared pool, creating it on first use."""
+    global _pool
+    with _pool_lock:
+        if _pool is None:
+            _pool = ParserPool()
+        return _pool
+
+
+def configure_parser_pool(workers: int) -> ParserPool:
+    """Replace the shared pool with one of the given size (0 = run parsers inline)."""
+    global _pool
+    with _pool_lock:
+        old, _pool = _pool, ParserPool(workers)
+    if old is not None:
+        old.shutdown()
+    return _pool
+
+
+def shutdown_parser_pool() -> None:
+    global _pool
+    with _pool_lock:
+        pool, _pool = _pool, None
+    if pool is not None:
+        pool.shutdown()
+
+
+atexit.register(shutdown_parser_pool)
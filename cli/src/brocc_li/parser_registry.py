@@ -0,0 +1,283 @@
+"""
+URL routing for site-specific parsers.
+
+Structure:
+- PARSER_REGISTRY groups URL patterns by host. Within a host, more specific patterns
+  come first and the first match wins.
+- Patterns are compiled once at import into a host -> routes index, so resolving a URL
+  is one dict lookup plus a few regex matches against that host's routes.
+- Parser modules are referenced by name and only imported when a route is loaded.
+  Importing this module never imports a parser.
+
+Gotchas:
+- Patterns still match the full URL (scheme included); the host bucket is only a filter.
+- `ParserRoute.parser` is a picklable handle: unpickling it in a parser worker
+  imports the parser module there, so the parent process never has to.
+- Feed and timeline parsers listed in ITEM_PARSERS also expose a generator of per-post FeedItems
+  (`ParserRoute.load_items`). html_to_md doesn't call it: the page parser reports the same
+  items while rendering, so one parse in the worker returns both.
+"""
+
+import importlib
+import re
+from functools import lru_cache
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, NamedTuple, Optional, Tuple
+from urllib.parse import urlsplit
+
+if TYPE_CHECKING:
+    from brocc_li.parsers.feed_items import FeedItem
+
+ParserFunc = Callable[..., Optional[str]]
+ItemParserFunc = Callable[..., Iterator["FeedItem"]]
+
+PARSERS_PACKAGE = "brocc_li.parsers"
+
+# Host(s) -> ordered (URL pattern, parser module in brocc_li.parsers, function name)
+PARSER_REGISTRY: Dict[Tuple[str, ...], List[Tuple[str, str, str]]] = {
+    ("mail.google.com",): [
+        (
+            r"https://mail\.google\.com/mail/u/\d+/\#inbox(\?.+)?$",
+            "gmail_inbox",
+            "gmail_inbox_html_to_md",
+        ),
+    ],
+    ("www.instagram.com",): [
+        (r"https://www\.instagram\.com/?(\?.+)?$", "instagram_home", "instagram_home_html_to_md"),
+        (
+            r"https://www\.instagram\.com/direct/inbox/?(\?.+)?$",
+            "instagram_inbox",
+            "instagram_inbox_html_to_md",
+        ),
+        (
+            r"https://www\.instagram\.com/explore/search/.*",
+            "instagram_explore_search",
+            "instagram_explore_search_html_to_md",
+        ),
+        (
+            r"https://www\.instagram\.com/explore/.*",
+            "instagram_explore",
+            "instagram_explore_html_to_md",
+        ),
+        (
+            r"https://www\.instagram\.com/([^/]+)/saved/.*",
+            "instagram_saved_collection",
+            "instagram_saved_collection_html_to_md",
+        ),
+        # Profile (needs to be after inbox)
+        (
+            r"https://www\.instagram\.com/([^/]+)/?(\?.+)?$",
+            "instagram_profile",
+            "instagram_profile_html_to_md",
+        ),
+    ],
+    ("www.threads.net",): [
+        (
+            r"https://www\.threads\.net/activity/?(\?.+)?$",
+            "threads_activity",
+            "threads_activity_html_to_md",
+        ),
+        (r"https://www\.threads\.net/?(\?.+)?$", "threads_home", "threads_home_html_to_md"),
+    ],
+    ("bsky.app",): [
+        (r"https://bsky\.app/?(\?.+)?$", "bsky_feed", "bsky_feed_html_to_md"),
+        (
+            r"https://bsky\.app/profile/([^/]+)/follows(\?.+)?$",
+            "bsky_followers",
+            "bsky_followers_html_to_md",
+        ),
+        (
+            r"https://bsky\.app/profile/([^/]+)/followers(\?.+)?$",
+            "bsky_followers",
+            "bsky_followers_html_to_md",
+        ),
+        (r"https://bsky\.app/profile/([^/]+)/?(\?.+)?$", "bsky_profile", "bsky_profile_html_to_md"),
+    ],
+    ("www.linkedin.com",): [
+        # Company
+        (
+            r"https://www\.linkedin\.com/company/([^/]+)/about/?(\?.+)?$",
+            "linkedin_company_about",
+            "linkedin_company_about_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/company/([^/]+)/people/?(\?.+)?$",
+            "linkedin_company_people",
+            "linkedin_company_people_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/company/([^/]+)/posts/.*",
+            "linkedin_feed_v2",
+            "linkedin_feed_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/company/([^/]+)/?(\?.+)?$",
+            "linkedin_company",
+            "linkedin_company_html_to_md",
+        ),
+        # User specific
+        (
+            r"https://www\.linkedin\.com/messaging/.*",
+            "linkedin_messages",
+            "linkedin_messages_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/in/([^/]+)/recent-activity/.*",
+            "linkedin_feed_v2",
+            "linkedin_feed_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/in/([^/]+)/?(\?.+)?$",
+            "linkedin_profile",
+            "linkedin_profile_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/mynetwork/invite-connect/connections/?(\?.+)?$",
+            "linkedin_connections_me",
+            "linkedin_connections_me_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/mynetwork/network-manager/people-follow/followers/.*",
+            "linkedin_followers",
+            "linkedin_followers_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/mynetwork/network-manager/people-follow/following/.*",
+            "linkedin_followers",
+            "linkedin_followers_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/search/results/people/.*",
+            "linkedin_search_connections",
+            "linkedin_search_connections_html_to_md",
+        ),
+        (
+            r"https://www\.linkedin\.com/feed/followers/.*",
+            "linkedin_followers",
+            "linkedin_followers_html_to_md",
+        ),
+        (r"https://www\.linkedin\.com/feed/.*", "linkedin_feed_v2", "linkedin_feed_html_to_md"),
+    ],
+    ("x.com", "twitter.com"): [
+        (r"https://(x|twitter)\.com/home(\?.+)?$", "twitter_home", "twitter_feed_html_to_md"),
+        (r"https://(x|twitter)\.com/messages.*", "twitter_inbox", "twitter_inbox_html_to_md"),
+        (
+            r"https://(x|twitter)\.com/i/bookmarks(\?.+)?$",
+            "twitter_bookmarks",
+            "twitter_bookmarks_html_to_md",
+        ),
+        (
+            r"https://(x|twitter)\.com/([^/]+)/likes(\?.+)?$",
+            "twitter_likes",
+            "twitter_likes_html_to_md",
+        ),
+        (
+            r"https://(x|twitter)\.com/([^/]+)/followers(\?.+)?$",
+            "twitter_profile_followers",
+            "twitter_followers_html_to_md",
+        ),
+        (
+            r"https://(x|twitter)\.com/([^/]+)/status/(\d+)(\?.+)?$",
+            "twitter_thread",
+            "twitter_thread_html_to_md",
+        ),
+        # Profile needs to be after specific sub-pages like /likes, /followers
+        (
+            r"https://(x|twitter)\.com/([^/]+)/?(\?.+)?$",
+            "twitter_profile",
+            "twitter_profile_html_to_md",
+        ),
+    ],
+    ("www.youtube.com",): [
+        (
+            r"https://www\.youtube\.com/feed/history(\?.+)?$",
+            "youtube_history",
+            "youtube_history_html_to_md",
+        ),
+        (r"https://www\.youtube\.com/?(\?.+)?$", "youtube_home", "youtube_home_html_to_md"),
+    ],
+}
+
+# Parser module -> generator yielding one FeedItem per post
+ITEM_PARSERS: Dict[str, str] = {
+    "twitter_home": "twitter_feed_items",
+    "twitter_profile": "twitter_profile_items",
+    "twitter_bookmarks": "twitter_bookmarks_items",
+    "twitter_likes": "twitter_likes_items",
+    "linkedin_feed_v2": "linkedin_feed_items",
+    "threads_home": "threads_home_items",
+    "bsky_feed": "bsky_feed_items",
+}
+
+
+def load_parser(module: str, function: str) -> ParserFunc:
+    """Import a parser module and return its conversion function."""
+    return getattr(importlib.import_module(module), function)
+
+
+class LazyParser:
+    """Callable handle to a parser that imports its module on first use."""
+
+    def __init__(self, module: str, function: str):
+        self.module = module
+        self.__name__ = function
+        self._func: Optional[ParserFunc] = None
+
+    def __call__(self, html: str, debug: bool = False) -> Optional[str]:
+        if self._func is None:
+            self._func = load_parser(self.module, self.__name__)
+        return self._func(html, debug=debug)
+
+    def __reduce__(self):
+        # Unpickles as the real parser function, importing the module at load time
+        return (load_parser, (self.module, self.__name__))
+
+
+class ParserRoute(NamedTuple):
+    pattern: re.Pattern[str]
+    module: str  # Fully qualified module path
+    function: str
+
+    @property
+    def parser(self) -> LazyParser:
+        return LazyParser(self.module, self.function)
+
+    def load(self) -> ParserFunc:
+        return load_parser(self.module, self.function)
+
+    @property
+    def item_function(self) -> Optional[str]:
+        return ITEM_PARSERS.get(self.module.rpartition(".")[2])
+
+    def load_items(self) -> Optional[ItemParserFunc]:
+        """The per-item generator for this route's parser, or None if it only renders pages."""
+        if self.item_function is None:
+            return None
+        return getattr(importlib.import_module(self.module), self.item_function)
+
+
+def _build_index() -> Dict[str, List[ParserRoute]]:
+    index: Dict[str, List[ParserRoute]] = {}
+    for hosts, routes in PARSER_REGISTRY.items():
+        compiled = [
+            ParserRoute(re.compile(pattern), f"{PARSERS_PACKAGE}.{module}", function)
+            for pattern, module, function in routes
+        ]
+        for host in hosts:
+            index.setdefault(host, []).extend(compiled)
+    return index
+
+
+_ROUTES_BY_HOST = _build_index()
+
+
+@lru_cache(maxsize=1024)
+def resolve_parser(url: str) -> Optional[ParserRoute]:
+    """Return the route for the site-specific parser handling this URL, or None for generic."""
+    try:
+        host = urlsplit(url).netloc
+    except ValueError:
+        return None
+    for route in _ROUTES_BY_HOST.get(host, ()):
+        if route.pattern.match(url):
+            return route
+    return None
@@ -1,4 +1,4 @@
-from typing import List, Optional
+from typing import Iterator, Optional
 
 from bs4 import BeautifulSoup
 
@@ -11,6 +11,63 @@ from .bsky_utils import (
     extract_user_info_from_post,
     format_post_markdown,
 )
+from .feed_items import FeedItem, feed_item, join_items, reported
+
+
+def _post_items(soup: BeautifulSoup, debug: bool = False) -> Iterator[FeedItem]:
+    # 1. Find all posts
+    post_selector = 'div[data-testid*="feedItem-by-"]'
+    if debug:
+        logger.debug(f"Attempting to find posts with selector: '{post_selector}'")
+    posts = soup.select(post_selector)
+    logger.info(
+        f"Found {len(posts)} potential posts using '{post_selector}' selector"
+    )  # Log selector used
+
+    if not posts and debug:
+        logger.warning(
+            "Selector did not find any post elements. Double-check the selector against the actual HTML structure."
+        )
+
+    processed_post_urls = set()  # Keep track of posts already processed to avoid duplicates
+
+    for i, post_el in enumerate(posts):
+        if debug:
+            logger.debug(f"--- Processing Post Element {i + 1}/{len(posts)} ---")
+
+        # Extract post data using utils
+        user_info = extract_user_info_from_post(post_el, debug=debug)
+        content_info = extract_post_content_and_links(post_el, debug=debug)
+
+        # Check for duplicates based on post URL
+        post_url = content_info.get("post_url")
+        if post_url and post_url in processed_post_urls:
+            if debug:
+                logger.debug(f"Skipping duplicate post (already processed URL): {post_url}")
+            continue  # Skip this iteration
+        if post_url:
+            processed_post_urls.add(post_url)
+        elif debug:
+            # If no URL, log a warning but process anyway - might be a post snippet without a permalink
+            logger.warning(
+                "Processing post element without a unique post URL. Duplicates might occur if structure is nested."
+            )
+
+        # Extract media (still placeholder)
+        media_strings = extract_media(post_el, debug=debug)
+        # Extract metrics (still placeholder)
+        metrics = extract_metrics(post_el, debug=debug)
+
+        # Format the full post block using the util
+        post_block = format_post_markdown(
+            user_info, content_info, media_strings, metrics, debug=debug
+        )
+        yield feed_item(post_url or None, post_block)
+
+
+def bsky_feed_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each feed post as a FeedItem keyed by its bsky.app post URL."""
+    yield from _post_items(BeautifulSoup(html, "html.parser"), debug=debug)
 
 
 def bsky_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
@@ -28,71 +85,18 @@ def bsky_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
             logger.debug(soup.prettify()[:500])
             logger.debug("----------------------------------------------------")
 
-        output_blocks: List[str] = []
-
-        # 1. Find all posts
-        post_selector = 'div[data-testid*="feedItem-by-"]'
-        if debug:
-            logger.debug(f"Attempting to find posts with selector: '{post_selector}'")
-        posts = soup.select(post_selector)
-        logger.info(
-            f"Found {len(posts)} potential posts using '{post_selector}' selector"
-        )  # Log selector used
-
-        if not posts and debug:
-            logger.warning(
-                "Selector did not find any post elements. Double-check the selector against the actual HTML structure."
-            )
-
-        processed_post_urls = set()  # Keep track of posts already processed to avoid duplicates
-
-        for i, post_el in enumerate(posts):
-            if debug:
-                logger.debug(f"--- Processing Post Element {i + 1}/{len(posts)} ---")
-
-            # Extract post data using utils
-            user_info = extract_user_info_from_post(post_el, debug=debug)
-            content_info = extract_post_content_and_links(post_el, debug=debug)
-
-            # Check for duplicates based on post URL
-            post_url = content_info.get("post_url")
-            if post_url and post_url in processed_post_urls:
-                if debug:
-                    logger.debug(f"Skipping duplicate post (already processed URL): {post_url}")
-                continue  # Skip this iteration
-            if post_url:
-                processed_post_urls.add(post_url)
-            elif debug:
-                # If no URL, log a warning but process anyway - might be a post snippet without a permalink
-                logger.warning(
-                    "Processing post element without a unique post URL. Duplicates might occur if structure is nested."
-                )
-
-            # Extract media (still placeholder)
-            media_strings = extract_media(post_el, debug=debug)
-            # Extract metrics (still placeholder)
-            metrics = extract_metrics(post_el, debug=debug)
-
-            # Format the full post block using the util
-            # Pass post_el to format function? No, pass extracted dicts.
-            post_block = format_post_markdown(
-                user_info, content_info, media_strings, metrics, debug=debug
-            )
-
-            output_blocks.append(post_block)
+        items = list(reported(_post_items(soup, debug=debug)))
 
         # Join all blocks with double newlines
-        markdown = "\n\n".join(output_blocks)
+        markdown = join_items(items)
 
         if not markdown:
             logger.warning(
-                f"BeautifulSoup extraction resulted in empty markdown. Found {len(posts)} post elements but placeholder logic might be incomplete or structure unexpected."
+                f"BeautifulSoup extraction resulted in empty markdown. Found {len(items)} posts but placeholder logic might be incomplete or structure unexpected."
             )
             return ""  # Return empty string if no posts processed
 
-        logger.info(
-            f"Bluesky BeautifulSoup conversion finished. Processed {len(posts)} post elements."
-        )
+        logger.info(f"Bluesky BeautifulSoup conversion finished. Processed {len(items)} posts.")
         return markdown.strip()
     except Exception as e:
         logger.error(
@@ -1,8 +1,8 @@
 from typing import Dict, List, Optional
 
 from unstructured.documents.elements import Element, Image
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.utils.logger import logger
 
 # Noise patterns specific to Bluesky followers pages
@@ -288,7 +288,7 @@ def bsky_followers_html_to_md(html: str, debug: bool = False) -> Optional[str]:
                 logger.debug(f"... and {len(elements) - 20} more raw elements")
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements")
+            logger.warning("partition_html returned no elements")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter out noise --- #
@@ -0,0 +1,72 @@
+"""
+Per-item output for feed parsers.
+
+Feed parsers (twitter_home, linkedin_feed_v2, threads_home, bsky_feed) render each post as
+one markdown block and join the blocks into a page. Their `*_items` generators yield the
+blocks as FeedItems instead, so merging, dedupe and storage can work per post without
+re-splitting the joined string.
+
+Structure:
+- FeedItem carries a stable id (post URL or URN, when the page exposes one), the markdown
+  block exactly as it appears in the page output, and a hash of that block.
+- Item ids are what doc_db uses to find posts already stored from an earlier capture.
+- Page parsers pass the items they render through `reported`, so html_to_md can collect them
+  from the same parse (inside `collecting_items`) instead of running the parser twice.
+
+Gotchas:
+- item_id is None when the post has no permalink in the captured HTML; `item_key` falls
+  back to the content hash so such items can still be deduped.
+- Item generators let parse errors propagate; the `*_html_to_md` wrappers keep their
+  catch-all error strings.
+"""
+
+import hashlib
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Generator, Iterable, Iterator, List, NamedTuple, Optional
+
+
+class FeedItem(NamedTuple):
+    item_id: Optional[str]  # Canonical post URL / URN
+    markdown: str
+    content_hash: str
+
+
+def content_hash(markdown: str) -> str:
+    return hashlib.blake2b(markdown.strip().encode("utf-8"), digest_size=16).hexdigest()
+
+
+def feed_item(item_id: Optional[str], markdown: str) -> FeedItem:
+    return FeedItem(item_id, markdown, content_hash(markdown))
+
+
+def item_key(item: FeedItem) -> str:
+    """Dedupe key: the item id, or the content hash when the post has no id."""
+    return item.item_id or f"hash:{item.content_hash}"
+
+
+def join_items(items: Iterable[FeedItem], separator: str = "\n\n") -> str:
+    return separator.join(item.markdown for item in items)
+
+
+_collected: ContextVar[Optional[List[FeedItem]]] = ContextVar("collected_feed_items", default=None)
+
+
+@contextmanager
+def collecting_items() -> Generator[List[FeedItem], None, None]:
+    """Collect every item page parsers pass through `reported` while the block runs."""
+    items: List[FeedItem] = []
+    token = _collected.set(items)
+    try:
+        yield items
+    finally:
+        _collected.reset(token)
+
+
+def reported(items: Iterable[FeedItem]) -> Iterator[FeedItem]:
+    """Yield items unchanged, also handing them to the active `collecting_items` block."""
+    collected = _collected.get()
+    for item in items:
+        if collected is not None:
+            collected.append(item)
+        yield item
@@ -0,0 +1,432 @@
+"""
+Lightweight replacement for unstructured's `partition_html` in site parsers.
+
+Walks an lxml tree once and produces the same kinds of document elements the parsers
+already consume (Title, Text, NarrativeText, ListItem, Image, ...), as instances of
+unstructured's own element classes so `isinstance` checks and `.metadata.image_url` work
+unchanged.
+
+Structure:
+- Paragraph rules mirror unstructured's v1 HTML parser: block tags (div, p, li, h1-h6,
+  img, ...) start a new element; phrasing tags (span, a, b, ...) join text into the
+  current one; unknown tags (svg, custom elements, ...) contribute only their tail;
+  nav/form/figure/details/template and button/label contents are dropped.
+- Only <main> (or <body>) is walked, after stripping script/style/noscript/meta/link/del.
+- Headings become Title, <li>/<dd> become ListItem, <pre> becomes CodeSnippet. Other text
+  is classified by shape: bullets, US addresses, emails, then NarrativeText vs Text.
+
+Gotchas:
+- unstructured decides NarrativeText with a POS tagger (spaCy) that checks for a verb. That
+  is what made `partition_html` slow (and need a model download), so here the verb check
+  is a word-list heuristic. The other narrative checks (capitalization and alpha ratios,
+  sentence counts) follow unstructured's thresholds.
+- No language detection, element ids or emphasis metadata; only image and link metadata.
+"""
+
+import re
+from functools import lru_cache
+from typing import Any, List, Optional, Sequence, Type
+
+from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
+from unstructured.documents.elements import (
+    Address,
+    CodeSnippet,
+    Element,
+    ElementMetadata,
+    EmailAddress,
+    Image,
+    ListItem,
+    NarrativeText,
+    Table,
+    Text,
+    Title,
+)
+from unstructured.nlp.patterns import (
+    EMAIL_ADDRESS_PATTERN_RE,
+    UNICODE_BULLETS_RE,
+    US_CITY_STATE_ZIP_RE,
+)
+
+# Removed (with their contents) before walking; their tails are kept
+STRIPPED_TAGS = ("del", "link", "meta", "noscript", "script", "style")
+
+FLOW_TAGS = frozenset(
+    [
+        "address",
+        "article",
+        "aside",
+        "blockquote",
+        "body",
+        "center",
+        "div",
+        "footer",
+        "header",
+        "hgroup",
+        "main",
+        "section",
+        "p",
+        "dl",
+        "ol",
+        "ul",
+        "dt",
+    ]
+)
+HEADING_TAGS = frozenset(["h1", "h2", "h3", "h4", "h5", "h6"])
+LIST_ITEM_TAGS = frozenset(["li", "dd"])
+PHRASING_TAGS = frozenset(
+    [
+        "a",
+        "b",
+        "em",
+        "i",
+        "strong",
+        "abbr",
+        "bdi",
+        "bdo",
+        "big",
+        "cite",
+        "code",
+        "data",
+        "dfn",
+        "kbd",
+        "mark",
+        "meter",
+        "q",
+        "s",
+        "samp",
+        "small",
+        "span",
+        "strike",
+        "sub",
+        "sup",
+        "time",
+        "tt",
+        "u",
+        "var",
+        "wbr",
+    ]
+)
+# Block elements dropped with their contents (likely boilerplate or form chrome)
+REMOVED_BLOCK_TAGS = frozenset(
+    ["details", "figure", "hr", "nav", "template", "form", "input", "summary"]
+)
+
+# Narrative text thresholds, as in unstructured.partition.text_type
+CAP_RATIO_THRESHOLD = 0.5
+NON_ALPHA_THRESHOLD = 0.5
+SENTENCE_MIN_WORDS = 3
+
+CLASSIFY_CACHE_SIZE = 8192
+
+# lxml ships without type information
+LxmlElement = Any
+
+_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+
+_ALPHA_WORD_RE = re.compile(r"[^\W\d_]+")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.!?])\s+")
+_PUNCTUATION_RE = re.compile(r"[^\w\s]")
+
+# Stand-in for a POS tagger's verb check: common verbs and auxiliaries in their usual forms,
+# plus the "-ing"/"-ed" suffixes (minus frequent non-verbs)
+_VERB_WORDS = frozenset(
+    """
+    am is are was were be been being have has had having do does did doing done
+    will would can could shall should may might must don doesn didn isn aren wasn weren
+    won couldn shouldn wouldn haven hasn hadn ll ve
+    get gets got make makes made go goes went gone see sees saw seen know knows knew
+    think thinks thought take takes took taken come comes came want wants look looks
+    use uses find finds found give gives gave given tell tells told work works call calls
+    try tries ask asks need needs feel feels felt become becomes became leave leaves left
+    put puts mean means meant keep keeps kept let lets begin begins began help helps show
+    shows shown hear hears heard play plays run runs ran move moves like likes live lives
+    believe believes bring brings brought happen happens write writes wrote written
+    provide provides sit sits sat stand stands stood lose loses lost pay pays paid meet
+    meets met include includes continue continues set sets learn learns change changes
+    lead leads led understand understands understood watch watches follow follows stop
+    stops create creates speak speaks spoke read reads spend spends spent grow grows grew
+    open opens win wins won offer offers remember remembers love loves consider considers
+    appear appears buy buys bought wait waits serve serves send sends sent expect expects
+    build builds built stay stays fall falls fell reach reaches remain remains suggest
+    suggests raise raises pass passes sell sells sold require requires report reports
+    decide decides pull pulls join joins share shares post posts check checks add adds
+    hire hires launch launches announce announces say says said thank thanks sign signs
+    """.split()
+)
+_NON_VERB_SUFFIX_WORDS = frozenset(
+    """
+    during thing things something nothing anything everything morning mornings evening
+    evenings string strings ceiling spring wing wings king kings ring rings building
+    buildings meeting meetings feed speed need seed bed red hundred
+    """.split()
+)
+
+
+class _Paragraph:
+    """Text and link annotations accumulated for the element being built."""
+
+    __slots__ = ("texts", "link_texts", "link_urls", "preserve_whitespace")
+
+    def __init__(self, preserve_whitespace: bool = False):
+        self.texts: List[str] = []
+        self.link_texts: List[str] = []
+        self.link_urls: List[str] = []
+        self.preserve_whitespace = preserve_whitespace
+
+    def normalized(self) -> str:
+        text = "".join(self.texts)
+        if not self.preserve_whitespace:
+            return " ".join(text.split())
+        # <pre> keeps its whitespace, minus one leading and one trailing newline
+        start = 1 if text.startswith("\n") else 0
+        end = -1 if text.endswith("\n") else len(text)
+        return text[start:end]
+
+    def clear(self) -> None:
+        self.texts.clear()
+        self.link_texts.clear()
+        self.link_urls.clear()
+
+
+def _is_phrasing(node: LxmlElement) -> bool:
+    tag = node.tag
+    if not isinstance(tag, str):
+        return True
+    if tag == "math":
+        return (node.get("display") or "").strip().lower() != "block"
+    # Unknown tags act as phrasing, so they never break a paragraph
+    return not (
+        tag in FLOW_TAGS
+        or tag in HEADING_TAGS
+        or tag in LIST_ITEM_TAGS
+        or tag in REMOVED_BLOCK_TAGS
+        or tag in ("pre", "img", "table")
+    )
+
+
+def _clean_bullets(text: str) -> str:
+    if UNICODE_BULLETS_RE.match(text) is None:
+        return text
+    return UNICODE_BULLETS_RE.sub("", text, 1).strip()
+
+
+def _sentence_count(text: str, min_words: int) -> int:
+    return sum(
+        1
+        for sentence in _SENTENCE_SPLIT_RE.split(text)
+        if len(_PUNCTUATION_RE.sub(" ", sentence).split()) >= min_words
+    )
+
+
+def _exceeds_cap_ratio(text: str) -> bool:
+    if _sentence_count(text, SENTENCE_MIN_WORDS) > 1:
+        return False
+    if text.isupper():
+        return True
+    words = _ALPHA_WORD_RE.findall(text)
+    if not words:
+        return True
+    capitalized = sum(1 for word in words if word.istitle() or word.isupper())
+    return capitalized / len(words) > CAP_RATIO_THRESHOLD
+
+
+def _under_non_alpha_ratio(text: str) -> bool:
+    chars = [char for char in text if not char.isspace()]
+    if not chars:
+        return False
+    return sum(1 for char in chars if char.isalpha()) / len(chars) < NON_ALPHA_THRESHOLD
+
+
+def _contains_verb(text: str) -> bool:
+    for word in _ALPHA_WORD_RE.findall(text.lower()):
+        if word in _VERB_WORDS:
+            return True
+        if len(word) > 4 and word.endswith(("ing", "ed")) and word not in _NON_VERB_SUFFIX_WORDS:
+            return True
+    return False
+
+
+def is_possible_narrative_text(text: str) -> bool:
+    """Whether text reads like prose rather than a label, name or count."""
+    if not text or text.isnumeric():
+        return False
+    if _exceeds_cap_ratio(text) or _under_non_alpha_ratio(text):
+        return False
+    return _sentence_count(text, SENTENCE_MIN_WORDS) >= 2 or _contains_verb(text)
+
+
+@lru_cache(maxsize=CLASSIFY_CACHE_SIZE)
+def classify_text(text: str) -> Optional[Type[Text]]:
+    """Element class for a normalized paragraph, or None to drop it."""
+    if UNICODE_BULLETS_RE.match(text.strip()) is not None:
+        return ListItem
+    if US_CITY_STATE_ZIP_RE.match(text.strip()) is not None:
+        return Address
+    if EMAIL_ADDRESS_PATTERN_RE.match(text.strip()) is not None:
+        return EmailAddress
+    if len(text) < 2:
+        return None
+    if is_possible_narrative_text(text):
+        return NarrativeText
+    return Text
+
+
+class _ElementWalker:
+    def __init__(self):
+        self.elements: List[Element] = []
+
+    def block(self, node: LxmlElement) -> None:
+        tag = node.tag
+        if tag in HEADING_TAGS:
+            self.flow(node, Title)
+        elif tag in LIST_ITEM_TAGS:
+            self.flow(node, ListItem)
+        elif tag == "pre":
+            self.flow(node, CodeSnippet, preserve_whitespace=True)
+        elif tag == "img":
+            self.image(node)
+        elif tag == "table":
+            self.table(node)
+        elif tag not in REMOVED_BLOCK_TAGS:
+            self.flow(node, None)
+
+    def flow(
+        self,
+        node: LxmlElement,
+        element_cls: Optional[Type[Text]],
+        preserve_whitespace: bool = False,
+    ) -> None:
+        """Element from the node's text and leading phrasing, then each block child and its tail."""
+        children = list(node)
+        paragraph = _Paragraph(preserve_whitespace)
+        index = self.phrasing_run(node.text, children, 0, paragraph, element_cls)
+        while index < len(children):
+            child = children[index]
+            self.block(child)
+            # Text after a block child is classified by shape, even inside a heading
+            paragraph = _Paragraph(preserve_whitespace)
+            index = self.phrasing_run(child.tail, children, index + 1, paragraph, None)
+
+    def phrasing_run(
+        self,
+        text: Optional[str],
+        children: Sequence[LxmlElement],
+        index: int,
+        paragraph: _Paragraph,
+        element_cls: Optional[Type[Text]],
+    ) -> int:
+        """Accumulate text plus the phrasing children from index on; return the next block index."""
+        if text:
+            paragraph.texts.append(text)
+        while index < len(children) and _is_phrasing(children[index]):
+            self.phrasing(children[index], paragraph, element_cls)
+            index += 1
+        self.flush(paragraph, element_cls)
+        return index
+
+    def phrasing(
+        self,
+        node: LxmlElement,
+        paragraph: _Paragraph,
+        element_cls: Optional[Type[Text]],
+    ) -> None:
+        tag = node.tag
+        if tag == "br":
+            paragraph.texts.append("\n")
+        elif isinstance(tag, str) and (tag in PHRASING_TAGS or tag == "math"):
+            start = len(paragraph.texts)
+            if node.text:
+                paragraph.texts.append(node.text)
+            for child in node:
+                if _is_phrasing(child):
+                    self.phrasing(child, paragraph, element_cls)
+                else:
+                    # Block inside inline markup: the browser renders it as its own paragraph
+                    self.flush(paragraph, element_cls)
+                    start = 0
+                    self.block(child)
+                    if child.tail:
+                        paragraph.texts.append(child.tail)
+            href = node.get("href") if tag == "a" else None
+            if href:
+                link_text = " ".join("".join(paragraph.texts[start:]).split())
+                if link_text:
+                    paragraph.link_texts.append(link_text)
+                    paragraph.link_urls.append(href)
+        # Removed phrasing (button, label) and unknown tags contribute only their tail
+        if node.tail:
+            paragraph.texts.append(node.tail)
+
+    def flush(self, paragraph: _Paragraph, element_cls: Optional[Type[Text]]) -> None:
+        text = paragraph.normalized()
+        link_texts, link_urls = list(paragraph.link_texts), list(paragraph.link_urls)
+        paragraph.clear()
+        if not text:
+            return
+        if element_cls is None:
+            element_cls = classify_text(text)
+            if element_cls is None:
+                return
+            if element_cls is ListItem:
+                text = _clean_bullets(text)
+                if not text:
+                    return
+        metadata = (
+            ElementMetadata(link_texts=link_texts, link_urls=link_urls)
+            if link_urls
+            else ElementMetadata()
+        )
+        self.elements.append(element_cls(text, metadata=metadata))
+
+    def image(self, node: LxmlElement) -> None:
+        src = (node.get("data-src") or "").strip() or (node.get("src") or "").strip()
+        if not src:
+            return
+        # Inline data: images carry no useful URL
+        image_url = None if src.startswith("data:") else src
+        alt = (node.get("alt") or "").strip()
+        self.elements.append(Image(text=alt, metadata=ElementMetadata(image_url=image_url)))
+
+    def table(self, node: LxmlElement) -> None:
+        # Nested tables flatten into the text of the cell that holds them
+        row_nodes = [
+            row
+            for child in node
+            for row in ([child] if child.tag == "tr" else child)
+            if child.tag in ("tr", "thead", "tbody", "tfoot") and row.tag == "tr"
+        ]
+        rows: List[str] = []
+        for row in row_nodes:
+            cells = (
+                " ".join(text.strip() for text in cell.itertext() if text.strip())
+                for cell in row
+                if cell.tag in ("th", "td")
+            )
+            rows.append(" ".join(cell for cell in cells if cell))
+        table_text = " ".join(rows).strip()
+        if table_text:
+            self.elements.append(Table(table_text))
+
+
+def partition_html(text: str) -> List[Element]:
+    """Document elements for an HTML page, in document order."""
+    if not text or not text.strip():
+        return []
+    try:
+        root = etree.fromstring(text, _PARSER)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        root = etree.fromstring(text.encode("utf-8"), _PARSER)
+    if root is None:
+        return []
+    etree.strip_elements(root, *STRIPPED_TAGS, with_tail=False)
+
+    start = root.find(".//main")
+    if start is None:
+        start = root.find(".//body")
+    if start is None:
+        start = root
+
+    walker = _ElementWalker()
+    walker.block(start)
+    return walker.elements
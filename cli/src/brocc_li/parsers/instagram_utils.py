@@ -2,8 +2,8 @@ import re
 from typing import Any, Dict, List, Optional, Set
 
 from unstructured.documents.elements import Element, Image, ListItem, NarrativeText, Text, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.utils.logger import logger
 
 
@@ -14,7 +14,7 @@ def partition_instagram_html(html: str, debug: bool = False) -> List[Element]:
     logger.info(f"unstructured found {len(elements)} raw elements.")
 
     if not elements:
-        logger.warning("unstructured.partition_html returned no elements.")
+        logger.warning("partition_html returned no elements.")
         return []
 
     # Apply minimal filtering initially
@@ -1,11 +1,12 @@
 from typing import Any, Dict, List, Optional
 
 from unstructured.documents.elements import Element, NarrativeText, Text, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import (
     extract_company_metadata,
 )
+from brocc_li.parsers.pattern_matcher import PatternMatcher
 from brocc_li.parsers.unstructured_utils import extract_section_by_title, is_element_noisy
 from brocc_li.utils.logger import logger
 
@@ -26,6 +27,7 @@ COMPANY_NOISE_PATTERNS = [
     "Get the app",
     "Join now",
 ]
+COMPANY_NOISE_MATCHER = PatternMatcher(COMPANY_NOISE_PATTERNS)
 
 
 # Special condition to keep important company metadata
@@ -49,11 +51,11 @@ def is_company_noise(text: str, debug: bool = False) -> bool:
     text_lower = text.lower().strip()
 
     # Exact matches or patterns indicating noise
-    for pattern in COMPANY_NOISE_PATTERNS:
-        if pattern.lower() == text_lower or pattern.lower() in text_lower:
-            if debug:
-                logger.debug(f"Company noise: matched '{pattern}' in '{text[:50]}...'")
-            return True
+    pattern = COMPANY_NOISE_MATCHER.search(text_lower)
+    if pattern:
+        if debug:
+            logger.debug(f"Company noise: matched '{pattern}' in '{text[:50]}...'")
+        return True
 
     # Filter short, likely metadata/UI elements by length and digits
     if len(text_lower) < 10 and any(char.isdigit() for char in text_lower):
@@ -228,7 +230,7 @@ def linkedin_company_html_to_md(html: str, debug: bool = False) -> Optional[str]
                 )
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements for company profile.")
+            logger.warning("partition_html returned no elements for company profile.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
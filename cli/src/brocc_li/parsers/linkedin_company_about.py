@@ -1,11 +1,12 @@
 from typing import List, Optional
 
 from unstructured.documents.elements import Element, NarrativeText, Text
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import (
     extract_company_metadata,
 )
+from brocc_li.parsers.pattern_matcher import PatternMatcher
 from brocc_li.parsers.unstructured_utils import extract_section_by_title, is_element_noisy
 from brocc_li.utils.logger import logger
 
@@ -31,6 +32,7 @@ ABOUT_NOISE_PATTERNS = [
     "Learn more about Recommended Content",
     "Get directions to",
 ]
+ABOUT_NOISE_MATCHER = PatternMatcher(ABOUT_NOISE_PATTERNS)
 
 
 # Special condition to keep company size and founded info even if it would be filtered as noise
@@ -48,11 +50,11 @@ def is_about_noise(text: str, debug: bool = False) -> bool:
     text_lower = text.lower().strip()
 
     # Exact matches or patterns indicating noise
-    for pattern in ABOUT_NOISE_PATTERNS:
-        if pattern.lower() == text_lower or pattern.lower() in text_lower:
-            if debug:
-                logger.debug(f"About noise: matched '{pattern}' in '{text[:50]}...'")
-            return True
+    pattern = ABOUT_NOISE_MATCHER.search(text_lower)
+    if pattern:
+        if debug:
+            logger.debug(f"About noise: matched '{pattern}' in '{text[:50]}...'")
+        return True
 
     # Filter short, likely metadata/UI elements by length and digits
     if len(text_lower) < 10 and any(char.isdigit() for char in text_lower):
@@ -198,9 +200,7 @@ def linkedin_company_about_html_to_md(html: str, debug: bool = False) -> Optiona
                 )
 
         if not elements:
-            logger.warning(
-                "unstructured.partition_html returned no elements for company about page."
-            )
+            logger.warning("partition_html returned no elements for company about page.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
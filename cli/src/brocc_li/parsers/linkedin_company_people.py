@@ -1,7 +1,6 @@
 from typing import Optional
 
-from unstructured.partition.html import partition_html
-
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.utils.logger import logger
 
 
@@ -1,9 +1,10 @@
 from typing import Dict, List, Optional
 
 from unstructured.documents.elements import Element, Image, NarrativeText, Text, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import extract_company_metadata
+from brocc_li.parsers.pattern_matcher import PatternMatcher
 from brocc_li.parsers.unstructured_utils import is_element_noisy
 from brocc_li.utils.logger import logger
 
@@ -26,6 +27,7 @@ COMPANY_POSTS_NOISE_PATTERNS = [
     "Watch webinar",
     "Learn top tips",
 ]
+COMPANY_POSTS_NOISE_MATCHER = PatternMatcher(COMPANY_POSTS_NOISE_PATTERNS)
 
 
 # Special condition to keep follower and employee count for company metadata
@@ -41,11 +43,11 @@ def is_company_post_noise(text: str, debug: bool = False) -> bool:
     text_lower = text.lower().strip()
 
     # Exact matches or patterns indicating noise
-    for pattern in COMPANY_POSTS_NOISE_PATTERNS:
-        if pattern.lower() == text_lower or pattern.lower() in text_lower:
-            if debug:
-                logger.debug(f"Company post noise: matched '{pattern}' in '{text[:50]}...'")
-            return True
+    pattern = COMPANY_POSTS_NOISE_MATCHER.search(text_lower)
+    if pattern:
+        if debug:
+            logger.debug(f"Company post noise: matched '{pattern}' in '{text[:50]}...'")
+        return True
 
     # Filter short, likely metadata/UI elements by length and digits
     if len(text_lower) < 10 and any(char.isdigit() for char in text_lower):
@@ -147,7 +149,7 @@ def linkedin_company_posts_html_to_md(html: str, debug: bool = False) -> Optiona
                 )
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements for company posts.")
+            logger.warning("partition_html returned no elements for company posts.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
@@ -1,8 +1,8 @@
 from typing import List, Optional
 
 from unstructured.documents.elements import Element, Image, ListItem, NarrativeText, Text, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import check_block_type, find_first_link, is_noisy
 from brocc_li.utils.logger import logger
 
@@ -14,7 +14,7 @@ def linkedin_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
         logger.info(f"unstructured found {len(elements)} raw elements.")
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements.")
+            logger.warning("partition_html returned no elements.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
@@ -1,8 +1,9 @@
 import re
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
 from bs4 import BeautifulSoup, Tag
 
+from brocc_li.parsers.feed_items import FeedItem, feed_item, join_items, reported
 from brocc_li.utils.logger import logger
 
 
@@ -593,80 +594,89 @@ def _format_linkedin_post_markdown(
     return "\n".join(lines)
 
 
+FEED_ITEM_SELECTOR = "div.feed-shared-update-v2"
+
+
+def _post_items(feed_items: List[Tag], debug: bool = False) -> Iterator[FeedItem]:
+    for i, item in enumerate(feed_items):
+        # Ensure item_urn is Optional[str]
+        urn_val = item.get("data-urn")
+        item_urn: Optional[str] = str(urn_val) if urn_val else None
+
+        if debug:
+            item_html_str = str(item)
+            truncated_html = (
+                (item_html_str[:250] + "...") if len(item_html_str) > 250 else item_html_str
+            )  # Shorten more
+            logger.debug(
+                f"--- Processing Feed Item {i + 1}/{len(feed_items)} (URN: {item_urn}) ---"
+            )
+            logger.debug(f"Item HTML (truncated): {truncated_html}")
+
+        # --- Extract Content ---
+        actor_info = _extract_actor_info(item, debug=debug)
+        # --- Skip 'None' items that don't have proper author info ---
+        if actor_info["name"] == "None" or actor_info["name"] is None:
+            if debug:
+                logger.debug(f"Skipping item {i + 1} because it has no valid author name")
+            continue
+
+        post_text = _extract_post_text(item, debug=debug)
+        media_info = _extract_media(item, debug=debug)
+        metrics_info = _extract_metrics(item, debug=debug)
+        comments_info = _extract_comments(item, debug=debug)
+
+        # --- Format Block ---
+        markdown_block = _format_linkedin_post_markdown(
+            actor=actor_info,
+            content=post_text,
+            media=media_info,
+            metrics=metrics_info,
+            comments=comments_info,
+            post_urn=item_urn,
+        )
+        yield feed_item(item_urn, markdown_block)
+
+
+def linkedin_feed_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each feed post as a FeedItem keyed by its URN (e.g. urn:li:activity:123)."""
+    soup = BeautifulSoup(html, "html.parser")
+    yield from _post_items(soup.select(FEED_ITEM_SELECTOR), debug=debug)
+
+
 def linkedin_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
     """
     Parses the HTML of a LinkedIn feed page and extracts feed items.
     """
     try:
         soup = BeautifulSoup(html, "html.parser")
-        feed_item_selector = "div.feed-shared-update-v2"
-        feed_items: List[Tag] = soup.select(feed_item_selector)
+        feed_items: List[Tag] = soup.select(FEED_ITEM_SELECTOR)
 
         if debug:
             logger.debug(
-                f"Found {len(feed_items)} potential feed items using selector: '{feed_item_selector}'"
+                f"Found {len(feed_items)} potential feed items using selector: '{FEED_ITEM_SELECTOR}'"
             )
 
         if not feed_items:
-            logger.warning(f"No feed items found using selector: '{feed_item_selector}'.")
+            logger.warning(f"No feed items found using selector: '{FEED_ITEM_SELECTOR}'.")
             return None  # Return None if no items found
 
-        output_blocks: List[str] = []
-        filtered_count = 0
-
-        for i, item in enumerate(feed_items):
-            # Ensure item_urn is Optional[str]
-            urn_val = item.get("data-urn")
-            item_urn: Optional[str] = str(urn_val) if urn_val else None
-            item_html_str = str(item)
-            truncated_html = (
-                (item_html_str[:250] + "...") if len(item_html_str) > 250 else item_html_str
-            )  # Shorten more
-
-            if debug:
-                logger.debug(
-                    f"--- Processing Feed Item {i + 1}/{len(feed_items)} (URN: {item_urn}) ---"
-                )
-                logger.debug(f"Item HTML (truncated): {truncated_html}")
-
-            # --- Extract Content ---
-            actor_info = _extract_actor_info(item, debug=debug)
-            post_text = _extract_post_text(item, debug=debug)
-            media_info = _extract_media(item, debug=debug)
-            metrics_info = _extract_metrics(item, debug=debug)
-            comments_info = _extract_comments(item, debug=debug)
-
-            # --- Skip 'None' items that don't have proper author info ---
-            if actor_info["name"] == "None" or actor_info["name"] is None:
-                if debug:
-                    logger.debug(f"Skipping item {i + 1} because it has no valid author name")
-                filtered_count += 1
-                continue
-
-            # --- Format Block ---
-            markdown_block = _format_linkedin_post_markdown(
-                actor=actor_info,
-                content=post_text,
-                media=media_info,
-                metrics=metrics_info,
-                comments=comments_info,
-                post_urn=item_urn,
-            )
-            output_blocks.append(markdown_block)
+        items = list(reported(_post_items(feed_items, debug=debug)))
+        filtered_count = len(feed_items) - len(items)
 
         if filtered_count > 0 and debug:
             logger.debug(f"Filtered out {filtered_count} items with missing author information")
 
         # --- Combine and Return ---
         # Join blocks with double newline instead of separator
-        markdown_output = "\n\n".join(output_blocks)
+        markdown_output = join_items(items)
 
         if not markdown_output:
             logger.warning("Processing resulted in empty markdown despite finding feed items.")
             return None  # Return None if output is empty
         else:
             logger.info(
-                f"Successfully processed {len(output_blocks)} feed items into markdown after filtering {filtered_count} invalid items."
+                f"Successfully processed {len(items)} feed items into markdown after filtering {filtered_count} invalid items."
             )
 
         return markdown_output.strip()
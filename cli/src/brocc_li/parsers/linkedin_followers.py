@@ -1,8 +1,8 @@
 from typing import Dict, List, Optional, Set
 
 from unstructured.documents.elements import Element, Image, NarrativeText, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import extract_profile_url, format_profile_header
 from brocc_li.parsers.unstructured_utils import is_element_noisy
 from brocc_li.utils.logger import logger
@@ -143,7 +143,7 @@ def linkedin_followers_html_to_md(html: str, debug: bool = False) -> Optional[st
                 logger.debug(f"  ... and {len(elements) - 30} more elements")
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements.")
+            logger.warning("partition_html returned no elements.")
             return "<!-- unstructured found no elements -->"
 
         # --- Minimal Noise Filtering --- #
@@ -1,8 +1,9 @@
 from typing import List, Optional
 
 from unstructured.documents.elements import Element, Image, NarrativeText, Title
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
+from brocc_li.parsers.pattern_matcher import PatternMatcher
 from brocc_li.parsers.unstructured_utils import is_element_noisy
 from brocc_li.utils.logger import logger
 
@@ -25,6 +26,7 @@ PROFILE_NOISE_PATTERNS = [
     "Endorsed by",
     "who is highly skilled at this",
 ]
+PROFILE_NOISE_MATCHER = PatternMatcher(PROFILE_NOISE_PATTERNS)
 
 
 def is_profile_noise(text: str, debug: bool = False) -> bool:
@@ -34,11 +36,11 @@ def is_profile_noise(text: str, debug: bool = False) -> bool:
 
     text_lower = text.lower()
 
-    for pattern in PROFILE_NOISE_PATTERNS:
-        if pattern.lower() in text_lower:
-            if debug:
-                logger.debug(f"Profile noise: matched '{pattern}' in '{text[:50]}...'")
-            return True
+    pattern = PROFILE_NOISE_MATCHER.search(text_lower)
+    if pattern:
+        if debug:
+            logger.debug(f"Profile noise: matched '{pattern}' in '{text[:50]}...'")
+        return True
 
     return False
 
@@ -83,7 +85,7 @@ def linkedin_profile_html_to_md(html: str, debug: bool = False) -> Optional[str]
                 logger.debug(f"  Element {i + 1}: {type(element).__name__} - {str(element)}")
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements.")
+            logger.warning("partition_html returned no elements.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
@@ -1,8 +1,8 @@
 from typing import List, Optional, Set
 
 from unstructured.documents.elements import Element, Image
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.linkedin_utils import extract_profile_url, format_profile_header
 from brocc_li.parsers.unstructured_utils import is_element_noisy
 from brocc_li.utils.logger import logger
@@ -94,7 +94,7 @@ def linkedin_search_connections_html_to_md(html: str, debug: bool = False) -> Op
                 logger.debug(f"  ... and {len(elements) - 20} more elements")
 
         if not elements:
-            logger.warning("unstructured.partition_html returned no elements.")
+            logger.warning("partition_html returned no elements.")
             return "<!-- unstructured found no elements -->"
 
         # --- Filter Noise --- #
@@ -2,10 +2,10 @@ import re
 from datetime import datetime
 from typing import Any, Dict, List, Optional, Tuple
 
-import dateparser
-from geotext import GeoText
 from unstructured.documents.elements import Element, Image, NarrativeText, Text, Title
 
+from brocc_li.parsers.pattern_matcher import PatternMatcher
+from brocc_li.parsers.resolve_utils import find_places, parse_date
 from brocc_li.utils.logger import logger
 
 # List of noisy text patterns to filter out
@@ -493,6 +493,18 @@ COMPANY_TYPES = [
     "benefit corporation",
 ]
 
+# Compiled once; each classifier below scans its text once regardless of list size
+NOISE_MATCHER = PatternMatcher(NOISE_PATTERNS)
+ROLE_MATCHER = PatternMatcher(role for roles in COMMON_ROLE_PATTERNS.values() for role in roles)
+RELATIONSHIP_MATCHER = PatternMatcher(RELATIONSHIP_INDICATORS)
+DEGREE_MATCHER = PatternMatcher(CONNECTION_PATTERNS["degree"])
+MUTUAL_MATCHER = PatternMatcher(CONNECTION_PATTERNS["mutual"])
+CONNECTION_PHRASE_MATCHER = PatternMatcher(CONNECTION_PATTERNS["phrases"])
+NON_NAME_MATCHER = PatternMatcher(NON_NAME_INDICATORS)
+LOCATION_MATCHER = PatternMatcher(LOCATION_INDICATORS)
+INDUSTRY_MATCHER = PatternMatcher(INDUSTRY_CATEGORIES)
+COMPANY_TYPE_MATCHER = PatternMatcher(COMPANY_TYPES)
+
 
 def is_noisy(element_text: str, debug: bool = False) -> bool:
     """Check if element text matches any known noise patterns."""
@@ -510,14 +522,11 @@ def is_noisy(element_text: str, debug: bool = False) -> bool:
             logger.debug("Noisy check: matched exact text 'follow'")
         return True
 
-    for pattern in NOISE_PATTERNS:
-        # Use text_strip here for case-sensitive patterns if needed in future
-        if pattern.lower() in text_lower:
-            if debug:
-                logger.debug(
-                    f"Noisy check: matched pattern '{pattern}' in '{element_text[:50]}...'"
-                )
-            return True
+    pattern = NOISE_MATCHER.search(text_lower)
+    if pattern:
+        if debug:
+            logger.debug(f"Noisy check: matched pattern '{pattern}' in '{element_text[:50]}...'")
+        return True
 
     if PLAYBACK_SPEED_REGEX.match(text_lower):
         if debug:
@@ -722,38 +731,33 @@ def extract_company_metadata(
                     if debug:
                         logger.debug(f"Found labeled industry: {industry_text}")
                 # Then check against our industry categories
-                elif any(industry in text_lower for industry in INDUSTRY_CATEGORIES):
+                elif industries := INDUSTRY_MATCHER.matched(text_lower):
                     # If multiple industries match, use the full text as it might be a compound industry
-                    if len([ind for ind in INDUSTRY_CATEGORIES if ind in text_lower]) > 1:
+                    if len(industries) > 1:
                         metadata["industry"] = text
                     else:
                         # Otherwise extract the matching industry as a substring
-                        for industry in INDUSTRY_CATEGORIES:
-                            if industry in text_lower:
-                                start_idx = text_lower.find(industry)
-                                # Get the industry and surrounding words
-                                substring = text[
-                                    max(0, start_idx - 5) : min(
-                                        len(text), start_idx + len(industry) + 15
-                                    )
-                                ]
-                                metadata["industry"] = substring.strip()
-                                break
+                        industry = industries[0]
+                        start_idx = text_lower.find(industry)
+                        # Get the industry and surrounding words
+                        substring = text[
+                            max(0, start_idx - 5) : min(len(text), start_idx + len(industry) + 15)
+                        ]
+                        metadata["industry"] = substring.strip()
                     if debug:
                         logger.debug(f"Found industry: {metadata['industry']}")
 
-            # Location detection - improved with geotext
-            geo = GeoText(text)
+            # Location detection - improved with geotext (cached)
+            geo = find_places(text)
             has_geo_entities = bool(geo.cities or geo.countries or geo.nationalities)
-            is_potential_location = has_geo_entities or any(
-                indicator.lower() in text_lower for indicator in LOCATION_INDICATORS
-            )
+            has_location_indicator = LOCATION_MATCHER.search(text_lower) is not None
+            is_potential_location = has_geo_entities or has_location_indicator
 
             if is_potential_location:
                 # Store with priority (1 = high, 2 = medium, 3 = low)
                 priority = 3
                 # Explicit location indicators get highest priority
-                if any(indicator.lower() in text_lower for indicator in LOCATION_INDICATORS):
+                if has_location_indicator:
                     priority = 1
                 # GeoText matches get medium-high priority
                 elif has_geo_entities:
@@ -798,18 +802,15 @@ def extract_company_metadata(
                     if debug:
                         logger.debug(f"Found labeled company type: {type_text}")
                 # Check against comprehensive company types
-                elif any(company_type in text_lower for company_type in COMPANY_TYPES):
-                    # Extract the matching type
-                    for company_type in COMPANY_TYPES:
-                        if company_type in text_lower:
-                            start_idx = text_lower.find(company_type)
-                            end_idx = start_idx + len(company_type)
-                            metadata["type"] = text[start_idx:end_idx]
-                            break
+                elif company_types := COMPANY_TYPE_MATCHER.matched(text_lower):
+                    # Extract the first matching type
+                    start_idx = text_lower.find(company_types[0])
+                    end_idx = start_idx + len(company_types[0])
+                    metadata["type"] = text[start_idx:end_idx]
                     if debug:
                         logger.debug(f"Found company type: {metadata['type']}")
 
-            # Founded year - improved with dateparser
+            # Founded year - resolved through the shared date cache
             elif not metadata["founded"]:
                 # Look for founding date patterns
                 founded_indicators = [
@@ -826,7 +827,7 @@ def extract_company_metadata(
                     "est. in",
                 ]
                 if any(indicator in text_lower for indicator in founded_indicators):
-                    # First try with dateparser
+                    # Parsed founding date, if any
                     parsed_date = None
 
                     # Try to extract just the year portion if possible
@@ -839,58 +840,34 @@ def extract_company_metadata(
                         if debug:
                             logger.debug(f"Found founding year: {metadata['founded']} from pattern")
                     else:
-                        # Try with dateparser for more complex cases
-                        try:
-                            # Remove common label text to help dateparser
-                            for label in founded_indicators:
-                                if label in text_lower:
-                                    clean_text = text.lower().replace(label, "").strip()
-                                    parsed_date = dateparser.parse(clean_text)
-                                    if parsed_date:
-                                        break
-
-                            # If no date found, try the full text as a fallback
-                            if not parsed_date:
-                                parsed_date = dateparser.parse(text)
-
-                            if parsed_date:
-                                # Extract just the year from the parsed date
-                                year = parsed_date.year
-                                if 1800 <= year <= datetime.now().year:
-                                    metadata["founded"] = str(year)
-                                    if debug:
-                                        logger.debug(
-                                            f"Found founding year: {metadata['founded']} from dateparser"
-                                        )
-                                else:
-                                    # Fallback to the original text if year is unreasonable
-                                    founded_text = text
-                                    for label in founded_indicators:
-                                        founded_text = founded_text.replace(label, "").strip()
-                                    metadata["founded"] = founded_text
-                                    if debug:
-                                        logger.debug(
-                                            f"Found founded text (invalid year): {metadata['founded']}"
-                                        )
-                            else:
-                                # If dateparser fails, fall back to the original text
-                                founded_text = text
-                                for label in founded_indicators:
-                                    founded_text = founded_text.replace(label, "").strip()
-                                metadata["founded"] = founded_text
-                                if debug:
-                                    logger.debug(
-                                        f"Found founded text (no date): {metadata['founded']}"
-                                    )
-                        except Exception as e:
-                            # Handle any dateparser errors gracefully
+                        # Try date parsing for more complex cases,
+                        # removing common label text first to help it
+                        for label in founded_indicators:
+                            if label in text_lower:
+                                clean_text = text.lower().replace(label, "").strip()
+                                parsed_date = parse_date(clean_text)
+                                if parsed_date:
+                                    break
+
+                        # If no date found, try the full text as a fallback
+                        if not parsed_date:
+                            parsed_date = parse_date(text)
+
+                        if parsed_date and 1800 <= parsed_date.year <= datetime.now().year:
+                            # Extract just the year from the parsed date
+                            metadata["founded"] = str(parsed_date.year)
                             if debug:
-                                logger.debug(f"Error parsing date from '{text}': {e}")
-                            # Fallback to just the text with labels removed
+                                logger.debug(
+                                    f"Found founding year: {metadata['founded']} from parsed date"
+                                )
+                        else:
+                            # Fall back to the original text if there's no reasonable year
                             founded_text = text
                             for label in founded_indicators:
                                 founded_text = founded_text.replace(label, "").strip()
                             metadata["founded"] = founded_text
+                            if debug:
+                                logger.debug(f"Found founded text (no date): {metadata['founded']}")
                 elif re.match(r"^(19\d{2}|20[0-2]\d)$", text.strip()):
                     # Just year detection
                     metadata["founded"] = text.strip()
@@ -1012,11 +989,11 @@ def is_person_name(text: str) -> bool:
 
     # Check for patterns that are definitely not names
     text_lower = text.lower()
-    if any(indicator in text_lower for indicator in NON_NAME_INDICATORS):
+    if NON_NAME_MATCHER.search(text_lower):
         return False
 
     # Avoid locations that look like names
-    if any(loc in text_lower for loc in LOCATION_INDICATORS):
+    if LOCATION_MATCHER.search(text_lower):
         return False
 
     return True
@@ -1027,32 +1004,27 @@ def is_job_title(text: str) -> bool:
     text_lower = text.lower()
 
     # 1. Direct relationship indicators between person and organization
-    if any(rel in text_lower for rel in RELATIONSHIP_INDICATORS):
-        # Additional check for org name after relationship indicator
-        for rel in RELATIONSHIP_INDICATORS:
-            if rel in text_lower:
-                # Most job titles with these patterns are legitimate
-                return True
-
-    # 2. Check if any role term is present (with word boundaries)
-    all_roles = []
-    for role_type in COMMON_ROLE_PATTERNS.values():
-        all_roles.extend(role_type)
-
-    if any(
-        role in text_lower.split() or f"{role}," in text_lower or f"{role}." in text_lower
-        for role in all_roles
-    ):
+    # (most job titles with these patterns are legitimate)
+    if RELATIONSHIP_MATCHER.search(text_lower):
         return True
 
-    if any(f"{role} " in text_lower or f" {role}" in text_lower for role in all_roles):
-        return True
+    # 2. Check if any role term is present (with word boundaries)
+    for start, role in ROLE_MATCHER.occurrences(text_lower):
+        end = start + len(role)
+        before = text_lower[start - 1] if start > 0 else ""
+        after = text_lower[end] if end < len(text_lower) else ""
+        # Followed by a space, comma or period, or preceded by a space
+        if before == " " or (after and after in " ,."):
+            return True
+        # A whole whitespace-separated word
+        if " " not in role and (not before or before.isspace()) and (not after or after.isspace()):
+            return True
 
     # 3. LinkedIn-specific formatting patterns
     if "•" in text and len(text) < 50:  # LinkedIn often uses bullets in titles
         return True
 
-    if " | " in text and not any(x in text_lower for x in CONNECTION_PATTERNS["degree"]):
+    if " | " in text and not DEGREE_MATCHER.search(text_lower):
         return True
 
     # 4. Common LinkedIn job title patterns like "X at Y" or "X of Y"
@@ -1074,11 +1046,11 @@ def is_connection_info(text: str) -> bool:
     text_lower = text.lower()
 
     # Connection degree indicators
-    if any(x in text_lower for x in CONNECTION_PATTERNS["degree"]):
+    if DEGREE_MATCHER.search(text_lower):
         return True
 
     # Mutual connection patterns
-    if any(x in text_lower for x in CONNECTION_PATTERNS["mutual"]):
+    if MUTUAL_MATCHER.search(text_lower):
         return True
 
     # Connection count patterns
@@ -1088,7 +1060,7 @@ def is_connection_info(text: str) -> bool:
         return True
 
     # Specific LinkedIn connection phrases
-    if any(phrase in text_lower for phrase in CONNECTION_PATTERNS["phrases"]):
+    if CONNECTION_PHRASE_MATCHER.search(text_lower):
         return True
 
     return False
@@ -0,0 +1,101 @@
+"""
+Compiled multi-pattern substring matching for parser text classifiers.
+
+Noise filters and LinkedIn heuristics ask "does this text contain any of these N phrases?"
+for every element on a page. Looping over the phrases makes each element O(N); a
+PatternMatcher answers in one scan of the text, independent of N.
+
+Structure:
+- Patterns are folded into a trie and emitted as one regex whose alternations branch on
+  the next character (the Aho-Corasick goto function, run by the C regex engine). At each
+  text position only the trie path for that character is tried.
+- `search` finds the leftmost match. `occurrences` also reports every pattern that ends
+  inside a longer one at the same position, so callers can count distinct hits or check
+  what surrounds each one.
+- `matcher_for` caches matchers for pattern lists passed in at call time.
+
+Gotchas:
+- Matching is on lowercased patterns, and callers pass text they have already lowercased
+  (every classifier here lowercases once up front).
+- `matcher_for` caches by the patterns' contents, so it costs one tuple() of the list per
+  call. Hot loops should hold on to a PatternMatcher instead.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, TypeAlias
+
+_TERMINAL = ""
+MATCHER_CACHE_SIZE = 128  # Distinct pattern lists; the parsers use a few dozen
+
+_TrieNode: TypeAlias = Dict[str, "_TrieNode"]
+
+
+def _trie_pattern(patterns: Sequence[str]) -> str:
+    trie: _TrieNode = {}
+    for pattern in patterns:
+        node = trie
+        for char in pattern:
+            node = node.setdefault(char, {})
+        node[_TERMINAL] = {}
+
+    def build(node: _TrieNode) -> str:
+        branches = [re.escape(char) + build(child) for char, child in node.items() if char]
+        if not branches:
+            return ""
+        body = branches[0] if len(branches) == 1 else f"(?:{'|'.join(branches)})"
+        # Greedy optional tail: the longest pattern through this node wins
+        return f"(?:{body})?" if _TERMINAL in node else body
+
+    return build(trie) if patterns else "(?!)"
+
+
+class PatternMatcher:
+    """Finds any of a fixed set of (lowercased) substrings in one pass over the text."""
+
+    def __init__(self, patterns: Iterable[str]):
+        # Deduplicated, lowercased, in first-seen order
+        self.patterns: Tuple[str, ...] = tuple(
+            dict.fromkeys(pattern.lower() for pattern in patterns if pattern)
+        )
+        self._rank = {pattern: rank for rank, pattern in enumerate(self.patterns)}
+        # Patterns that are a prefix of each pattern (itself included), shortest first
+        self._prefixes = {
+            pattern: sorted(
+                (other for other in self.patterns if pattern.startswith(other)), key=len
+            )
+            for pattern in self.patterns
+        }
+        trie = _trie_pattern(self.patterns)
+        self._search_re = re.compile(trie)
+        # Zero-width, so every start position gets its longest match
+        self._every_position_re = re.compile(f"(?=({trie}))")
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def search(self, text_lower: str) -> Optional[str]:
+        """The leftmost pattern found in the text, or None."""
+        match = self._search_re.search(text_lower)
+        return match.group(0) if match else None
+
+    def occurrences(self, text_lower: str) -> Iterator[Tuple[int, str]]:
+        """(start, pattern) for every occurrence of every pattern, overlaps included."""
+        for match in self._every_position_re.finditer(text_lower):
+            for pattern in self._prefixes[match.group(1)]:
+                yield match.start(), pattern
+
+    def matched(self, text_lower: str) -> List[str]:
+        """Distinct patterns found in the text, in the order they were given."""
+        found = {pattern for _, pattern in self.occurrences(text_lower)}
+        return sorted(found, key=self._rank.__getitem__)
+
+
+def matcher_for(patterns: Sequence[str]) -> PatternMatcher:
+    """Matcher for a pattern list, built on first use and reused for the same patterns."""
+    return _cached_matcher(tuple(patterns))
+
+
+@lru_cache(maxsize=MATCHER_CACHE_SIZE)
+def _cached_matcher(patterns: Tuple[str, ...]) -> PatternMatcher:
+    return PatternMatcher(patterns)
@@ -0,0 +1,175 @@
+"""
+Shared, memoized date and location resolution for parsers.
+
+Parsers call these helpers instead of dateparser / GeoText directly, so the same
+strings (timestamps repeated down a feed, the same city on every card) are resolved once.
+
+Structure:
+- `parse_date` tries a regex pre-pass over formats seen on the sites we parse (ISO dates,
+  "Mar 21, 2024", "3/21/24", "3:45 PM", "Today", "5 hours ago") and only falls back to
+  dateparser for anything else. Each fast format must match the *whole* string, and
+  resolves to the same date dateparser would.
+- `find_places` wraps GeoText and returns immutable tuples so results can be cached.
+- Both caches are bounded LRUs; dateparser and GeoText are imported on first fallback.
+
+Gotchas:
+- Relative dates depend on "now": fast-path results are never cached, and the dateparser
+  cache is keyed by today's date so yesterday's "2 hours ago" doesn't leak into today.
+  Within a day, a cached dateparser result for a relative phrase keeps the time it was
+  first resolved at.
+- Failures are cached too (as None); repeated unparseable text is the common slow case.
+"""
+
+import re
+from datetime import date, datetime, timedelta
+from functools import lru_cache
+from typing import Callable, List, NamedTuple, Optional, Tuple
+
+from brocc_li.utils.logger import logger
+
+DATE_CACHE_SIZE = 4096
+PLACE_CACHE_SIZE = 4096
+
+# Output format used by every parser that normalizes dates
+DISPLAY_DATE_FORMAT = "%b %d, %Y"
+
+_MONTHS = {
+    "jan": 1,
+    "feb": 2,
+    "mar": 3,
+    "apr": 4,
+    "may": 5,
+    "jun": 6,
+    "jul": 7,
+    "aug": 8,
+    "sep": 9,
+    "sept": 9,
+    "oct": 10,
+    "nov": 11,
+    "dec": 12,
+}
+
+_MONTH_NAMES = (
+    "jan(?:uary)?|feb(?:ruary)?|mar(?:ch)?|apr(?:il)?|may|june?|july?|aug(?:ust)?"
+    "|sep(?:t(?:ember)?)?|oct(?:ober)?|nov(?:ember)?|dec(?:ember)?"
+)
+
+_RELATIVE_UNITS = {
+    "second": timedelta(seconds=1),
+    "minute": timedelta(minutes=1),
+    "hour": timedelta(hours=1),
+    "day": timedelta(days=1),
+    "week": timedelta(weeks=1),
+}
+
+_ISO_DATE_RE = re.compile(r"(\d{4})-(\d{1,2})-(\d{1,2})")
+_MONTH_DAY_RE = re.compile(rf"({_MONTH_NAMES})\.?\s+(\d{{1,2}})(?:,\s*(\d{{4}}))?", re.IGNORECASE)
+_NUMERIC_DATE_RE = re.compile(r"(\d{1,2})/(\d{1,2})/(\d{4}|\d{2})")
+_CLOCK_TIME_RE = re.compile(r"(\d{1,2}):(\d{2})\s*(am|pm)", re.IGNORECASE)
+_RELATIVE_DAY_RE = re.compile(r"(today|yesterday)", re.IGNORECASE)
+_RELATIVE_AGO_RE = re.compile(r"(\d+)\s+(second|minute|hour|day|week)s?\s+ago", re.IGNORECASE)
+
+
+def _iso_date(match: re.Match[str], now: datetime) -> datetime:
+    year, month, day = (int(group) for group in match.groups())
+    return datetime(year, month, day)
+
+
+def _month_day(match: re.Match[str], now: datetime) -> datetime:
+    month, day, year = match.groups()
+    return datetime(int(year) if year else now.year, _MONTHS[month[:3].lower()], int(day))
+
+
+def _numeric_date(match: re.Match[str], now: datetime) -> datetime:
+    # Month first, like dateparser's default for English
+    month, day, year = match.groups()
+    full_year = datetime.strptime(year, "%y").year if len(year) == 2 else int(year)
+    return datetime(full_year, int(month), int(day))
+
+
+def _clock_time(match: re.Match[str], now: datetime) -> datetime:
+    hour, minute, meridiem = match.groups()
+    if not 1 <= int(hour) <= 12:
+        raise ValueError("hour out of range for a 12-hour clock")
+    hour_24 = int(hour) % 12 + (12 if meridiem.lower() == "pm" else 0)
+    return now.replace(hour=hour_24, minute=int(minute), second=0, microsecond=0)
+
+
+def _relative_day(match: re.Match[str], now: datetime) -> datetime:
+    return now if match.group(1).lower() == "today" else now - timedelta(days=1)
+
+
+def _relative_ago(match: re.Match[str], now: datetime) -> datetime:
+    count, unit = match.groups()
+    return now - int(count) * _RELATIVE_UNITS[unit.lower()]
+
+
+_FAST_FORMATS: List[Tuple[re.Pattern[str], Callable[[re.Match[str], datetime], datetime]]] = [
+    (_ISO_DATE_RE, _iso_date),
+    (_MONTH_DAY_RE, _month_day),
+    (_NUMERIC_DATE_RE, _numeric_date),
+    (_CLOCK_TIME_RE, _clock_time),
+    (_RELATIVE_DAY_RE, _relative_day),
+    (_RELATIVE_AGO_RE, _relative_ago),
+]
+
+
+def _parse_fast(text: str) -> Optional[datetime]:
+    now = datetime.now()
+    for pattern, build in _FAST_FORMATS:
+        match = pattern.fullmatch(text)
+        if match:
+            try:
+                return build(match, now)
+            except ValueError:
+                # e.g. Feb 30 or 13/01/24: let dateparser decide what it means
+                return None
+    return None
+
+
+@lru_cache(maxsize=DATE_CACHE_SIZE)
+def _parse_with_dateparser(text: str, today: date) -> Optional[datetime]:
+    import dateparser
+
+    try:
+        return dateparser.parse(text)
+    except Exception as e:
+        logger.debug(f"dateparser failed on {text!r}: {e}")
+        return None
+
+
+def parse_date(text: str) -> Optional[datetime]:
+    """Resolve a date string to a datetime, or None if it isn't one."""
+    text = text.strip()
+    if not text:
+        return None
+    parsed = _parse_fast(text)
+    if parsed is not None:
+        return parsed
+    return _parse_with_dateparser(text, date.today())
+
+
+def format_date(text: str) -> Optional[str]:
+    """Resolve a date string and format it like "Mar 21, 2024", or None if it isn't one."""
+    parsed = parse_date(text)
+    return parsed.strftime(DISPLAY_DATE_FORMAT) if parsed else None
+
+
+class Places(NamedTuple):
+    cities: Tuple[str, ...]
+    countries: Tuple[str, ...]
+    nationalities: Tuple[str, ...]
+
+
+@lru_cache(maxsize=PLACE_CACHE_SIZE)
+def find_places(text: str) -> Places:
+    """Cities, countries and nationalities GeoText finds in the text."""
+    from geotext import GeoText
+
+    geo = GeoText(text)
+    return Places(tuple(geo.cities), tuple(geo.countries), tuple(geo.nationalities))
+
+
+def clear_resolution_caches() -> None:
+    _parse_with_dateparser.cache_clear()
+    find_places.cache_clear()
@@ -1,12 +1,48 @@
 import re
 from typing import List, Optional
 
-import dateparser
 from bs4 import BeautifulSoup, Tag
 from rich.markup import escape
 
+from brocc_li.parsers.pattern_matcher import matcher_for
+from brocc_li.parsers.resolve_utils import format_date
 from brocc_li.utils.logger import logger
 
+# Likely date portions inside longer element text, tried in order
+ELEMENT_DATE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in [
+        # Month name patterns (Mar 21, March 21, etc)
+        r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:,\s*\d{4})?",
+        # Numeric date patterns (MM/DD/YY, DD/MM/YY)
+        r"\b\d{1,2}/\d{1,2}/\d{2,4}",
+        r"\b\d{1,2}-\d{1,2}-\d{2,4}",
+        # ISO-like date patterns (YYYY-MM-DD)
+        r"\b\d{4}[/-]\d{1,2}[/-]\d{1,2}",
+        # Time patterns (maybe date is just a time in the UI)
+        r"\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)",
+        # Yesterday, Today patterns
+        r"\b(?:Today|Yesterday)\b",
+        # Relative time patterns
+        r"\b\d+\s+(?:minute|hour|day|week|month)s?\s+ago\b",
+    ]
+]
+
+# Date portions inside free text, tried after the text as a whole
+TEXT_DATE_PATTERNS = [
+    re.compile(pattern)
+    for pattern in [
+        # Month name patterns
+        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:,\s*\d{4})?",
+        # Numeric dates
+        r"\d{1,2}/\d{1,2}/\d{2,4}",
+        # ISO-like dates
+        r"\d{4}-\d{1,2}-\d{1,2}",
+        # Time patterns
+        r"\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)",
+    ]
+]
+
 
 def extract_date_from_element(element: Tag, debug: bool = False) -> Optional[str]:
     """
@@ -27,110 +63,51 @@ def extract_date_from_element(element: Tag, debug: bool = False) -> Optional[str
     date_span = element.select_one("span[title]")
     if date_span and date_span.get("title"):
         date_title = date_span.get("title")
+        if isinstance(date_title, list):
+            date_title = str(date_title[0]) if date_title and date_title[0] else None
         if isinstance(date_title, str) and date_title.strip():
-            # Try to parse it with dateparser for normalization
-            parsed_date = dateparser.parse(date_title.strip())
-            if parsed_date:
-                formatted_date = parsed_date.strftime("%b %d, %Y")
-                if debug:
-                    safe_date = escape(formatted_date)
-                    logger.debug(f"Date extracted from span title and normalized: {safe_date}")
-                return formatted_date
-            else:
-                if debug:
-                    safe_date = escape(str(date_title))
-                    logger.debug(f"Date extracted from span title (unparseable): {safe_date}")
-                return date_title.strip()
-        elif isinstance(date_title, list) and date_title and date_title[0]:
-            date_str = str(date_title[0]).strip()
-            # Try to parse it with dateparser
-            parsed_date = dateparser.parse(date_str)
-            if parsed_date:
-                formatted_date = parsed_date.strftime("%b %d, %Y")
-                if debug:
-                    safe_date = escape(formatted_date)
-                    logger.debug(f"Date extracted from span title list and normalized: {safe_date}")
-                return formatted_date
-            else:
-                if debug:
-                    safe_date = escape(date_str)
-                    logger.debug(f"Date extracted from span title list (unparseable): {safe_date}")
-                return date_str
+            date_str = date_title.strip()
+            formatted_date = format_date(date_str)
+            if debug:
+                safe_date = escape(formatted_date or date_str)
+                state = "normalized" if formatted_date else "unparseable"
+                logger.debug(f"Date extracted from span title ({state}): {safe_date}")
+            return formatted_date or date_str
 
-    # Strategy 2: Use element text and look for date patterns with dateparser
+    # Strategy 2: Use element text and look for likely date portions
     element_text = element.get_text(strip=True)
     if not element_text:
         return None
 
-    # First try with regex to extract likely date portions
-    # Common date patterns in various formats
-    date_patterns = [
-        # Month name patterns (Mar 21, March 21, etc)
-        r"\b(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:,\s*\d{4})?",
-        # Numeric date patterns (MM/DD/YY, DD/MM/YY)
-        r"\b\d{1,2}/\d{1,2}/\d{2,4}",
-        r"\b\d{1,2}-\d{1,2}-\d{2,4}",
-        # ISO-like date patterns (YYYY-MM-DD)
-        r"\b\d{4}[/-]\d{1,2}[/-]\d{1,2}",
-        # Time patterns (maybe date is just a time in the UI)
-        r"\b\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)",
-        # Yesterday, Today patterns
-        r"\b(?:Today|Yesterday)\b",
-        # Relative time patterns
-        r"\b\d+\s+(?:minute|hour|day|week|month)s?\s+ago\b",
-    ]
-
-    # Try each pattern
     date_candidates = []
-    for pattern in date_patterns:
-        date_match = re.search(pattern, element_text)
+    for pattern in ELEMENT_DATE_PATTERNS:
+        date_match = pattern.search(element_text)
         if date_match:
             date_str = date_match.group(0).strip()
             date_candidates.append(date_str)
             if debug:
-                safe_pattern = escape(pattern)
+                safe_pattern = escape(pattern.pattern)
                 safe_date = escape(date_str)
                 logger.debug(f"Date candidate from pattern {safe_pattern}: {safe_date}")
 
-    # Now try dateparser on each candidate, plus the full text
-    date_candidates.append(element_text)  # Add full text as final candidate
+    # Try each candidate, plus the full text
+    date_candidates.append(element_text)
 
     for candidate in date_candidates:
-        parsed_date = dateparser.parse(candidate)
-        if parsed_date:
-            formatted_date = parsed_date.strftime("%b %d, %Y")
+        formatted_date = format_date(candidate)
+        if formatted_date:
             if debug:
                 safe_candidate = escape(candidate)
                 safe_date = escape(formatted_date)
-                logger.debug(
-                    f"Date successfully parsed with dateparser: {safe_candidate} -> {safe_date}"
-                )
+                logger.debug(f"Date successfully parsed: {safe_candidate} -> {safe_date}")
             return formatted_date
 
     # Strategy 3: Last resort for very short text that might just be a date
     if len(element_text) < 20:
-        try:
-            parsed_date = dateparser.parse(element_text)
-            if parsed_date:
-                formatted_date = parsed_date.strftime("%b %d, %Y")
-                if debug:
-                    safe_text = escape(element_text)
-                    safe_date = escape(formatted_date)
-                    logger.debug(
-                        f"Short text successfully parsed as date: {safe_text} -> {safe_date}"
-                    )
-                return formatted_date
-            else:
-                if debug:
-                    safe_text = escape(element_text)
-                    logger.debug(f"Using short text as date (unparseable): {safe_text}")
-                return element_text
-        except Exception as e:
-            if debug:
-                safe_text = escape(element_text)
-                safe_error = escape(str(e))
-                logger.debug(f"Error parsing date from short text '{safe_text}': {safe_error}")
-            return element_text
+        if debug:
+            safe_text = escape(element_text)
+            logger.debug(f"Using short text as date (unparseable): {safe_text}")
+        return element_text
 
     # No date pattern recognized
     if debug:
@@ -208,7 +185,7 @@ def find_largest_container(
 
 def extract_date_text(text: str) -> Optional[str]:
     """
-    Extract and parse date patterns from raw text string using dateparser.
+    Extract and parse date patterns from raw text string.
     Useful for cleaning up mixed text that contains date information.
 
     Args:
@@ -220,36 +197,19 @@ def extract_date_text(text: str) -> Optional[str]:
     if not text:
         return None
 
-    # First try with dateparser directly
-    try:
-        parsed_date = dateparser.parse(text)
-        if parsed_date:
-            return parsed_date.strftime("%b %d, %Y")
-    except Exception:
-        pass
+    # First try the text as a whole
+    formatted_date = format_date(text)
+    if formatted_date:
+        return formatted_date
 
-    # If direct parsing fails, try to extract date patterns first
-    date_patterns = [
-        # Month name patterns
-        r"(?:Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec)[a-z]*\.?\s+\d{1,2}(?:,\s*\d{4})?",
-        # Numeric dates
-        r"\d{1,2}/\d{1,2}/\d{2,4}",
-        # ISO-like dates
-        r"\d{4}-\d{1,2}-\d{1,2}",
-        # Time patterns
-        r"\d{1,2}:\d{2}\s*(?:AM|PM|am|pm)",
-    ]
-
-    for pattern in date_patterns:
-        match = re.search(pattern, text)
+    # Then try to extract date patterns first
+    for pattern in TEXT_DATE_PATTERNS:
+        match = pattern.search(text)
         if match:
             date_str = match.group(0).strip()
-            try:
-                parsed_date = dateparser.parse(date_str)
-                if parsed_date:
-                    return parsed_date.strftime("%b %d, %Y")
-            except Exception:
-                return date_str
+            formatted_date = format_date(date_str)
+            if formatted_date:
+                return formatted_date
 
     return None
 
@@ -273,10 +233,9 @@ def is_noise_element(element: Tag, noise_patterns: List[str]) -> bool:
     element_attrs = " ".join([str(v) for k, v in element.attrs.items()]).lower()
 
     # Check against noise patterns
-    for pattern in noise_patterns:
-        pattern_lower = pattern.lower()
-        if pattern_lower in element_text or pattern_lower in element_attrs:
-            return True
+    matcher = matcher_for(noise_patterns)
+    if matcher.search(element_text) or matcher.search(element_attrs):
+        return True
 
     # Check for common UI patterns
     ui_patterns = ["loading", "progress", "spinner", "advertisement", "cookie", "banner"]
@@ -1,8 +1,8 @@
 from typing import List, Optional
 
 from unstructured.documents.elements import Element
-from unstructured.partition.html import partition_html
 
+from brocc_li.parsers.html_elements import partition_html
 from brocc_li.parsers.threads_utils import (
     clean_username,
     is_profile_picture,
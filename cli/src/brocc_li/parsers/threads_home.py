@@ -1,10 +1,12 @@
 import re  # Import regex
-from typing import List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 from urllib.parse import urlparse
 
 # Use Image type for checking
 from unstructured.documents.elements import Element, Image, NarrativeText, Text
-from unstructured.partition.html import partition_html
+
+from brocc_li.parsers.feed_items import FeedItem, feed_item, join_items, reported
+from brocc_li.parsers.html_elements import partition_html
 
 # Use our Threads-specific utils
 from brocc_li.parsers.threads_utils import (
@@ -42,6 +44,9 @@ THREADS_NOISE = [
     "...",
 ]
 
+# Timestamp links point at the post: /@user/post/<code>
+POST_PATH_RE = re.compile(r"^(?:https://www\.threads\.net)?/@([^/]+)/post/([^/?#]+)")
+
 
 # --- Helper to Merge Consecutive Text Elements ---
 def merge_consecutive_text(elements: List[Element], debug: bool = False) -> List[Element]:
@@ -107,299 +112,340 @@ def find_next_post_start(elements: List[Element], start_index: int, debug: bool
     return len(elements)  # Return end of list if no more posts found
 
 
-def threads_home_html_to_md(html: str, debug: bool = False) -> Optional[str]:
-    try:
-        if debug:
-            logger.debug("Partitioning HTML with unstructured (strategy=hi_res)...")
+def _find_post_url(elements: List[Element]) -> Optional[str]:
+    """Permalink of the first post linked from these elements (its timestamp, /@user/post/<code>)."""
+    for element in elements:
+        for link in getattr(element.metadata, "link_urls", None) or []:
+            match = POST_PATH_RE.match(link)
+            if match:
+                return f"https://www.threads.net/@{match.group(1)}/post/{match.group(2)}"
+    return None
 
-        elements: list[Element] = partition_html(text=html, strategy="hi_res")
 
-        if debug:
-            logger.debug(f"Received {len(elements)} elements from partition_html.")
-            # Log initial elements summary
-            element_types = {}
-            for el in elements:
-                el_type = type(el).__name__
-                element_types[el_type] = element_types.get(el_type, 0) + 1
-
-                # Log image elements specifically
-                if isinstance(el, Image):
-                    img_url = getattr(el.metadata, "image_url", None)
-                    img_text = str(el)[:100] + "..." if len(str(el)) > 100 else str(el)
-                    logger.debug(f"  IMAGE FOUND: text='{img_text}', url={img_url}")
-
-                # v10: Check for links in metadata
-                link_url = extract_links_from_metadata(el)
-                if link_url:
-                    logger.debug(
-                        f"  LINK FOUND IN METADATA: element_type={el_type}, text='{str(el)[:50]}...', url={link_url}"
+def _partition_posts(html: str, debug: bool = False) -> Tuple[List[Element], List[Dict[str, Any]]]:
+    """Partition the page, drop noise and group elements into posts."""
+    if debug:
+        logger.debug("Partitioning HTML...")
+
+    elements: list[Element] = partition_html(text=html)
+
+    if debug:
+        logger.debug(f"Received {len(elements)} elements from partition_html.")
+        # Log initial elements summary
+        element_types = {}
+        for el in elements:
+            el_type = type(el).__name__
+            element_types[el_type] = element_types.get(el_type, 0) + 1
+
+            # Log image elements specifically
+            if isinstance(el, Image):
+                img_url = getattr(el.metadata, "image_url", None)
+                img_text = str(el)[:100] + "..." if len(str(el)) > 100 else str(el)
+                logger.debug(f"  IMAGE FOUND: text='{img_text}', url={img_url}")
+
+            # v10: Check for links in metadata
+            link_url = extract_links_from_metadata(el)
+            if link_url:
+                logger.debug(
+                    f"  LINK FOUND IN METADATA: element_type={el_type}, text='{str(el)[:50]}...', url={link_url}"
+                )
+
+        logger.debug(f"Element type counts: {element_types}")
+
+        # v10: Log sample elements with their metadata to understand structure
+        logger.debug("--- Element Metadata Sample ---")
+        for i, el in enumerate(elements[:10]):
+            try:
+                if hasattr(el, "metadata"):
+                    metadata = (
+                        el.metadata.__dict__
+                        if hasattr(el.metadata, "__dict__")
+                        else str(el.metadata)
                     )
+                    logger.debug(f"Element {i} ({type(el).__name__}) metadata: {metadata}")
+            except Exception as e:
+                logger.debug(f"Error accessing metadata for element {i}: {e}")
+        logger.debug("--- End Element Metadata Sample ---")
+
+    # --- Filter Noise (v8: But preserve timestamps and links) --- #
+    filtered_elements = []
+    # Index in `elements` of each kept element; timestamps (the post permalinks) get filtered
+    kept_positions: List[int] = []
+    if debug:
+        logger.debug("--- Filtering Noisy Elements (v8) ---")
+    for position, element in enumerate(elements):
+        if not is_element_noisy(element, THREADS_NOISE, debug=debug):
+            filtered_elements.append(element)
+            kept_positions.append(position)
+    kept_positions.append(len(elements))
+    if debug:
+        logger.debug(f"Elements remaining after noise filtering: {len(filtered_elements)}")
+        # Count image elements after filtering
+        image_count = sum(1 for el in filtered_elements if isinstance(el, Image))
+        logger.debug(f"Images remaining after filtering: {image_count}")
+
+    # --- Post Grouping Logic (V9: with clean usernames) --- #
+    posts = []
+    current_index = 0
+    while current_index < len(filtered_elements):
+        element = filtered_elements[current_index]
+
+        profile_pic_match = is_profile_picture(element)
+        potential_username_element = (
+            filtered_elements[current_index + 1]
+            if current_index + 1 < len(filtered_elements)
+            else None
+        )
+        is_likely_username_start = False
+        username_text = ""
 
-            logger.debug(f"Element type counts: {element_types}")
-
-            # v10: Log sample elements with their metadata to understand structure
-            logger.debug("--- Element Metadata Sample ---")
-            for i, el in enumerate(elements[:10]):
-                try:
-                    if hasattr(el, "metadata"):
-                        metadata = (
-                            el.metadata.__dict__
-                            if hasattr(el.metadata, "__dict__")
-                            else str(el.metadata)
-                        )
-                        logger.debug(f"Element {i} ({type(el).__name__}) metadata: {metadata}")
-                except Exception as e:
-                    logger.debug(f"Error accessing metadata for element {i}: {e}")
-            logger.debug("--- End Element Metadata Sample ---")
+        if profile_pic_match and potential_username_element:
+            username_text_candidate = str(potential_username_element).strip()
+            # Clean username text if needed
+            cleaned_username = clean_username(username_text_candidate)
 
-        # --- Filter Noise (v8: But preserve timestamps and links) --- #
-        filtered_elements = []
-        if debug:
-            logger.debug("--- Filtering Noisy Elements (v8) ---")
-        for element in elements:
-            if not is_element_noisy(element, THREADS_NOISE, debug=debug):
-                filtered_elements.append(element)
-        if debug:
-            logger.debug(f"Elements remaining after noise filtering: {len(filtered_elements)}")
-            # Count image elements after filtering
-            image_count = sum(1 for el in filtered_elements if isinstance(el, Image))
-            logger.debug(f"Images remaining after filtering: {image_count}")
+            if (
+                isinstance(potential_username_element, Text)
+                and len(cleaned_username) > 1
+                and len(cleaned_username) < 35
+                and not is_timestamp(potential_username_element, debug=False)
+            ):
+                is_likely_username_start = True
+                username_text = cleaned_username
 
-        if not filtered_elements:
-            logger.warning("No elements remaining after initial noise filtering.")
-            return "<!-- No elements remaining after filtering -->"
+        if is_likely_username_start:
+            post_start_index = current_index
+            if debug:
+                logger.debug(
+                    f"--- Potential Post Start --- Index: {post_start_index}, User: {username_text}"
+                )
 
-        # --- Post Grouping Logic (V9: with clean usernames) --- #
-        posts = []
-        current_index = 0
-        while current_index < len(filtered_elements):
-            element = filtered_elements[current_index]
+            # Extract profile URL from the profile picture element
+            profile_url = extract_profile_url(element)
+            if debug and profile_url:
+                logger.debug(f"  Extracted profile URL: {profile_url}")
 
-            profile_pic_match = is_profile_picture(element)
-            potential_username_element = (
-                filtered_elements[current_index + 1]
-                if current_index + 1 < len(filtered_elements)
+            # Check for optional timestamp immediately after username
+            timestamp_offset = 2  # Index relative to profile pic
+            potential_timestamp_element = (
+                filtered_elements[post_start_index + timestamp_offset]
+                if post_start_index + timestamp_offset < len(filtered_elements)
                 else None
             )
-            is_likely_username_start = False
-            username_text = ""
-
-            if profile_pic_match and potential_username_element:
-                username_text_candidate = str(potential_username_element).strip()
-                # Clean username text if needed
-                cleaned_username = clean_username(username_text_candidate)
-
-                if (
-                    isinstance(potential_username_element, Text)
-                    and len(cleaned_username) > 1
-                    and len(cleaned_username) < 35
-                    and not is_timestamp(potential_username_element, debug=False)
-                ):
-                    is_likely_username_start = True
-                    username_text = cleaned_username
-
-            if is_likely_username_start:
-                post_start_index = current_index
-                if debug:
-                    logger.debug(
-                        f"--- Potential Post Start --- Index: {post_start_index}, User: {username_text}"
-                    )
+            timestamp_found_early = (
+                is_timestamp(potential_timestamp_element, debug=debug)
+                if potential_timestamp_element
+                else False
+            )
+            content_start_offset = (
+                timestamp_offset + 1 if timestamp_found_early else timestamp_offset
+            )
 
-                # Extract profile URL from the profile picture element
-                profile_url = extract_profile_url(element)
-                if debug and profile_url:
-                    logger.debug(f"  Extracted profile URL: {profile_url}")
-
-                # Check for optional timestamp immediately after username
-                timestamp_offset = 2  # Index relative to profile pic
-                potential_timestamp_element = (
-                    filtered_elements[post_start_index + timestamp_offset]
-                    if post_start_index + timestamp_offset < len(filtered_elements)
-                    else None
-                )
-                timestamp_found_early = (
-                    is_timestamp(potential_timestamp_element, debug=debug)
-                    if potential_timestamp_element
-                    else False
-                )
-                content_start_offset = (
-                    timestamp_offset + 1 if timestamp_found_early else timestamp_offset
-                )
+            # Find the start of the *next* post to determine the end of this one
+            next_post_start_index = find_next_post_start(
+                filtered_elements, post_start_index + 1, debug=debug
+            )
+            if debug:
+                logger.debug(f" -> Next post starts at index: {next_post_start_index}")
+
+            # Extract elements for this post (content elements start *after* the profile pic+username+optional timestamp)
+            post_content_elements = filtered_elements[
+                post_start_index + content_start_offset : next_post_start_index
+            ]
+
+            # Log post elements if debugging
+            if debug:
+                post_images = [el for el in post_content_elements if isinstance(el, Image)]
+                if post_images:
+                    logger.debug(f" -> Post has {len(post_images)} image elements")
+                    for i, img in enumerate(post_images):
+                        img_url = getattr(img.metadata, "image_url", None)
+                        logger.debug(f"    Post image {i}: url={img_url or 'NONE'}")
+                else:
+                    logger.debug(" -> Post has NO image elements")
 
-                # Find the start of the *next* post to determine the end of this one
-                next_post_start_index = find_next_post_start(
-                    filtered_elements, post_start_index + 1, debug=debug
+                logger.debug(
+                    f" -> Associating {len(post_content_elements)} content elements with user {username_text}"
                 )
-                if debug:
-                    logger.debug(f" -> Next post starts at index: {next_post_start_index}")
 
-                # Extract elements for this post (content elements start *after* the profile pic+username+optional timestamp)
-                post_content_elements = filtered_elements[
-                    post_start_index + content_start_offset : next_post_start_index
-                ]
+            # Add the found post
+            post_data = {
+                "username": username_text,
+                "profile_url": profile_url,  # Add profile URL to post data
+                "elements": post_content_elements,
+                "post_url": _find_post_url(
+                    elements[
+                        kept_positions[post_start_index] : kept_positions[next_post_start_index]
+                    ]
+                ),
+            }
+
+            # Add the early timestamp if found
+            if timestamp_found_early and potential_timestamp_element:
+                post_data["elements"].insert(0, potential_timestamp_element)
+
+            posts.append(post_data)
+            current_index = next_post_start_index
+        else:
+            current_index += 1
+
+    if debug:
+        logger.debug(f"Identified {len(posts)} posts using pattern matching (v9).")
 
-                # Log post elements if debugging
-                if debug:
-                    post_images = [el for el in post_content_elements if isinstance(el, Image)]
-                    if post_images:
-                        logger.debug(f" -> Post has {len(post_images)} image elements")
-                        for i, img in enumerate(post_images):
-                            img_url = getattr(img.metadata, "image_url", None)
-                            logger.debug(f"    Post image {i}: url={img_url or 'NONE'}")
+    return filtered_elements, posts
+
+
+def _post_markdown(post_data: Dict[str, Any], post_idx: int, debug: bool = False) -> Optional[str]:
+    """Markdown block for one grouped post, or None if it has nothing beyond the header."""
+    username = post_data.get("username", "Unknown User")
+    # Clean username again to ensure consistency
+    username = clean_username(username)
+    profile_url = post_data.get("profile_url")
+    elements = post_data.get("elements", [])
+
+    if debug:
+        logger.debug(f"--- Processing post {post_idx} ({username}), {len(elements)} elements ---")
+
+    # --- V9: Improved Text and Image Processing --- #
+    # 1. Extract text, timestamps, and image URLs
+    all_text_elements = [el for el in elements if isinstance(el, (Text, NarrativeText))]
+    all_image_elements = [el for el in elements if isinstance(el, Image)]
+    all_timestamp_elements = [el for el in elements if is_timestamp(el)]
+
+    # 2. Process timestamps first
+    timestamp_texts = []
+    for element in all_timestamp_elements:
+        timestamp_text = str(element).strip()
+        if timestamp_text:
+            timestamp_texts.append(f"* Posted {timestamp_text}")
+
+    # 3. Process images - collect URLs with alt text
+    image_data = []
+    for element in all_image_elements:
+        img_url = getattr(element.metadata, "image_url", None)
+        if img_url:
+            alt_text = clean_element_text(str(element))
+            if not alt_text or len(alt_text) < 5:
+                alt_text = "Image"
+            image_data.append((alt_text, img_url))
+
+    # 4. Deduplicate image URLs
+    deduplicated_images = deduplicate_image_urls(image_data, debug=debug)
+
+    # 5. Process text elements
+    text_blocks = []
+    for element in all_text_elements:
+        # Skip elements we already processed as timestamps
+        if is_timestamp(element):
+            continue
+
+        text = str(element).strip()
+        if text:
+            cleaned_text = clean_element_text(text)
+            if cleaned_text:
+                # v10: Check if this element has a link in its metadata
+                link_url = extract_links_from_metadata(element)
+                if link_url:
+                    # Element has link metadata - format as markdown link
+                    # If the entire text is the link, wrap it
+                    if len(cleaned_text) < 50:
+                        # Short text - likely the whole thing is a link
+                        cleaned_text = f"[{cleaned_text}]({link_url})"
                     else:
-                        logger.debug(" -> Post has NO image elements")
+                        # Longer text - append the link at the end
+                        domain = urlparse(link_url).netloc
+                        display_text = domain if domain else "link"
+                        cleaned_text += f" [{display_text}]({link_url})"
+
+                    if debug:
+                        logger.debug(
+                            f"Applied metadata link to text element: {cleaned_text[:100]}..."
+                        )
 
-                    logger.debug(
-                        f" -> Associating {len(post_content_elements)} content elements with user {username_text}"
-                    )
+                text_blocks.append(cleaned_text)
+
+    # 6. Deduplicate text blocks
+    deduplicated_text = deduplicate_text_blocks(text_blocks, debug=debug)
+
+    # 7. Format links in text with improved URL detection
+    formatted_text = []
+    for text in deduplicated_text:
+        # Skip already formatted links (those we processed from metadata)
+        if re.search(r"\[.+?\]\(.+?\)", text):
+            formatted_text.append(text)
+        # Only try link formatting if there's likely a URL present
+        elif "http" in text or "www." in text:
+            formatted = format_markdown_links(text)
+            formatted_text.append(formatted)
+        else:
+            formatted_text.append(text)
 
-                # Add the found post
-                post_data = {
-                    "username": username_text,
-                    "profile_url": profile_url,  # Add profile URL to post data
-                    "elements": post_content_elements,
-                }
+    if debug and formatted_text:
+        logger.debug(
+            f"Post contains {len(formatted_text)} text blocks, {len(deduplicated_images)} images"
+        )
 
-                # Add the early timestamp if found
-                if timestamp_found_early and potential_timestamp_element:
-                    post_data["elements"].insert(0, potential_timestamp_element)
+    # --- Build the final markdown post --- #
+    post_lines = []
 
-                posts.append(post_data)
-                current_index = next_post_start_index
-            else:
-                current_index += 1
+    # Add the header with profile URL if available
+    if profile_url:
+        post_header = f"### Post by [{username}]({profile_url})"
+    else:
+        post_header = f"### Post by {username}"
 
-        if debug:
-            logger.debug(f"Identified {len(posts)} posts using pattern matching (v9).")
+    post_lines.append(post_header)
 
-        if not posts and filtered_elements:
-            logger.warning("Post pattern matching failed (v9), no posts detected.")
-            return "<!-- Post pattern matching failed -->"
+    # Add timestamps if any
+    if timestamp_texts:
+        post_lines.append("\n".join(timestamp_texts))
 
-        # --- Convert Posts to Markdown (V9: With fixed links) --- #
-        markdown_blocks = []
-        for post_idx, post_data in enumerate(posts):
-            username = post_data.get("username", "Unknown User")
-            # Clean username again to ensure consistency
-            username = clean_username(username)
-            profile_url = post_data.get("profile_url")
-            elements = post_data.get("elements", [])
+    # Add content: first text blocks, then images
+    for text in formatted_text:
+        post_lines.append(text)
 
-            if debug:
-                logger.debug(
-                    f"--- Processing post {post_idx} ({username}), {len(elements)} elements ---"
-                )
+    # Add images after text
+    for alt_text, url in deduplicated_images:
+        post_lines.append(f"![{alt_text}]({url})")
 
-            # --- V9: Improved Text and Image Processing --- #
-            # 1. Extract text, timestamps, and image URLs
-            all_text_elements = [el for el in elements if isinstance(el, (Text, NarrativeText))]
-            all_image_elements = [el for el in elements if isinstance(el, Image)]
-            all_timestamp_elements = [el for el in elements if is_timestamp(el)]
-
-            # 2. Process timestamps first
-            timestamp_texts = []
-            for element in all_timestamp_elements:
-                timestamp_text = str(element).strip()
-                if timestamp_text:
-                    timestamp_texts.append(f"* Posted {timestamp_text}")
-
-            # 3. Process images - collect URLs with alt text
-            image_data = []
-            for element in all_image_elements:
-                img_url = getattr(element.metadata, "image_url", None)
-                if img_url:
-                    alt_text = clean_element_text(str(element))
-                    if not alt_text or len(alt_text) < 5:
-                        alt_text = "Image"
-                    image_data.append((alt_text, img_url))
-
-            # 4. Deduplicate image URLs
-            deduplicated_images = deduplicate_image_urls(image_data, debug=debug)
-
-            # 5. Process text elements
-            text_blocks = []
-            for element in all_text_elements:
-                # Skip elements we already processed as timestamps
-                if is_timestamp(element):
-                    continue
-
-                text = str(element).strip()
-                if text:
-                    cleaned_text = clean_element_text(text)
-                    if cleaned_text:
-                        # v10: Check if this element has a link in its metadata
-                        link_url = extract_links_from_metadata(element)
-                        if link_url:
-                            # Element has link metadata - format as markdown link
-                            # If the entire text is the link, wrap it
-                            if len(cleaned_text) < 50:
-                                # Short text - likely the whole thing is a link
-                                cleaned_text = f"[{cleaned_text}]({link_url})"
-                            else:
-                                # Longer text - append the link at the end
-                                domain = urlparse(link_url).netloc
-                                display_text = domain if domain else "link"
-                                cleaned_text += f" [{display_text}]({link_url})"
-
-                            if debug:
-                                logger.debug(
-                                    f"Applied metadata link to text element: {cleaned_text[:100]}..."
-                                )
-
-                        text_blocks.append(cleaned_text)
-
-            # 6. Deduplicate text blocks
-            deduplicated_text = deduplicate_text_blocks(text_blocks, debug=debug)
-
-            # 7. Format links in text with improved URL detection
-            formatted_text = []
-            for text in deduplicated_text:
-                # Skip already formatted links (those we processed from metadata)
-                if re.search(r"\[.+?\]\(.+?\)", text):
-                    formatted_text.append(text)
-                # Only try link formatting if there's likely a URL present
-                elif "http" in text or "www." in text:
-                    formatted = format_markdown_links(text)
-                    formatted_text.append(formatted)
-                else:
-                    formatted_text.append(text)
+    # Only keep non-empty posts
+    if len(post_lines) > 1:  # More than just the header
+        return "\n\n".join(post_lines)
+    if debug:
+        logger.debug(f"Skipping empty post by {username} (Post Index: {post_idx})")
+    return None
 
-            if debug and formatted_text:
-                logger.debug(
-                    f"Post contains {len(formatted_text)} text blocks, {len(deduplicated_images)} images"
-                )
 
-            # --- Build the final markdown post --- #
-            post_lines = []
+def _post_items(posts: List[Dict[str, Any]], debug: bool = False) -> Iterator[FeedItem]:
+    for post_idx, post_data in enumerate(posts):
+        markdown = _post_markdown(post_data, post_idx, debug=debug)
+        if markdown:
+            yield feed_item(post_data.get("post_url"), markdown)
 
-            # Add the header with profile URL if available
-            if profile_url:
-                post_header = f"### Post by [{username}]({profile_url})"
-            else:
-                post_header = f"### Post by {username}"
 
-            post_lines.append(post_header)
+def threads_home_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each post in the home feed as a FeedItem keyed by its permalink."""
+    _, posts = _partition_posts(html, debug=debug)
+    yield from _post_items(posts, debug=debug)
 
-            # Add timestamps if any
-            if timestamp_texts:
-                post_lines.append("\n".join(timestamp_texts))
 
-            # Add content: first text blocks, then images
-            for text in formatted_text:
-                post_lines.append(text)
+def threads_home_html_to_md(html: str, debug: bool = False) -> Optional[str]:
+    try:
+        filtered_elements, posts = _partition_posts(html, debug=debug)
+
+        if not filtered_elements:
+            logger.warning("No elements remaining after initial noise filtering.")
+            return "<!-- No elements remaining after filtering -->"
 
-            # Add images after text
-            for alt_text, url in deduplicated_images:
-                post_lines.append(f"![{alt_text}]({url})")
+        if not posts:
+            logger.warning("Post pattern matching failed (v9), no posts detected.")
+            return "<!-- Post pattern matching failed -->"
 
-            # Only add non-empty posts
-            if len(post_lines) > 1:  # More than just the header
-                markdown_blocks.append("\n\n".join(post_lines))
-            elif debug:
-                logger.debug(f"Skipping empty post by {username} (Post Index: {post_idx})")
+        # --- Convert Posts to Markdown (V9: With fixed links) --- #
+        items = list(reported(_post_items(posts, debug=debug)))
 
         # Handle case with no markdown blocks
-        if not markdown_blocks:
+        if not items:
             logger.warning("No markdown posts generated after processing (v9).")
             # Fallback logic (simplified)
             all_text = "\n\n".join([str(el) for el in filtered_elements if isinstance(el, Text)])
@@ -408,7 +454,7 @@ def threads_home_html_to_md(html: str, debug: bool = False) -> Optional[str]:
             else:
                 return "<!-- No markdown posts generated -->"
 
-        markdown = "\n\n\n".join(markdown_blocks)
+        markdown = join_items(items, separator="\n\n\n")
         logger.info("Threads HTML to markdown conversion completed successfully (v10).")
         return markdown.strip()
 
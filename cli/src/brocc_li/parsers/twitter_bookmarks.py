@@ -1,16 +1,19 @@
-from typing import Optional
+from typing import Iterator, List, Optional
 
 from bs4 import BeautifulSoup
 
 from brocc_li.utils.logger import logger
 
-from .twitter_utils import (
-    extract_media,
-    extract_metrics,
-    extract_tweet_content,
-    extract_user_info,
-    format_tweet_markdown,
-)
+from .feed_items import FeedItem, reported
+from .twitter_utils import tweet_items
+
+TWEET_SELECTOR = 'article[data-testid="tweet"]'
+
+
+def twitter_bookmarks_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each bookmarked tweet as a FeedItem keyed by its permalink."""
+    tweets = BeautifulSoup(html, "html.parser").select(TWEET_SELECTOR)
+    yield from tweet_items(tweets, debug=debug, label="bookmarked tweet")
 
 
 def twitter_bookmarks_html_to_md(html: str, debug: bool = False) -> Optional[str]:
@@ -18,45 +21,21 @@ def twitter_bookmarks_html_to_md(html: str, debug: bool = False) -> Optional[str
         soup = BeautifulSoup(html, "html.parser")
 
         # Find all tweets using the container selector
-        tweets = soup.select('article[data-testid="tweet"]')
+        tweets = soup.select(TWEET_SELECTOR)
         logger.info(f"Found {len(tweets)} bookmarked tweets in the HTML")
 
         if not tweets:
             logger.warning("No bookmarked tweets found in HTML")
             return None
 
-        output_blocks = []
+        output_blocks: List[str] = []
 
         # Add a header for the bookmarks section
         output_blocks.append("## Your Bookmarks")
-
-        for i, tweet in enumerate(tweets):
-            if debug:
-                logger.debug(f"Processing bookmarked tweet {i + 1}/{len(tweets)}")
-
-            # Extract tweet metadata
-            user_info = extract_user_info(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Extracted user info: {user_info}")
-
-            # Extract tweet content
-            content = extract_tweet_content(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Tweet content length: {len(content)} chars")
-
-            # Extract media
-            media_strings = extract_media(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Found {len(media_strings)} media items")
-
-            # Extract metrics
-            metrics = extract_metrics(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Engagement metrics: {metrics}")
-
-            # Format the full tweet block
-            tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
-            output_blocks.append(tweet_block)
+        output_blocks.extend(
+            item.markdown
+            for item in reported(tweet_items(tweets, debug=debug, label="bookmarked tweet"))
+        )
 
         # Join all blocks with double newlines
         markdown = "\n\n".join(output_blocks)
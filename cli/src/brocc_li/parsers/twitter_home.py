@@ -1,16 +1,11 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from bs4 import BeautifulSoup
 
 from brocc_li.utils.logger import logger
 
-from .twitter_utils import (
-    extract_media,
-    extract_metrics,
-    extract_tweet_content,
-    extract_user_info,
-    format_tweet_markdown,
-)
+from .feed_items import FeedItem, reported
+from .twitter_utils import tweet_items
 
 
 def _is_section_relevant(header_text: str) -> bool:
@@ -43,6 +38,17 @@ def _is_section_relevant(header_text: str) -> bool:
     return False
 
 
+def _tweet_items(soup: BeautifulSoup, debug: bool = False) -> Iterator[FeedItem]:
+    tweets = soup.select('article[data-testid="tweet"]')
+    logger.info(f"Found {len(tweets)} tweets in the HTML")
+    yield from tweet_items(tweets, debug=debug)
+
+
+def twitter_feed_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each tweet in the home timeline as a FeedItem keyed by its permalink."""
+    yield from _tweet_items(BeautifulSoup(html, "html.parser"), debug=debug)
+
+
 def twitter_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
     try:
         soup = BeautifulSoup(html, "html.parser")
@@ -62,38 +68,8 @@ def twitter_feed_html_to_md(html: str, debug: bool = False) -> Optional[str]:
                     logger.debug(f"Adding section header: {header_text}")
                 output_blocks.append(f"## {header_text}")
 
-        # 2. Find all tweets using the container selector
-        tweets = soup.select('article[data-testid="tweet"]')
-        logger.info(f"Found {len(tweets)} tweets in the HTML")
-
-        for i, tweet in enumerate(tweets):
-            if debug:
-                logger.debug(f"Processing tweet {i + 1}/{len(tweets)}")
-
-            # Extract tweet metadata
-            user_info = extract_user_info(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Extracted user info: {user_info}")
-
-            # Extract tweet content
-            content = extract_tweet_content(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Tweet content length: {len(content)} chars")
-
-            # Extract media
-            media_strings = extract_media(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Found {len(media_strings)} media items")
-
-            # Extract metrics
-            metrics = extract_metrics(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Engagement metrics: {metrics}")
-
-            # Format the full tweet block
-            tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
-
-            output_blocks.append(tweet_block)
+        # 2. Then every tweet, in page order
+        output_blocks.extend(item.markdown for item in reported(_tweet_items(soup, debug=debug)))
 
         # Join all blocks with double newlines
         markdown = "\n\n".join(output_blocks)
@@ -1,16 +1,19 @@
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
 from bs4 import BeautifulSoup
 
 from brocc_li.utils.logger import logger
 
-from .twitter_utils import (
-    extract_media,
-    extract_metrics,
-    extract_tweet_content,
-    extract_user_info,
-    format_tweet_markdown,
-)
+from .feed_items import FeedItem, reported
+from .twitter_utils import tweet_items
+
+TWEET_SELECTOR = 'article[data-testid="tweet"]'
+
+
+def twitter_likes_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each liked tweet as a FeedItem keyed by its permalink."""
+    tweets = BeautifulSoup(html, "html.parser").select(TWEET_SELECTOR)
+    yield from tweet_items(tweets, debug=debug, label="liked tweet")
 
 
 def twitter_likes_html_to_md(html: str, debug: bool = False) -> Optional[str]:
@@ -32,7 +35,7 @@ def twitter_likes_html_to_md(html: str, debug: bool = False) -> Optional[str]:
             output_blocks.append("# Twitter Likes Feed (Parsed)")  # Default title
 
         # Find all tweets using the standard container selector
-        tweets = soup.select('article[data-testid="tweet"]')
+        tweets = soup.select(TWEET_SELECTOR)
         logger.info(f"Found {len(tweets)} liked tweets in the HTML")
 
         if not tweets:
@@ -46,34 +49,10 @@ def twitter_likes_html_to_md(html: str, debug: bool = False) -> Optional[str]:
             existing_output = "\n\n".join(output_blocks)
             return f"{existing_output}\n\nNo tweets found."
 
-        for i, tweet in enumerate(tweets):
-            if debug:
-                logger.debug(f"--- Processing liked tweet {i + 1}/{len(tweets)} ---")
-
-            # Extract tweet metadata (might need adjustments for likes page structure)
-            user_info = extract_user_info(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Extracted user info: {user_info}")
-
-            # Extract content, media, metrics using utils
-            content = extract_tweet_content(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Tweet content length: {len(content)} chars")
-
-            media_strings = extract_media(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Found {len(media_strings)} media items")
-
-            metrics = extract_metrics(tweet, debug=debug)
-            if debug:
-                logger.debug(f"Engagement metrics: {metrics}")
-
-            # Format the full tweet block
-            tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
-
-            output_blocks.append(tweet_block)
-            if debug:
-                logger.debug(f"--- Finished processing liked tweet {i + 1} ---")
+        output_blocks.extend(
+            item.markdown
+            for item in reported(tweet_items(tweets, debug=debug, label="liked tweet"))
+        )
 
         # Join all blocks with double newlines
         markdown_output = "\n\n".join(output_blocks)
@@ -1,18 +1,22 @@
 import re
-from typing import List, Optional
+from typing import Iterator, List, Optional
 
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, Tag
 
 from brocc_li.utils.logger import logger
 
+from .feed_items import FeedItem, feed_item, reported
 from .twitter_utils import (
     extract_media,
     extract_metrics,
     extract_tweet_content,
+    extract_tweet_url,
     extract_user_info,
     format_tweet_markdown,
 )
 
+TWEET_SELECTOR = 'article[data-testid="tweet"]'
+
 
 def _format_stat(stat_text: str, debug: bool = False) -> str:
     """Format a stat text by separating numbers from labels."""
@@ -82,6 +86,51 @@ def _extract_profile_stats(soup, debug: bool = False) -> List[str]:
     return stats
 
 
+def _tweet_items(tweets: List[Tag], debug: bool = False) -> Iterator[FeedItem]:
+    processed_tweets = set()  # Track processed content to avoid duplicates
+    for i, tweet in enumerate(tweets):
+        if debug:
+            logger.debug(f"Processing tweet {i + 1}/{len(tweets)}")
+
+        # Extract user info
+        user_info = extract_user_info(tweet, debug=debug)
+        if debug:
+            logger.debug(f"Extracted user info: {user_info}")
+
+        # Extract tweet content
+        content = extract_tweet_content(tweet, debug=debug)
+
+        # Skip tweets we've already processed (check first 50 chars)
+        text_start = content[:50] if content else ""
+        if text_start in processed_tweets:
+            if debug:
+                logger.debug(f"Skipping duplicate tweet: {text_start}...")
+            continue
+
+        if content:
+            processed_tweets.add(text_start)
+
+            # Extract media
+            media_strings = extract_media(tweet, debug=debug)
+            if debug:
+                logger.debug(f"Found {len(media_strings)} media items")
+
+            # Extract metrics
+            metrics = extract_metrics(tweet, debug=debug)
+            if debug:
+                logger.debug(f"Engagement metrics: {metrics}")
+
+            # Format the tweet
+            tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
+            yield feed_item(extract_tweet_url(tweet), tweet_block)
+
+
+def twitter_profile_items(html: str, debug: bool = False) -> Iterator[FeedItem]:
+    """Yield each tweet on the profile timeline as a FeedItem keyed by its permalink."""
+    tweets = BeautifulSoup(html, "html.parser").select(TWEET_SELECTOR)
+    yield from _tweet_items(tweets, debug=debug)
+
+
 def twitter_profile_html_to_md(html: str, debug: bool = False) -> Optional[str]:
     try:
         soup = BeautifulSoup(html, "html.parser")
@@ -140,50 +189,16 @@ def twitter_profile_html_to_md(html: str, debug: bool = False) -> Optional[str]:
             output_blocks.append(f"**{stats_str}**")
 
         # Extract tweets using twitter_utils helpers
-        tweets = soup.select('article[data-testid="tweet"]')
+        tweets = soup.select(TWEET_SELECTOR)
         if tweets:
             if debug:
                 logger.debug(f"Found {len(tweets)} tweets")
 
             output_blocks.append("\n## Tweets")
 
-            # Process each tweet using the utilities
-            processed_tweets = set()  # Track processed content to avoid duplicates
-            for i, tweet in enumerate(tweets):
-                if debug:
-                    logger.debug(f"Processing tweet {i + 1}/{len(tweets)}")
-
-                # Extract user info
-                user_info = extract_user_info(tweet, debug=debug)
-                if debug:
-                    logger.debug(f"Extracted user info: {user_info}")
-
-                # Extract tweet content
-                content = extract_tweet_content(tweet, debug=debug)
-
-                # Skip tweets we've already processed (check first 50 chars)
-                text_start = content[:50] if content else ""
-                if text_start in processed_tweets:
-                    if debug:
-                        logger.debug(f"Skipping duplicate tweet: {text_start}...")
-                    continue
-
-                if content:
-                    processed_tweets.add(text_start)
-
-                    # Extract media
-                    media_strings = extract_media(tweet, debug=debug)
-                    if debug:
-                        logger.debug(f"Found {len(media_strings)} media items")
-
-                    # Extract metrics
-                    metrics = extract_metrics(tweet, debug=debug)
-                    if debug:
-                        logger.debug(f"Engagement metrics: {metrics}")
-
-                    # Format the tweet
-                    tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
-                    output_blocks.append(tweet_block)
+            output_blocks.extend(
+                item.markdown for item in reported(_tweet_items(tweets, debug=debug))
+            )
 
         markdown = "\n\n".join(output_blocks)
 
@@ -1,8 +1,9 @@
 import re
-from typing import Callable, Dict, List, Optional, Set, Tuple, TypedDict
+from typing import Callable, Dict, Iterator, List, Optional, Set, Tuple, TypedDict
 
 from bs4 import BeautifulSoup, Tag
 
+from brocc_li.parsers.feed_items import FeedItem, feed_item
 from brocc_li.utils.logger import logger
 
 
@@ -218,6 +219,28 @@ def extract_user_info(tweet_element: Tag, debug: bool = False) -> UserInfo:
     return user_info
 
 
+# /handle/status/123, optionally followed by /photo/1, /analytics etc.
+TWEET_PATH_RE = re.compile(r"^(?:https://(?:x|twitter)\.com)?/([^/?#]+)/status/(\d+)")
+
+
+def extract_tweet_url(tweet_element: Tag) -> Optional[str]:
+    """
+    Canonical permalink (https://x.com/handle/status/id) of a tweet element.
+
+    Prefers the link wrapping the tweet's timestamp, falling back to the first status link.
+    """
+    time_element = tweet_element.select_one("time")
+    time_link = time_element.find_parent("a") if time_element else None
+    candidates = [time_link] if time_link else []
+    candidates += tweet_element.select('a[href*="/status/"]')
+    for link in candidates:
+        href = link.get("href")
+        match = TWEET_PATH_RE.match(href) if isinstance(href, str) else None
+        if match:
+            return f"https://x.com/{match.group(1)}/status/{match.group(2)}"
+    return None
+
+
 def format_tweet_markdown(
     user_info: UserInfo,
     content: str,
@@ -851,6 +874,37 @@ def format_user_markdown_header(
     return header
 
 
+def tweet_items(tweets: List[Tag], debug: bool = False, label: str = "tweet") -> Iterator[FeedItem]:
+    """Format each tweet element as a FeedItem keyed by its permalink."""
+    for i, tweet in enumerate(tweets):
+        if debug:
+            logger.debug(f"Processing {label} {i + 1}/{len(tweets)}")
+
+        # Extract tweet metadata
+        user_info = extract_user_info(tweet, debug=debug)
+        if debug:
+            logger.debug(f"Extracted user info: {user_info}")
+
+        # Extract tweet content
+        content = extract_tweet_content(tweet, debug=debug)
+        if debug:
+            logger.debug(f"Tweet content length: {len(content)} chars")
+
+        # Extract media
+        media_strings = extract_media(tweet, debug=debug)
+        if debug:
+            logger.debug(f"Found {len(media_strings)} media items")
+
+        # Extract metrics
+        metrics = extract_metrics(tweet, debug=debug)
+        if debug:
+            logger.debug(f"Engagement metrics: {metrics}")
+
+        # Format the full tweet block
+        tweet_block = format_tweet_markdown(user_info, content, media_strings, metrics)
+        yield feed_item(extract_tweet_url(tweet), tweet_block)
+
+
 def process_html_with_parser(
     html: str,
     element_selector: str,
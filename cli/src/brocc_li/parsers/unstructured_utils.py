@@ -3,6 +3,7 @@ from typing import Callable, List, Optional, Tuple
 from unstructured.documents.elements import Element, Title
 
 from brocc_li.parsers.linkedin_utils import is_noisy
+from brocc_li.parsers.pattern_matcher import matcher_for
 from brocc_li.utils.logger import logger
 
 
@@ -41,11 +42,11 @@ def is_element_noisy(
     if specific_noise_patterns:
         text_lower = element_text.lower().strip()
 
-        for pattern in specific_noise_patterns:
-            if pattern.lower() == text_lower or pattern.lower() in text_lower:
-                if debug:
-                    logger.debug(f"Specific noise: matched '{pattern}' in '{element_text[:50]}...'")
-                return True
+        pattern = matcher_for(specific_noise_patterns).search(text_lower)
+        if pattern:
+            if debug:
+                logger.debug(f"Specific noise: matched '{pattern}' in '{element_text[:50]}...'")
+            return True
 
     return False
 
@@ -0,0 +1,268 @@
+"""
+Per-tab state for ChromeTabs, keyed by tab id, in bounded memory.
+
+Tab refs used to live in a Set[TabReference]: finding the ref for a tab was a scan over
+every open tab, and hashing a ref hashed its whole markdown and HTML. Every ref also kept
+the page's full raw HTML and markdown for as long as the tab stayed open, which with many
+heavy SPA tabs came to hundreds of MB.
+
+Structure:
+- One slotted TabState record per tab in a dict, so every per-tab lookup and update is
+  O(1). Each record has a version; versions come from one counter and every write takes a
+  new one, so they never repeat, even for a tab id that was removed and recorded again.
+- Writers that capture content across an await note `version(tab_id)` first and write back
+  with `put(ref, if_version=...)`. The write is dropped if the tab navigated, closed or
+  was captured again meanwhile, instead of overwriting the newer state.
+- Markdown is kept compressed (zstd with the `zstd` extra installed, zlib otherwise): the
+  next merge needs the old blocks verbatim, since merge_md copies them into its output.
+- Raw HTML (and the feed items parsed from it) is only held until `release_html`, which
+  ChromeTabs calls once the change callbacks (the savers) have had the ref. A digest
+  stays for `html_matches`.
+- Compressed markdown is held in memory up to max_resident_bytes across all tabs. Past
+  that, the least recently used tabs spill theirs to files in a temporary directory, read
+  back (and made resident again) on next use.
+- Readers (callbacks included) get immutable TabReferences from `get`, or a read-only
+  `snapshot()` that later writes don't change.
+
+Gotchas:
+- `get` and `snapshot` decompress, and may read spilled markdown from disk. For just the
+  URL, use `url`.
+"""
+
+import functools
+import hashlib
+import itertools
+import os
+import shutil
+import tempfile
+import zlib
+from collections import OrderedDict
+from types import MappingProxyType
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Mapping,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
+from brocc_li.utils.html_metadata import HtmlMetadata
+from brocc_li.utils.logger import logger
+
+if TYPE_CHECKING:
+    from brocc_li.parsers.feed_items import FeedItem
+
+MAX_RESIDENT_BYTES = 32 * 1024 * 1024  # Compressed markdown kept in memory, across all tabs
+ZSTD_LEVEL = 3
+
+
+class TabReference(NamedTuple):
+    id: str
+    url: str
+    markdown: str
+    # Last captured HTML: the whole document, or only the added subtrees after a delta.
+    # Kept by the store only until the change callbacks have had it.
+    html: Optional[str] = None
+    title: Optional[str] = None
+    metadata: Optional[HtmlMetadata] = None  # Extracted from the same parse as markdown
+    items: Optional[List["FeedItem"]] = None  # Per-post items, from feed and timeline parsers
+
+
+@functools.cache
+def _codec() -> Tuple[Callable[[bytes], bytes], Callable[[bytes], bytes]]:
+    """(compress, decompress): zstd with the "zstd" extra installed, zlib otherwise."""
+    try:
+        import zstandard  # pyright: ignore[reportMissingImports]
+    except ImportError:
+        logger.debug("zstandard is not installed, compressing tab content with zlib")
+        return zlib.compress, zlib.decompress
+    return (
+        zstandard.ZstdCompressor(level=ZSTD_LEVEL).compress,
+        zstandard.ZstdDecompressor().decompress,
+    )
+
+
+def _compress(text: str) -> bytes:
+    return _codec()[0](text.encode("utf-8")) if text else b""
+
+
+def _decompress(data: bytes) -> str:
+    return _codec()[1](data).decode("utf-8") if data else ""
+
+
+def _digest(html: str) -> bytes:
+    return hashlib.blake2b(html.encode("utf-8"), digest_size=16).digest()
+
+
+class TabState:
+    __slots__ = (
+        "url",
+        "title",
+        "metadata",
+        "version",
+        "markdown",  # Compressed; None while spilled to disk
+        "html",  # Raw, until released
+        "items",  # Released with the html
+        "html_digest",
+    )
+
+    def __init__(self, ref: TabReference, version: int) -> None:
+        self.url = ref.url
+        self.title = ref.title
+        self.metadata = ref.metadata
+        self.version = version
+        self.markdown: Optional[bytes] = _compress(ref.markdown)
+        self.html = ref.html
+        self.items = ref.items
+        self.html_digest = _digest(ref.html) if ref.html is not None else None
+
+
+class TabStateStore:
+    """The current TabReference of each tracked tab, by tab id."""
+
+    def __init__(self, max_resident_bytes: int = MAX_RESIDENT_BYTES) -> None:
+        self.max_resident_bytes = max_resident_bytes
+        self._states: Dict[str, TabState] = {}
+        self._versions = itertools.count(1)
+        self._resident: OrderedDict[str, int] = OrderedDict()  # tab_id -> size, LRU first
+        self._resident_bytes = 0
+        self._spill_dir: Optional[str] = None
+
+    def __len__(self) -> int:
+        return len(self._states)
+
+    def __contains__(self, tab_id: object) -> bool:
+        return tab_id in self._states
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._states)
+
+    @property
+    def resident_bytes(self) -> int:
+        return self._resident_bytes
+
+    def get(self, tab_id: str) -> Optional[TabReference]:
+        state = self._states.get(tab_id)
+        if state is None:
+            return None
+        return TabReference(
+            id=tab_id,
+            url=state.url,
+            markdown=_decompress(self._markdown(tab_id, state)),
+            html=state.html,
+            title=state.title,
+            metadata=state.metadata,
+            items=state.items,
+        )
+
+    def url(self, tab_id: str) -> Optional[str]:
+        state = self._states.get(tab_id)
+        return state.url if state else None
+
+    def version(self, tab_id: str) -> int:
+        """The tab's current version, or 0 if it isn't tracked."""
+        state = self._states.get(tab_id)
+        return state.version if state else 0
+
+    def html_matches(self, tab_id: str, html: str) -> bool:
+        """Whether html is the HTML last stored for the tab, even after it was released."""
+        state = self._states.get(tab_id)
+        return state is not None and state.html_digest == _digest(html)
+
+    def put(self, ref: TabReference, if_version: Optional[int] = None) -> bool:
+        """
+        Record ref as its tab's current state. With if_version, only if the tab is still at
+        that version (0: still untracked); returns whether the write happened.
+        """
+        if if_version is not None and self.version(ref.id) != if_version:
+            return False
+        self._forget_markdown(ref.id)
+        state = TabState(ref, next(self._versions))
+        self._states[ref.id] = state
+        self._admit(ref.id, len(state.markdown or b""))
+        return True
+
+    def release_html(self, tab_id: str, if_version: Optional[int] = None) -> None:
+        """Drop the tab's raw HTML and items (keeping the digest), unless rewritten since."""
+        state = self._states.get(tab_id)
+        if state is not None and (if_version is None or state.version == if_version):
+            state.html = None
+            state.items = None
+
+    def discard(self, tab_id: str) -> Optional[str]:
+        """Stop tracking the tab. Returns its last URL, or None if it wasn't tracked."""
+        state = self._states.get(tab_id)
+        if state is None:
+            return None
+        self._forget_markdown(tab_id)
+        del self._states[tab_id]
+        return state.url
+
+    def clear(self) -> None:
+        self._states.clear()
+        self._resident.clear()
+        self._resident_bytes = 0
+        if self._spill_dir is not None:
+            shutil.rmtree(self._spill_dir, ignore_errors=True)
+            self._spill_dir = None
+
+    def snapshot(self, tab_ids: Optional[Iterable[str]] = None) -> Mapping[str, TabReference]:
+        """
+        Read-only tab id -> TabReference mapping (of just tab_ids, if given), unaffected by
+        later writes.
+        """
+        ids = list(self._states) if tab_ids is None else tab_ids
+        refs = {tab_id: ref for tab_id in ids if (ref := self.get(tab_id)) is not None}
+        return MappingProxyType(refs)
+
+    # --- Memory bound ---
+
+    def _markdown(self, tab_id: str, state: TabState) -> bytes:
+        """The tab's compressed markdown, reading it back from disk if it was spilled."""
+        markdown = state.markdown
+        if markdown is None:
+            path = self._spill_path(tab_id)
+            with open(path, "rb") as f:
+                markdown = state.markdown = f.read()
+            os.remove(path)
+            self._admit(tab_id, len(markdown))
+        else:
+            self._resident.move_to_end(tab_id)
+        return markdown
+
+    def _admit(self, tab_id: str, size: int) -> None:
+        self._resident[tab_id] = size
+        self._resident_bytes += size
+        # Spill least recently used tabs, never the one just admitted
+        while self._resident_bytes > self.max_resident_bytes and len(self._resident) > 1:
+            victim, victim_size = self._resident.popitem(last=False)
+            self._resident_bytes -= victim_size
+            self._spill(victim, self._states[victim])
+
+    def _spill(self, tab_id: str, state: TabState) -> None:
+        if state.markdown is None:
+            return
+        with open(self._spill_path(tab_id), "wb") as f:
+            f.write(state.markdown)
+        state.markdown = None
+
+    def _forget_markdown(self, tab_id: str) -> None:
+        size = self._resident.pop(tab_id, None)
+        if size is not None:
+            self._resident_bytes -= size
+            return
+        state = self._states.get(tab_id)
+        if state is not None and state.markdown is None:
+            os.remove(self._spill_path(tab_id))
+
+    def _spill_path(self, tab_id: str) -> str:
+        if self._spill_dir is None:
+            self._spill_dir = tempfile.mkdtemp(prefix="brocc-tabs-")
+            logger.debug(f"Tab content over {self.max_resident_bytes:,} bytes, spilling to disk")
+        name = hashlib.blake2b(tab_id.encode("utf-8"), digest_size=8).hexdigest()
+        return os.path.join(self._spill_dir, name)
@@ -0,0 +1,288 @@
+"""
+Parser benchmark over the captured pages in html_fixtures.
+
+Every fixture runs through the generic converter, and fixtures listed in FIXTURE_URLS
+also run through the parser PARSER_REGISTRY routes their URL to. For each
+(fixture, parser) pair we record best-of-N wall time, peak traced memory and output size.
+
+Usage (from cli/):
+    uv run python -m brocc_li.tests.benchmark_parsers --save   # write a baseline
+    uv run python -m brocc_li.tests.benchmark_parsers          # compare against it
+
+Gotchas:
+- Parsers are called in-process (not through the parser pool) so timings are the
+  parser alone, and the conversion cache is cleared before every generic run.
+- Peak memory comes from a separate tracemalloc run; tracing slows code down too much
+  to share a run with the timings.
+- Wall times are machine-specific, so baselines live outside git (.benchmarks/).
+"""
+
+import argparse
+import json
+import platform
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, List, NamedTuple, Optional
+
+from rich.console import Console
+from rich.table import Table
+
+from brocc_li.html_to_md import clear_conversion_cache, html_to_md
+from brocc_li.parser_registry import resolve_parser
+
+FIXTURES_DIR = Path(__file__).parent / "html_fixtures"
+DEFAULT_BASELINE = Path(".benchmarks") / "parsers.json"
+GENERIC = "generic"
+
+# Runs are flagged when slower/bigger than baseline by this fraction...
+DEFAULT_TOLERANCE = 0.25
+# ...and by at least this much, so sub-millisecond jitter on tiny pages isn't a regression
+MIN_SECONDS_DELTA = 0.005
+MIN_PEAK_KIB_DELTA = 256
+
+# Representative URL for each fixture captured from a page with a dedicated parser
+FIXTURE_URLS: Dict[str, str] = {
+    "_bsky-feed.html": "https://bsky.app/",
+    "_bsky-followers.html": "https://bsky.app/profile/alice.bsky.social/followers",
+    "_bsky-follows.html": "https://bsky.app/profile/alice.bsky.social/follows",
+    "_bsky-profile.html": "https://bsky.app/profile/alice.bsky.social",
+    "_gmail-inbox.html": "https://mail.google.com/mail/u/0/#inbox",
+    "_gmail-inbox-thread.html": "https://mail.google.com/mail/u/0/#inbox",
+    "_instagram-explore-search.html": "https://www.instagram.com/explore/search/keyword/?q=ramen",
+    "_instagram-home.html": "https://www.instagram.com/",
+    "_instagram-profile.html": "https://www.instagram.com/vprtwn/",
+    "_instagram-saved.html": "https://www.instagram.com/vprtwn/saved/",
+    "_instagram-saved-collection.html": "https://www.instagram.com/vprtwn/saved/bali/18017585512627752/",
+    "_linkedin-company-about.html": "https://www.linkedin.com/company/google/about/",
+    "_linkedin-company-feed.html": "https://www.linkedin.com/company/google/posts/?feedView=all",
+    "_linkedin-company-people.html": "https://www.linkedin.com/company/google/people/",
+    "_linkedin-company-posts.html": "https://www.linkedin.com/company/google/posts/",
+    "_linkedin-company.html": "https://www.linkedin.com/company/google/",
+    "_linkedin-connections-me.html": "https://www.linkedin.com/mynetwork/invite-connect/connections/",
+    "_linkedin-feed.html": "https://www.linkedin.com/feed/",
+    "_linkedin-feed-2.html": "https://www.linkedin.com/feed/",
+    "_linkedin-feed-3.html": "https://www.linkedin.com/feed/",
+    "_linkedin-followers.html": "https://www.linkedin.com/mynetwork/network-manager/people-follow/followers/",
+    "_linkedin-following.html": "https://www.linkedin.com/mynetwork/network-manager/people-follow/following/",
+    "_linkedin-messages.html": "https://www.linkedin.com/messaging/thread/12345/",
+    "_linkedin-person-feed.html": "https://www.linkedin.com/in/someone/recent-activity/all/",
+    "_linkedin-profile.html": "https://www.linkedin.com/in/someone/",
+    "_linkedin-profile-2.html": "https://www.linkedin.com/in/someone/",
+    "_linkedin-search-connections.html": "https://www.linkedin.com/search/results/people/?keywords=test",
+    "_threads-activity.html": "https://www.threads.net/activity",
+    "_threads-home.html": "https://www.threads.net/",
+    "_x-bookmarks.html": "https://x.com/i/bookmarks",
+    "_x-home.html": "https://x.com/home",
+    "_x-inbox.html": "https://x.com/messages",
+    "_x-likes.html": "https://x.com/someone/likes",
+    "_x-profile.html": "https://x.com/someone",
+    "_x-profile-followers.html": "https://x.com/someone/followers",
+    "_x-thread.html": "https://x.com/someone/status/1234567890",
+    "_youtube-home.html": "https://www.youtube.com/",
+}
+
+
+class BenchmarkResult(NamedTuple):
+    fixture: str
+    parser: str  # Parser function name, or GENERIC
+    seconds: float  # Best of N runs
+    peak_kib: float
+    output_chars: int
+    error: Optional[str] = None
+
+    @property
+    def key(self) -> str:
+        return f"{self.fixture}::{self.parser}"
+
+
+class Regression(NamedTuple):
+    key: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        return self.current / self.baseline if self.baseline else float("inf")
+
+
+def _measure(
+    fixture: str, parser: str, run: Callable[[], Optional[str]], repeat: int
+) -> BenchmarkResult:
+    try:
+        best = float("inf")
+        output = None
+        for _ in range(repeat):
+            start = time.perf_counter()
+            output = run()
+            best = min(best, time.perf_counter() - start)
+
+        tracemalloc.start()
+        try:
+            run()
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    except Exception as e:
+        return BenchmarkResult(fixture, parser, 0.0, 0.0, 0, error=f"{type(e).__name__}: {e}")
+    return BenchmarkResult(fixture, parser, best, peak / 1024, len(output or ""))
+
+
+def _run_generic(html: str, slug: str) -> Optional[str]:
+    clear_conversion_cache()
+    return html_to_md(html, url=slug)
+
+
+def run_benchmarks(
+    fixture_names: List[str], repeat: int = 3, include_generic: bool = True
+) -> List[BenchmarkResult]:
+    results: List[BenchmarkResult] = []
+    for name in fixture_names:
+        html = (FIXTURES_DIR / name).read_text(encoding="utf-8")
+        route = resolve_parser(FIXTURE_URLS[name]) if name in FIXTURE_URLS else None
+        if route is not None:
+            results.append(_measure(name, route.function, partial(route.load(), html), repeat))
+        if include_generic:
+            # A bare slug never matches a route, so this is always the generic path
+            slug = name.removeprefix("_").removesuffix(".html")
+            results.append(_measure(name, GENERIC, partial(_run_generic, html, slug), repeat))
+    return results
+
+
+def save_baseline(results: List[BenchmarkResult], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    payload = {
+        "meta": {
+            "created": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": {
+            result.key: {
+                "seconds": result.seconds,
+                "peak_kib": result.peak_kib,
+                "output_chars": result.output_chars,
+            }
+            for result in results
+            if result.error is None
+        },
+    }
+    path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
+
+
+def load_baseline(path: Path) -> Dict[str, Dict[str, float]]:
+    return json.loads(path.read_text(encoding="utf-8"))["results"]
+
+
+def find_regressions(
+    results: List[BenchmarkResult],
+    baseline: Dict[str, Dict[str, float]],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> List[Regression]:
+    """Time and memory regressions beyond tolerance; output size changes are reported separately."""
+    regressions: List[Regression] = []
+    for result in results:
+        previous = baseline.get(result.key)
+        if previous is None or result.error is not None:
+            continue
+        for metric, min_delta in (("seconds", MIN_SECONDS_DELTA), ("peak_kib", MIN_PEAK_KIB_DELTA)):
+            before, now = previous[metric], getattr(result, metric)
+            if now > before * (1 + tolerance) and now - before > min_delta:
+                regressions.append(Regression(result.key, metric, before, now))
+    return regressions
+
+
+def changed_outputs(
+    results: List[BenchmarkResult], baseline: Dict[str, Dict[str, float]]
+) -> List[Regression]:
+    return [
+        Regression(
+            result.key, "output_chars", baseline[result.key]["output_chars"], result.output_chars
+        )
+        for result in results
+        if result.key in baseline
+        and result.error is None
+        and baseline[result.key]["output_chars"] != result.output_chars
+    ]
+
+
+def _print_results(
+    console: Console, results: List[BenchmarkResult], baseline: Dict[str, Dict[str, float]]
+) -> None:
+    table = Table(title="Parser benchmark")
+    for column in ("Fixture", "Parser", "Time (ms)", "vs base", "Peak (KiB)", "Output (chars)"):
+        table.add_column(column, justify="left" if column in ("Fixture", "Parser") else "right")
+    for result in results:
+        if result.error is not None:
+            table.add_row(result.fixture, result.parser, "[red]error[/red]", "", "", result.error)
+            continue
+        previous = baseline.get(result.key)
+        delta = (
+            f"{result.seconds / previous['seconds']:.2f}x"
+            if previous and previous["seconds"]
+            else ""
+        )
+        table.add_row(
+            result.fixture,
+            result.parser,
+            f"{result.seconds * 1000:.1f}",
+            delta,
+            f"{result.peak_kib:,.0f}",
+            f"{result.output_chars:,}",
+        )
+    console.print(table)
+    total = sum(result.seconds for result in results)
+    console.print(f"Total best-of time: {total:.2f}s over {len(results)} runs")
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1] if __doc__ else None)
+    parser.add_argument("--baseline", type=Path, default=DEFAULT_BASELINE)
+    parser.add_argument("--save", action="store_true", help="Write results as the new baseline")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs per case (best is kept)")
+    parser.add_argument("--tolerance", type=float, default=DEFAULT_TOLERANCE)
+    parser.add_argument("--only", default="", help="Only fixtures whose name contains this")
+    parser.add_argument("--no-generic", action="store_true", help="Skip the generic path")
+    args = parser.parse_args(argv)
+
+    console = Console()
+    fixture_names = [
+        path.name for path in sorted(FIXTURES_DIR.glob("_*.html")) if args.only in path.name
+    ]
+    results = run_benchmarks(fixture_names, args.repeat, include_generic=not args.no_generic)
+
+    baseline = load_baseline(args.baseline) if args.baseline.exists() else {}
+    _print_results(console, results, baseline)
+
+    if args.save:
+        save_baseline(results, args.baseline)
+        console.print(f"[green]Saved baseline to {args.baseline}[/green]")
+        return 0
+    if not baseline:
+        console.print(
+            f"[yellow]No baseline at {args.baseline}; run with --save to create one[/yellow]"
+        )
+        return 0
+
+    for change in changed_outputs(results, baseline):
+        console.print(
+            f"[yellow]Output size changed: {change.key} {change.baseline:,.0f} -> {change.current:,.0f} chars[/yellow]"
+        )
+    regressions = find_regressions(results, baseline, args.tolerance)
+    for regression in regressions:
+        console.print(
+            f"[red]Regression: {regression.key} {regression.metric} "
+            f"{regression.baseline:,.3f} -> {regression.current:,.3f} ({regression.ratio:.2f}x)[/red]"
+        )
+    if regressions:
+        return 1
+    console.print("[green]No regressions against baseline[/green]")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,101 @@
+import asyncio
+import json
+from collections import Counter
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
+
+import pytest
+import websockets
+
+from brocc_li.chrome_session import CdpBrowserSession
+
+
+class FakeBrowser:
+    """Browser endpoint that answers the commands brocc sends, with per-tab delays."""
+
+    def __init__(self, tabs: Dict[str, Tuple[str, str, float]]):
+        self.tabs = tabs  # target id -> (url, html, delay before answering getOuterHTML)
+        self.connections = 0
+        self.commands: Counter[Tuple[str, Optional[str]]] = Counter()
+        self.sockets: List[websockets.ServerConnection] = []
+        self.evaluated: List[str] = []  # Runtime.evaluate expressions
+        self.eval_values: Dict[str, Any] = {}  # substring of an expression -> value it evaluates to
+
+    async def handler(self, ws: websockets.ServerConnection) -> None:
+        self.connections += 1
+        self.sockets.append(ws)
+        async for raw in ws:
+            asyncio.create_task(self.answer(ws, json.loads(raw)))
+
+    async def answer(self, ws: websockets.ServerConnection, command: Dict[str, Any]) -> None:
+        method = command["method"]
+        session_id: Optional[str] = command.get("sessionId")
+        target_id = session_id[len("S-") :] if session_id else ""  # "": a browser command
+        self.commands[(method, session_id)] += 1
+        reply: Dict[str, Any] = {"id": command["id"], "result": {}}
+        if session_id:
+            reply["sessionId"] = session_id
+
+        if method == "Target.setDiscoverTargets":
+            for tab_id, (url, _, _) in self.tabs.items():
+                info = {"targetId": tab_id, "type": "page", "url": url}
+                await ws.send(
+                    json.dumps({"method": "Target.targetCreated", "params": {"targetInfo": info}})
+                )
+        elif method == "Target.attachToTarget":
+            tab_id = command["params"]["targetId"]
+            if tab_id in self.tabs:
+                reply["result"] = {"sessionId": f"S-{tab_id}"}
+            else:
+                reply = {"id": command["id"], "error": {"message": "No target with given id"}}
+        elif method == "Page.getResourceTree":
+            reply["result"] = {"frameTree": {"frame": {"url": self.tabs[target_id][0]}}}
+        elif method == "DOM.getDocument":
+            url = self.tabs[target_id][0]
+            reply["result"] = {"root": {"nodeId": 1, "documentURL": url}}
+        elif method == "DOM.getOuterHTML":
+            await asyncio.sleep(self.tabs[target_id][2])
+            reply["result"] = {"outerHTML": self.tabs[target_id][1]}
+        elif method == "Runtime.evaluate":
+            expression = command["params"]["expression"]
+            self.evaluated.append(expression)
+            value = next(
+                (value for key, value in self.eval_values.items() if key in expression),
+                "DOM change observer installed",
+            )
+            reply["result"] = {"result": {"value": value}}
+        await ws.send(json.dumps(reply))
+
+    async def target_event(self, method: str, tab_id: str, url: str = "") -> None:
+        info = {"targetId": tab_id, "type": "page", "url": url, "title": url}
+        params = (
+            {"targetId": tab_id} if method == "Target.targetDestroyed" else {"targetInfo": info}
+        )
+        await self.sockets[-1].send(json.dumps({"method": method, "params": params}))
+
+    async def binding_call(self, session_id: str, name: str, payload: Dict[str, Any]) -> None:
+        event = {
+            "method": "Runtime.bindingCalled",
+            "sessionId": session_id,
+            "params": {"name": name, "payload": json.dumps(payload), "executionContextId": 1},
+        }
+        await self.sockets[-1].send(json.dumps(event))
+
+
+BrowserFixture = Tuple[FakeBrowser, CdpBrowserSession]
+
+
+@pytest.fixture
+async def browser() -> AsyncIterator[BrowserFixture]:
+    fake = FakeBrowser(
+        {
+            # The slow tab is asked first but answers last
+            "slow": ("https://example.com/slow", "<html>slow</html>", 0.2),
+            "fast": ("https://example.com/fast", "<html>fast</html>", 0.0),
+        }
+    )
+    async with websockets.serve(fake.handler, "127.0.0.1", 0) as server:
+        port = server.sockets[0].getsockname()[1]
+        cdp = CdpBrowserSession()
+        await cdp.connect(f"ws://127.0.0.1:{port}/devtools/browser/test")
+        yield fake, cdp
+        await cdp.close()
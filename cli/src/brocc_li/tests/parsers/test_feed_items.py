@@ -0,0 +1,62 @@
+import re
+
+import pytest
+
+from brocc_li.parser_registry import resolve_parser
+from brocc_li.parsers.feed_items import content_hash, feed_item, item_key
+from brocc_li.tests.parsers.get_fixture import get_fixture
+
+FEEDS = [
+    ("https://x.com/home", "_x-home.html", r"https://x\.com/[^/]+/status/\d+", "\n\n"),
+    (
+        "https://www.linkedin.com/feed/",
+        "_linkedin-feed.html",
+        r"urn:li:[a-zA-Z]+:\d+",
+        "\n\n",
+    ),
+    (
+        "https://www.threads.net/",
+        "_threads-home.html",
+        r"https://www\.threads\.net/@[^/]+/post/[^/]+",
+        "\n\n\n",
+    ),
+    ("https://bsky.app/", "_bsky-feed.html", r"https://bsky\.app/profile/[^/]+/post/\w+", "\n\n"),
+    ("https://x.com/someone", "_x-profile.html", r"https://x\.com/[^/]+/status/\d+", "\n\n"),
+    ("https://x.com/i/bookmarks", "_x-bookmarks.html", r"https://x\.com/[^/]+/status/\d+", "\n\n"),
+    ("https://x.com/someone/likes", "_x-likes.html", r"https://x\.com/[^/]+/status/\d+", "\n\n"),
+]
+
+
+@pytest.mark.parametrize("url, fixture, id_pattern, separator", FEEDS)
+def test_items_match_page_output(url: str, fixture: str, id_pattern: str, separator: str):
+    route = resolve_parser(url)
+    assert route is not None
+    items_parser = route.load_items()
+    assert items_parser is not None
+    html = get_fixture(fixture)
+
+    items = list(items_parser(html))
+    assert items
+    ids = [item.item_id for item in items if item.item_id]
+    assert len(ids) >= len(items) // 2
+    assert all(re.fullmatch(id_pattern, item_id) for item_id in ids)
+    assert all(item.content_hash == content_hash(item.markdown) for item in items)
+
+    # Every item block appears in the page markdown, in order
+    page = route.load()(html)
+    assert page is not None
+    assert separator.join(item.markdown for item in items).strip() in page
+
+
+def test_non_feed_routes_have_no_item_parser():
+    route = resolve_parser("https://www.linkedin.com/in/someone/")
+    assert route is not None
+    assert route.load_items() is None
+
+
+def test_item_key_falls_back_to_content_hash():
+    item = feed_item(None, "### Post by someone\n\nhello")
+    assert item_key(item) == f"hash:{item.content_hash}"
+    assert item_key(feed_item("urn:li:activity:1", "x")) == "urn:li:activity:1"
+    # Surrounding whitespace doesn't change the hash
+    assert feed_item(None, "hello\n").content_hash == feed_item(None, "hello").content_hash
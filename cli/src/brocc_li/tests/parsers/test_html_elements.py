@@ -0,0 +1,124 @@
+from unstructured.documents.elements import (
+    CodeSnippet,
+    Image,
+    ListItem,
+    NarrativeText,
+    Table,
+    Text,
+    Title,
+)
+
+from brocc_li.parsers.html_elements import partition_html
+from brocc_li.tests.parsers.get_fixture import get_fixture
+
+
+def _kinds(html: str):
+    return [(type(element).__name__, str(element)) for element in partition_html(text=html)]
+
+
+def test_blocks_split_and_phrasing_joins():
+    html = """
+    <html><body>
+      <h2>Experience</h2>
+      <div>Founder <b>at</b> <a href="/company/acme">Acme</a></div>
+      <p>We are building tools that help teams ship faster.</p>
+      <ul><li>First point</li><li>Second point</li></ul>
+      <img src="https://example.com/a.png" alt="Acme logo">
+      <pre>
+x = 1
+  y = 2
+</pre>
+    </body></html>
+    """
+    assert _kinds(html) == [
+        ("Title", "Experience"),
+        ("Text", "Founder at Acme"),
+        ("NarrativeText", "We are building tools that help teams ship faster."),
+        ("ListItem", "First point"),
+        ("ListItem", "Second point"),
+        ("Image", "Acme logo"),
+        ("CodeSnippet", "x = 1\n  y = 2"),
+    ]
+
+
+def test_removed_and_unknown_tags_keep_only_their_tail():
+    html = """
+    <body>
+      <div>Before<button>Click me</button> after</div>
+      <nav>Home Jobs Messaging</nav>tail of nav
+      <div><svg><text>icon</text></svg>Label</div>
+      <script>var x = "Hidden";</script>
+    </body>
+    """
+    assert [str(element) for element in partition_html(text=html)] == [
+        "Before after",
+        "tail of nav",
+        "Label",
+    ]
+
+
+def test_block_inside_inline_starts_new_element():
+    html = "<body><div><span>Intro <div>Nested block</div> outro</span></div></body>"
+    assert [str(element) for element in partition_html(text=html)] == [
+        "Intro",
+        "Nested block",
+        "outro",
+    ]
+
+
+def test_main_is_preferred_over_body():
+    html = "<body><div>Site chrome</div><main><h1>Content</h1></main></body>"
+    assert _kinds(html) == [("Title", "Content")]
+
+
+def test_metadata_for_images_and_links():
+    html = """
+    <body>
+      <img data-src="https://cdn.example.com/lazy.jpg" src="placeholder.gif" alt="Jane Doe">
+      <img src="data:image/png;base64,AAAA" alt="inline">
+      <img alt="no source">
+      <p>Read <a href="https://example.com/post">the post</a> now</p>
+    </body>
+    """
+    elements = partition_html(text=html)
+    images = [element for element in elements if isinstance(element, Image)]
+    assert [image.metadata.image_url for image in images] == [
+        "https://cdn.example.com/lazy.jpg",
+        None,
+    ]
+    paragraph = elements[-1]
+    assert paragraph.metadata.link_urls == ["https://example.com/post"]
+    assert paragraph.metadata.link_texts == ["the post"]
+
+
+def test_text_classification():
+    html = """
+    <body>
+      <div>• Bulleted point</div>
+      <div>Software Development</div>
+      <div>8K followers</div>
+      <div>x</div>
+      <div>I'm excited to share that our team is hiring engineers.</div>
+      <table><tr><td>Series C</td><td>US$ 36.5M</td></tr></table>
+    </body>
+    """
+    elements = partition_html(text=html)
+    assert isinstance(elements[0], ListItem) and str(elements[0]) == "Bulleted point"
+    assert type(elements[1]) is Text
+    assert type(elements[2]) is Text
+    assert isinstance(elements[3], NarrativeText)
+    assert isinstance(elements[4], Table) and str(elements[4]) == "Series C US$ 36.5M"
+    assert len(elements) == 5
+
+
+def test_empty_html():
+    assert partition_html(text="") == []
+    assert partition_html(text="   ") == []
+
+
+def test_fixture_produces_element_mix():
+    elements = partition_html(text=get_fixture("_linkedin-company.html"))
+    kinds = {type(element) for element in elements}
+    assert {Title, Text, NarrativeText, Image} <= kinds
+    assert CodeSnippet not in kinds
+    assert "Motion" in [str(element) for element in elements if isinstance(element, Title)]
@@ -0,0 +1,53 @@
+import random
+
+from brocc_li.parsers.linkedin_utils import is_job_title, is_noisy
+from brocc_li.parsers.pattern_matcher import PatternMatcher, matcher_for
+
+
+def test_search_and_matched_order():
+    matcher = PatternMatcher(["Follow", "see more", "follow", ""])
+    assert matcher.patterns == ("follow", "see more")
+    assert matcher.search("click to see more or follow") == "see more"
+    assert matcher.matched("follow us and see more") == ["follow", "see more"]
+    assert matcher.search("nothing here") is None
+    assert matcher.matched("") == []
+
+
+def test_empty_matcher_never_matches():
+    matcher = PatternMatcher([])
+    assert len(matcher) == 0
+    assert matcher.search("anything") is None
+    assert list(matcher.occurrences("anything")) == []
+
+
+def test_occurrences_match_brute_force():
+    random.seed(7)
+    patterns = ["ab", "abc", "b", "bca", "cab", "c a", "aaa"]
+    matcher = PatternMatcher(patterns)
+    for _ in range(500):
+        text = "".join(random.choice("abc ") for _ in range(random.randint(0, 20)))
+        expected = sorted(
+            (start, pattern)
+            for pattern in patterns
+            for start in range(len(text))
+            if text.startswith(pattern, start)
+        )
+        assert sorted(matcher.occurrences(text)) == expected
+        assert set(matcher.matched(text)) == {pattern for _, pattern in expected}
+
+
+def test_matcher_for_reuses_by_contents():
+    patterns = ["promoted", "sponsored"]
+    assert matcher_for(patterns) is matcher_for(list(patterns))
+    assert matcher_for([*patterns, "ad"]).search("an ad") == "ad"
+    assert matcher_for(patterns).search("an ad") is None
+
+
+def test_linkedin_classifiers():
+    assert is_job_title("Senior Software Engineer at Acme")
+    assert is_job_title("Founder | Investor")
+    assert not is_job_title("Jane Doe")
+    # Role inside a longer word doesn't count
+    assert not is_job_title("Engineering")
+    assert is_noisy("Media is loading…")
+    assert not is_noisy("Building developer tools for data teams")
@@ -0,0 +1,74 @@
+from datetime import datetime
+from unittest import mock
+
+import dateparser
+import pytest
+
+from brocc_li.parsers import resolve_utils
+from brocc_li.parsers.resolve_utils import (
+    clear_resolution_caches,
+    find_places,
+    format_date,
+    parse_date,
+)
+
+
+@pytest.fixture(autouse=True)
+def fresh_caches():
+    clear_resolution_caches()
+    yield
+    clear_resolution_caches()
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "2024-03-21",
+        "Mar 21",
+        "March 21, 2024",
+        "Sep. 5, 2023",
+        "3/21/24",
+        "1/2/99",
+        "12/1/2023",
+        "3:45 PM",
+        "12:05 am",
+        "Today",
+        "yesterday",
+        "5 hours ago",
+        "2 weeks ago",
+    ],
+)
+def test_fast_path_matches_dateparser(text: str):
+    with mock.patch.object(resolve_utils, "_parse_with_dateparser") as fallback:
+        fast = format_date(text)
+    fallback.assert_not_called()
+    expected = dateparser.parse(text)
+    assert expected is not None
+    assert fast == expected.strftime("%b %d, %Y")
+
+
+@pytest.mark.parametrize("text", ["Feb 30, 2024", "0:30 PM", "Mar 21 at noon", "in 2 days"])
+def test_ambiguous_or_partial_text_falls_back_to_dateparser(text: str):
+    expected = dateparser.parse(text)
+    parsed = parse_date(text)
+    assert (parsed and parsed.date()) == (expected and expected.date())
+
+
+def test_dateparser_results_are_cached():
+    with mock.patch("dateparser.parse", return_value=datetime(2020, 1, 1)) as parse:
+        assert format_date("the first of january") == "Jan 01, 2020"
+        assert format_date("the first of january") == "Jan 01, 2020"
+        assert parse_date("not a date at all") is not None
+    assert parse.call_count == 2
+
+
+def test_unparseable_text():
+    assert parse_date("") is None
+    assert format_date("Compose") is None
+
+
+def test_find_places():
+    places = find_places("Mountain View, California, United States")
+    assert "United States" in places.countries
+    assert find_places("Mountain View, California, United States") is places
+    assert find_places("Software Development") == ((), (), ())
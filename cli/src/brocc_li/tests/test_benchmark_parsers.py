@@ -0,0 +1,60 @@
+from pathlib import Path
+
+from brocc_li.parser_registry import resolve_parser
+from brocc_li.tests.benchmark_parsers import (
+    FIXTURE_URLS,
+    FIXTURES_DIR,
+    GENERIC,
+    BenchmarkResult,
+    changed_outputs,
+    find_regressions,
+    load_baseline,
+    run_benchmarks,
+    save_baseline,
+)
+
+
+def test_fixture_urls_route_to_parsers():
+    for fixture, url in FIXTURE_URLS.items():
+        assert (FIXTURES_DIR / fixture).exists(), fixture
+        assert resolve_parser(url) is not None, f"{fixture}: {url} has no parser route"
+
+
+def test_run_and_round_trip_baseline(tmp_path: Path):
+    results = run_benchmarks(["_x-likes.html"], repeat=1)
+
+    assert [result.parser for result in results] == ["twitter_likes_html_to_md", GENERIC]
+    for result in results:
+        assert result.error is None
+        assert result.seconds > 0
+        assert result.peak_kib > 0
+        assert result.output_chars > 0
+
+    path = tmp_path / "baseline.json"
+    save_baseline(results, path)
+    baseline = load_baseline(path)
+    assert set(baseline) == {result.key for result in results}
+    assert find_regressions(results, baseline) == []
+    assert changed_outputs(results, baseline) == []
+
+
+def test_find_regressions_respects_tolerance_and_noise_floor():
+    baseline = {
+        "_a.html::generic": {"seconds": 0.100, "peak_kib": 1000.0, "output_chars": 50},
+        "_b.html::generic": {"seconds": 0.001, "peak_kib": 10.0, "output_chars": 50},
+    }
+    results = [
+        BenchmarkResult("_a.html", GENERIC, 0.200, 5000.0, 60),  # Slower, bigger, changed
+        BenchmarkResult("_b.html", GENERIC, 0.003, 20.0, 50),  # 3x but within noise floors
+        BenchmarkResult("_c.html", GENERIC, 9.0, 9000.0, 50),  # Not in baseline
+    ]
+
+    regressions = find_regressions(results, baseline, tolerance=0.25)
+    assert [(r.key, r.metric) for r in regressions] == [
+        ("_a.html::generic", "seconds"),
+        ("_a.html::generic", "peak_kib"),
+    ]
+    assert regressions[0].ratio == 2.0
+    assert [(c.key, c.current) for c in changed_outputs(results, baseline)] == [
+        ("_a.html::generic", 60)
+    ]
@@ -0,0 +1,140 @@
+import asyncio
+from typing import Awaitable, Callable
+
+from brocc_li.capture_scheduler import (
+    DEBOUNCE_BASE_SECONDS,
+    DEBOUNCE_MAX_SECONDS,
+    CapturePriority,
+    CaptureScheduler,
+)
+
+
+async def test_priority_order_and_concurrency_cap():
+    scheduler = CaptureScheduler(max_concurrent=2, host_interval=0)
+    started = []
+    running = 0
+    peak = 0
+    release = asyncio.Event()
+
+    def job(name: str) -> Callable[[], Awaitable[str]]:
+        async def capture() -> str:
+            nonlocal running, peak
+            started.append(name)
+            running += 1
+            peak = max(peak, running)
+            await release.wait()
+            running -= 1
+            return name
+
+        return capture
+
+    runs = [
+        asyncio.create_task(
+            scheduler.run("a", "https://a.com/", CapturePriority.BACKGROUND, job("a"))
+        ),
+        asyncio.create_task(
+            scheduler.run("b", "https://b.com/", CapturePriority.BACKGROUND, job("b"))
+        ),
+    ]
+    await asyncio.sleep(0)
+    # Queued while both slots are busy; the focused tab goes ahead of earlier requests
+    runs += [
+        asyncio.create_task(scheduler.run(key, f"https://{key}.com/", priority, job(key)))
+        for key, priority in [
+            ("c", CapturePriority.BACKGROUND),
+            ("d", CapturePriority.CHANGED),
+            ("e", CapturePriority.FOCUSED),
+        ]
+    ]
+    await asyncio.sleep(0.01)
+    assert started == ["a", "b"]
+    assert scheduler.waiting == 3
+
+    release.set()
+    assert await asyncio.gather(*runs) == ["a", "b", "c", "d", "e"]
+    assert started == ["a", "b", "e", "d", "c"]
+    assert peak == 2
+
+
+async def test_requests_for_a_waiting_key_coalesce():
+    scheduler = CaptureScheduler(max_concurrent=1, host_interval=0)
+    calls = []
+    gate = asyncio.Event()
+
+    async def blocker():
+        await gate.wait()
+
+    async def capture():
+        calls.append("t")
+        return len(calls)
+
+    first = asyncio.create_task(scheduler.run("busy", None, CapturePriority.CHANGED, blocker))
+    await asyncio.sleep(0)
+    waiting = [
+        asyncio.create_task(scheduler.run("t", None, CapturePriority.BACKGROUND, capture))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0)
+    assert scheduler.waiting == 1
+    gate.set()
+    await first
+    assert await asyncio.gather(*waiting) == [1, 1, 1]
+    assert calls == ["t"]
+
+
+async def test_same_host_starts_are_spaced():
+    scheduler = CaptureScheduler(max_concurrent=5, host_interval=0.05)
+    loop = asyncio.get_running_loop()
+    starts = {}
+
+    def job(key: str) -> Callable[[], Awaitable[None]]:
+        async def capture() -> None:
+            starts[key] = loop.time()
+
+        return capture
+
+    await asyncio.gather(
+        scheduler.run("x1", "https://x.com/1", CapturePriority.CHANGED, job("x1")),
+        scheduler.run("x2", "https://x.com/2", CapturePriority.CHANGED, job("x2")),
+        scheduler.run("y1", "https://y.com/1", CapturePriority.CHANGED, job("y1")),
+    )
+    assert starts["x2"] - starts["x1"] >= 0.04
+    # Another host isn't held back
+    assert starts["y1"] - starts["x1"] < 0.04
+
+
+async def test_debounce_grows_for_churning_tabs_and_shrinks_when_focused():
+    scheduler = CaptureScheduler()
+    calls = []
+
+    async def capture():
+        calls.append(1)
+
+    scheduler.request("t", None, capture)
+    assert scheduler.debounce_delay("t") == DEBOUNCE_BASE_SECONDS
+    scheduler.request("t", None, capture)  # Coalesced into the pending run
+    # Fire now instead of waiting out the delay
+    timer = scheduler._debounces["t"].timer
+    assert timer is not None
+    timer.cancel()
+    scheduler._fire("t", None, CapturePriority.CHANGED, capture)
+    await asyncio.sleep(0.01)
+    assert calls == [1]
+
+    # Changing again right after a capture: back off, up to the cap
+    scheduler.request("t", None, capture)
+    assert scheduler.debounce_delay("t") == DEBOUNCE_BASE_SECONDS * 2
+    for _ in range(10):
+        scheduler._debounces["t"] = scheduler._debounces["t"]._replace(timer=None)
+        scheduler.request("t", None, capture)
+    assert scheduler.debounce_delay("t") == DEBOUNCE_MAX_SECONDS
+
+    # The tab the user is reading gets captured sooner
+    scheduler._debounces["t"] = scheduler._debounces["t"]._replace(timer=None)
+    scheduler.request("t", None, capture, focused=True)
+    assert scheduler.debounce_delay("t") == DEBOUNCE_MAX_SECONDS / 2
+    scheduler.request("f", None, capture, focused=True)
+    assert scheduler.debounce_delay("f") == DEBOUNCE_BASE_SECONDS / 2
+
+    scheduler.cancel_all()
+    assert not scheduler._debounces
@@ -0,0 +1,61 @@
+import asyncio
+from typing import List, Optional
+
+import aiohttp
+import pytest
+
+from brocc_li import chrome_manager
+from brocc_li.chrome_cdp import ChromeTab
+from brocc_li.chrome_manager import ChromeManager
+
+
+async def test_tab_lookups_share_one_listing(monkeypatch: pytest.MonkeyPatch):
+    listings: List[Optional[aiohttp.ClientSession]] = []
+
+    async def fake_get_tabs(session: Optional[aiohttp.ClientSession] = None) -> List[ChromeTab]:
+        listings.append(session)
+        await asyncio.sleep(0.01)
+        return [ChromeTab(id="a", url="https://example.com/a"), ChromeTab(id="b")]
+
+    monkeypatch.setattr(chrome_manager, "get_tabs", fake_get_tabs)
+    manager = ChromeManager()
+    try:
+        tabs = await asyncio.gather(*(manager.get_tab(tab_id) for tab_id in "abcab"))
+        assert [tab.id if tab else None for tab in tabs] == ["a", "b", None, "a", "b"]
+        assert len(listings) == 1
+        assert listings[0] is manager.http_session()
+
+        # An expired listing is refreshed
+        await manager.list_tabs(max_age=0)
+        assert len(listings) == 2
+    finally:
+        await manager.close()
+
+
+async def test_visibility_probes_bounded_like_captures(monkeypatch: pytest.MonkeyPatch):
+    active = 0
+    peak = 0
+
+    async def fake_get_tab_visibility(cdp: object, tab_id: str) -> str:
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        await asyncio.sleep(0.01)
+        active -= 1
+        return "focused" if tab_id == "tab0" else "hidden"
+
+    async def fake_cdp_session() -> object:
+        return object()
+
+    monkeypatch.setattr(chrome_manager, "get_tab_visibility", fake_get_tab_visibility)
+    manager = ChromeManager()
+    monkeypatch.setattr(manager, "cdp_session", fake_cdp_session)
+    try:
+        tab_ids = [f"tab{i}" for i in range(20)]
+        visibility = await manager.get_tab_visibilities(tab_ids)
+        assert visibility == {
+            tab_id: "focused" if tab_id == "tab0" else "hidden" for tab_id in tab_ids
+        }
+        assert peak == manager.capture_scheduler.max_concurrent
+    finally:
+        await manager.close()
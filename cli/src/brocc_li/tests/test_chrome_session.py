@@ -0,0 +1,109 @@
+import asyncio
+
+import pytest
+
+from brocc_li.chrome_cdp import (
+    DOM_CHANGE_BINDING,
+    DeltaCursor,
+    DomChange,
+    DomDelta,
+    get_tab_html_content,
+    get_tab_html_delta,
+    monitor_dom_changes,
+    start_tab_html_delta,
+    tabs_from_targets,
+)
+from brocc_li.chrome_session import CdpError
+from brocc_li.tests.conftest import BrowserFixture
+
+
+async def test_fetches_share_one_connection(browser: BrowserFixture):
+    fake, cdp = browser
+    results = await asyncio.gather(
+        get_tab_html_content(cdp, "slow"),
+        get_tab_html_content(cdp, "fast"),
+        get_tab_html_content(cdp, "slow"),
+    )
+    assert results == [
+        ("<html>slow</html>", "https://example.com/slow"),
+        ("<html>fast</html>", "https://example.com/fast"),
+        ("<html>slow</html>", "https://example.com/slow"),
+    ]
+    assert await get_tab_html_content(cdp, "fast") == (
+        "<html>fast</html>",
+        "https://example.com/fast",
+    )
+
+    assert fake.connections == 1
+    assert fake.commands[("Target.attachToTarget", None)] == 2
+    for session_id in ("S-slow", "S-fast"):
+        assert fake.commands[("Page.enable", session_id)] == 1
+        assert fake.commands[("DOM.enable", session_id)] == 1
+    assert fake.commands[("DOM.getOuterHTML", "S-fast")] == 2
+    assert set(cdp.targets) == {"slow", "fast"}
+
+
+async def test_error_response_raises(browser: BrowserFixture):
+    _, cdp = browser
+    with pytest.raises(CdpError, match="No target"):
+        await cdp.attach("missing")
+    assert await get_tab_html_content(cdp, "missing") == (None, None)
+
+
+async def test_monitor_gets_only_its_session_events(browser: BrowserFixture):
+    fake, cdp = browser
+    monitor = monitor_dom_changes(cdp, "fast")
+    first_event = asyncio.ensure_future(monitor.__anext__())
+    while fake.commands[("Runtime.evaluate", "S-fast")] == 0:
+        await asyncio.sleep(0.01)
+    # The observer is exposed to the page and reinstalled in every new document
+    assert fake.commands[("Runtime.addBinding", "S-fast")] == 1
+    assert fake.commands[("Page.addScriptToEvaluateOnNewDocument", "S-fast")] == 1
+
+    await fake.binding_call("S-slow", DOM_CHANGE_BINDING, {"added_nodes": 1})
+    await fake.binding_call("S-fast", "someOtherBinding", {"added_nodes": 2})
+    await fake.binding_call("S-fast", DOM_CHANGE_BINDING, {"added_nodes": 3, "text_added": 40})
+    assert await asyncio.wait_for(first_event, timeout=2) == DomChange(added_nodes=3, text_added=40)
+
+    # Closing the browser connection ends the monitor
+    next_event = asyncio.ensure_future(monitor.__anext__())
+    await fake.sockets[-1].close()
+    with pytest.raises(StopAsyncIteration):
+        await asyncio.wait_for(next_event, timeout=2)
+    assert not cdp.connected
+    with pytest.raises(ConnectionError):
+        await cdp.send("Page.enable", session_id="S-fast")
+
+
+def test_tabs_from_targets_keeps_visible_pages():
+    targets = [
+        {"targetId": "a", "type": "page", "url": "https://example.com/", "title": ""},
+        {"targetId": "b", "type": "service_worker", "url": "https://example.com/sw.js"},
+        {"targetId": "c", "type": "page", "subtype": "prerender", "url": "https://example.com/"},
+    ]
+    tabs = tabs_from_targets(targets)
+    assert [(tab.id, tab.url, tab.title) for tab in tabs] == [
+        ("a", "https://example.com/", "Untitled")
+    ]
+
+
+async def test_delta_capture_continues_from_cursor(browser: BrowserFixture):
+    fake, cdp = browser
+    fake.eval_values["__broccDeltaStart"] = {"doc_id": "d1", "seq": 1, "url": "https://x/"}
+    cursor = await start_tab_html_delta(cdp, "fast")
+    assert cursor is not None and cursor == DeltaCursor("d1", 1)
+
+    fake.eval_values["__broccDeltaTake"] = {
+        "doc_id": "d1",
+        "seq": 2,
+        "url": "https://x/",
+        "reset": False,
+        "fragments": ["<div>new</div>", ""],
+    }
+    delta = await get_tab_html_delta(cdp, "fast", cursor)
+    assert delta == DomDelta(DeltaCursor("d1", 2), "https://x/", ["<div>new</div>"])
+    assert fake.evaluated[-1].endswith('__broccDeltaTake("d1", 1)')
+
+    # A new document (or a missed capture) means a full snapshot instead
+    fake.eval_values["__broccDeltaTake"] = {"doc_id": "d2", "seq": 0, "reset": True}
+    assert await get_tab_html_delta(cdp, "fast", DeltaCursor("d1", 2)) is None
@@ -0,0 +1,304 @@
+import asyncio
+import time
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+import pytest
+
+from brocc_li import chrome_tabs
+from brocc_li.capture_scheduler import CapturePriority, CaptureScheduler
+from brocc_li.chrome_cdp import ChromeTab, DeltaCursor, DomChange, DomDelta
+from brocc_li.chrome_session import CdpBrowserSession
+from brocc_li.chrome_tabs import (
+    FULL_SNAPSHOT_EVERY_DELTAS,
+    ChromeTabs,
+    DeltaState,
+    TabChangeEvent,
+    TabReference,
+)
+from brocc_li.tests.conftest import BrowserFixture
+
+
+class FakeChromeManager:
+    """Stands in for ChromeManager: fixed tabs, the test's CDP session, canned HTML and deltas."""
+
+    connected = True
+
+    def __init__(
+        self,
+        tabs: Iterable[ChromeTab] = (),
+        visibility: Optional[Dict[str, str]] = None,
+        cdp: Optional[CdpBrowserSession] = None,
+        deltas: Iterable[Optional[DomDelta]] = (),
+    ):
+        self.tabs = list(tabs)
+        self.visibility = visibility or {}
+        self.cdp = cdp
+        self.deltas = list(deltas)
+        self.capture_scheduler = CaptureScheduler()
+        # (tab ids, priority, focused tab id) per get_html_for_tabs call
+        self.fetches: List[Tuple[List[str], Optional[CapturePriority], Optional[str]]] = []
+        self.release = asyncio.Event()  # Fetches wait for this; clear it to hold them
+        self.release.set()
+        self.active = 0  # Fetches in flight, and the most ever in flight at once
+        self.peak = 0
+        self.cursor = DeltaCursor("d1", 1)  # Where deltas after a full snapshot start
+        # Where get_tab_html finds the tab
+        self.page_url: Optional[str] = "https://example.com/feed"
+
+    async def list_tabs(self) -> List[ChromeTab]:
+        return self.tabs
+
+    async def cdp_session(self) -> CdpBrowserSession:
+        if self.cdp is None:
+            raise ConnectionError("No target events in this test")
+        return self.cdp
+
+    async def get_tab_visibilities(self, tab_ids: List[str]) -> Dict[str, str]:
+        return {tab_id: self.visibility.get(tab_id, "hidden") for tab_id in tab_ids}
+
+    async def get_html_for_tabs(
+        self,
+        tabs: List[Dict[str, Any]],
+        priority: Optional[CapturePriority] = None,
+        focused_tab_id: Optional[str] = None,
+    ) -> List[Tuple[Dict[str, Any], Optional[str], Optional[str]]]:
+        self.fetches.append(([tab["id"] for tab in tabs], priority, focused_tab_id))
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await self.release.wait()
+        finally:
+            self.active -= 1
+        return [(tab, f"<p>Page at {tab['url']}</p>", tab["url"]) for tab in tabs]
+
+    async def get_tab_delta(self, tab_id: str, since: DeltaCursor) -> Optional[DomDelta]:
+        return self.deltas.pop(0)
+
+    async def start_tab_delta(self, tab_id: str) -> Optional[DeltaCursor]:
+        return self.cursor
+
+    async def get_tab_html(self, tab_id: str) -> Tuple[Optional[str], Optional[str]]:
+        await self.release.wait()
+        return "<p>First post</p><p>Second post</p>", self.page_url
+
+    async def close(self) -> None:
+        pass
+
+
+async def test_tab_changes_come_from_target_events(
+    browser: BrowserFixture, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(chrome_tabs, "NAVIGATION_CAPTURE_DELAY", 0.01)
+    fake, cdp = browser
+    events: "asyncio.Queue[TabChangeEvent]" = asyncio.Queue()
+    # The consistency poll never runs during the test
+    tabs = ChromeTabs(FakeChromeManager(cdp=cdp), check_interval=3600)  # type: ignore[arg-type]
+    tabs._on_polling_change_callback = events.put_nowait
+    tabs._start_interaction_monitor = lambda tab_id: None  # type: ignore[method-assign]
+    tabs._monitoring = True
+    tabs.last_tabs_check = time.monotonic()
+    loop_task = asyncio.create_task(tabs._monitor_loop())
+    try:
+        # Tabs already open when the loop subscribes count as new
+        initial = await asyncio.wait_for(events.get(), timeout=2)
+        assert {tab["id"] for tab in initial.new_tabs} == {"slow", "fast"}
+
+        await fake.target_event("Target.targetCreated", "new", "about:blank")
+        await fake.target_event("Target.targetInfoChanged", "new", "https://example.com/new")
+        change = await asyncio.wait_for(events.get(), timeout=2)
+        assert [tab["url"] for tab in change.new_tabs] == ["https://example.com/new"]
+
+        await fake.target_event("Target.targetInfoChanged", "fast", "https://example.com/next")
+        await fake.target_event("Target.targetDestroyed", "slow")
+        change = await asyncio.wait_for(events.get(), timeout=2)
+        assert [tab["old_url"] for tab in change.navigated_tabs] == ["https://example.com/fast"]
+        assert [tab["id"] for tab in change.closed_tabs] == ["slow"]
+    finally:
+        tabs._monitoring = False
+        loop_task.cancel()
+
+
+async def test_startup_captures_visible_tabs_first():
+    manager = FakeChromeManager(
+        [ChromeTab(id=tab_id, url=f"https://example.com/{tab_id}") for tab_id in "abcd"],
+        {"a": "hidden", "b": "focused", "c": "hidden", "d": "visible"},
+    )
+    manager.release.clear()
+    tabs = ChromeTabs(
+        manager,  # type: ignore[arg-type]
+        check_interval=3600,
+        recently_stored=lambda urls: {"https://example.com/c"},
+    )
+    monitored = []
+    tabs._start_interaction_monitor = monitored.append  # type: ignore[method-assign]
+    events: "asyncio.Queue[TabChangeEvent]" = asyncio.Queue()
+
+    # Monitoring starts with every tab recorded, before any content is fetched
+    assert await tabs.start_monitoring(events.put_nowait, lambda ref: None)
+    assert {(ref.id, ref.markdown) for ref in tabs.tab_states.snapshot().values()} == {
+        (tab_id, "") for tab_id in "abcd"
+    }
+    try:
+        manager.release.set()
+        visible = await asyncio.wait_for(events.get(), timeout=2)
+        assert [tab["id"] for tab in visible.new_tabs] == ["b", "d"]
+        background = await asyncio.wait_for(events.get(), timeout=2)
+        assert [tab["id"] for tab in background.new_tabs] == ["a"]
+        assert manager.fetches == [
+            (["b", "d"], CapturePriority.CHANGED, "b"),
+            (["a"], CapturePriority.BACKGROUND, "b"),
+        ]
+        # The recently stored tab is watched for changes but not captured again
+        assert sorted(monitored) == ["a", "b", "c", "d"]
+        assert {
+            tab_id: ref.markdown.strip() for tab_id, ref in tabs.tab_states.snapshot().items()
+        } == {
+            "a": "Page at https://example.com/a",
+            "b": "Page at https://example.com/b",
+            "c": "",
+            "d": "Page at https://example.com/d",
+        }
+    finally:
+        await tabs.stop_monitoring()
+
+
+async def test_navigations_handled_concurrently(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chrome_tabs, "NAVIGATION_MONITOR_DELAY", 0.05)
+    monkeypatch.setattr(chrome_tabs, "NAVIGATION_CAPTURE_DELAY", 0.05)
+    manager = FakeChromeManager()
+    manager.release.clear()
+    tabs = ChromeTabs(manager, check_interval=3600)  # type: ignore[arg-type]
+    monitored = []
+    tabs._start_interaction_monitor = monitored.append  # type: ignore[method-assign]
+    tabs._monitoring = True
+    tab_ids = [f"tab{i}" for i in range(8)]
+    for tab_id in tab_ids:
+        tabs.tab_states.put(
+            TabReference(id=tab_id, url=f"https://example.com/{tab_id}", markdown="")
+        )
+
+    processing = asyncio.create_task(
+        tabs.process_tab_changes(
+            [ChromeTab(id=tab_id, url=f"https://example.org/{tab_id}") for tab_id in tab_ids]
+        )
+    )
+    # Every navigated tab's fetch is in flight at once, none waiting on another
+    while manager.active < len(tab_ids) and not processing.done():
+        await asyncio.sleep(0.01)
+    manager.release.set()
+    event = await asyncio.wait_for(processing, timeout=5)
+    assert manager.peak == len(tab_ids)
+    assert event is not None and len(event.navigated_tabs) == len(tab_ids)
+    assert {tab_id: ref.markdown.strip() for tab_id, ref in tabs.tab_states.snapshot().items()} == {
+        tab_id: f"Page at https://example.org/{tab_id}" for tab_id in tab_ids
+    }
+
+    # Monitors for the new documents start once the delay has passed
+    for _ in range(100):
+        if len(monitored) == len(tab_ids):
+            break
+        await asyncio.sleep(0.05)
+    assert sorted(monitored) == tab_ids
+    assert not tabs._monitor_restarts
+
+
+async def test_navigated_tab_captured_once_loaded(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(chrome_tabs, "NAVIGATION_CAPTURE_DELAY", 0.2)
+    manager = FakeChromeManager()
+    tabs = ChromeTabs(manager, check_interval=3600)  # type: ignore[arg-type]
+    tabs._start_interaction_monitor = lambda tab_id: None  # type: ignore[method-assign]
+    for tab_id in ("a", "b"):
+        tabs.tab_states.put(
+            TabReference(id=tab_id, url=f"https://example.com/{tab_id}", markdown="")
+        )
+
+    processing = asyncio.create_task(
+        tabs.process_tab_changes(
+            [
+                ChromeTab(id="a", url="https://example.org/a"),
+                ChromeTab(id="b", url="https://example.org/b"),
+                ChromeTab(id="new", url="https://example.org/new"),
+            ]
+        )
+    )
+    await asyncio.sleep(0.05)
+    # New tabs are captured right away, navigated ones wait for their document to load
+    assert [ids for ids, _, _ in manager.fetches] == [["new"]]
+    # Tab b moves on again while loading; the capture for that change replaces it
+    tabs.tab_states.put(TabReference(id="b", url="https://example.org/b2", markdown=""))
+    await asyncio.wait_for(processing, timeout=5)
+    assert [ids for ids, _, _ in manager.fetches] == [["new"], ["a"]]
+    assert tabs.tab_states.url("b") == "https://example.org/b2"
+
+
+async def test_fetch_scheduled_only_past_change_threshold():
+    tabs = ChromeTabs(FakeChromeManager())  # type: ignore[arg-type]
+    scheduler = tabs.chrome_manager.capture_scheduler
+    # Churn like ticking timestamps accumulates but stays below the threshold
+    for _ in range(10):
+        tabs._handle_dom_change("t", DomChange(added_nodes=1, text_added=5, text_removed=5))
+    assert ("update", "t") not in scheduler._debounces
+    assert tabs._pending_changes["t"] == DomChange(10, 0, 50, 50)
+
+    tabs._handle_dom_change("t", DomChange(added_nodes=4, text_added=300, focused=True))
+    assert ("update", "t") in scheduler._debounces
+    assert "t" not in tabs._pending_changes
+    assert tabs._focused_tab_id == "t"
+
+    tabs._stop_interaction_monitor("t")
+    assert ("update", "t") not in scheduler._debounces
+
+
+async def test_delta_appends_to_stored_markdown():
+    url = "https://example.com/feed"
+    delta = DomDelta(DeltaCursor("d1", 2), url, ["<p>Second post</p>", "<p>First post</p>"])
+    tabs = ChromeTabs(FakeChromeManager(deltas=[delta, None]))  # type: ignore[arg-type]
+    updates = []
+    tabs._on_interaction_update_callback = updates.append
+    tabs.tab_states.put(TabReference("t", url, "First post", html="<p>First post</p>"))
+    tabs._delta_states["t"] = DeltaState(DeltaCursor("d1", 1), 0, time.monotonic())
+
+    assert await tabs._apply_delta("t")
+    [ref] = updates
+    assert ref.markdown == "First post\n\nSecond post"
+    assert "Second post" in (ref.html or "")
+    # The callback had the delta HTML; the store keeps only the markdown
+    assert tabs.tab_states.snapshot() == {"t": ref._replace(html=None)}
+    assert tabs._delta_states["t"].cursor == DeltaCursor("d1", 2)
+
+    # The observer couldn't continue the sequence: fall back to a full snapshot
+    assert not await tabs._apply_delta("t")
+    assert "t" not in tabs._delta_states
+
+    # Too many deltas since the last snapshot: no delta is even requested
+    tabs._delta_states["t"] = DeltaState(
+        DeltaCursor("d1", 2), FULL_SNAPSHOT_EVERY_DELTAS, time.monotonic()
+    )
+    assert not await tabs._apply_delta("t")
+
+
+async def test_deltas_continue_only_from_a_stored_snapshot():
+    url = "https://example.com/feed"
+    manager = FakeChromeManager(deltas=[None])  # The delta after the first snapshot fails
+    tabs = ChromeTabs(manager)  # type: ignore[arg-type]
+    tabs.tab_states.put(TabReference("t", url, "First post"))
+
+    await tabs._fetch_and_update_tab_content("t")
+    ref = tabs.tab_states.get("t")
+    assert ref is not None and "Second post" in ref.markdown
+    assert tabs._delta_states["t"].cursor == manager.cursor
+
+    # Navigated while the snapshot was fetched: it isn't stored, so no delta may follow it
+    manager.release.clear()
+    fetching = asyncio.create_task(tabs._fetch_and_update_tab_content("t"))
+    await asyncio.sleep(0.01)
+    tabs.tab_states.put(TabReference("t", "https://example.com/other", ""))
+    manager.release.set()
+    await asyncio.wait_for(fetching, timeout=5)
+    assert tabs.tab_states.url("t") == "https://example.com/other"
+    assert "t" not in tabs._delta_states
+
+    # No URL for the tab: the capture is aborted, and so is the delta sequence
+    manager.page_url = None
+    await tabs._fetch_and_update_tab_content("t")
+    assert "t" not in tabs._delta_states
@@ -1,13 +1,14 @@
 import os
 import shutil
 import tempfile
-from datetime import datetime
+from datetime import datetime, timedelta
 
 import pytest
 
-from brocc_li.doc_db import DUCKDB_CHUNKS_TABLE, DocDB
+from brocc_li.doc_db import DUCKDB_CHUNKS_TABLE, DocDB, _item_words, _only_known_items
+from brocc_li.parsers.feed_items import feed_item, item_key
 from brocc_li.tests.generate_test_markdown import generate_test_markdown
-from brocc_li.types.doc import Doc, Source
+from brocc_li.types.doc import Chunk, Doc, Source
 from brocc_li.utils.logger import logger
 
 
@@ -406,6 +407,29 @@ def test_get_seen_urls(docdb):
     assert "https://example.com/3" in source1_urls
 
 
+def test_get_recently_stored_urls(docdb):
+    """Only URLs stored at or after the cutoff count as recent."""
+    now = datetime.now()
+    for i, ingested_at in enumerate([now, now - timedelta(days=2)]):
+        docdb.store_document(
+            Doc(
+                id=f"doc{i}",
+                url=f"https://example.com/{i}",
+                text_content=f"Content for doc{i}",
+                source=Source.CHROME,
+                source_location_identifier="location1",
+                ingested_at=Doc.format_date(ingested_at),
+            )
+        )
+
+    urls = ["https://example.com/0", "https://example.com/1", "https://example.com/2"]
+    assert docdb.get_recently_stored_urls(urls, since=now - timedelta(hours=1)) == {
+        "https://example.com/0"
+    }
+    assert len(docdb.get_recently_stored_urls(urls, since=now - timedelta(days=3))) == 2
+    assert docdb.get_recently_stored_urls([], since=now) == set()
+
+
 def test_get_documents(docdb):
     """Test retrieving multiple documents with filtering."""
     # Store multiple documents with different timestamps
@@ -603,9 +627,9 @@ def test_get_duckdb_chunks(docdb):
     # Convert to int if string for sorting comparison
     ordered_chunks = sorted(
         chunks,
-        key=lambda c: int(c["chunk_index"])
-        if isinstance(c["chunk_index"], str)
-        else c["chunk_index"],
+        key=lambda c: (
+            int(c["chunk_index"]) if isinstance(c["chunk_index"], str) else c["chunk_index"]
+        ),
     )
     for i, chunk in enumerate(ordered_chunks):
         chunk_idx = (
@@ -677,9 +701,9 @@ def test_store_document_with_rich_markdown_content(docdb):
     # Convert to int if string for sorting comparison
     ordered_chunks = sorted(
         chunks,
-        key=lambda c: int(c["chunk_index"])
-        if isinstance(c["chunk_index"], str)
-        else c["chunk_index"],
+        key=lambda c: (
+            int(c["chunk_index"]) if isinstance(c["chunk_index"], str) else c["chunk_index"]
+        ),
     )
     for i, chunk in enumerate(ordered_chunks):
         chunk_idx = (
@@ -1128,3 +1152,65 @@ def test_merge_at_boundaries(docdb):
     updated_chunks = docdb.get_duckdb_chunks(updated_doc["id"])
     reconstructed = docdb._reconstruct_text_from_chunks(updated_chunks)
     assert reconstructed == updated_text
+
+
+def test_feed_items_indexed_and_not_re_embedded(docdb, monkeypatch):
+    """Posts already stored from another page are indexed and kept, but not embedded again."""
+    embedded = {}
+    monkeypatch.setattr(
+        docdb,
+        "_store_lance_chunks",
+        lambda chunks, doc: embedded.setdefault(doc["id"], []).extend(chunks),
+    )
+    post_a = feed_item("https://x.com/alice/status/1", "### Alice\n\nFirst post")
+    post_b = feed_item("https://x.com/bob/status/2", "### Bob\n\nSecond post")
+    post_c = feed_item("https://x.com/carol/status/3", "### Carol\n\nThird post")
+
+    home = Doc(
+        id="items_home",
+        url="https://x.com/home",
+        text_content=f"{post_a.markdown}\n\n{post_b.markdown}",
+        source=Source.CHROME,
+        ingested_at=Doc.format_date(datetime.now()),
+    )
+    docdb.store_document(home, items=[post_a, post_b])
+    assert docdb.get_item_doc_ids(item_key(post_a)) == ["items_home"]
+
+    likes = Doc(
+        id="items_likes",
+        url="https://x.com/someone/likes",
+        text_content=f"# Likes\n\n{post_b.markdown}\n\n{post_c.markdown}",
+        source=Source.CHROME,
+        ingested_at=Doc.format_date(datetime.now()),
+    )
+    docdb.store_document(likes, items=[post_b, post_c])
+
+    # The likes doc keeps post_b's text, but only the home doc embeds it
+    likes_text = docdb._reconstruct_text_from_chunks(docdb.get_duckdb_chunks("items_likes"))
+    assert "Second post" in likes_text and "Third post" in likes_text
+    embedded_likes = " ".join(
+        part["text"] for chunk in embedded["items_likes"] for part in chunk.content
+    )
+    assert "Second post" not in embedded_likes
+    assert "Third post" in embedded_likes
+    assert set(docdb.get_item_doc_ids(item_key(post_b))) == {"items_home", "items_likes"}
+
+    # Known items are only those stored under a different URL
+    keys = [item_key(post_a), item_key(post_c), "https://x.com/dan/status/4"]
+    assert docdb.get_known_item_keys(keys) == {item_key(post_a), item_key(post_c)}
+    assert docdb.get_known_item_keys(keys, exclude_url="https://x.com/home") == {item_key(post_c)}
+
+
+def test_chunks_of_known_items_detected():
+    known = [_item_words(feed_item("a", "### [Alice](https://x.com/alice)\n\nFirst *post*"))]
+
+    def chunk(text: str) -> Chunk:
+        content = [{"type": "text", "text": text}]
+        return Chunk(id="c", doc_id="d", chunk_index=0, chunk_total=1, content=content)
+
+    assert _only_known_items(chunk("Alice\n\nFirst post"), known)
+    # Part of a known post split across chunks
+    assert _only_known_items(chunk("First post"), known)
+    assert not _only_known_items(chunk("Alice First post\n\nBob Second post"), known)
+    assert not _only_known_items(chunk("Intro\n\nAlice First post\n\nOutro"), known)
+    assert not _only_known_items(chunk(""), known)
@@ -1,6 +1,14 @@
 from datetime import datetime, timezone
 
-from brocc_li.utils.html_metadata import HtmlMetadata, extract_metadata
+import pytest
+from bs4 import BeautifulSoup
+
+from brocc_li.utils import html_metadata
+from brocc_li.utils.html_metadata import (
+    HtmlMetadata,
+    extract_metadata,
+    extract_metadata_from_soup,
+)
 
 
 class TestHtmlMetadata:
@@ -472,3 +480,51 @@ class TestHtmlMetadata:
 
         assert metadata.keywords == ["keyword1", "keyword2", "keyword3"]
         assert metadata.published_at == datetime(2023, 5, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+    def test_json_ld_parsed_once(self, monkeypatch: pytest.MonkeyPatch):
+        """Test that author, keyword and date fallbacks share one JSON-LD parse per script"""
+        html = """
+        <html>
+        <head>
+            <script type="application/ld+json">
+            {"author": {"name": "LD Author"}, "keywords": ["ld1", "ld2"]}
+            </script>
+            <script type="application/ld+json">[{"dateModified": "2023-05-07"}]</script>
+        </head>
+        </html>
+        """
+        calls = []
+        loads = html_metadata.json.loads
+        monkeypatch.setattr(html_metadata.json, "loads", lambda s: calls.append(s) or loads(s))
+        metadata = extract_metadata(html)
+
+        assert metadata.author == "LD Author"
+        assert metadata.keywords == ["ld1", "ld2"]
+        assert metadata.published_at == datetime(2023, 5, 7)
+        assert len(calls) == 2
+
+    def test_html_and_soup_extraction_agree(self):
+        """Test that the lxml path and the BeautifulSoup path resolve the same values"""
+        html = """
+        <html>
+        <head>
+            <title>Fallback Title</title>
+            <meta name="author">
+            <meta name="author" content="Second Meta Author">
+            <link rel="stylesheet icon" href="/icon.png">
+            <script type="application/ld+json">{bad json</script>
+        </head>
+        <body>
+            <template><div class="byline">Hidden Author</div></template>
+            <div class="post-author">By Visible Author<script>var x = 1;</script></div>
+            <time datetime="May 8, 2023">May 8</time>
+        </body>
+        </html>
+        """
+        metadata = extract_metadata(html)
+        # Only the first <meta name="author"> counts; template text is not rendered
+        assert metadata.author == "Visible Author"
+        assert metadata.title == "Fallback Title"
+        assert metadata.favicon == "/icon.png"
+        assert metadata.published_at == datetime(2023, 5, 8)
+        assert extract_metadata_from_soup(BeautifulSoup(html, "lxml")) == metadata
@@ -10,11 +10,14 @@ Running `make chrome` saves new fixtures from open Chrome tabs.
 import re
 import time
 from pathlib import Path
+from unittest import mock
 
 import pytest
+from bs4 import BeautifulSoup
 
 import brocc_li.html_to_md
-from brocc_li.html_to_md import html_to_md, run_with_timeout
+from brocc_li.html_to_md import clean_html, convert_page, html_to_md, run_with_timeout
+from brocc_li.parser_registry import ParserRoute
 from brocc_li.utils.logger import logger
 
 # Set to True to enable debug logging
@@ -190,14 +193,14 @@ def test_fixture_conversion(fixtures_dir: Path, fixture_name: str):
     assert_valid_markdown(markdown, fixture_name)
 
 
-def test_parser_timeout():
-    """Test that parser timeout works correctly."""
+def slow_parser(html: str, debug: bool = False) -> str:
+    """Parser that sleeps longer than short timeouts (module-level so workers can unpickle it)."""
+    time.sleep(0.3)  # Sleep for just 0.3 seconds
+    return "Parsed content"
 
-    # Create a mock parser function that sleeps longer than the timeout
-    def slow_parser(html: str, debug: bool = False) -> str:
-        time.sleep(0.3)  # Sleep for just 0.3 seconds
-        return "Parsed content"
 
+def test_parser_timeout():
+    """Test that parser timeout works correctly."""
     # Run with a very short timeout (0.1 second)
     result = run_with_timeout(slow_parser, "<html></html>", timeout=0.1, debug=False)
 
@@ -210,17 +213,12 @@ def test_parser_timeout():
     # Should return the expected result
     assert result == "Parsed content"
 
-    # Test directly with convert_html_to_markdown function
-    # Register a test pattern temporarily
-    original_registry = brocc_li.html_to_md.PARSER_REGISTRY.copy()
-
     # Create minimal HTML that the generic parser can handle
     minimal_html = """<html><body><h1>Test</h1><p>Content</p></body></html>"""
 
-    try:
-        # Add our slow parser to the registry with a real regex pattern
-        brocc_li.html_to_md.PARSER_REGISTRY[r"https://test-timeout-url\.com"] = slow_parser
-
+    # Route the test URL to our slow parser (loaded lazily by module path, like real parsers)
+    slow_route = ParserRoute(re.compile(r"https://test-timeout-url\.com"), __name__, "slow_parser")
+    with mock.patch("brocc_li.html_to_md.resolve_parser", return_value=slow_route):
         # Call with short timeout using a matching URL
         result = html_to_md(minimal_html, url="https://test-timeout-url.com", timeout=0.1)
 
@@ -228,9 +226,6 @@ def test_parser_timeout():
         assert result is not None
         assert "Test" in result
         assert "Parsed content" not in result  # Our slow parser's output shouldn't be there
-    finally:
-        # Restore original registry
-        brocc_li.html_to_md.PARSER_REGISTRY = original_registry
 
 
 def test_url_conversion():
@@ -267,3 +262,117 @@ def test_url_conversion():
     assert (
         "(https://absolute.com/image.jpg)" in markdown_with_base
     )  # Absolute URLs remain unchanged
+
+
+def test_clean_html_removes_noise_in_one_pass():
+    """Scripts, handlers, comments and the banner go; everything else stays in order."""
+    html = """
+    <html><body>
+        <!-- tracking comment -->
+        <div id="keep"><p>Visible text</p><script>var x = 1;</script></div>
+        <div onclick="track()"><p>Clickable widget</p></div>
+        <p>🥦 reading 12 PAGES</p>
+        <svg><text>vector label</text></svg>
+        <p>Tail text</p>
+    </body></html>
+    """
+    soup = clean_html(html)
+    text = soup.get_text(" ", strip=True)
+
+    assert text == "Visible text Tail text"
+    assert soup.find(id="keep") is not None
+    assert not soup.find_all(["script", "svg"])
+    assert "tracking comment" not in str(soup)
+
+
+def test_scan_content_tree_matches_bs4():
+    """Single-pass stats and selector matches agree with find_all/get_text/select_one."""
+    html = """
+    <html><body>
+        <div class="page"><p>Intro</p>
+            <div id="content" class="post content">
+                <h2>Title</h2><p>First <b>bold</b> para</p><!-- note --><p>  Second  </p>
+                <template><p>hidden</p></template>
+                <div class="content"><p>Nested</p><p><span>Deep</span> text</p><h3>Sub</h3></div>
+            </div>
+        </div>
+        <main><article><p>Article text</p></article></main>
+    </body></html>
+    """
+    selectors = brocc_li.html_to_md.MAIN_CONTENT_SELECTORS + ["div > p"]
+    soup = BeautifulSoup(html, "lxml")
+    scan = brocc_li.html_to_md.scan_content_tree(soup, selectors)
+
+    for tag in [soup, *soup.find_all()]:
+        if tag.name == "template":
+            continue  # Its own get_text counts template strings; never a content candidate
+        paragraphs = tag.find_all("p")
+        assert scan.stats[id(tag)] == (
+            len(tag.find_all()),
+            len(tag.get_text(strip=True)),
+            len(paragraphs),
+            len(tag.find_all(["h1", "h2", "h3", "h4", "h5", "h6"])),
+            sum(len(p.get_text(strip=True)) for p in paragraphs),
+        ), tag.name
+    for selector in selectors:
+        assert scan.selector_matches.get(selector) is soup.select_one(selector), selector
+    assert scan.divs == soup.find_all("div")
+
+
+def test_convert_page_extracts_metadata_from_same_parse():
+    """Metadata comes from the same tree as the markdown, before cleaning strips scripts."""
+    html = """
+    <html>
+    <head>
+        <title>Page Title</title>
+        <meta name="description" content="Page description">
+        <script type="application/ld+json">{"author": {"name": "Jane Doe"}}</script>
+    </head>
+    <body>
+        <article>
+            <h1>Heading</h1>
+            <p>First paragraph with enough text to count as real content on the page.</p>
+            <p>Second paragraph with enough text to count as real content on the page.</p>
+        </article>
+    </body>
+    </html>
+    """
+    page = convert_page(html, url="https://example.com/post")
+
+    assert page.markdown is not None
+    assert "# Heading" in page.markdown
+    assert page.markdown == html_to_md(html, url="https://example.com/post")
+    assert page.metadata is not None
+    assert page.metadata.title == "Page Title"
+    assert page.metadata.description == "Page description"
+    assert page.metadata.author == "Jane Doe"
+
+
+def test_conversion_cache_hits_on_identical_html():
+    """Converting byte-identical HTML again is served from the cache."""
+    brocc_li.html_to_md.clear_conversion_cache()
+    html = "<html><body><article><h1>Cached</h1><p>Same bytes twice.</p></article></body></html>"
+    url = "https://example.com/cached"
+
+    first = convert_page(html, url=url)
+    with mock.patch("brocc_li.html_to_md.parse_html") as parse_html:
+        second = convert_page(html, url=url)
+        parse_html.assert_not_called()
+
+    assert not first.cached
+    assert second.cached
+    assert second.markdown == first.markdown
+    assert second.metadata == first.metadata
+
+    # Any change to the HTML is a miss
+    assert not convert_page(html.replace("twice", "again"), url=url).cached
+
+
+def test_conversion_cache_skips_timed_out_parsers():
+    """A fallback produced after a parser timeout isn't cached, so the parser gets another try."""
+    brocc_li.html_to_md.clear_conversion_cache()
+    html = """<html><body><h1>Test</h1><p>Content</p></body></html>"""
+    slow_route = ParserRoute(re.compile(r"https://test-timeout-url\.com"), __name__, "slow_parser")
+    with mock.patch("brocc_li.html_to_md.resolve_parser", return_value=slow_route):
+        assert not convert_page(html, url="https://test-timeout-url.com", timeout=0.1).cached
+        assert not convert_page(html, url="https://test-timeout-url.com", timeout=0.1).cached
@@ -0,0 +1,80 @@
+"""
+Parity checks for the generic converter's parser backends.
+
+html5lib is the spec-compliant reference. Faster backends may nest malformed markup
+differently (e.g. lxml keeps nested <a> tags), so outputs are compared on word recall
+rather than byte equality.
+"""
+
+import importlib.util
+import re
+from collections import Counter
+from functools import lru_cache
+from pathlib import Path
+
+import pytest
+
+from brocc_li.html_to_md import ParserBackend, html_to_md
+from brocc_li.tests.test_html_to_md import assert_valid_markdown
+
+FIXTURES_DIR = Path(__file__).parent / "html_fixtures"
+FIXTURE_NAMES = [fixture.name for fixture in sorted(FIXTURES_DIR.glob("_*.html"))]
+
+# Minimum share of the reference output's words the backend output must contain
+MIN_WORD_RECALL = 0.9
+
+FAST_BACKENDS = [
+    ParserBackend.LXML,
+    pytest.param(
+        ParserBackend.SELECTOLAX,
+        marks=pytest.mark.skipif(
+            importlib.util.find_spec("selectolax") is None,
+            reason="selectolax not installed",
+        ),
+    ),
+]
+
+
+def _convert(fixture_name: str, backend: ParserBackend):
+    html = (FIXTURES_DIR / fixture_name).read_text(encoding="utf-8")
+    slug = fixture_name.removeprefix("_").removesuffix(".html")
+    return html_to_md(html, url=slug, parser_backend=backend)
+
+
+@lru_cache(maxsize=None)
+def _reference(fixture_name: str):
+    return _convert(fixture_name, ParserBackend.HTML5LIB)
+
+
+def _words(markdown: str) -> Counter[str]:
+    return Counter(re.findall(r"\w+", markdown.lower()))
+
+
+@pytest.mark.parametrize("backend", FAST_BACKENDS)
+@pytest.mark.parametrize("fixture_name", FIXTURE_NAMES)
+def test_backend_parity(fixture_name: str, backend: ParserBackend):
+    reference = _reference(fixture_name)
+    markdown = _convert(fixture_name, backend)
+
+    if reference is None:
+        assert markdown is None, f"{backend.value} produced output where html5lib produced none"
+        return
+
+    assert markdown is not None, f"{backend.value} produced no output for {fixture_name}"
+    assert_valid_markdown(markdown, fixture_name)
+
+    reference_words = _words(reference)
+    recall = sum((reference_words & _words(markdown)).values()) / sum(reference_words.values())
+    assert recall >= MIN_WORD_RECALL, (
+        f"{backend.value} output for {fixture_name} only covers {recall:.1%} of html5lib words"
+    )
+
+
+def test_selectolax_falls_back_without_dependency(monkeypatch: pytest.MonkeyPatch):
+    import brocc_li.html_to_md
+
+    monkeypatch.setattr(brocc_li.html_to_md, "_lexbor_strip", lambda html: None)
+    html = "<html><body><article><h1>Title</h1><p>Body text</p></article></body></html>"
+    markdown = html_to_md(html, parser_backend=ParserBackend.SELECTOLAX)
+    assert markdown is not None
+    assert "# Title" in markdown
@@ -1,13 +1,14 @@
-import re
-from typing import Callable, Dict, Optional, Tuple
+import pickle
+import subprocess
+import sys
+from typing import Callable, Optional, Tuple
 from unittest import mock
 
 import pytest
 
-from brocc_li.html_to_md import (  # Import the registry itself
-    PARSER_REGISTRY,
-    html_to_md,
-)
+from brocc_li.html_to_md import clear_conversion_cache, convert_page, html_to_md
+from brocc_li.parser_pool import ParserPool
+from brocc_li.parser_registry import resolve_parser
 
 # Import all the specific parser functions referenced in the registry
 from brocc_li.parsers.bsky_feed import bsky_feed_html_to_md
@@ -42,6 +43,7 @@ from brocc_li.parsers.twitter_profile_followers import twitter_followers_html_to
 from brocc_li.parsers.twitter_thread import twitter_thread_html_to_md
 from brocc_li.parsers.youtube_history import youtube_history_html_to_md
 from brocc_li.parsers.youtube_home import youtube_home_html_to_md
+from brocc_li.tests.parsers.get_fixture import get_fixture
 
 # Define realistic test cases: (URL, expected_parser_function_or_None)
 # Using None signifies that the generic parser should be used.
@@ -162,30 +164,74 @@ TEST_CASES: list[Tuple[str, Optional[Callable]]] = [
 ]
 
 
-def find_matching_parser(url: str, registry: Dict[str, Callable]) -> Optional[Callable]:
-    """Helper to find the first matching parser in the registry."""
-    for pattern, parser_func in registry.items():
-        if re.match(pattern, url):
-            return parser_func
-    return None
-
-
 @pytest.mark.parametrize("url, expected_parser", TEST_CASES)
 def test_parser_registry_mapping(url: str, expected_parser: Optional[Callable]):
     """Verify that URLs correctly map to the expected parser function or None."""
-    matched_parser = find_matching_parser(url, PARSER_REGISTRY)
+    route = resolve_parser(url)
 
     if expected_parser:
-        assert matched_parser is not None, f"Expected a parser for URL: {url}, but got None"
-        assert matched_parser.__name__ == expected_parser.__name__, (
-            f"URL {url} matched {matched_parser.__name__}, expected {expected_parser.__name__}"
+        assert route is not None, f"Expected a parser for URL: {url}, but got None"
+        assert route.load() is expected_parser, (
+            f"URL {url} matched {route.function}, expected {expected_parser.__name__}"
         )
     else:
-        assert matched_parser is None, (
-            f"Expected no specific parser for URL: {url}, but matched {matched_parser.__name__ if matched_parser else 'None'}"
+        assert route is None, (
+            f"Expected no specific parser for URL: {url}, but matched {route.function if route else 'None'}"
         )
 
 
+def test_lazy_parser_unpickles_as_real_function():
+    route = resolve_parser("https://x.com/home")
+    assert route is not None
+    assert pickle.loads(pickle.dumps(route.parser)) is twitter_feed_html_to_md
+
+
+def test_convert_page_returns_items_from_the_same_parse():
+    url = "https://x.com/home"
+    html = get_fixture("_x-home.html")
+    route = resolve_parser(url)
+    assert route is not None
+    items_parser = route.load_items()
+    assert items_parser is not None
+    pool = ParserPool(workers=1)
+    try:
+        with mock.patch("brocc_li.html_to_md.get_parser_pool", return_value=pool):
+            page = convert_page(html, url, timeout=60)
+        assert pool._live  # Parsed by a worker, not in this process
+    finally:
+        pool.shutdown()
+    assert page.items is not None and page.items == list(items_parser(html))
+    assert page.markdown == route.load()(html)
+    assert convert_page("<p>Hello</p>", "https://example.com/").items is None
+
+
+def test_importing_html_to_md_does_not_import_parsers():
+    code = (
+        "import sys, brocc_li.html_to_md; "
+        "print([m for m in sys.modules if m.startswith('brocc_li.parsers.')])"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "[]"
+
+
+@pytest.fixture(autouse=True)
+def fresh_conversion_cache():
+    """The tests below patch conversion internals, so earlier cached results must not leak in."""
+    clear_conversion_cache()
+    yield
+    clear_conversion_cache()
+
+
+@pytest.fixture
+def inline_parser_pool():
+    """Mock parsers can't be pickled into worker processes, so run them inline."""
+    with mock.patch("brocc_li.html_to_md.get_parser_pool", return_value=ParserPool(workers=0)):
+        yield
+
+
+@pytest.mark.usefixtures("inline_parser_pool")
 def test_convert_html_to_markdown_with_specific_parsers():
     """Test that convert_html_to_markdown correctly selects and uses specific parsers based on URL."""
     # Test sample URLs
@@ -204,28 +250,18 @@ def test_convert_html_to_markdown_with_specific_parsers():
 
     for url, _parser_func in test_cases:
         # Instead of trying to mock the specific function itself (which doesn't work because
-        # the convert_html_to_markdown function accesses it through the registry),
-        # we'll patch the registry lookup mechanism
-
-        try:
-            # Mock the pattern matching to always return our mock parser for any URL
-            with mock.patch("brocc_li.html_to_md.re.match", return_value=True):
-                # Mock the first parser in the registry to be our mock_parser
-                with mock.patch.dict(
-                    PARSER_REGISTRY, {list(PARSER_REGISTRY.keys())[0]: mock_parser}
-                ):
-                    # Call the function
-                    result = html_to_md(html_content, url=url)
-
-                    # Verify mock was called and returned expected output
-                    mock_parser.assert_called_once()
-                    assert result == expected_output
+        # html_to_md loads it lazily through the registry), we patch the route lookup
+        mock_route = mock.Mock(parser=mock_parser, function="mock_parser", item_function=None)
+        with mock.patch("brocc_li.html_to_md.resolve_parser", return_value=mock_route):
+            # Call the function
+            result = html_to_md(html_content, url=url)
 
-                    # Clear the mock for the next test case
-                    mock_parser.reset_mock()
+            # Verify mock was called and returned expected output
+            mock_parser.assert_called_once()
+            assert result == expected_output
 
-        finally:
-            pass
+            # Clear the mock for the next test case
+            mock_parser.reset_mock()
 
 
 def test_convert_html_to_markdown_fallback_to_generic():
@@ -234,10 +270,10 @@ def test_convert_html_to_markdown_fallback_to_generic():
     html_content = "<html><body><p>Test content</p></body></html>"
     expected_output = "# Generic Parser Output"
 
-    # We'll patch the re.match to ensure no patterns match
-    with mock.patch("brocc_li.html_to_md.re.match", return_value=False):
+    # We'll patch the route lookup to ensure no patterns match
+    with mock.patch("brocc_li.html_to_md.resolve_parser", return_value=None):
         # And then mock the generic conversion to return our expected output
-        with mock.patch("brocc_li.html_to_md.md", return_value=expected_output):
+        with mock.patch("brocc_li.html_to_md.soup_to_md", return_value=expected_output):
             # Call the function
             result = html_to_md(html_content, url=url)
 
@@ -245,6 +281,7 @@ def test_convert_html_to_markdown_fallback_to_generic():
             assert result == expected_output
 
 
+@pytest.mark.usefixtures("inline_parser_pool")
 def test_convert_html_to_markdown_handles_exceptions():
     """Test that convert_html_to_markdown properly handles exceptions from specific parsers."""
     url = "https://twitter.com/jack/status/1234567890"
@@ -259,30 +296,28 @@ def test_convert_html_to_markdown_handles_exceptions():
     mock_logger = mock.MagicMock()
 
     # First mock the specific parser to raise an exception
-    with mock.patch("brocc_li.html_to_md.re.match", return_value=True):
-        first_parser_key = list(PARSER_REGISTRY.keys())[0]
-
-        with mock.patch.dict(PARSER_REGISTRY, {first_parser_key: error_parser}):
-            # Mock the logger to avoid the exc_info issue
-            with mock.patch("brocc_li.html_to_md.logger", mock_logger):
-                # Then mock the generic parser fallback
-                with mock.patch("brocc_li.html_to_md.md", return_value=expected_output):
+    error_route = mock.Mock(
+        parser=error_parser, function="mock_parser_with_error", item_function=None
+    )
+    with mock.patch("brocc_li.html_to_md.resolve_parser", return_value=error_route):
+        # Mock the logger to avoid the exc_info issue
+        with mock.patch("brocc_li.html_to_md.logger", mock_logger):
+            # Then mock the generic parser fallback
+            with mock.patch("brocc_li.html_to_md.soup_to_md", return_value=expected_output):
+                with mock.patch("brocc_li.html_to_md.clean_soup", return_value=mock.MagicMock()):
                     with mock.patch(
-                        "brocc_li.html_to_md.clean_html", return_value=mock.MagicMock()
+                        "brocc_li.html_to_md.extract_content", return_value=mock.MagicMock()
                     ):
-                        with mock.patch(
-                            "brocc_li.html_to_md.extract_content", return_value=mock.MagicMock()
-                        ):
-                            with mock.patch("brocc_li.html_to_md.get_strip_list", return_value=[]):
-                                with mock.patch(
-                                    "brocc_li.html_to_md.post_process_markdown",
-                                    return_value=expected_output,
-                                ):
-                                    # Call the function
-                                    result = html_to_md(html_content, url=url)
-
-                                    # Verify the error was logged
-                                    mock_logger.error.assert_called_once()
-
-                                    # It should have fallen back to the generic parser
-                                    assert result == expected_output
+                        with mock.patch("brocc_li.html_to_md.get_strip_list", return_value=[]):
+                            with mock.patch(
+                                "brocc_li.html_to_md.post_process_markdown",
+                                return_value=expected_output,
+                            ):
+                                # Call the function
+                                result = html_to_md(html_content, url=url)
+
+                                # Verify the error was logged
+                                mock_logger.error.assert_called_once()
+
+                                # It should have fallen back to the generic parser
+                                assert result == expected_output
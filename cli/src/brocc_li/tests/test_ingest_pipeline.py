@@ -0,0 +1,104 @@
+import threading
+import time
+from typing import List, Optional, Sequence
+
+from brocc_li.doc_db import PreparedDocument, VectorUpdate
+from brocc_li.ingest_pipeline import IngestPipeline, _LatestPerPage
+from brocc_li.parsers.feed_items import FeedItem
+from brocc_li.tab_state import TabReference
+from brocc_li.types.doc import Doc
+
+
+class FakeDocDB:
+    """Stands in for DocDB: records writes, optionally held until released."""
+
+    def __init__(self, write_seconds: float = 0.0):
+        self.write_seconds = write_seconds
+        self.release = threading.Event()
+        self.release.set()
+        self.lock = threading.Lock()
+        self.writing = 0
+        self.max_writing = 0
+        self.written: List[str] = []
+        self.vectors: List[str] = []
+
+    def prepare_document(
+        self, document: Doc, items: Optional[Sequence[FeedItem]] = None
+    ) -> PreparedDocument:
+        return PreparedDocument(document.model_dump(), document.text_content or "", [], items)
+
+    def write_document(self, prepared: PreparedDocument) -> Optional[VectorUpdate]:
+        self.release.wait()
+        with self.lock:
+            self.writing += 1
+            self.max_writing = max(self.max_writing, self.writing)
+        time.sleep(self.write_seconds)
+        with self.lock:
+            self.writing -= 1
+            self.written.append(prepared.doc_data["url"])
+        return VectorUpdate(prepared.doc_data["id"], prepared.doc_data, [], replace=False)
+
+    def store_vectors(self, update: VectorUpdate) -> None:
+        with self.lock:
+            self.vectors.append(update.doc_data["url"])
+
+
+def tab_ref(i: int) -> TabReference:
+    return TabReference(
+        id=f"tab{i}",
+        url=f"https://example.com/{i}",
+        markdown=f"# Page {i}",
+        html=f"<html><head><title>Page {i}</title></head><body><h1>Page {i}</h1></body></html>",
+    )
+
+
+def test_tabs_stored_through_one_writer():
+    db = FakeDocDB(write_seconds=0.01)
+    pipeline = IngestPipeline(db, metadata_workers=3, chunk_workers=3)  # type: ignore[arg-type]
+    pipeline.start()
+    for i in range(12):
+        assert pipeline.submit(tab_ref(i))
+    # Nothing to store without markdown
+    pipeline.submit(tab_ref(12)._replace(markdown=""))
+    assert pipeline.stop(timeout=5)
+
+    expected = {f"https://example.com/{i}" for i in range(12)}
+    assert set(db.written) == expected and len(db.written) == 12
+    assert set(db.vectors) == expected
+    assert db.max_writing == 1
+
+
+def test_submit_neither_waits_nor_drops_while_stages_full():
+    db = FakeDocDB()
+    db.release.clear()
+    pipeline = IngestPipeline(
+        db,  # type: ignore[arg-type]
+        metadata_workers=1,
+        chunk_workers=1,
+        embed_workers=1,
+        queue_size=1,
+    )
+    pipeline.start()
+    try:
+        # Every stage fills up behind the held writer; the intake takes the rest
+        started = time.monotonic()
+        assert all(pipeline.submit(tab_ref(i)) for i in range(20))
+        assert time.monotonic() - started < 1
+    finally:
+        db.release.set()
+        assert pipeline.stop(timeout=5)
+    assert sorted(db.written) == sorted(f"https://example.com/{i}" for i in range(20))
+
+
+def test_intake_keeps_latest_capture_per_page():
+    intake = _LatestPerPage()
+    first, other = tab_ref(1), tab_ref(2)
+    newer = first._replace(markdown="# Page 1, scrolled")
+    navigated = first._replace(url="https://example.com/elsewhere")
+    intake.offer(first)
+    intake.offer(other)
+    # A newer capture of a queued page takes its place; another page of the tab is queued too
+    intake.offer(newer)
+    intake.offer(navigated)
+    assert intake.qsize() == 3
+    assert [intake.get(), intake.get(), intake.get()] == [newer, other, navigated]
@@ -4,6 +4,7 @@ from brocc_li.merge_md import (
     MergeResult,
     MergeResultType,
     _split_into_blocks,
+    append_md,
     merge_md,
 )  # Import helper
 
@@ -332,3 +333,15 @@ def test_merge_md(old_md, new_md, expected_type, expected_content):
     assert isinstance(result, MergeResult)
     assert result.type == expected_type
     assert result.content == expected_content
+
+
+def test_append_md_keeps_old_blocks_and_adds_new_ones():
+    delta = "Block D\n\nBlock E\n\nBlock E\n\n  Block A  "
+    result = append_md(OLD_MD_BASE, delta)
+    assert result.type == MergeResultType.MERGED
+    assert result.content == normalize_md(OLD_MD_BASE + "\n\nBlock E")
+
+
+def test_append_md_empty_delta_or_old():
+    assert append_md(OLD_MD_BASE, "").content == normalize_md(OLD_MD_BASE)
+    assert append_md(None, "Block X") == MergeResult(MergeResultType.KEPT_NEW, "Block X")
@@ -0,0 +1,121 @@
+import os
+import threading
+import time
+from typing import Optional
+
+import pytest
+
+from brocc_li import parser_pool
+from brocc_li.parser_pool import ParserPool
+
+# Spawning and unpickling happen before the parse clock starts, so this holds for cold workers too
+TIMEOUT = 5
+
+
+def worker_pid() -> int:
+    return os.getpid()
+
+
+def sleep_then_return(seconds: float) -> str:
+    time.sleep(seconds)
+    return "done"
+
+
+def raise_error() -> None:
+    raise ValueError("bad markup")
+
+
+@pytest.fixture
+def pool():
+    pool = ParserPool(workers=1)
+    yield pool
+    pool.shutdown()
+
+
+def test_runs_job_in_worker_process(pool: ParserPool):
+    job = pool.run(worker_pid, timeout=TIMEOUT)
+    assert job.error is None
+    assert not job.timed_out
+    assert job.result != os.getpid()
+    # Workers are persistent
+    assert pool.run(worker_pid, timeout=TIMEOUT).result == job.result
+
+
+def test_reports_parse_time(pool: ParserPool):
+    job = pool.run(sleep_then_return, 0.2, timeout=TIMEOUT)
+    assert job.result == "done"
+    assert 0.2 <= job.elapsed < TIMEOUT
+
+
+def test_timeout_kills_and_replaces_worker(pool: ParserPool):
+    first_pid = pool.run(worker_pid, timeout=TIMEOUT).result
+
+    start = time.perf_counter()
+    job = pool.run(sleep_then_return, 60, timeout=0.2)
+    assert job.timed_out
+    assert job.result is None
+    assert time.perf_counter() - start < 10
+
+    # The stuck worker is gone and a fresh one takes the next job
+    next_pid = pool.run(worker_pid, timeout=TIMEOUT).result
+    assert next_pid is not None
+    assert next_pid != first_pid
+
+
+def test_worker_that_died_while_idle_is_replaced(pool: ParserPool):
+    first_pid = pool.run(worker_pid, timeout=TIMEOUT).result
+    [worker] = pool._live
+    worker.process.kill()
+    worker.process.join()
+
+    job = pool.run(worker_pid, timeout=TIMEOUT)
+    assert job.result is None
+    assert job.error is not None and "Worker died" in job.error
+    # The dead worker didn't go back to the idle queue
+    next_pid = pool.run(worker_pid, timeout=TIMEOUT).result
+    assert next_pid is not None and next_pid != first_pid
+
+
+def test_parser_exception_is_reported(pool: ParserPool):
+    job = pool.run(raise_error, timeout=TIMEOUT)
+    assert job.result is None
+    assert job.error is not None and "bad markup" in job.error
+
+
+def test_unpicklable_job_fails_fast(pool: ParserPool):
+    job = pool.run(lambda: "nope", timeout=TIMEOUT)
+    assert job.result is None
+    assert job.error is not None
+
+
+def test_inline_mode_runs_in_process():
+    job = ParserPool(workers=0).run(worker_pid, timeout=0)
+    assert job.result == os.getpid()
+
+
+def test_waiting_job_gives_up_on_shutdown(pool: ParserPool):
+    busy = threading.Thread(target=pool.run, args=(sleep_then_return, 2), kwargs={"timeout": 10})
+    busy.start()
+    while not pool._live:
+        time.sleep(0.01)
+
+    # The only worker is busy, so this job waits for it until the pool shuts down
+    results = []
+    waiting = threading.Thread(target=lambda: results.append(pool.run(worker_pid, timeout=10)))
+    waiting.start()
+    time.sleep(0.1)
+    pool.shutdown()
+    waiting.join(timeout=5)
+    busy.join(timeout=5)
+    assert not waiting.is_alive()
+    assert results[0].error == "Parser pool is shut down"
+
+
+@pytest.mark.parametrize("value, expected", [("3", 3), ("0", 0), ("-1", 0), ("lots", None)])
+def test_worker_count_from_env(
+    monkeypatch: pytest.MonkeyPatch, value: str, expected: Optional[int]
+):
+    monkeypatch.delenv("BROCC_PARSER_WORKERS", raising=False)
+    default = parser_pool._default_workers()
+    monkeypatch.setenv("BROCC_PARSER_WORKERS", value)
+    assert parser_pool._default_workers() == (default if expected is None else expected)
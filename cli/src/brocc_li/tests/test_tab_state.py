@@ -0,0 +1,70 @@
+import os
+
+import pytest
+
+from brocc_li.tab_state import TabReference, TabStateStore
+
+
+def test_put_if_version_drops_stale_writes():
+    store = TabStateStore()
+    assert store.put(TabReference("t", "https://example.com/a", ""), if_version=0)
+    fetched_at = store.version("t")
+
+    # The tab navigates while a capture of the old page is in flight
+    store.put(TabReference("t", "https://example.com/b", ""))
+    assert not store.put(TabReference("t", "https://example.com/a", "old"), if_version=fetched_at)
+    assert store.get("t") == TabReference("t", "https://example.com/b", "")
+
+    # A closed tab isn't brought back by a late write
+    fetched_at = store.version("t")
+    store.discard("t")
+    assert not store.put(TabReference("t", "https://example.com/b", "late"), if_version=fetched_at)
+    assert "t" not in store
+    assert store.version("t") == 0
+
+
+def test_snapshot_is_read_only_and_stable():
+    store = TabStateStore()
+    store.put(TabReference("a", "https://example.com/a", "A"))
+    snapshot = store.snapshot()
+
+    store.put(TabReference("a", "https://example.com/a", "A2"))
+    store.put(TabReference("b", "https://example.com/b", "B"))
+    assert dict(snapshot) == {"a": TabReference("a", "https://example.com/a", "A")}
+    assert len(store) == 2 and sorted(store) == ["a", "b"]
+    with pytest.raises(TypeError):
+        snapshot["c"] = TabReference("c", "https://example.com/c", "")  # type: ignore[index]
+
+
+def test_html_released_but_still_matched():
+    store = TabStateStore()
+    store.put(TabReference("t", "https://example.com/", "Hello", html="<p>Hello</p>"))
+    version = store.version("t")
+    store.release_html("t", if_version=version - 1)  # Stale: rewritten since
+    assert store.get("t").html == "<p>Hello</p>"  # type: ignore[union-attr]
+
+    store.release_html("t", if_version=version)
+    assert store.get("t") == TabReference("t", "https://example.com/", "Hello")
+    assert store.html_matches("t", "<p>Hello</p>")
+    assert not store.html_matches("t", "<p>Hello again</p>")
+
+
+def test_least_recently_used_markdown_spills_to_disk():
+    pages = {tab_id: f"# Page {tab_id}\n\n" + " ".join(map(str, range(2000))) for tab_id in "abc"}
+    store = TabStateStore(max_resident_bytes=1)  # Only the newest tab stays in memory
+    for tab_id, markdown in pages.items():
+        store.put(TabReference(tab_id, f"https://example.com/{tab_id}", markdown))
+    assert list(store._resident) == ["c"]
+
+    # Reading a spilled tab brings it back and spills the least recently used one
+    assert store.get("a").markdown == pages["a"]  # type: ignore[union-attr]
+    assert list(store._resident) == ["a"]
+    assert store.snapshot()["b"].markdown == pages["b"]
+
+    # Rewriting or dropping a spilled tab leaves no file behind
+    store.put(TabReference("a", "https://example.com/a", "new"))
+    assert store.discard("b") == "https://example.com/b"
+    spill_dir = store._spill_dir
+    assert spill_dir is not None and len(os.listdir(spill_dir)) == 1  # c, spilled for a
+    store.clear()
+    assert not os.path.exists(spill_dir)
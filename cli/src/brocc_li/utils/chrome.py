@@ -3,7 +3,8 @@ import os
 import platform
 import shutil
 import subprocess
-from typing import Optional
+from contextlib import asynccontextmanager
+from typing import AsyncGenerator, Optional
 
 import aiohttp
 import psutil
@@ -13,6 +14,18 @@ from brocc_li.utils.logger import logger
 REMOTE_DEBUG_PORT = 9222
 
 
+@asynccontextmanager
+async def client_session(
+    session: Optional[aiohttp.ClientSession] = None,
+) -> AsyncGenerator[aiohttp.ClientSession, None]:
+    """The caller's pooled HTTP session, or a one-off session when none is given."""
+    if session is not None:
+        yield session
+    else:
+        async with aiohttp.ClientSession() as one_off:
+            yield one_off
+
+
 def find_chrome_path() -> Optional[str]:
     """Find Chrome executable path based on the current platform."""
     system = platform.system().lower()
@@ -65,12 +78,16 @@ def find_chrome_path() -> Optional[str]:
     return None
 
 
-async def is_chrome_debug_port_active(port: int = REMOTE_DEBUG_PORT) -> bool:
+async def is_chrome_debug_port_active(
+    port: int = REMOTE_DEBUG_PORT, session: Optional[aiohttp.ClientSession] = None
+) -> bool:
     """Check if Chrome is running with debug port active by attempting to connect to it."""
     try:
         timeout = aiohttp.ClientTimeout(total=1.0)
-        async with aiohttp.ClientSession(timeout=timeout) as session:
-            async with session.get(f"http://localhost:{port}/json/version") as response:
+        async with client_session(session) as http:
+            async with http.get(
+                f"http://localhost:{port}/json/version", timeout=timeout
+            ) as response:
                 return response.status == 200
     except Exception:
         return False
@@ -1,9 +1,39 @@
+import json
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from functools import cached_property
+from typing import Any, Dict, Iterator, List, Mapping, Optional, Tuple, Union
 
 from bs4 import BeautifulSoup, Tag
+from dateutil import parser as date_parser
+from lxml import etree  # pyright: ignore[reportAttributeAccessIssue]
 from pydantic import BaseModel, HttpUrl, field_validator
 
+# lxml ships without type information
+LxmlElement = Any
+Attrs = Mapping[str, Union[str, List[str]]]
+
+_PARSER = etree.HTMLParser(remove_comments=True, remove_pis=True)
+
+BYLINE_CLASSES = ["byline", "author", "article-byline", "post-author", "entry-author"]
+BYLINE_PREFIXES = ["By ", "by ", "Author: ", "Written by "]
+FAVICON_RELS = ["icon", "shortcut icon", "apple-touch-icon"]
+JSON_LD_DATE_FIELDS = ["datePublished", "dateCreated", "publishedAt", "dateModified"]
+
+# (attribute, value, dateutil fallback) in order of preference
+META_DATE_KEYS: List[Tuple[str, str, bool]] = [
+    ("property", "article:published_time", False),
+    ("property", "og:published_time", False),
+    ("name", "published_time", False),
+    ("itemprop", "datePublished", False),
+    ("name", "DC.date.issued", True),
+    ("name", "pubdate", True),
+    ("name", "lastmod", True),
+    ("name", "date", True),
+]
+
+# BeautifulSoup's get_text leaves out strings anywhere inside these tags
+_NON_TEXT_TAGS = ("script", "style", "template", "rt", "rp")
+
 
 class HtmlMetadata(BaseModel):
     """Structured metadata extracted from an HTML document."""
@@ -29,520 +59,357 @@ class HtmlMetadata(BaseModel):
 
 def extract_metadata(html_content: str, url: Optional[str] = None) -> HtmlMetadata:
     """
-    Extracts core metadata from HTML content: title, description, og_image and favicon.
+    Extracts core metadata from HTML content: title, description, author, og_image,
+    favicon, keywords and publication date.
 
-    Uses BeautifulSoup to parse and extract the most commonly needed metadata fields.
+    Parses with lxml directly (no BeautifulSoup tree) and indexes the document in one pass.
     Falls back to standard HTML tags if OpenGraph tags aren't available.
     """
-    soup = BeautifulSoup(html_content, "lxml")  # Use lxml for speed and robustness
+    index = _TreeIndex()
+    root = _parse_tree(html_content)
+    if root is not None:
+        index.add_all(root.iter())
+    return _resolve(index, url)
 
-    metadata: Dict[str, Any] = {}
 
-    # Add the original URL if provided
-    if url:
-        metadata["url"] = url
+def extract_metadata_from_soup(soup: BeautifulSoup, url: Optional[str] = None) -> HtmlMetadata:
+    """
+    Same as extract_metadata, for a soup that has already been parsed.
 
-    # --- Title ---
-    # Try OpenGraph title first, then regular title tag
-    og_title_tag = soup.find("meta", property="og:title")
-    title_tag = soup.find("title")
-
-    # First check OG title
-    if og_title_tag and isinstance(og_title_tag, Tag):
-        og_title_content = og_title_tag.get("content")
-        if og_title_content and isinstance(og_title_content, str):
-            metadata["title"] = og_title_content.strip()
-
-    # Fall back to regular title if no OG title
-    if "title" not in metadata and title_tag and isinstance(title_tag, Tag) and title_tag.string:
-        title_text = str(title_tag.string).strip()
-        if title_text:
-            metadata["title"] = title_text
-
-    # --- Description ---
-    # Try OpenGraph description first, then meta description
-    og_desc_tag = soup.find("meta", property="og:description")
-    meta_desc_tag = soup.find("meta", attrs={"name": "description"})
-
-    # First check OG description
-    if og_desc_tag and isinstance(og_desc_tag, Tag):
-        og_desc_content = og_desc_tag.get("content")
-        if og_desc_content and isinstance(og_desc_content, str):
-            metadata["description"] = og_desc_content.strip()
-
-    # Fall back to meta description if no OG description
-    if "description" not in metadata and meta_desc_tag and isinstance(meta_desc_tag, Tag):
-        meta_desc_content = meta_desc_tag.get("content")
-        if meta_desc_content and isinstance(meta_desc_content, str):
-            metadata["description"] = meta_desc_content.strip()
-
-    # --- OpenGraph Image ---
-    og_image_tag = soup.find("meta", property="og:image")
-    if og_image_tag and isinstance(og_image_tag, Tag):
-        og_image_content = og_image_tag.get("content")
-        if og_image_content and isinstance(og_image_content, str):
-            metadata["og_image"] = og_image_content.strip()
-
-    # --- Author ---
-    # Check multiple possible locations for author info
-    # Order of preference: og:author, article:author, meta author, schema.org,
-    # Dublin Core, rel="author", twitter:creator, byline classes
-    author_found = False
-
-    # Check OpenGraph author
-    og_author_tag = soup.find("meta", property="og:author")
-    if og_author_tag and isinstance(og_author_tag, Tag):
-        og_author = og_author_tag.get("content")
-        if og_author and isinstance(og_author, str) and og_author.strip():
-            metadata["author"] = og_author.strip()
-            author_found = True
-
-    # Check article:author (common in article schema)
-    if not author_found:
-        article_author_tag = soup.find("meta", property="article:author")
-        if article_author_tag and isinstance(article_author_tag, Tag):
-            article_author = article_author_tag.get("content")
-            if article_author and isinstance(article_author, str) and article_author.strip():
-                metadata["author"] = article_author.strip()
-                author_found = True
-
-    # Check meta author tag
-    if not author_found:
-        meta_author_tag = soup.find("meta", attrs={"name": "author"})
-        if meta_author_tag and isinstance(meta_author_tag, Tag):
-            meta_author = meta_author_tag.get("content")
-            if meta_author and isinstance(meta_author, str) and meta_author.strip():
-                metadata["author"] = meta_author.strip()
-                author_found = True
-
-    # Check schema.org author
-    if not author_found:
-        # Try <meta itemprop="author">
-        schema_meta_author = soup.find("meta", attrs={"itemprop": "author"})
-        if schema_meta_author and isinstance(schema_meta_author, Tag):
-            schema_author = schema_meta_author.get("content")
-            if schema_author and isinstance(schema_author, str) and schema_author.strip():
-                metadata["author"] = schema_author.strip()
-                author_found = True
-
-        # Try <span itemprop="author">
-        if not author_found:
-            schema_span_author = soup.find(attrs={"itemprop": "author"})
-            if schema_span_author and isinstance(schema_span_author, Tag):
-                # It might contain nested elements or direct text
-                author_name_elem = schema_span_author.find(attrs={"itemprop": "name"})
-                if (
-                    author_name_elem
-                    and isinstance(author_name_elem, Tag)
-                    and author_name_elem.get_text(strip=True)
-                ):
-                    metadata["author"] = author_name_elem.get_text(strip=True)
-                    author_found = True
-                elif schema_span_author.get_text(strip=True):
-                    metadata["author"] = schema_span_author.get_text(strip=True)
-                    author_found = True
-
-    # Check Dublin Core
-    if not author_found:
-        dc_author_tag = soup.find("meta", attrs={"name": "DC.creator"})
-        if dc_author_tag and isinstance(dc_author_tag, Tag):
-            dc_author = dc_author_tag.get("content")
-            if dc_author and isinstance(dc_author, str) and dc_author.strip():
-                metadata["author"] = dc_author.strip()
-                author_found = True
-
-    # Check rel="author" link
-    if not author_found:
-        rel_author_link = soup.find("link", attrs={"rel": "author"})
-        if rel_author_link and isinstance(rel_author_link, Tag):
-            rel_author_title = rel_author_link.get("title")
-            if rel_author_title and isinstance(rel_author_title, str) and rel_author_title.strip():
-                metadata["author"] = rel_author_title.strip()
-                author_found = True
-
-        # Also try <a rel="author"> which often contains the author name in the text
-        if not author_found:
-            a_rel_author = soup.find("a", attrs={"rel": "author"})
-            if a_rel_author and isinstance(a_rel_author, Tag) and a_rel_author.get_text(strip=True):
-                metadata["author"] = a_rel_author.get_text(strip=True)
-                author_found = True
-
-    # As last resort, check twitter:creator
-    if not author_found:
-        twitter_creator_tag = soup.find("meta", attrs={"name": "twitter:creator"})
-        if twitter_creator_tag and isinstance(twitter_creator_tag, Tag):
-            twitter_creator = twitter_creator_tag.get("content")
-            if twitter_creator and isinstance(twitter_creator, str) and twitter_creator.strip():
-                # Remove @ if present (common in Twitter handles)
-                creator = twitter_creator.strip()
-                if creator.startswith("@"):
-                    creator = creator[1:]
-                metadata["author"] = creator
-                author_found = True
-
-    # Check common byline elements
-    if not author_found:
-        byline_classes = ["byline", "author", "article-byline", "post-author", "entry-author"]
-        for class_name in byline_classes:
-            byline_elem = soup.find(class_=class_name)
-            if byline_elem and isinstance(byline_elem, Tag):
-                if byline_elem.get_text(strip=True):
-                    # Direct text in the element
-                    author_text = byline_elem.get_text(strip=True)
-                    # Clean up common prefixes
-                    for prefix in ["By ", "by ", "Author: ", "Written by "]:
-                        if author_text.startswith(prefix):
-                            author_text = author_text[len(prefix) :]
-                    metadata["author"] = author_text.strip()
-                    author_found = True
-                    break
-
-    # Try to find JSON-LD structured data
-    if not author_found:
-        import json
-        from json.decoder import JSONDecodeError
-
-        json_ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-        for script in json_ld_scripts:
-            if script and isinstance(script, Tag):
-                script_text = script.get_text(strip=True)
-                if script_text:
-                    try:
-                        ld_data = json.loads(script_text)
-                        # Handle both single objects and arrays
-                        if isinstance(ld_data, dict):
-                            items = [ld_data]
-                        elif isinstance(ld_data, list):
-                            items = ld_data
-                        else:
-                            continue
-
-                        # Look for author in JSON-LD data
-                        for item in items:
-                            # Check for author property
-                            if "author" in item:
-                                author_info = item["author"]
-                                # Author can be a string or an object with a name
-                                if isinstance(author_info, str):
-                                    metadata["author"] = author_info.strip()
-                                    author_found = True
-                                    break
-                                elif isinstance(author_info, dict) and "name" in author_info:
-                                    metadata["author"] = author_info["name"].strip()
-                                    author_found = True
-                                    break
-                    except (JSONDecodeError, AttributeError):
-                        # Skip invalid JSON
-                        continue
-
-                    if author_found:
-                        break
-
-    # --- Keywords ---
-    # Check multiple possible locations for keywords/tags
-    # Order of preference: meta keywords, article:tag, og:keywords, news_keywords, schema.org keywords, JSON-LD keywords
-    keywords_found = False
-
-    # Check standard meta keywords tag
-    meta_keywords_tag = soup.find("meta", attrs={"name": "keywords"})
-    if meta_keywords_tag and isinstance(meta_keywords_tag, Tag):
-        meta_keywords = meta_keywords_tag.get("content")
-        if meta_keywords and isinstance(meta_keywords, str) and meta_keywords.strip():
-            metadata["keywords"] = meta_keywords.strip()
-            keywords_found = True
-
-    # Check article:tag (used by Facebook)
-    if not keywords_found:
-        article_tags = soup.find_all("meta", property="article:tag")
-        if article_tags:
-            tags = []
-            for tag in article_tags:
-                if isinstance(tag, Tag):
-                    tag_content = tag.get("content")
-                    if tag_content and isinstance(tag_content, str) and tag_content.strip():
-                        tags.append(tag_content.strip())
-            if tags:
-                metadata["keywords"] = tags
-                keywords_found = True
-
-    # Check news_keywords (used by Google News)
-    if not keywords_found:
-        news_keywords_tag = soup.find("meta", attrs={"name": "news_keywords"})
-        if news_keywords_tag and isinstance(news_keywords_tag, Tag):
-            news_keywords = news_keywords_tag.get("content")
-            if news_keywords and isinstance(news_keywords, str) and news_keywords.strip():
-                metadata["keywords"] = news_keywords.strip()
-                keywords_found = True
-
-    # Check schema.org keywords
-    if not keywords_found:
-        schema_keywords = soup.find("meta", attrs={"itemprop": "keywords"})
-        if schema_keywords and isinstance(schema_keywords, Tag):
-            keywords_content = schema_keywords.get("content")
-            if keywords_content and isinstance(keywords_content, str) and keywords_content.strip():
-                metadata["keywords"] = keywords_content.strip()
-                keywords_found = True
-
-    # Check JSON-LD for keywords
-    if not keywords_found:
-        import json
-        from json.decoder import JSONDecodeError
-
-        json_ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-        for script in json_ld_scripts:
-            if script and isinstance(script, Tag):
-                script_text = script.get_text(strip=True)
-                if script_text:
-                    try:
-                        ld_data = json.loads(script_text)
-                        # Handle both single objects and arrays
-                        if isinstance(ld_data, dict):
-                            items = [ld_data]
-                        elif isinstance(ld_data, list):
-                            items = ld_data
-                        else:
-                            continue
-
-                        # Look for keywords in JSON-LD data
-                        for item in items:
-                            if "keywords" in item:
-                                keywords_info = item["keywords"]
-                                if isinstance(keywords_info, str):
-                                    metadata["keywords"] = keywords_info.strip()
-                                    keywords_found = True
-                                    break
-                                elif isinstance(keywords_info, list):
-                                    # Filter out empty strings and strip whitespace
-                                    valid_keywords = [
-                                        k.strip()
-                                        for k in keywords_info
-                                        if isinstance(k, str) and k.strip()
-                                    ]
-                                    if valid_keywords:
-                                        metadata["keywords"] = valid_keywords
-                                        keywords_found = True
-                                        break
-                    except (JSONDecodeError, AttributeError):
-                        continue
-
-                    if keywords_found:
-                        break
-
-    # --- Published Date ---
-    # Check multiple possible locations for publication date
-    # Order of preference: article:published_time, og:published_time, published_time,
-    # datePublished schema.org, DC.date.issued, pubdate, lastmod, date
-    date_found = False
-
-    # Check article:published_time (Facebook/OpenGraph)
-    og_pub_tag = soup.find("meta", property="article:published_time")
-    if og_pub_tag and isinstance(og_pub_tag, Tag):
-        og_pub_content = og_pub_tag.get("content")
-        if og_pub_content and isinstance(og_pub_content, str) and og_pub_content.strip():
+    The soup must not be cleaned yet: JSON-LD lives in <script> tags.
+    """
+    index = _SoupIndex()
+    index.add_all(node for node in soup.descendants if isinstance(node, Tag))
+    return _resolve(index, url)
+
+
+def _parse_tree(html_content: str) -> Optional[LxmlElement]:
+    if not html_content or not html_content.strip():
+        return None
+    try:
+        return etree.fromstring(html_content, _PARSER)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration
+        return etree.fromstring(html_content.encode("utf-8"), _PARSER)
+
+
+def _tokens(value: Any) -> List[str]:
+    """Tokens of a space-separated attribute (BeautifulSoup already splits class and rel)."""
+    if isinstance(value, list):
+        return value
+    return value.split() if isinstance(value, str) else []
+
+
+def _str(value: Any) -> Optional[str]:
+    return value if isinstance(value, str) else None
+
+
+def _stripped(value: Optional[str]) -> Optional[str]:
+    """The stripped value, or None if there is nothing left."""
+    return value.strip() or None if value else None
+
+
+class _MetadataIndex:
+    """
+    The metadata-bearing nodes of a document, collected in one traversal.
+
+    Lookups keep `soup.find` semantics: only the first <meta> for each attribute value and
+    the first <link> for each rel counts, even if a later one has usable content.
+    Subclasses read text from their tree type.
+    """
+
+    def __init__(self):
+        self.meta: Dict[Tuple[str, str], Optional[str]] = {}  # (attr, value) -> content
+        self.article_tags: List[Optional[str]] = []
+        self.links: Dict[str, Attrs] = {}  # rel token or full rel string -> attributes
+        self.title: Optional[Any] = None
+        self.times: List[str] = []
+        self.json_ld_scripts: List[Any] = []
+        self.rel_author_anchor: Optional[Any] = None
+        self.itemprop_author: Optional[Any] = None
+        self.bylines: Dict[str, Any] = {}
+
+    def add_all(self, nodes: Iterator[Any]) -> None:
+        for node in nodes:
+            self.add(node)
+
+    def add(self, node: Any) -> None:
+        name, attrs = self.name_and_attrs(node)
+        if name == "meta":
+            content = _str(attrs.get("content"))
+            for attr in ("property", "name", "itemprop"):
+                value = _str(attrs.get(attr))
+                if value is not None:
+                    self.meta.setdefault((attr, value), content)
+            if attrs.get("property") == "article:tag":
+                self.article_tags.append(content)
+        elif name == "link":
+            rel = _tokens(attrs.get("rel"))
+            for key in [*rel, " ".join(rel)]:
+                self.links.setdefault(key, attrs)
+        elif name == "title":
+            if self.title is None:
+                self.title = node
+        elif name == "time":
+            value = _str(attrs.get("datetime"))
+            if value is not None:
+                self.times.append(value)
+        elif name == "script":
+            if attrs.get("type") == "application/ld+json":
+                self.json_ld_scripts.append(node)
+        elif name == "a":
+            if self.rel_author_anchor is None and "author" in _tokens(attrs.get("rel")):
+                self.rel_author_anchor = node
+
+        if self.itemprop_author is None and attrs.get("itemprop") == "author":
+            self.itemprop_author = node
+        classes = attrs.get("class")
+        if classes:
+            for class_name in _tokens(classes):
+                if class_name in BYLINE_CLASSES:
+                    self.bylines.setdefault(class_name, node)
+
+    def meta_content(self, attr: str, value: str) -> Optional[str]:
+        return self.meta.get((attr, value))
+
+    @cached_property
+    def json_ld(self) -> List[Dict[str, Any]]:
+        """Top-level JSON-LD objects from every script block, parsed once."""
+        items: List[Dict[str, Any]] = []
+        for script in self.json_ld_scripts:
+            script_text = (self.string(script) or "").strip()
+            if not script_text:
+                continue
             try:
-                metadata["published_at"] = datetime.fromisoformat(og_pub_content.strip())
-                date_found = True
-            except (ValueError, TypeError):
-                pass
-
-    # Check og:published_time
-    if not date_found:
-        og_pub_tag = soup.find("meta", property="og:published_time")
-        if og_pub_tag and isinstance(og_pub_tag, Tag):
-            og_pub_content = og_pub_tag.get("content")
-            if og_pub_content and isinstance(og_pub_content, str) and og_pub_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(og_pub_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    pass
-
-    # Check published_time
-    if not date_found:
-        pub_time_tag = soup.find("meta", attrs={"name": "published_time"})
-        if pub_time_tag and isinstance(pub_time_tag, Tag):
-            pub_time_content = pub_time_tag.get("content")
-            if pub_time_content and isinstance(pub_time_content, str) and pub_time_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(pub_time_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    pass
-
-    # Check schema.org datePublished
-    if not date_found:
-        date_pub_tag = soup.find("meta", attrs={"itemprop": "datePublished"})
-        if date_pub_tag and isinstance(date_pub_tag, Tag):
-            date_pub_content = date_pub_tag.get("content")
-            if date_pub_content and isinstance(date_pub_content, str) and date_pub_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(date_pub_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    pass
-
-    # Check Dublin Core date issued
-    if not date_found:
-        dc_date_tag = soup.find("meta", attrs={"name": "DC.date.issued"})
-        if dc_date_tag and isinstance(dc_date_tag, Tag):
-            dc_date_content = dc_date_tag.get("content")
-            if dc_date_content and isinstance(dc_date_content, str) and dc_date_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(dc_date_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    try:
-                        # Try W3CDTF format (subset of ISO8601)
-                        from dateutil import parser
-
-                        metadata["published_at"] = parser.parse(dc_date_content.strip())
-                        date_found = True
-                    except (ImportError, ValueError, TypeError):
-                        pass
-
-    # Check pubdate meta
-    if not date_found:
-        pubdate_tag = soup.find("meta", attrs={"name": "pubdate"})
-        if pubdate_tag and isinstance(pubdate_tag, Tag):
-            pubdate_content = pubdate_tag.get("content")
-            if pubdate_content and isinstance(pubdate_content, str) and pubdate_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(pubdate_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    try:
-                        from dateutil import parser
-
-                        metadata["published_at"] = parser.parse(pubdate_content.strip())
-                        date_found = True
-                    except (ImportError, ValueError, TypeError):
-                        pass
-
-    # Check lastmod meta
-    if not date_found:
-        lastmod_tag = soup.find("meta", attrs={"name": "lastmod"})
-        if lastmod_tag and isinstance(lastmod_tag, Tag):
-            lastmod_content = lastmod_tag.get("content")
-            if lastmod_content and isinstance(lastmod_content, str) and lastmod_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(lastmod_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    try:
-                        from dateutil import parser
-
-                        metadata["published_at"] = parser.parse(lastmod_content.strip())
-                        date_found = True
-                    except (ImportError, ValueError, TypeError):
-                        pass
-
-    # Check date meta
-    if not date_found:
-        date_tag = soup.find("meta", attrs={"name": "date"})
-        if date_tag and isinstance(date_tag, Tag):
-            date_content = date_tag.get("content")
-            if date_content and isinstance(date_content, str) and date_content.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(date_content.strip())
-                    date_found = True
-                except (ValueError, TypeError):
-                    try:
-                        from dateutil import parser
-
-                        metadata["published_at"] = parser.parse(date_content.strip())
-                        date_found = True
-                    except (ImportError, ValueError, TypeError):
-                        pass
-
-    # Check date from time tag
-    if not date_found:
-        time_tags = soup.find_all("time")
-        for time_tag in time_tags:
-            if not isinstance(time_tag, Tag):
+                ld_data = json.loads(script_text)
+            except json.JSONDecodeError:
+                # Skip invalid JSON
                 continue
+            # Handle both single objects and arrays
+            for item in ld_data if isinstance(ld_data, list) else [ld_data]:
+                if isinstance(item, dict):
+                    items.append(item)
+        return items
+
+    def name_and_attrs(self, node: Any) -> Tuple[Optional[str], Attrs]:
+        raise NotImplementedError
+
+    def text(self, node: Any) -> str:
+        """Concatenated stripped text, like BeautifulSoup's get_text(strip=True)."""
+        raise NotImplementedError
+
+    def string(self, node: Any) -> Optional[str]:
+        """The node's only string, like BeautifulSoup's .string."""
+        raise NotImplementedError
+
+    def itemprop_name(self, node: Any) -> Optional[Any]:
+        """First descendant with itemprop="name"."""
+        raise NotImplementedError
+
+
+class _SoupIndex(_MetadataIndex):
+    def name_and_attrs(self, node: Tag) -> Tuple[Optional[str], Attrs]:
+        return node.name, node.attrs
+
+    def text(self, node: Tag) -> str:
+        return node.get_text(strip=True)
+
+    def string(self, node: Tag) -> Optional[str]:
+        return str(node.string) if node.string is not None else None
+
+    def itemprop_name(self, node: Tag) -> Optional[Tag]:
+        found = node.find(itemprop="name")
+        return found if isinstance(found, Tag) else None
+
+
+class _TreeIndex(_MetadataIndex):
+    def name_and_attrs(self, node: LxmlElement) -> Tuple[Optional[str], Attrs]:
+        # Entities and other non-element nodes have a non-str tag
+        return (node.tag, node.attrib) if isinstance(node.tag, str) else (None, {})
+
+    def text(self, node: LxmlElement) -> str:
+        if any(ancestor.tag in _NON_TEXT_TAGS for ancestor in node.iterancestors()):
+            return ""
+        hidden = {inner for tag in node.iter(*_NON_TEXT_TAGS) for inner in tag.iter()}
+        parts: List[str] = []
+        for element in node.iter():
+            if element.text and element not in hidden:
+                parts.append(element.text.strip())
+            if element is not node and element.tail and element.getparent() not in hidden:
+                parts.append(element.tail.strip())
+        return "".join(parts)
+
+    def string(self, node: LxmlElement) -> Optional[str]:
+        return node.text if len(node) == 0 else None
+
+    def itemprop_name(self, node: LxmlElement) -> Optional[LxmlElement]:
+        return next(
+            (element for element in node.iterdescendants() if element.get("itemprop") == "name"),
+            None,
+        )
+
+
+def _parse_date(value: Optional[str], dateutil_fallback: bool) -> Optional[datetime]:
+    value = _stripped(value)
+    if value is None:
+        return None
+    try:
+        return datetime.fromisoformat(value)
+    except (ValueError, TypeError):
+        if not dateutil_fallback:
+            return None
+    try:
+        # W3CDTF and other formats fromisoformat doesn't accept
+        return date_parser.parse(value)
+    except (ValueError, TypeError, OverflowError):
+        return None
 
-            # Check for datetime attribute
-            datetime_attr = time_tag.get("datetime")
-            if datetime_attr and isinstance(datetime_attr, str) and datetime_attr.strip():
-                try:
-                    metadata["published_at"] = datetime.fromisoformat(datetime_attr.strip())
-                    date_found = True
-                    break
-                except (ValueError, TypeError):
-                    try:
-                        from dateutil import parser
-
-                        metadata["published_at"] = parser.parse(datetime_attr.strip())
-                        date_found = True
-                        break
-                    except (ImportError, ValueError, TypeError):
-                        pass
-
-    # Check JSON-LD for publication date
-    if not date_found:
-        import json
-        from json.decoder import JSONDecodeError
-
-        json_ld_scripts = soup.find_all("script", attrs={"type": "application/ld+json"})
-        for script in json_ld_scripts:
-            if script and isinstance(script, Tag):
-                script_text = script.get_text(strip=True)
-                if script_text:
-                    try:
-                        ld_data = json.loads(script_text)
-                        # Handle both single objects and arrays
-                        if isinstance(ld_data, dict):
-                            items = [ld_data]
-                        elif isinstance(ld_data, list):
-                            items = ld_data
-                        else:
-                            continue
-
-                        # Look for date in JSON-LD data
-                        for item in items:
-                            for date_field in [
-                                "datePublished",
-                                "dateCreated",
-                                "publishedAt",
-                                "dateModified",
-                            ]:
-                                if date_field in item:
-                                    date_str = item[date_field]
-                                    if isinstance(date_str, str) and date_str.strip():
-                                        try:
-                                            metadata["published_at"] = datetime.fromisoformat(
-                                                date_str.strip()
-                                            )
-                                            date_found = True
-                                            break
-                                        except (ValueError, TypeError):
-                                            try:
-                                                from dateutil import parser
-
-                                                metadata["published_at"] = parser.parse(
-                                                    date_str.strip()
-                                                )
-                                                date_found = True
-                                                break
-                                            except (ImportError, ValueError, TypeError):
-                                                pass
-                            if date_found:
-                                break
-                    except (JSONDecodeError, AttributeError):
-                        continue
-
-                    if date_found:
-                        break
-
-    # --- Favicon ---
-    # Look for icon in various forms
-    for rel in ["icon", "shortcut icon", "apple-touch-icon"]:
-        icon_link = soup.find("link", rel=rel)
-        if icon_link and isinstance(icon_link, Tag):
-            icon_href = icon_link.get("href")
-            if icon_href and isinstance(icon_href, str):
-                metadata["favicon"] = icon_href.strip()
-                break
 
+def _title(index: _MetadataIndex) -> Optional[str]:
+    # Try OpenGraph title first, then regular title tag
+    og_title = index.meta_content("property", "og:title")
+    if og_title:
+        return og_title.strip()
+    return _stripped(index.string(index.title)) if index.title is not None else None
+
+
+def _first_content(index: _MetadataIndex, *keys: Tuple[str, str]) -> Optional[str]:
+    for attr, value in keys:
+        content = index.meta_content(attr, value)
+        if content:
+            return content.strip()
+    return None
+
+
+def _author(index: _MetadataIndex) -> Optional[str]:
+    # Order of preference: og:author, article:author, meta author, schema.org,
+    # Dublin Core, rel="author", twitter:creator, byline classes, JSON-LD
+    for attr, value in [
+        ("property", "og:author"),
+        ("property", "article:author"),
+        ("name", "author"),
+        ("itemprop", "author"),
+    ]:
+        author = _stripped(index.meta_content(attr, value))
+        if author:
+            return author
+
+    # <span itemprop="author"> might contain a nested name element or direct text
+    if index.itemprop_author is not None:
+        name_elem = index.itemprop_name(index.itemprop_author)
+        name = index.text(name_elem) if name_elem is not None else ""
+        author = name or index.text(index.itemprop_author)
+        if author:
+            return author
+
+    author = _stripped(index.meta_content("name", "DC.creator"))
+    if author:
+        return author
+
+    rel_author_link = index.links.get("author")
+    if rel_author_link is not None:
+        author = _stripped(_str(rel_author_link.get("title")))
+        if author:
+            return author
+    # <a rel="author"> often contains the author name in the text
+    if index.rel_author_anchor is not None:
+        author = index.text(index.rel_author_anchor)
+        if author:
+            return author
+
+    creator = _stripped(index.meta_content("name", "twitter:creator"))
+    if creator:
+        # Remove @ if present (common in Twitter handles)
+        return creator[1:] if creator.startswith("@") else creator
+
+    for class_name in BYLINE_CLASSES:
+        byline = index.bylines.get(class_name)
+        author_text = index.text(byline) if byline is not None else ""
+        if author_text:
+            # Clean up common prefixes
+            for prefix in BYLINE_PREFIXES:
+                if author_text.startswith(prefix):
+                    author_text = author_text[len(prefix) :]
+            return author_text.strip()
+
+    for item in index.json_ld:
+        # Author can be a string or an object with a name
+        author_info = item.get("author")
+        if isinstance(author_info, str):
+            return author_info.strip()
+        if isinstance(author_info, dict) and isinstance(author_info.get("name"), str):
+            return author_info["name"].strip()
+    return None
+
+
+def _keywords(index: _MetadataIndex) -> Optional[Union[str, List[str]]]:
+    # Order of preference: meta keywords, article:tag, news_keywords, schema.org keywords,
+    # JSON-LD keywords
+    keywords = _stripped(index.meta_content("name", "keywords"))
+    if keywords:
+        return keywords
+
+    tags = [tag for tag in map(_stripped, index.article_tags) if tag]
+    if tags:
+        return tags
+
+    for attr, value in [("name", "news_keywords"), ("itemprop", "keywords")]:
+        keywords = _stripped(index.meta_content(attr, value))
+        if keywords:
+            return keywords
+
+    for item in index.json_ld:
+        keywords_info = item.get("keywords")
+        if isinstance(keywords_info, str):
+            return keywords_info.strip()
+        if isinstance(keywords_info, list):
+            # Filter out empty strings and strip whitespace
+            valid_keywords = [k.strip() for k in keywords_info if isinstance(k, str) and k.strip()]
+            if valid_keywords:
+                return valid_keywords
+    return None
+
+
+def _published_at(index: _MetadataIndex) -> Optional[datetime]:
+    for attr, value, dateutil_fallback in META_DATE_KEYS:
+        published_at = _parse_date(index.meta_content(attr, value), dateutil_fallback)
+        if published_at:
+            return published_at
+    for datetime_attr in index.times:
+        published_at = _parse_date(datetime_attr, dateutil_fallback=True)
+        if published_at:
+            return published_at
+    for item in index.json_ld:
+        for date_field in JSON_LD_DATE_FIELDS:
+            published_at = _parse_date(_str(item.get(date_field)), dateutil_fallback=True)
+            if published_at:
+                return published_at
+    return None
+
+
+def _favicon(index: _MetadataIndex) -> Optional[str]:
+    for rel in FAVICON_RELS:
+        icon_link = index.links.get(rel)
+        icon_href = _str(icon_link.get("href")) if icon_link is not None else None
+        if icon_href:
+            return icon_href.strip()
+    return None
+
+
+def _resolve(index: _MetadataIndex, url: Optional[str]) -> HtmlMetadata:
+    metadata: Dict[str, Any] = {
+        "title": _title(index),
+        "description": _first_content(
+            index, ("property", "og:description"), ("name", "description")
+        ),
+        "og_image": _first_content(index, ("property", "og:image")),
+        "author": _author(index),
+        "keywords": _keywords(index),
+        "published_at": _published_at(index),
+        "favicon": _favicon(index),
+    }
+    # Add the original URL if provided
+    if url:
+        metadata["url"] = url
     # Validate and return using Pydantic model
-    return HtmlMetadata(**metadata)
+    return HtmlMetadata(**{key: value for key, value in metadata.items() if value is not None})
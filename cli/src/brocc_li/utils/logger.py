@@ -1,3 +1,4 @@
+import multiprocessing
 import os
 import sys
 from contextlib import contextmanager
@@ -12,9 +13,11 @@ from brocc_li.cli.config_dir import get_config_dir
 CONFIG_DIR = get_config_dir()
 LOG_FILE = CONFIG_DIR / "brocc_session.log"
 
-# Open the log file, overwriting if it exists
+# Open the log file, overwriting if it exists. Child processes (e.g. parser workers)
+# append so they don't wipe the session log the main process is writing.
+LOG_FILE_MODE = "a" if multiprocessing.parent_process() is not None else "w"
 try:
-    log_file_handle = open(LOG_FILE, "w", encoding="utf-8")
+    log_file_handle = open(LOG_FILE, LOG_FILE_MODE, encoding="utf-8")
 except Exception as e:
     # Fallback to stderr if file cannot be opened
     print(f"Error opening log file {LOG_FILE}: {e}", file=sys.stderr)